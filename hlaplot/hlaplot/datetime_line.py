@@ -16,10 +16,60 @@ class DateTimeLengthError(Exception):
     pass
 
 
+class _RingBuffer(object):
+
+    """
+    Preallocated circular buffer with contiguous views of its contents.
+
+    Each sample is written twice, at position p and p + max_length, so
+    the valid data is always the contiguous slice [start:start+length]
+    and can be returned as a view, without copying.
+    """
+
+    def __init__(self, max_length, dtype=float):
+        self._max_length = max_length
+        self._buffer = _numpy.empty(2*max_length, dtype=dtype)
+        self._start = 0
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def set(self, array):
+        array = _numpy.asarray(array, dtype=self._buffer.dtype)
+        length = len(array)
+        self._buffer[:length] = array
+        self._buffer[self._max_length:self._max_length+length] = array
+        self._start = 0
+        self._length = length
+
+    def extend(self, array):
+        array = _numpy.asarray(array, dtype=self._buffer.dtype)
+        max_length = self._max_length
+        if len(array) > max_length:
+            array = array[-max_length:]
+        size = len(array)
+        if not size:
+            return
+        end = self._start + self._length
+        positions = (end + _numpy.arange(size)) % max_length
+        self._buffer[positions] = array
+        self._buffer[positions + max_length] = array
+        overflow = max(self._length + size - max_length, 0)
+        self._start = (self._start + overflow) % max_length
+        self._length = min(self._length + size, max_length)
+
+    def view(self):
+        return self._buffer[self._start:self._start+self._length]
+
+
 class DateTimeLine(_custom_line.CustomLine):
 
     """
     Keep a matplotlib line for datetime data and the maximum array length.
+
+    Data is kept in preallocated circular buffers, so adding points does
+    not reallocate the arrays; the line is given views of these buffers.
     """
 
     def __init__(self, line, max_data_length=1000):
@@ -29,6 +79,8 @@ class DateTimeLine(_custom_line.CustomLine):
         """
         super(DateTimeLine, self).__init__(line)
         self._max_data_length = max_data_length
+        self._x_buffer = _RingBuffer(max_data_length, dtype=object)
+        self._y_buffer = _RingBuffer(max_data_length, dtype=float)
         self.line_style = '-'
         self.marker = 'None'
 
@@ -52,6 +104,7 @@ class DateTimeLine(_custom_line.CustomLine):
     @x.setter
     def x(self, array):
         self._check_array_length(array)
+        self._x_buffer.set(array)
         super(DateTimeLine, self)._set_x(array)
 
     @property
@@ -61,6 +114,7 @@ class DateTimeLine(_custom_line.CustomLine):
     @y.setter
     def y(self, array):
         self._check_array_length(array)
+        self._y_buffer.set(array)
         super(DateTimeLine, self)._set_y(array)
 
     def clear(self):
@@ -72,23 +126,22 @@ class DateTimeLine(_custom_line.CustomLine):
         self.add_xy(x, y)
 
     def add_xy(self, x, y):
-        current_x = self._get_x()
-        current_y = self._get_y()
-        length = self.length
-        if length < self._max_data_length:
-            new_x = self._append(current_x, x)
-            new_y = self._append(current_y, y)
-        else:
-            new_x = self._remove_first_and_append(current_x, x)
-            new_y = self._remove_first_and_append(current_y, y)
-        self._set_x(new_x)
-        self._set_y(new_y)
+        self.add_many([x], [y])
 
-    def _append(self, array, element):
-        return _numpy.append(array, element)
+    def add_many(self, xs, ys):
+        """
+        Add several (x,y) points at once, dropping the oldest ones if the
+        maximum length is exceeded.
 
-    def _remove_first_and_append(self, array, element):
-        return _numpy.append(array[1:], element)
+        xs -- sequence of datetime
+        ys -- sequence of values, with the same length as xs
+        """
+        if not len(xs) == len(ys):
+            raise DateTimeLengthError
+        self._x_buffer.extend(xs)
+        self._y_buffer.extend(ys)
+        self._set_x(self._x_buffer.view())
+        self._set_y(self._y_buffer.view())
 
     def _check_array_length(self, array):
         if len(array) > self._max_data_length:
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+benchmark_datetime_line
+    Compare adding points to a DateTimeLine one by one, in batches and
+    with the former numpy.append implementation.
+"""
+
+import sys
+import timeit
+import datetime
+import numpy
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.figure
+import hlaplot.datetime_line as datetime_line
+
+
+class AppendLine(datetime_line.DateTimeLine):
+
+    """DateTimeLine adding points with numpy.append, as formerly done."""
+
+    def add_xy(self, x, y):
+        current_x = self._get_x()
+        current_y = self._get_y()
+        if self.length < self.max_length:
+            new_x = numpy.append(current_x, x)
+            new_y = numpy.append(current_y, y)
+        else:
+            new_x = numpy.append(current_x[1:], x)
+            new_y = numpy.append(current_y[1:], y)
+        self._set_x(new_x)
+        self._set_y(new_y)
+
+
+def create_line(cls, max_data_length):
+    figure = matplotlib.figure.Figure()
+    axes = figure.add_subplot(1, 1, 1)
+    line, = axes.plot([], [])
+    return cls(line, max_data_length)
+
+
+def create_data(nr_points):
+    t0 = datetime.datetime(2000, 1, 1, 0, 0, 0)
+    t = [t0 + datetime.timedelta(seconds=i) for i in range(nr_points)]
+    y = numpy.random.random(nr_points)
+    return t, y
+
+
+def bench_add_xy(cls, max_data_length, t, y):
+    line = create_line(cls, max_data_length)
+    for i in range(len(t)):
+        line.add_xy(t[i], y[i])
+
+
+def bench_add_many(max_data_length, t, y, batch_size):
+    line = create_line(datetime_line.DateTimeLine, max_data_length)
+    for i in range(0, len(t), batch_size):
+        line.add_many(t[i:i+batch_size], y[i:i+batch_size])
+
+
+def run(max_data_length=10000, nr_points=20000, batch_size=100, repeat=3):
+    t, y = create_data(nr_points)
+    cases = (
+        ('numpy.append add_xy',
+         lambda: bench_add_xy(AppendLine, max_data_length, t, y)),
+        ('ring buffer add_xy',
+         lambda: bench_add_xy(datetime_line.DateTimeLine,
+                              max_data_length, t, y)),
+        ('ring buffer add_many ({})'.format(batch_size),
+         lambda: bench_add_many(max_data_length, t, y, batch_size)),
+    )
+    print('max_data_length: {}, points: {}'.format(max_data_length,
+                                                   nr_points))
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('{:<30s} {:10.4f} s {:10.2f} us/point'.format(
+            name, elapsed, 1e6*elapsed/nr_points))
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
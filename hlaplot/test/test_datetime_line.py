@@ -149,6 +149,101 @@ class TestFullArray(unittest.TestCase):
                          'length not equal to _max_data_length')
 
 
+class TestAddMany(unittest.TestCase):
+
+    def setUp(self):
+        self.figure = matplotlib.figure.Figure()
+        self.canvas = backend.FigureCanvasQTAgg(self.figure)
+        self.axes = self.figure.add_subplot(1, 1, 1)
+
+        self.line, = self.axes.plot_date(x=[], y=[], xdate=True)
+        self.datetime_line = datetime_line.DateTimeLine(self.line,
+                                                       max_data_length=10)
+
+        t0 = datetime.datetime(2000, 1, 1, 0, 0, 0)
+        self.t = [t0 + datetime.timedelta(hours=i) for i in range(35)]
+        self.y = [float(i) for i in range(len(self.t))]
+
+    def test_add_many_not_full(self):
+        self.datetime_line.add_many(self.t[:4], self.y[:4])
+        self.datetime_line.add_many(self.t[4:7], self.y[4:7])
+        self.assertEqual(list(self.datetime_line.x), self.t[:7],
+                         'returned wrong x array')
+        self.assertEqual(list(self.datetime_line.y), self.y[:7],
+                         'returned wrong y array')
+
+    def test_add_many_wrap_around(self):
+        end = 0
+        for size in (3, 4, 6, 1, 8, 3):
+            start, end = end, end + size
+            self.datetime_line.add_many(self.t[start:end],
+                                        self.y[start:end])
+            first = max(end - 10, 0)
+            self.assertEqual(list(self.datetime_line.x), self.t[first:end],
+                             'returned wrong x array')
+            self.assertEqual(list(self.datetime_line.y), self.y[first:end],
+                             'returned wrong y array')
+
+    def test_add_many_larger_than_max_length(self):
+        self.datetime_line.add_many(self.t[:3], self.y[:3])
+        self.datetime_line.add_many(self.t[3:], self.y[3:])
+        self.assertEqual(list(self.datetime_line.x), self.t[-10:],
+                         'returned wrong x array')
+        self.assertEqual(self.datetime_line.length, 10,
+                         'length not equal to _max_data_length')
+
+    def test_add_many_after_set(self):
+        self.datetime_line.x = self.t[:8]
+        self.datetime_line.y = self.y[:8]
+        self.datetime_line.add_many(self.t[8:13], self.y[8:13])
+        self.assertEqual(list(self.datetime_line.y), self.y[3:13],
+                         'returned wrong y array')
+
+    def test_add_many_different_lengths(self):
+        result = False
+        try:
+            self.datetime_line.add_many(self.t[:3], self.y[:2])
+        except datetime_line.DateTimeLengthError:
+            result = True
+        self.assertTrue(result,
+                        'DateTimeLengthError not raised')
+        self.assertEqual(self.datetime_line.length, 0,
+                         'length not zero after failed add')
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = datetime_line._RingBuffer(5)
+
+    def test_view_is_contiguous(self):
+        self.buffer.extend(range(4))
+        self.buffer.extend(range(4, 7))
+        view = self.buffer.view()
+        self.assertEqual(list(view), [2.0, 3.0, 4.0, 5.0, 6.0],
+                         'returned wrong data')
+        self.assertTrue(view.flags['C_CONTIGUOUS'],
+                        'view not contiguous')
+        self.assertFalse(view.flags['OWNDATA'],
+                         'view is a copy')
+
+    def test_extend_wrap_around(self):
+        expected = []
+        for i in range(23):
+            self.buffer.extend([i])
+            expected = (expected + [i])[-5:]
+            self.assertEqual(list(self.buffer.view()), expected,
+                             'returned wrong data')
+            self.assertEqual(len(self.buffer), len(expected),
+                             'wrong length')
+
+    def test_extend_empty(self):
+        self.buffer.extend(range(3))
+        self.buffer.extend([])
+        self.assertEqual(list(self.buffer.view()), [0.0, 1.0, 2.0],
+                         'returned wrong data')
+
+
 def empty_line_suite():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestEmptyLine)
     return suite
@@ -164,9 +259,21 @@ def full_array_suite():
     return suite
 
 
+def add_many_suite():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAddMany)
+    return suite
+
+
+def ring_buffer_suite():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestRingBuffer)
+    return suite
+
+
 def suite():
     suite_list = []
     suite_list.append(empty_line_suite())
     suite_list.append(set_get_suite())
     suite_list.append(full_array_suite())
+    suite_list.append(add_many_suite())
+    suite_list.append(ring_buffer_suite())
     return unittest.TestSuite(suite_list)
@@ -4,7 +4,7 @@
 import sys as _sys
 import subprocess as _subprocess
 import argparse as _argparse
-from siriushla import util
+from siriushla import util, zygote
 from siriushla.sirius_application import SiriusApplication
 from siriuspy.envars import VACA_PREFIX
 from siriushla.as_ap_launcher import MainOperation
@@ -31,6 +31,8 @@ if returnval:
             break
 
 if need_new_window:
+    # keep a warm interpreter to start the applications of the launcher
+    zygote.start_server()
     app = SiriusApplication()
     app.open_window(MainOperation, parent=None, prefix=args.prefix)
     _sys.exit(app.exec_())
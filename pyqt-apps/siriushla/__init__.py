@@ -5,6 +5,10 @@ with open(_os.path.join(__path__[0], 'VERSION'), 'r') as _f:
     __version__ = _f.read().strip()
 del _os
 
+# handle --profile-startup before other siriushla modules are imported
+from .startup import profile_from_argv as _profile_from_argv
+_profile_from_argv()
+
 
 _all_ = [
     'as_ap_configdb',
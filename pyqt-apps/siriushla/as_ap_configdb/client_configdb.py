@@ -1,6 +1,7 @@
 """Window to manage configurations."""
 import logging
 import time
+from functools import partial as _part
 
 from qtpy.QtWidgets import QGridLayout, QHBoxLayout, QVBoxLayout, \
     QWidget, QFrame, QLabel, QComboBox, QPushButton, QMessageBox, QTabWidget, \
@@ -9,7 +10,7 @@ from qtpy.QtCore import Qt, Slot, QModelIndex, QAbstractItemModel
 
 from siriuspy.clientconfigdb import ConfigDBException
 from siriushla.widgets.windows import SiriusMainWindow
-from .models import ConfigTypeModel, ConfigDbTableModel
+from .models import ConfigTypeModel, ConfigDbTableModel, ConfigDBFetcher
 from .configdialogs import RenameConfigDialog
 
 
@@ -56,11 +57,23 @@ class TreeItem:
 class JsonTreeModel(QAbstractItemModel):
     """Model for a tree that represent a JSON document."""
 
-    def __init__(self, config_type, name, connection, parent=None):
-        """Set model data."""
+    def __init__(self, config_type, name, connection, parent=None,
+                 fetcher=None):
+        """Set model data.
+
+        If no fetcher is given, one is created and shut down when the
+        model is destroyed.
+        """
         super().__init__(parent)
         self._rootItem = TreeItem(['Key', 'Value'], None)
         self._connection = connection
+        if fetcher is None:
+            fetcher = ConfigDBFetcher(connection, self)
+            self.destroyed.connect(fetcher.shutdown)
+        self._fetcher = fetcher
+        self._channel = 'tree{}'.format(id(self))
+        self._fetcher.fetched.connect(self._configs_fetched)
+        self._fetcher.failed.connect(self._fetch_failed)
         self.setupModelData([(config_type, name)])
 
     def index(self, row, column, parent):
@@ -137,31 +150,47 @@ class JsonTreeModel(QAbstractItemModel):
 
         return None
 
-    def setupModelData(self, config_list):
-        """Set model data."""
-        # Parse json data to python structures
-        configs = list()
-        for config_type, name in config_list:
-            if not config_type:
-                continue
-            try:
-                request = self._connection.get_config_info(
-                    name, config_type=config_type)
-                request['value'] = self._connection.get_config_value(
-                    name, config_type=config_type)
-                if 'modified' in request:
-                    request['modified'] = \
-                        [time.strftime(
-                            '%d/%m/%Y %H:%M:%S', time.localtime(float(t)))
-                         for t in request['modified']]
-                    request['created'] = time.strftime(
-                            '%d/%m/%Y %H:%M:%S', time.localtime(float(
-                                request['created'])))
-                configs.append(request)
-            except ConfigDBException as err:
-                configs.append(err.server_code)
+    def setupModelData(self, config_list, discarded=False):
+        """Request model data. The tree is filled when it arrives.
+
+        Requests still pending are dropped.
+        """
+        config_list = [conf for conf in config_list if conf[0]]
+        if not config_list:
+            self._fetcher.cancel(self._channel)
+            self._fillTree([])
+            return
+        self._fetcher.get_configs(
+            self._channel, config_list, discarded=discarded)
+
+    def _configs_fetched(self, channel, req_id, configs):
+        if channel != self._channel:
+            return
+        # configurations are cached, so format copies of them
+        configs = [self._format_config(conf) for conf in configs]
         self._fillTree(configs)
 
+    def _fetch_failed(self, channel, req_id, err):
+        if channel != self._channel:
+            return
+        self._fillTree([])
+        QMessageBox.warning(self.parent(), 'Error', str(err))
+
+    @staticmethod
+    def _format_config(config):
+        if not isinstance(config, dict):
+            return config
+        config = dict(config)
+        if 'modified' in config:
+            config['modified'] = \
+                [time.strftime(
+                    '%d/%m/%Y %H:%M:%S', time.localtime(float(t)))
+                 for t in config['modified']]
+            config['created'] = time.strftime(
+                    '%d/%m/%Y %H:%M:%S', time.localtime(float(
+                        config['created'])))
+        return config
+
     def _fillTree(self, config):
         """Fill tree."""
         self.beginResetModel()
@@ -313,8 +342,11 @@ class ConfigurationManager(SiriusMainWindow):
         self.layout.setColumnStretch(2, 2)
 
         # Set table models and options
-        self.editor_model = ConfigDbTableModel('notexist', self._model)
-        self.d_editor_model = ConfigDbTableModel('notexist', self._model, True)
+        self._fetcher = ConfigDBFetcher(self._model, self)
+        self.editor_model = ConfigDbTableModel(
+            'notexist', self._model, fetcher=self._fetcher)
+        self.d_editor_model = ConfigDbTableModel(
+            'notexist', self._model, True, fetcher=self._fetcher)
         self.editor.setModel(self.editor_model)
         self.editor.setSelectionBehavior(self.editor.SelectRows)
         self.editor.setSortingEnabled(True)
@@ -325,7 +357,8 @@ class ConfigurationManager(SiriusMainWindow):
         self.d_editor.horizontalHeader().setResizeMode(QHeaderView.Stretch)
         self.d_editor.setSelectionMode(self.d_editor.SingleSelection)
         # Set tree model and options
-        self.tree_model = JsonTreeModel(None, None, self._model)
+        self.tree_model = JsonTreeModel(
+            None, None, self._model, fetcher=self._fetcher)
         self.tree.setModel(self.tree_model)
         # Delete button
         self.delete_button.setEnabled(False)
@@ -338,6 +371,10 @@ class ConfigurationManager(SiriusMainWindow):
         self.editor_tab.currentChanged.connect(self._tab_changed)
         # Fill tables when configuration is selected
         self.config_type.currentTextChanged.connect(self._fill_table)
+        self.editor_model.modelReset.connect(_part(
+            self._table_loaded, self.editor, self.nr_configs))
+        self.d_editor_model.modelReset.connect(_part(
+            self._table_loaded, self.d_editor, self.nr_discarded))
         # Fill tree when a configuration is selected
         self.editor.selectionModel().selectionChanged.connect(
             lambda x, y: self._fill_tree())
@@ -365,19 +402,14 @@ class ConfigurationManager(SiriusMainWindow):
     @Slot(str)
     def _fill_table(self, config_type):
         """Fill table with configuration of `config_type`."""
-        leng = len(self._model.find_configs(
-            config_type=config_type, discarded=False))
-        self.nr_configs.setText(str(leng))
-        leng = len(self._model.find_configs(
-            config_type=config_type, discarded=True))
-        self.nr_discarded.setText(str(leng))
-
-        self.editor_model.setupModelData(config_type)
-        self.d_editor_model.setupModelData(config_type)
-        self.editor.resizeColumnsToContents()
-        self.d_editor.resizeColumnsToContents()
         self.editor_model.sort(2, Qt.DescendingOrder)
         self.d_editor_model.sort(2, Qt.DescendingOrder)
+        self.editor_model.setupModelData(config_type)
+        self.d_editor_model.setupModelData(config_type)
+
+    def _table_loaded(self, table, label):
+        label.setText(str(table.model().rowCount(QModelIndex())))
+        table.resizeColumnsToContents()
 
     @Slot()
     def _fill_tree(self):
@@ -390,6 +422,7 @@ class ConfigurationManager(SiriusMainWindow):
                 configs.append(self._type_name(row, self.editor_model))
             # Set tree data
             self.tree_model.setupModelData(configs)
+            self._prefetch_neighbours(rows)
             if len(configs) == 1:
                 self.delete_button.setEnabled(True)
                 self.delete_button.setText(
@@ -418,11 +451,22 @@ class ConfigurationManager(SiriusMainWindow):
                 self.retrieve_button.style().polish(self.retrieve_button)
             else:
                 config_type, name = self._type_name(row, self.d_editor_model)
-                self.tree_model.setupModelData([(config_type, name)])
+                self.tree_model.setupModelData(
+                    [(config_type, name)], discarded=True)
                 self.retrieve_button.setEnabled(True)
                 self.retrieve_button.style().polish(self.retrieve_button)
         # self.tree.resizeColumnsToContents()
 
+    def _prefetch_neighbours(self, rows, nr_rows=2):
+        """Prefetch configurations next to the selected rows."""
+        if not rows:
+            return
+        first = max(min(rows) - nr_rows, 0)
+        last = min(max(rows) + nr_rows + 1, self.editor_model.rowCount(None))
+        neighbours = set(range(first, last)) - set(rows)
+        self._fetcher.prefetch(
+            [self.editor_model.config(row) for row in sorted(neighbours)])
+
     @Slot()
     def _remove_configuration(self):
         type = QMessageBox.Question
@@ -518,6 +562,11 @@ class ConfigurationManager(SiriusMainWindow):
         msg = '{}: {}, while trying to {}'.format(code, message, operation)
         QMessageBox(type, title, msg).exec_()
 
+    def closeEvent(self, event):
+        """Stop fetching configurations."""
+        self._fetcher.shutdown()
+        super().closeEvent(event)
+
     def _get_selected_rows(self, table):
         index_list = table.selectionModel().selectedIndexes()
         return {idx.row() for idx in index_list}
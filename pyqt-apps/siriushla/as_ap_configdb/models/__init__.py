@@ -4,3 +4,4 @@ from .config_names_model import ConfigNamesModel
 from .config_types_model import ConfigTypeModel, ConfigPVsTypeModel
 from .pv_configuration_model import PVConfigurationTableModel
 from .config_db_table_model import ConfigDbTableModel
+from .config_fetcher import ConfigDBFetcher, LRUCache
@@ -6,6 +6,7 @@ from qtpy.QtCore import Qt, Signal, QAbstractTableModel, \
 from qtpy.QtWidgets import QMessageBox
 
 from siriuspy.clientconfigdb import ConfigDBException
+from .config_fetcher import ConfigDBFetcher
 
 
 class ConfigDbTableModel(QAbstractTableModel):
@@ -15,14 +16,39 @@ class ConfigDbTableModel(QAbstractTableModel):
     connectionError = Signal(int, str, str)
     horizontalHeader = ('config_type', 'name', 'created', 'modified')
 
-    def __init__(self, config_type, client, discarded=False, parent=None):
-        """Constructor."""
+    def __init__(self, config_type, client, discarded=False, parent=None,
+                 fetcher=None):
+        """Constructor.
+
+        Configurations are listed asynchronously by fetcher, which may be
+        shared with other models of the same client. If no fetcher is
+        given, one is created and shut down when the model is destroyed.
+        """
         super().__init__(parent)
         self._client = client
         self._discarded = discarded
         self._config_type = config_type
+        self._configs = []
+        self._sorting = None
+        if fetcher is None:
+            fetcher = ConfigDBFetcher(client, self)
+            self.destroyed.connect(fetcher.shutdown)
+        self._fetcher = fetcher
+        self._channel = 'table{}'.format(id(self))
+        self._fetcher.fetched.connect(self._configs_fetched)
+        self._fetcher.failed.connect(self._fetch_failed)
         self.setupModelData(config_type)
 
+    @property
+    def fetcher(self):
+        """Configuration database fetcher."""
+        return self._fetcher
+
+    @property
+    def discarded(self):
+        """Whether model shows discarded configurations."""
+        return self._discarded
+
     @property
     def config_type(self):
         """Configuration type name."""
@@ -73,28 +99,50 @@ class ConfigDbTableModel(QAbstractTableModel):
         return None
 
     def setupModelData(self, config_type, discarded=False):
-        """Set model data."""
+        """Request model data. The model is reset when it arrives."""
+        self._fetcher.find_configs(
+            self._channel, config_type, discarded=self._discarded)
+
+    def config(self, row):
+        """Return (config_type, name) of row."""
+        config = self._configs[row]
+        return config['config_type'], config['name']
+
+    def _configs_fetched(self, channel, req_id, configs):
+        if channel != self._channel:
+            return
         self.beginResetModel()
-        try:
-            self._configs = self._client.find_configs(
-                config_type=config_type, discarded=self._discarded)
-        except ConfigDBException as err:
-            self._configs = []
-            QMessageBox.warning(self.parent(), 'Error', str(err))
+        self._configs = configs
+        self._sort_configs()
         self.endResetModel()
 
+    def _fetch_failed(self, channel, req_id, err):
+        if channel != self._channel:
+            return
+        self.beginResetModel()
+        self._configs = []
+        self.endResetModel()
+        QMessageBox.warning(self.parent(), 'Error', str(err))
+
     def sort(self, column, order=Qt.AscendingOrder):
-        """Sort model by column."""
+        """Sort model by column. Sorting is kept when data is updated."""
+        self._sorting = (column, order)
+        self.beginResetModel()
+        self._sort_configs()
+        self.endResetModel()
+
+    def _sort_configs(self):
+        if self._sorting is None:
+            return
+        column, order = self._sorting
         col = self.horizontalHeader[column]
         reverse = False if order == Qt.AscendingOrder else True
-        self.beginResetModel()
         if col in ('config_type', 'name'):
             self._configs.sort(key=lambda x: x[col].lower(), reverse=reverse)
         elif col == 'modified':
             self._configs.sort(key=lambda x: len(x[col]), reverse=reverse)
         else:
             self._configs.sort(key=lambda x: x[col], reverse=reverse)
-        self.endResetModel()
 
     def flags(self, index):
         """Override to make cells editable."""
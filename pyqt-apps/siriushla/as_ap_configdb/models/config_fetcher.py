@@ -0,0 +1,215 @@
+"""Asynchronous access to the configuration database."""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from qtpy.QtCore import QObject, Signal, Slot
+
+from siriuspy.clientconfigdb import ConfigDBException
+
+
+class LRUCache:
+    """Thread safe dictionary that drops the least recently used entries."""
+
+    def __init__(self, maxsize=128):
+        """Constructor."""
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        """Return number of entries."""
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Return whether key is cached."""
+        with self._lock:
+            return key in self._data
+
+    def get(self, key, default=None):
+        """Return value of key, marking it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        """Add value to cache, dropping the oldest entry if it is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class ConfigDBFetcher(QObject):
+    """Fetch data from the configuration database in worker threads.
+
+    Requests are grouped in channels: a new request in a channel cancels
+    the pending ones and results of superseded requests are never
+    delivered. Results are delivered in the thread of the fetcher through
+    the fetched and failed signals.
+
+    Configuration values are kept in a LRU cache keyed by
+    (config_type, name, discarded, modified timestamp). The metadata of a
+    configuration is requested every time it is fetched, so values are
+    only requested again after the configuration is modified.
+    """
+
+    MAX_WORKERS = 4
+    CACHE_SIZE = 64
+
+    # channel, request id, result
+    fetched = Signal(str, int, object)
+    # channel, request id, exception
+    failed = Signal(str, int, object)
+    _done = Signal(str, int, bool, object)
+
+    def __init__(self, client, parent=None):
+        """Constructor."""
+        super().__init__(parent)
+        self._client = client
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        self._lock = Lock()
+        self._request_ids = dict()
+        self._futures = dict()
+        self._prefetching = set()
+        self._cache = LRUCache(self.CACHE_SIZE)
+        self._done.connect(self._deliver)
+
+    @property
+    def client(self):
+        """Configuration database client."""
+        return self._client
+
+    @property
+    def cache(self):
+        """Cache of configuration values."""
+        return self._cache
+
+    def request(self, channel, func, *args, **kwargs):
+        """Run func(*args, **kwargs) in a worker, superseding channel.
+
+        Return the request id, delivered along with the result.
+        """
+        with self._lock:
+            req_id = self._request_ids.get(channel, 0) + 1
+            self._request_ids[channel] = req_id
+            future = self._futures.pop(channel, None)
+            if future is not None:
+                future.cancel()
+            self._futures[channel] = self._executor.submit(
+                self._run, channel, req_id, func, args, kwargs)
+        return req_id
+
+    def cancel(self, channel):
+        """Cancel pending request of channel and drop its result."""
+        with self._lock:
+            self._request_ids[channel] = self._request_ids.get(channel, 0) + 1
+            future = self._futures.pop(channel, None)
+        if future is not None:
+            future.cancel()
+
+    def is_current(self, channel, req_id):
+        """Return whether req_id is the last request of channel."""
+        with self._lock:
+            return self._request_ids.get(channel) == req_id
+
+    def find_configs(self, channel, config_type, discarded=False):
+        """Request list of configurations of config_type."""
+        return self.request(
+            channel, self._find_configs, config_type, discarded)
+
+    def get_configs(self, channel, configs, discarded=False):
+        """Request info and value of configs, a list of (type, name).
+
+        The result is a list where failed configurations are replaced by
+        the server error code.
+        """
+        return self.request(channel, self._get_configs, configs, discarded)
+
+    def prefetch(self, configs, discarded=False):
+        """Fetch configs, a list of (type, name), into the cache."""
+        for config_type, name in configs:
+            key = (config_type, name, discarded)
+            with self._lock:
+                if key in self._prefetching:
+                    continue
+                self._prefetching.add(key)
+            self._executor.submit(self._prefetch, key)
+
+    def shutdown(self):
+        """Cancel pending requests and stop workers."""
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+            self._request_ids.clear()
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    # --- run in worker threads ---
+
+    def _run(self, channel, req_id, func, args, kwargs):
+        if not self.is_current(channel, req_id):
+            return
+        try:
+            result = func(*args, **kwargs)
+        except Exception as err:
+            self._done.emit(channel, req_id, False, err)
+        else:
+            self._done.emit(channel, req_id, True, result)
+
+    def _find_configs(self, config_type, discarded):
+        return self._client.find_configs(
+            config_type=config_type, discarded=discarded)
+
+    def _get_config(self, config_type, name, discarded=False):
+        info = self._client.get_config_info(
+            name, config_type=config_type, discarded=discarded)
+        cache_key = (config_type, name, discarded, info['modified'][-1])
+        config = self._cache.get(cache_key)
+        if config is None:
+            config = dict(info)
+            config['value'] = self._client.get_config_value(
+                name, config_type=config_type, discarded=discarded)
+            self._cache.put(cache_key, config)
+        return config
+
+    def _get_configs(self, configs, discarded):
+        results = list()
+        for config_type, name in configs:
+            try:
+                results.append(
+                    self._get_config(config_type, name, discarded))
+            except ConfigDBException as err:
+                results.append(err.server_code)
+        return results
+
+    def _prefetch(self, key):
+        try:
+            self._get_config(*key)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._prefetching.discard(key)
+
+    # --- run in the fetcher thread ---
+
+    @Slot(str, int, bool, object)
+    def _deliver(self, channel, req_id, success, result):
+        with self._lock:
+            if self._request_ids.get(channel) != req_id:
+                return
+            self._futures.pop(channel, None)
+        if success:
+            self.fetched.emit(channel, req_id, result)
+        else:
+            self.failed.emit(channel, req_id, result)
@@ -9,8 +9,8 @@ import qtawesome as qta
 
 from siriuspy.clientconfigdb import ConfigDBException
 from siriushla.common.epics.wrapper import PyEpicsWrapper
-from siriushla.common.epics.task import EpicsChecker, EpicsSetter, \
-    EpicsConnector, EpicsWait
+from siriushla.common.epics.task import EpicsSetter, EpicsConnector, \
+    EpicsConvergenceWatcher
 from siriushla.widgets.windows import SiriusMainWindow
 from siriushla.widgets.pvnames_tree import PVNameTree
 from siriushla.widgets.dialog import ReportDialog, ProgressDialog
@@ -94,19 +94,17 @@ class SelectAndApplyPVsWidget(QWidget):
         conn_task = EpicsConnector(pvs, self._wrapper, self)
         set_task = EpicsSetter(pvs, values, delays, self._wrapper, self)
         pvs, values, delays = zip(*check_pvs_tuple)
-        check_task = EpicsChecker(pvs, values, delays, self._wrapper, self)
+        check_task = EpicsConvergenceWatcher(
+            pvs, values, delays, self._wrapper, self, readbacks=pvs)
         check_task.itemChecked.connect(
             lambda pv, status: failed_items.append(pv) if not status else None)
 
-        sleep_task = EpicsWait(pvs, wait_time=2.0, parent=self)
-
         # Set/Check PVs values and show wait dialog informing user
         labels = [
             'Connecting with PVs',
             'Setting PV values',
-            'Waiting IOCs updates',
-            'Checking PV values']
-        tasks = [conn_task, set_task, sleep_task, check_task]
+            'Waiting PV readbacks']
+        tasks = [conn_task, set_task, check_task]
         self.logger.debug(
             'Setting {} configuration'.format(self._current_config['name']))
         dlg = ProgressDialog(labels, tasks, self)
@@ -8,7 +8,7 @@ from pydm.widgets import PyDMLabel
 
 from siriuspy.envars import VACA_PREFIX as _VACA_PREFIX
 from siriushla.common.epics.task import EpicsConnector, EpicsSetter, \
-    EpicsChecker, EpicsGetter, EpicsWait
+    EpicsGetter, EpicsConvergenceWatcher, get_readback_name
 from siriushla.widgets.dialog import ReportDialog, ProgressDialog
 from siriushla.widgets.pvnames_tree import PVNameTree
 from siriushla.util import get_appropriate_color
@@ -19,6 +19,9 @@ from .set_energy import init_section
 class EnergyButton(QWidget):
     """Set dipole energy."""
 
+    # strength readbacks are computed from the power supplies currents
+    RTOL = 1e-5
+
     def __init__(self, section, parent=None):
         """Setups widget interface."""
         super().__init__(parent)
@@ -150,14 +153,14 @@ class EnergyButton(QWidget):
         dly_dips = [0.0, ] * len(self.dips)
         conn = EpicsConnector(self.dips, parent=self)
         set_dip = EpicsSetter(self.dips, energies, dly_dips, parent=self)
-        sleep_task = EpicsWait([None, ]*10, wait_time=2.0, parent=self)
-        check_dip = EpicsChecker(self.dips, energies, dly_dips, parent=self)
+        check_dip = EpicsConvergenceWatcher(
+            self.dips, energies, dly_dips, parent=self, rtol=self.RTOL,
+            readbacks=[get_readback_name(pvn) for pvn in self.dips])
         check_dip.itemChecked.connect(self._check_status)
 
         dlg = ProgressDialog(
-            ['Connecting', 'Setting Dipole', 'Waiting Dipole',
-             'Checking Dipole'],
-            [conn, set_dip, sleep_task, check_dip], parent=self)
+            ['Connecting', 'Setting Dipole', 'Waiting Dipole'],
+            [conn, set_dip, check_dip], parent=self)
         ret = dlg.exec_()
         if ret == dlg.Rejected:
             return
@@ -169,14 +172,14 @@ class EnergyButton(QWidget):
 
         conn = EpicsConnector(pvs, parent=self)
         set_mags = EpicsSetter(pvs, values, delays, parent=self)
-        sleep_task = EpicsWait([None, ]*10, wait_time=2.0, parent=self)
-        check_mags = EpicsChecker(pvs, values, delays, parent=self)
+        check_mags = EpicsConvergenceWatcher(
+            pvs, values, delays, parent=self, rtol=self.RTOL,
+            readbacks=[get_readback_name(pvn) for pvn in pvs])
         check_mags.itemChecked.connect(self._check_status)
 
         dlg = ProgressDialog(
-            ['Connecting to Magnets', 'Setting Magnets', 'Waiting Magnets',
-             'Checking Magnets'],
-            [conn, set_mags, sleep_task, check_mags], parent=self)
+            ['Connecting to Magnets', 'Setting Magnets', 'Waiting Magnets'],
+            [conn, set_mags, check_mags], parent=self)
         ret = dlg.exec_()
         if ret == dlg.Rejected:
             return
@@ -1,11 +1,11 @@
 import time as _time
-from epics import PV as _PV
 
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QPushButton, QMessageBox
 import qtawesome as qta
 
 from siriuspy.envars import VACA_PREFIX as _vaca_prefix
+from siriushla.common.epics import get_pv as _get_pv
 
 
 class RFKillBeamHandler:
@@ -30,7 +30,9 @@ class RFKillBeamHandler:
             'SR-RF-DLLRF-01:mV:AL:REF',
             'SR-RF-DLLRF-01:mV:AL:REF:S'}
         for pvn in pvnames:
-            _pvs[pvn] = _PV(_vaca_prefix+pvn, connection_timeout=0.05)
+            if pvn in RFKillBeamHandler._pvs:
+                continue
+            _pvs[pvn] = _get_pv(_vaca_prefix+pvn, connection_timeout=0.05)
 
         RFKillBeamHandler._pvs.update(_pvs)
 
@@ -2,21 +2,19 @@
 
 """Mock application launcher."""
 
-from epics import PV as _PV
-
 from qtpy.QtWidgets import QVBoxLayout, QMessageBox, QMenuBar, \
     QMenu, QHBoxLayout, QWidget, QPushButton, QAction, QGroupBox, \
     QInputDialog
 import qtawesome as qta
 
 from siriuspy.envars import VACA_PREFIX as _prefix
-from siriuspy.clientconfigdb import ConfigDBClient
 from siriuspy.search import PSSearch, IDSearch
 from siriuspy.namesys import SiriusPVName
 
 from siriushla import util
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.widgets.windows import create_window_from_widget
-from siriushla.as_ap_configdb.pvsconfigs import SelectAndApplyPVsWidget
 from siriushla.as_di_scrns.list_scrns import get_scrn_list
 from siriushla.as_di_dccts.main import get_dcct_list
 
@@ -744,7 +742,7 @@ def get_object(ismenubar=True, parent=None):
                 'or cancel to not set it: ',
                 value=0.7, min=0.0, max=1.5, decimals=3)
             if ok:
-                fila_pv = _PV(
+                fila_pv = _get_pv(
                     _prefix+'LI-01:EG-FilaPS:currentoutsoft',
                     connection_timeout=0.05)
                 fila_pv.get()  # force connection
@@ -754,7 +752,12 @@ def get_object(ismenubar=True, parent=None):
                     QMessageBox.warning(
                         self, 'Message',
                         'Could not connect to LI-01:EG-FilaPS!')
+                _release_pv(fila_pv)
 
+            # imported here, as they are only needed to apply configurations
+            from siriuspy.clientconfigdb import ConfigDBClient
+            from siriushla.as_ap_configdb.pvsconfigs import \
+                SelectAndApplyPVsWidget
             client = ConfigDBClient()
 
             WinClass = create_window_from_widget(
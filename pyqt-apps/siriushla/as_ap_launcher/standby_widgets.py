@@ -1,5 +1,4 @@
 import time as _time
-from epics import PV as _PV
 
 from qtpy.QtWidgets import QWidget, QHBoxLayout, QPushButton, QMessageBox
 from qtpy.QtCore import Slot
@@ -15,6 +14,7 @@ from siriuspy.search import PSSearch, HLTimeSearch
 from siriuspy.timesys.csdev import Const as TIConst
 from siriuspy.pwrsupply.csdev import Const as PSConst
 
+from siriushla.common.epics import get_pv as _get_pv
 from siriushla.widgets import PyDMLedMultiChannel, PyDMLed, QLed
 from siriushla.widgets.led import MultiChannelStatusDialog
 from siriushla.widgets.dialog import PSStatusDialog
@@ -93,15 +93,14 @@ class BoRampStandbyHandler:
         _pvs = dict()
 
         pspropties = ['OpMode-Sel', 'OpMode-Sts', 'Current-SP', 'Current-RB']
-        for psn in self._psnames:
-            for propty in pspropties:
-                pvname = psn+':'+propty
-                _pvs[pvname] = _PV(
-                    _vaca_prefix+pvname, connection_timeout=0.05)
-
-        for trg in self._triggers:
-            pvname = trg+':State-Sts'
-            _pvs[pvname] = _PV(_vaca_prefix+pvname, connection_timeout=0.05)
+        pvnames = [psn+':'+propty
+                   for psn in self._psnames for propty in pspropties]
+        pvnames += [trg+':State-Sts' for trg in self._triggers]
+        for pvname in pvnames:
+            if pvname in BoRampStandbyHandler._pvs:
+                continue
+            _pvs[pvname] = _get_pv(
+                _vaca_prefix+pvname, connection_timeout=0.05)
 
         BoRampStandbyHandler._pvs.update(_pvs)
 
@@ -323,17 +322,12 @@ class InjSysStandbyStatusLed(PyDMLedMultiChannel):
     def _update_statuses(self):
         if not self._connected:
             state = 3
+        elif self._nr_bad == len(self._address2status):
+            state = 0
+        elif self._nr_bad > 0:
+            state = 2
         else:
-            status_off = 0
-            for status in self._address2status.values():
-                if status == 'UNDEF' or not status:
-                    status_off += 1
-            if status_off == len(self._address2status.values()):
-                state = 0
-            elif status_off > 0:
-                state = 2
-            else:
-                state = 1
+            state = 1
         self.setState(state)
 
     def mouseDoubleClickEvent(self, ev):
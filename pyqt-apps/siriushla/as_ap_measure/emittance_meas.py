@@ -1,10 +1,10 @@
 #!/usr/bin/env python-sirius
 
+import time as _time
 import logging as _log
 from threading import Thread, Event
+from functools import partial as _part
 import numpy as np
-from scipy.optimize import curve_fit
-from epics import PV
 
 from matplotlib import rcParams
 
@@ -12,7 +12,7 @@ from qtpy.QtWidgets import QPushButton, QLabel, QGridLayout, QGroupBox, \
     QFormLayout, QMessageBox, QWidget, QComboBox, QSpinBox, QVBoxLayout, \
     QDoubleSpinBox, QFileDialog, QHBoxLayout, QSizePolicy, QCheckBox
 from qtpy.QtGui import QColor
-from qtpy.QtCore import Qt, QSize, Slot
+from qtpy.QtCore import Qt, QSize, Slot, Signal
 
 from pyqtgraph import PlotCurveItem, mkPen
 
@@ -22,14 +22,25 @@ from pydm.widgets.logdisplay import PyDMLogDisplay
 import mathphys.constants as _consts
 from siriuspy.magnet.factory import NormalizerFactory as _NormFact
 
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.widgets import SiriusSpinbox, SiriusLabel, MatplotlibWidget
 from siriushla.as_ti_control import HLTriggerSimple
 
+from .profile_analysis import ProfileWorker, ProfileSettings, \
+    gaussian as _gaussian
+
 rcParams['font.size'] = 9
 
 DT = 0.001
 SIMUL = False
 
+
+def _release_pvs(pvs):
+    """Release PVs taken from the pool."""
+    for pv in pvs:
+        _release_pv(pv)
+
 C = _consts.light_speed
 E0 = _consts.electron_rest_energy / _consts.elementary_charge * 1e-6  # [MeV]
 
@@ -43,6 +54,11 @@ class EmittanceMeasure(QWidget):
         self._place = place or 'LI'
         self.setObjectName(self._place[0:2] + 'App')
         self._select_experimental_setup()
+        # stop measurement and release PVs when destroyed
+        self._measuring = Event()
+        self.destroyed.connect(self._measuring.set)
+        self.destroyed.connect(
+            _part(_release_pvs, [self.quad_I_sp, self.quad_I_rb]))
         self.nemitx_tm = []
         self.nemity_tm = []
         self.nemitx_parf = []
@@ -70,22 +86,22 @@ class EmittanceMeasure(QWidget):
         if self._place.lower().startswith('li'):
             self.plt_image = ProcessImage(self, place='LI-Emittance')
             self.conv2kl = _NormFact.create('LI-01:MA-QF3')
-            self.quad_I_sp = PV('LI-01:PS-QF3:Current-SP')
-            self.quad_I_rb = PV('LI-01:PS-QF3:Current-Mon')
+            self.quad_I_sp = _get_pv('LI-01:PS-QF3:Current-SP')
+            self.quad_I_rb = _get_pv('LI-01:PS-QF3:Current-Mon')
             self.DIST = 2.8775
             self.QUAD_L = 0.112
         if self._place.lower().startswith('tb-qd2a'):
             self.plt_image = ProcessImage(self, place='TB-Emittance')
             self.conv2kl = _NormFact.create('TB-02:MA-QD2A')
-            self.quad_I_sp = PV('TB-02:PS-QD2A:Current-SP')
-            self.quad_I_rb = PV('TB-02:PS-QD2A:Current-RB')
+            self.quad_I_sp = _get_pv('TB-02:PS-QD2A:Current-SP')
+            self.quad_I_rb = _get_pv('TB-02:PS-QD2A:Current-RB')
             self.DIST = 6.904
             self.QUAD_L = 0.1
         if self._place.lower().startswith('tb-qf2a'):
             self.plt_image = ProcessImage(self, place='TB-Emittance')
             self.conv2kl = _NormFact.create('TB-02:MA-QF2A')
-            self.quad_I_sp = PV('TB-02:PS-QF2A:Current-SP')
-            self.quad_I_rb = PV('TB-02:PS-QF2A:Current-RB')
+            self.quad_I_sp = _get_pv('TB-02:PS-QF2A:Current-SP')
+            self.quad_I_rb = _get_pv('TB-02:PS-QF2A:Current-RB')
             self.DIST = 6.534
             self.QUAD_L = 0.1
 
@@ -122,27 +138,31 @@ class EmittanceMeasure(QWidget):
             if not SIMUL:
                 self.quad_I_sp.put(I, wait=True)
             self._measuring.wait(5 if i else 15)
-            j = 0
+            # use only frames analysed after the quadrupole settled
+            settled = _time.time()
+            seq = self.plt_image.worker.last_seq
             I_tmp = []
             sig_tmp = []
-            while j < samples:
+            while len(sig_tmp) < samples:
                 if self._measuring.is_set():
                     self.pb_stop.setEnabled(False)
                     self.pb_start.setEnabled(True)
                     _log.info('Stopped')
                     return
-                _log.info('    sample {0:02d}'.format(j))
+                records = self.plt_image.worker.wait_records(seq, timeout=1)
                 I_now = self.quad_I_rb.value
-                cen_x, sigma_x, cen_y, sigma_y = self.plt_image.get_params()
-                mu, sig = (cen_x, sigma_x) if pl == 'x' else (cen_y, sigma_y)
                 max_size = self.spbox_threshold.value()*1e-3
-                if sig > max_size:
-                    self._measuring.wait(1)
-                    continue
-                I_tmp.append(I_now)
-                sig_tmp.append(abs(sig))
-                self._measuring.wait(0.5)
-                j += 1
+                for rec in records:
+                    seq = rec.seq
+                    sig = rec.sigma_x if pl == 'x' else rec.sigma_y
+                    if rec.timestamp < settled or sig is None or \
+                            sig > max_size:
+                        continue
+                    _log.info('    sample {0:02d}'.format(len(sig_tmp)))
+                    I_tmp.append(I_now)
+                    sig_tmp.append(abs(sig))
+                    if len(sig_tmp) >= samples:
+                        break
             ind = np.argsort(sig_tmp)
             I_tmp = np.array(I_tmp)[ind]
             sig_tmp = np.array(sig_tmp)[ind]
@@ -525,7 +545,7 @@ class EmittanceMeasure(QWidget):
             return
         self.pb_stop.setEnabled(True)
         self.pb_start.setEnabled(False)
-        self._measuring = Event()
+        self._measuring.clear()
         self.measurement = Thread(target=self.meas_emittance, daemon=True)
         self.measurement.start()
 
@@ -570,33 +590,6 @@ def gettransmat(elem, L, K1=None, B=None):
     return R
 
 
-def _calc_moments(axis, proj):
-    dx = axis[1]-axis[0]
-    Norm = np.trapz(proj, dx=dx)
-    cen = np.trapz(proj*axis, dx=dx)/Norm
-    sec = np.trapz(proj*axis*axis, dx=dx)/Norm
-    std = np.sqrt(sec - cen*cen)
-    return cen, std
-
-
-def _gaussian(x, amp, mu, sigma, y0):
-    return amp*np.exp(-(x-mu)**2.0/(2.0*sigma**2.0))+y0
-
-
-def _fit_gaussian(x, y, amp=None, mu=None, sigma=None, y0=None):
-    amp = amp or np.amax(y)
-    par = _calc_moments(x, y)
-    mu = mu or par[0]
-    sigma = sigma or par[1]
-    y0 = y0 or np.mean(y)
-    try:
-        p_opt, p_cov = curve_fit(_gaussian, x, y, (amp, mu, sigma, y0))
-    except Exception:
-        p_opt = (amp, mu, sigma, y0)
-        print('Fitting Problem')
-    return p_opt
-
-
 class ImageView(PyDMImageView):
 
     def __init__(self, callback, **kwargs):
@@ -607,10 +600,23 @@ class ImageView(PyDMImageView):
     @Slot(np.ndarray)
     def image_value_changed(self, image):
         image = self.callback(image, self._image_width)
+        if image is not None:
+            super().image_value_changed(image)
+
+    def show_image(self, image):
         super().image_value_changed(image)
 
 
 class ProcessImage(QWidget):
+    """Show profile images and analyse them in a ProfileWorker.
+
+    The worker publishes a record of each analysed frame, which the
+    measurement consumes with worker.wait_records. Frames are shown after
+    they are analysed.
+    """
+
+    imageAnalysed = Signal(object)
+
     def __init__(self, parent=None, place='LI-Energy'):
         super().__init__(parent)
         self._place = place or 'LI-Energy'
@@ -619,30 +625,33 @@ class ProcessImage(QWidget):
         self.cen_y = None
         self.sigma_x = None
         self.sigma_y = None
-        self.bg_ready = False
-        self.bg = None
-        self.nbg = 0
+        self.imageAnalysed.connect(self._show_analysis)
+        self.worker = ProfileWorker(
+            lambda *args: self.imageAnalysed.emit(args))
+        self.destroyed.connect(self.worker.stop)
+        self.destroyed.connect(
+            _part(_release_pvs, [self.conv_coefx, self.conv_coefy]))
         self._setupUi()
 
     def _select_experimental_setup(self):
         if self._place.lower().startswith('li-ene'):
             prof = 'LA-BI:PRF4'
-            self.conv_coefx = PV(prof + ':X:Gauss:Coef')
-            self.conv_coefy = PV(prof + ':Y:Gauss:Coef')
+            self.conv_coefx = _get_pv(prof + ':X:Gauss:Coef')
+            self.conv_coefy = _get_pv(prof + ':Y:Gauss:Coef')
             self.image_channel = prof + ':RAW:ArrayData'
             self.width_channel = prof + ':ROI:MaxSizeX_RBV'
             self.trig_name = 'LI-Fam:TI-Scrn'
         elif self._place.lower().startswith('li-emit'):
             prof = 'LA-BI:PRF5'
-            self.conv_coefx = PV(prof + ':X:Gauss:Coef')
-            self.conv_coefy = PV(prof + ':Y:Gauss:Coef')
+            self.conv_coefx = _get_pv(prof + ':X:Gauss:Coef')
+            self.conv_coefy = _get_pv(prof + ':Y:Gauss:Coef')
             self.image_channel = prof + ':RAW:ArrayData'
             self.width_channel = prof + ':ROI:MaxSizeX_RBV'
             self.trig_name = 'LI-Fam:TI-Scrn'
         elif self._place.lower().startswith('tb-emit'):
             prof = 'TB-02:DI-ScrnCam-2'
-            self.conv_coefx = PV(prof + ':ImgScaleFactorX-RB')
-            self.conv_coefy = PV(prof + ':ImgScaleFactorY-RB')
+            self.conv_coefx = _get_pv(prof + ':ImgScaleFactorX-RB')
+            self.conv_coefy = _get_pv(prof + ':ImgScaleFactorY-RB')
             prof = 'TB-02:DI-Scrn-2'
             self.image_channel = prof + ':ImgData-Mon'
             self.width_channel = prof + ':ImgROIWidth-RB'
@@ -751,49 +760,32 @@ class ProcessImage(QWidget):
         self.spbox_roi_center_y.setEnabled(not clicked)
 
     def pb_reset_bg_clicked(self, clicked=False):
-        self.bg_ready = False
-        self.bg = None
-        self.nbg = 0
+        self.worker.reset_background()
 
     def cbbox_acq_bg_checked(self, check):
         if check:
             self.pb_reset_bg_clicked()
         else:
-            if self.bg is not None:
-                self.bg /= self.nbg
-                self.bg_ready = True
-
-    def calc_roi(self, image):
-        proj_x = image.sum(axis=0)
-        proj_y = image.sum(axis=1)
-        axis_x = np.arange(image.shape[1])
-        axis_y = np.arange(image.shape[0])
+            self.worker.finish_background()
 
+    def get_settings(self):
+        """Return ProfileSettings of the next frame."""
         if self.cbbox_auto_center.isChecked():
-            cen_x, _ = _calc_moments(axis_x, proj_x)
-            cen_y, _ = _calc_moments(axis_y, proj_y)
+            roi_center = None
         else:
-            cen_x = self.spbox_roi_center_x.value()
-            cen_y = self.spbox_roi_center_y.value()
-
-        roi_size_x = self.spbox_roi_size_x.value()
-        roi_size_y = self.spbox_roi_size_y.value()
-        strt_x, end_x = np.array([-1, 1])*roi_size_x + int(cen_x)
-        strt_y, end_y = np.array([-1, 1])*roi_size_y + int(cen_y)
-        strt_x = max(strt_x, 0)
-        strt_y = max(strt_y, 0)
-        end_x = min(end_x, image.shape[1])
-        end_y = min(end_y, image.shape[0])
-        self.plt_roi.setData(
-            np.array([strt_x, strt_x, end_x, end_x, strt_x]),
-            np.array([strt_y, end_y, end_y, strt_y, strt_y]))
-
-        image = image[strt_y:end_y, strt_x:end_x]
-        proj_x = image.sum(axis=0)
-        proj_y = image.sum(axis=1)
-        axis_x = axis_x[strt_x:end_x]
-        axis_y = axis_y[strt_y:end_y]
-        return proj_x, proj_y, axis_x, axis_y
+            roi_center = (
+                self.spbox_roi_center_x.value(),
+                self.spbox_roi_center_y.value())
+        coefx = self.conv_coefx.value
+        coefy = self.conv_coefy.value
+        return ProfileSettings(
+            method='moments' if self.cbox_method.currentIndex() else 'fit',
+            roi_size=(
+                self.spbox_roi_size_x.value(), self.spbox_roi_size_y.value()),
+            roi_center=roi_center,
+            max_value=self.spbox_img_max.value(),
+            acquire_bg=self.cbbox_acq_bg.isChecked(),
+            coefs=None if coefx is None or coefy is None else (coefx, coefy))
 
     def process_image(self, image, wid):
         if wid <= 0:
@@ -802,39 +794,28 @@ class ProcessImage(QWidget):
             image = image.reshape((-1, wid))
         except (TypeError, ValueError, AttributeError):
             return image
-        if self.cbbox_acq_bg.isChecked():
-            if self.bg is None:
-                self.bg = np.array(image, dtype=float)
-            else:
-                self.bg += np.array(image, dtype=float)
-            self.nbg += 1
-            return image
-        if self.bg_ready:
-            image -= np.array(self.bg, dtype=image.dtype)
-            b = np.where(image < 0)
-            image[b] = 0
-
         maxi = self.spbox_img_max.value()
         if maxi > 0:
-            b = np.where(image > maxi)
             self.image_view.colorMapMax = maxi
-            image[b] = maxi
-
-        proj_x, proj_y, axis_x, axis_y = self.calc_roi(image)
-        x_max = max(proj_x)
-        y_max = max(proj_y)
-        if self.cbox_method.currentIndex():
-            cen_x, std_x = _calc_moments(axis_x, proj_x)
-            cen_y, std_y = _calc_moments(axis_y, proj_y)
-            amp_x = x_max
-            amp_y = y_max
-            off_x = 0
-            off_y = 0
-        else:
-            amp_x, cen_x, std_x, off_x = _fit_gaussian(axis_x, proj_x)
-            amp_y, cen_y, std_y, off_y = _fit_gaussian(axis_y, proj_y)
-        std_x = abs(std_x)
-        std_y = abs(std_y)
+        # the image is shown when its analysis is done
+        self.worker.submit(image, self.get_settings())
+
+    def _show_analysis(self, args):
+        rec, image, proj_x, proj_y = args
+        self.image_view.show_image(image)
+        if rec is None:
+            return
+
+        strt_x, end_x, strt_y, end_y = rec.roi
+        self.plt_roi.setData(
+            np.array([strt_x, strt_x, end_x, end_x, strt_x]),
+            np.array([strt_y, end_y, end_y, strt_y, strt_y]))
+        axis_x = np.arange(strt_x, end_x)
+        axis_y = np.arange(strt_y, end_y)
+        amp_x, cen_x, std_x, off_x = rec.params_x
+        amp_y, cen_y, std_y, off_y = rec.params_y
+        x_max = max(proj_x.max(), 1)
+        y_max = max(proj_y.max(), 1)
         yd = _gaussian(axis_x, amp_x, cen_x, std_x, off_x)/x_max*400
         self.plt_fit_x.setData(axis_x, yd + axis_y[0])
         self.plt_his_x.setData(axis_x, proj_x/x_max*400 + axis_y[0])
@@ -843,26 +824,17 @@ class ProcessImage(QWidget):
         self.plt_fit_y.setData(yd + axis_x[0], axis_y)
         self.plt_his_y.setData(proj_y/y_max*400 + axis_x[0], axis_y)
 
-        offset_x = image.shape[1]/2
-        offset_y = image.shape[0]/2
-        self.lb_xave.setText('{0:4d}'.format(int(cen_x or 0)))
-        self.lb_yave.setText('{0:4d}'.format(int(cen_y or 0)))
-        self.lb_xstd.setText('{0:4d}'.format(int(std_x or 0)))
-        self.lb_ystd.setText('{0:4d}'.format(int(std_y or 0)))
+        self.lb_xave.setText('{0:4d}'.format(int(np.nan_to_num(cen_x))))
+        self.lb_yave.setText('{0:4d}'.format(int(np.nan_to_num(cen_y))))
+        self.lb_xstd.setText('{0:4d}'.format(int(np.nan_to_num(abs(std_x)))))
+        self.lb_ystd.setText('{0:4d}'.format(int(np.nan_to_num(abs(std_y)))))
 
-        coefx = self.conv_coefx.value
-        coefy = self.conv_coefy.value
-        if coefx is None or coefy is None:
+        if rec.cen_x is None:
             return
-
-        cen_x -= offset_x
-        cen_y -= offset_y
-        self.cen_x = cen_x * coefx*1e-3  # transform to meter
-        self.cen_y = cen_y * coefy*1e-3
-        self.sigma_x = std_x * coefx*1e-3
-        self.sigma_y = std_y * coefy*1e-3
-
-        return image
+        self.cen_x = rec.cen_x
+        self.cen_y = rec.cen_y
+        self.sigma_x = rec.sigma_x
+        self.sigma_y = rec.sigma_y
 
     def get_params(self):
         return self.cen_x, self.sigma_x, self.cen_y, self.sigma_y
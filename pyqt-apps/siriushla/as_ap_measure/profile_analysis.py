@@ -0,0 +1,411 @@
+"""Analysis of beam profile images in a worker thread."""
+
+import time as _time
+import logging as _log
+from collections import namedtuple as _namedtuple, deque as _deque
+from threading import Thread as _Thread, Condition as _Condition
+
+import numpy as _np
+
+from siriushla.startup import lazy_import
+
+_scyopt = lazy_import('scipy.optimize')
+
+
+ProfileSettings = _namedtuple('ProfileSettings', (
+    'method', 'roi_size', 'roi_center', 'max_value', 'acquire_bg',
+    'coefs'))
+ProfileSettings.__doc__ = """Analysis settings of one frame.
+
+method - 'fit' for Gaussian fits, 'moments' for statistical moments;
+roi_size - (x, y) half sizes of the region of interest, in pixels;
+roi_center - (x, y) center of the region of interest, in pixels, or None
+    to center it on the beam;
+max_value - pixel values are clipped to max_value, if it is positive;
+acquire_bg - whether the frame is accumulated in the background instead
+    of analysed;
+coefs - (x, y) pixel sizes in mm, or None if they are unknown.
+"""
+
+ProfileRecord = _namedtuple('ProfileRecord', (
+    'seq', 'timestamp', 'cen_x', 'sigma_x', 'cen_y', 'sigma_y',
+    'params_x', 'params_y', 'roi'))
+ProfileRecord.__doc__ = """Analysis result of one frame.
+
+seq - sequence number of the record;
+timestamp - time the frame was received;
+cen_x, sigma_x, cen_y, sigma_y - beam center, relative to the image
+    center, and size in meters, or None if coefs are unknown;
+params_x, params_y - (amplitude, center, sigma, offset), in pixels, of
+    the Gaussians of the horizontal and vertical projections;
+roi - (start x, end x, start y, end y) of the region of interest.
+"""
+
+
+def gaussian(x, amp, mu, sigma, y0):
+    """Gaussian with offset."""
+    return amp*_np.exp(-(x-mu)**2.0/(2.0*sigma**2.0))+y0
+
+
+def _gaussian_jac(x, amp, mu, sigma, y0):
+    dx = x - mu
+    expo = _np.exp(-dx*dx/(2.0*sigma*sigma))
+    jac = _np.empty((x.size, 4))
+    jac[:, 0] = expo
+    jac[:, 1] = amp*expo*dx/(sigma*sigma)
+    jac[:, 2] = jac[:, 1]*dx/sigma
+    jac[:, 3] = 1.0
+    return jac
+
+
+def calc_moments(axis, proj):
+    """Return center and standard deviation of proj."""
+    norm = proj.sum()
+    if norm <= 0:
+        return _np.nan, _np.nan
+    cen = _np.dot(proj, axis)/norm
+    sec = _np.dot(proj, axis*axis)/norm
+    return cen, _np.sqrt(max(sec - cen*cen, 0.0))
+
+
+def fit_gaussian(axis, proj, p0):
+    """Fit Gaussian to proj starting from p0.
+
+    Return fitted (amplitude, center, sigma, offset) and whether the fit
+    converged.
+    """
+    try:
+        p_opt, _ = _scyopt.curve_fit(
+            gaussian, axis, proj, p0, jac=_gaussian_jac)
+    except (RuntimeError, ValueError):
+        return tuple(p0), False
+    return tuple(p_opt), bool(_np.all(_np.isfinite(p_opt)))
+
+
+class ProfileAnalyzer:
+    """Compute beam center and size from profile images.
+
+    Background subtraction and clipping are done in place on the image,
+    with buffers reused between frames of the same shape. Projections are
+    computed only over the region of interest which, if not given, is
+    centered on the beam center found in the previous frame.
+
+    Gaussian fits start from the parameters fitted in the previous frame,
+    falling back to parameters estimated from the moments of the
+    projection when there are none or the fit does not converge.
+
+    Results with the center outside the region of interest, the size
+    below MIN_SIGMA pixels or above the region width, or the amplitude
+    within the noise are rejected: the record has no beam center and
+    size, and the next frame is centered on the whole image again.
+    """
+
+    MIN_SIGMA = 1.0
+    MIN_SNR = 5.0
+
+    def __init__(self):
+        """Init."""
+        self._shape = None
+        self._axis = None
+        self._axis2 = None
+        self._proj_x = None
+        self._proj_y = None
+        self._bg_sum = None
+        self._nr_bg = 0
+        self._bg = None
+        self._bg_tmp = None
+        self._bg_cast = None
+        self._last = None
+
+    @property
+    def nr_bg(self):
+        """Number of frames accumulated in the background."""
+        return self._nr_bg
+
+    @property
+    def has_bg(self):
+        """Whether background is subtracted from frames."""
+        return self._bg is not None
+
+    def reset_background(self):
+        """Discard background."""
+        self._bg_sum = None
+        self._nr_bg = 0
+        self._bg = None
+        self._bg_tmp = None
+
+    def accumulate_background(self, image):
+        """Add image to background."""
+        if self._bg_sum is None or self._bg_sum.shape != image.shape:
+            self._bg_sum = _np.zeros(image.shape)
+            self._nr_bg = 0
+        _np.add(self._bg_sum, image, out=self._bg_sum)
+        self._nr_bg += 1
+
+    def finish_background(self):
+        """Average accumulated frames into the subtracted background."""
+        if not self._nr_bg:
+            return
+        self._bg = self._bg_sum / self._nr_bg
+        self._bg_sum = None
+        self._bg_tmp = None
+
+    def analyse(self, image, settings, seq=0, timestamp=None):
+        """Analyse image in place.
+
+        Return the record and the projections of the region of interest.
+        """
+        timestamp = _time.time() if timestamp is None else timestamp
+        self._setup_buffers(image)
+        self._subtract_background(image)
+        if settings.max_value > 0:
+            _np.minimum(image, settings.max_value, out=image)
+
+        roi = self._calc_roi(image, settings)
+        strt_x, end_x, strt_y, end_y = roi
+        sub = image[strt_y:end_y, strt_x:end_x]
+        proj_x = _np.sum(sub, axis=0, dtype=float,
+                         out=self._proj_x[:end_x-strt_x])
+        proj_y = _np.sum(sub, axis=1, dtype=float,
+                         out=self._proj_y[:end_y-strt_y])
+
+        last = self._last if settings.method == 'fit' else None
+        params_x = self._calc_params(
+            self._axis[strt_x:end_x], self._axis2[strt_x:end_x], proj_x,
+            settings.method, last and last[0])
+        params_y = self._calc_params(
+            self._axis[strt_y:end_y], self._axis2[strt_y:end_y], proj_y,
+            settings.method, last and last[1])
+        valid = self._is_valid(
+            self._axis[strt_x:end_x], proj_x, params_x, settings.method) \
+            and self._is_valid(
+                self._axis[strt_y:end_y], proj_y, params_y, settings.method)
+        self._last = (params_x, params_y) if valid else None
+
+        cen_x = sigma_x = cen_y = sigma_y = None
+        if valid and settings.coefs is not None:
+            coefx, coefy = settings.coefs
+            # transform to meter, relative to image center
+            cen_x = (params_x[1] - image.shape[1]/2) * coefx*1e-3
+            cen_y = (params_y[1] - image.shape[0]/2) * coefy*1e-3
+            sigma_x = abs(params_x[2]) * coefx*1e-3
+            sigma_y = abs(params_y[2]) * coefy*1e-3
+        rec = ProfileRecord(
+            seq, timestamp, cen_x, sigma_x, cen_y, sigma_y,
+            params_x, params_y, roi)
+        return rec, proj_x.copy(), proj_y.copy()
+
+    def _setup_buffers(self, image):
+        if image.shape == self._shape:
+            return
+        self._shape = image.shape
+        size = max(image.shape)
+        self._axis = _np.arange(size, dtype=float)
+        self._axis2 = self._axis*self._axis
+        self._proj_x = _np.empty(image.shape[1])
+        self._proj_y = _np.empty(image.shape[0])
+        self._bg_tmp = None
+        self._last = None
+
+    def _subtract_background(self, image):
+        if self._bg is None or self._bg.shape != image.shape:
+            return
+        if self._bg_tmp is None or self._bg_tmp.dtype != image.dtype:
+            self._bg_tmp = _np.empty(image.shape, dtype=image.dtype)
+            self._bg_cast = self._bg.astype(image.dtype)
+        # image - min(image, bg) avoids wrap around of unsigned pixels
+        _np.minimum(image, self._bg_cast, out=self._bg_tmp)
+        _np.subtract(image, self._bg_tmp, out=image)
+
+    def _calc_roi(self, image, settings):
+        if settings.roi_center is not None:
+            cen_x, cen_y = settings.roi_center
+        elif self._last is not None:
+            cen_x, cen_y = self._last[0][1], self._last[1][1]
+        else:
+            # coarse beam center from the peaks of the projections of a
+            # subsample of the image, which the background does not shift
+            step = max(1, min(image.shape) // 256)
+            sub = image[::step, ::step]
+            proj_x = sub.sum(axis=0, dtype=float)
+            proj_y = sub.sum(axis=1, dtype=float)
+            if proj_x.max() > proj_x.min() and proj_y.max() > proj_y.min():
+                cen_x = _np.argmax(proj_x)*step
+                cen_y = _np.argmax(proj_y)*step
+            else:
+                cen_x, cen_y = image.shape[1]/2, image.shape[0]/2
+
+        size_x, size_y = settings.roi_size
+        strt_x = min(max(int(cen_x) - size_x, 0), image.shape[1] - 1)
+        strt_y = min(max(int(cen_y) - size_y, 0), image.shape[0] - 1)
+        end_x = max(min(int(cen_x) + size_x, image.shape[1]), strt_x + 1)
+        end_y = max(min(int(cen_y) + size_y, image.shape[0]), strt_y + 1)
+        return strt_x, end_x, strt_y, end_y
+
+    @classmethod
+    def _is_valid(cls, axis, proj, params, method):
+        """Whether params describe a beam inside the region of interest.
+
+        The center must lie in the region, the size must be between
+        MIN_SIGMA pixels and the width of the region and, for fits, the
+        amplitude must be MIN_SNR times above the noise of the residue.
+        """
+        amp, cen, sigma, off = params
+        if not _np.all(_np.isfinite(params)):
+            return False
+        if not axis[0] <= cen <= axis[-1]:
+            return False
+        if not cls.MIN_SIGMA <= abs(sigma) <= axis.size:
+            return False
+        if method != 'fit':
+            return True
+        noise = _np.std(proj - gaussian(axis, *params))
+        return amp > cls.MIN_SNR*noise
+
+    @staticmethod
+    def _calc_params(axis, axis2, proj, method, last):
+        if method != 'fit':
+            cen, std = calc_moments(axis, proj)
+            return (proj.max(), cen, std, 0.0)
+        if last is not None:
+            params, conv = fit_gaussian(axis, proj, last)
+            if conv:
+                return params
+        # seed with the moments of the projection above its minimum
+        off = proj.min()
+        amp = proj.max() - off
+        norm = proj.sum() - off*proj.size
+        if norm <= 0:
+            return (amp, _np.nan, _np.nan, off)
+        cen = (_np.dot(proj, axis) - off*axis.sum())/norm
+        sec = (_np.dot(proj, axis2) - off*axis2.sum())/norm
+        std = _np.sqrt(max(sec - cen*cen, 0.0)) or 1.0
+        params, conv = fit_gaussian(axis, proj, (amp, cen, std, off))
+        if not conv:
+            _log.warning('Fitting Problem')
+        return params
+
+
+class ProfileWorker:
+    """Analyse profile images in a worker thread.
+
+    Frames are submitted with their settings and analysed in order of
+    arrival. If frames arrive faster than they are analysed, only the
+    newest pending one is kept and the others are counted as dropped.
+
+    Records of the analysed frames are kept in a bounded history, which
+    consumers read with records or wait_records, and are passed to
+    callback, called in the worker thread as
+
+        callback(record, image, proj_x, proj_y)
+
+    with the analysed image. record is None for frames accumulated in the
+    background.
+    """
+
+    HISTORY_SIZE = 1000
+
+    def __init__(self, callback=None, history_size=HISTORY_SIZE):
+        """Init."""
+        self._callback = callback
+        self._analyzer = ProfileAnalyzer()
+        self._cond = _Condition()
+        self._pending = None
+        self._commands = list()
+        self._history = _deque(maxlen=history_size)
+        self._seq = 0
+        self._nr_dropped = 0
+        self._running = True
+        self._thread = _Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def last_seq(self):
+        """Sequence number of the last record, or 0."""
+        with self._cond:
+            return self._history[-1].seq if self._history else 0
+
+    @property
+    def nr_dropped(self):
+        """Number of frames dropped because the worker was busy."""
+        return self._nr_dropped
+
+    def submit(self, image, settings):
+        """Queue image, which is modified in place, for analysis."""
+        with self._cond:
+            if self._pending is not None:
+                self._nr_dropped += 1
+            self._pending = (image, settings, _time.time())
+            self._cond.notify_all()
+
+    def reset_background(self):
+        """Discard background before analysing the next frame."""
+        self._command(self._analyzer.reset_background)
+
+    def finish_background(self):
+        """Start subtracting the accumulated background."""
+        self._command(self._analyzer.finish_background)
+
+    def records(self, after_seq=0):
+        """Return records in history with sequence number after after_seq."""
+        with self._cond:
+            return [rec for rec in self._history if rec.seq > after_seq]
+
+    def wait_records(self, after_seq=0, timeout=None):
+        """Wait for records after after_seq and return them.
+
+        Return an empty list if there are none after timeout seconds.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: not self._running or (
+                    self._history and self._history[-1].seq > after_seq),
+                timeout)
+            return [rec for rec in self._history if rec.seq > after_seq]
+
+    def stop(self, *args):
+        """Stop worker thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def _command(self, func):
+        with self._cond:
+            self._commands.append(func)
+            self._cond.notify_all()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: not self._running or self._pending is not None
+                    or self._commands)
+                if not self._running:
+                    return
+                commands, self._commands = self._commands, list()
+                pending, self._pending = self._pending, None
+            for func in commands:
+                func()
+            if pending is not None:
+                self._process(*pending)
+
+    def _process(self, image, settings, timestamp):
+        if settings.acquire_bg:
+            self._analyzer.accumulate_background(image)
+            self._notify(None, image, None, None)
+            return
+        try:
+            rec, proj_x, proj_y = self._analyzer.analyse(
+                image, settings, self._seq + 1, timestamp)
+        except Exception:
+            _log.exception('Problem analysing image')
+            return
+        with self._cond:
+            self._seq = rec.seq
+            self._history.append(rec)
+            self._cond.notify_all()
+        self._notify(rec, image, proj_x, proj_y)
+
+    def _notify(self, *args):
+        if self._callback is not None and self._running:
+            self._callback(*args)
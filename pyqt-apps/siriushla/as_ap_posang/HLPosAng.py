@@ -3,7 +3,6 @@
 """HLA as_ap_posang module."""
 
 import os as _os
-from epics import PV as _PV
 from qtpy.QtWidgets import QGridLayout, QLabel, QGroupBox, QAbstractItemView, \
     QSizePolicy as QSzPlcy, QSpacerItem, QPushButton, QHeaderView, QWidget, \
     QMessageBox, QApplication, QHBoxLayout
@@ -17,6 +16,8 @@ from siriuspy.posang.csdev import Const
 from siriuspy.namesys import SiriusPVName as _PVName
 
 from siriushla import util as _hlautil
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.widgets import SiriusMainWindow, PyDMLogLabel, SiriusLedAlert, \
     PyDMLinEditScrollbar, PyDMLedMultiChannel, SiriusConnectionSignal
 from siriushla.as_ps_control import PSDetailWindow as _PSDetailWindow
@@ -44,10 +45,11 @@ class PosAngCorr(SiriusMainWindow):
 
         if self._tl == 'TS':
             self._is_chsept = False
-            ch3_pv = _PV(self.posang_prefix+':CH3-Cte',
-                         connection_timeout=0.1)
+            ch3_pv = _get_pv(self.posang_prefix+':CH3-Cte',
+                             connection_timeout=0.1)
             if not ch3_pv.wait_for_connection():
                 self._is_chsept = True
+            _release_pv(ch3_pv)
 
         if tl == 'ts':
             corr_h = (Const.TS_CORRH_POSANG_CHSEPT if self._is_chsept
@@ -39,6 +39,7 @@ class BaseWidget(QWidget):
         self.thread = QThread()
         self.updater = []
         self.graph = {'x': None, 'y': None}
+        self._frame_wids = [{'x': dict(), 'y': dict()} for _ in names]
         for _ in range(2):
             upd = UpdateGraph(ctrls, is_orb, acc)
             upd.moveToThread(self.thread)
@@ -151,18 +152,15 @@ class BaseWidget(QWidget):
             pen = mkPen(opts['color'], width=opts['lineWidth'])
             pen.setStyle(4)
             cpstd = InfiniteLine(pos=0.0, pen=pen, angle=0)
-            self.updater[i].ave_pstd[pln].connect(cpstd.setValue)
             graph.addItem(cpstd)
             cmstd = InfiniteLine(pos=0.0, pen=pen, angle=0)
-            self.updater[i].ave_mstd[pln].connect(cmstd.setValue)
             graph.addItem(cmstd)
             pen.setStyle(2)
             cave = InfiniteLine(pos=0.0, pen=pen, angle=0)
-            self.updater[i].ave[pln].connect(cave.setValue)
             graph.addItem(cave)
             cdta = graph.curveAtIndex(-1)
-            self.updater[i].data_sig[pln].connect(
-                _part(self._update_waveform, cdta, pln, i))
+            self._frame_wids[i][pln].update(
+                curve=cdta, ave_pstd=cpstd, ave_mstd=cmstd, ave_line=cave)
             cdta.setVisible(not i)
             cdta.curve.setZValue(-4*i)
             cdta.scatter.setZValue(-4*i)
@@ -219,21 +217,20 @@ class BaseWidget(QWidget):
             hbl.addWidget(cbx)
 
             lab_avg = Label(unit, '-100.00 mrad', wid)
-            self.updater[idx].ave[pln].connect(lab_avg.setFloat)
             lab_avg.setStyleSheet("""min-width:4.5em;""")
             lab_avg.setAlignment(Qt.AlignRight)
             hbl.addWidget(lab_avg)
             hbl.addWidget(QLabel(
                 " <html><head/><body><p>&#177;</p></body></html> ", wid))
             lab_std = Label(unit, '100.00 mrad', wid)
-            self.updater[idx].std[pln].connect(lab_std.setFloat)
             lab_std.setStyleSheet("""min-width:4.5em;""")
             lab_std.setAlignment(Qt.AlignLeft)
             hbl.addWidget(lab_std)
 
             hbl.addWidget(QLabel('(pp. ', wid))
             lab_p2p = Label(unit, '100.00 mrad', wid)
-            self.updater[idx].p2p[pln].connect(lab_p2p.setFloat)
+            self._frame_wids[idx][pln].update(
+                ave=lab_avg, std=lab_std, p2p=lab_p2p)
             lab_p2p.setStyleSheet("""min-width:4.5em;""")
             lab_p2p.setAlignment(Qt.AlignLeft)
             hbl.addWidget(lab_p2p)
@@ -277,6 +274,8 @@ class BaseWidget(QWidget):
                 grpbx.toggled.connect(cbx.setChecked)
                 for j in range(3):
                     cbx.toggled.connect(lines[3*i + j].setVisible)
+                self.updater[i].frame[pln].connect(
+                    _part(self._update_frame, i))
 
     def _get_color(self, pln, idx):
         cor = idx * 255
@@ -354,6 +353,19 @@ class BaseWidget(QWidget):
             # trc.opts['symbol'] = simbs  # pyqtgraph bug does not allow this
             trc.opts['symbolSize'] = sizes
 
+    def _update_frame(self, idx, frame):
+        wids = self._frame_wids[idx][frame.plane]
+        try:
+            self._update_waveform(wids['curve'], frame.plane, idx, frame.data)
+            wids['ave_line'].setValue(frame.ave)
+            wids['ave_pstd'].setValue(frame.ave_pstd)
+            wids['ave_mstd'].setValue(frame.ave_mstd)
+            wids['ave'].setFloat(frame.ave)
+            wids['std'].setFloat(frame.std)
+            wids['p2p'].setFloat(frame.p2p)
+        finally:
+            self.updater[idx].frame_done(frame.plane)
+
     def _update_waveform(self, curve, plane, idx, data):
         bpm_pos = self._csorb.bpm_pos
         if not self.is_orb and plane == 'x':
@@ -405,22 +417,44 @@ class BaseWidget(QWidget):
         self.last_dir = fname.rsplit('/', 1)[0]
 
 
+class OrbitFrame:
+    """Orbit difference of one plane and its statistics."""
+
+    __slots__ = ('plane', 'data', 'ave', 'std', 'p2p')
+
+    def __init__(self, plane, data, ave, std, p2p):
+        """."""
+        self.plane = plane
+        self.data = data
+        self.ave = ave
+        self.std = std
+        self.p2p = p2p
+
+    @property
+    def ave_pstd(self):
+        """."""
+        return self.ave - self.std
+
+    @property
+    def ave_mstd(self):
+        """."""
+        return self.ave + self.std
+
+
 class UpdateGraph(QObject):
-    """Worker to update graphics."""
-    avex = Signal([float])
-    stdx = Signal([float])
-    p2px = Signal([float])
-    ave_pstdx = Signal([float])
-    ave_mstdx = Signal([float])
-    data_sigx = Signal([_np.ndarray])
+    """Worker to update graphics.
+
+    Each update emits one OrbitFrame per plane whose orbit changed. A new
+    frame of a plane is only computed after the GUI calls frame_done for
+    the previous one, so frames are dropped while the GUI is busy. Orbits
+    that arrive meanwhile mark the plane as dirty and frame_done requests
+    a frame of the latest orbit, which is computed in the worker thread.
+    """
+    framex = Signal(object)
     ref_sigx = Signal([_np.ndarray])
-    avey = Signal([float])
-    stdy = Signal([float])
-    p2py = Signal([float])
-    ave_pstdy = Signal([float])
-    ave_mstdy = Signal([float])
-    data_sigy = Signal([_np.ndarray])
+    framey = Signal(object)
     ref_sigy = Signal([_np.ndarray])
+    _redraw = Signal(str)
 
     UNIT = 1e-6  # orbit is in um and strength in urad
 
@@ -434,12 +468,7 @@ class UpdateGraph(QObject):
         self._isvisible = True
         text = sorted(ctrls)[0]
         self.current_text = {'val': text, 'ref': text}
-        self.ave = {'x': self.avex, 'y': self.avey}
-        self.p2p = {'x': self.p2px, 'y': self.p2py}
-        self.std = {'x': self.stdx, 'y': self.stdy}
-        self.ave_pstd = {'x': self.ave_pstdx, 'y': self.ave_pstdy}
-        self.ave_mstd = {'x': self.ave_mstdx, 'y': self.ave_mstdy}
-        self.data_sig = {'x': self.data_sigx, 'y': self.data_sigy}
+        self.frame = {'x': self.framex, 'y': self.framey}
         self.raw_ref_sig = {'x': self.ref_sigx, 'y': self.ref_sigy}
         self.slots = {
             'val': {
@@ -461,6 +490,16 @@ class UpdateGraph(QObject):
         self.enbl_list = {
             'x': _np.ones(szx, dtype=bool),
             'y': _np.ones(szy, dtype=bool)}
+        # two buffers per plane: one being rendered and one being filled.
+        self._diff = {
+            'x': [_np.zeros(szx, dtype=float), _np.zeros(szx, dtype=float)],
+            'y': [_np.zeros(szy, dtype=float), _np.zeros(szy, dtype=float)]}
+        self._masked = {
+            'x': _np.zeros(szx, dtype=float),
+            'y': _np.zeros(szy, dtype=float)}
+        self._pending = {'x': False, 'y': False}
+        self._dirty = {'x': True, 'y': True}
+        self._redraw.connect(self.update_graphic)
         sig_x = self.ctrls[self.current_text['ref']]['x']['signal']
         sig_y = self.ctrls[self.current_text['ref']]['y']['signal']
         sig_x[_np.ndarray].connect(self.slots['ref']['x'])
@@ -504,41 +543,74 @@ class UpdateGraph(QObject):
     def set_enbl_list(self, pln, enbls):
         """."""
         self.enbl_list[pln] = _np.array(enbls, dtype=bool)
+        self._dirty[pln] = True
+
+    def frame_done(self, pln):
+        """Release plane for new frames. Called by the GUI after rendering."""
+        self._pending[pln] = False
+        if self._dirty[pln]:
+            self._redraw.emit(pln)
 
     def _update_vectors(self, orb_tp, pln, orb):
         self.vectors[orb_tp][pln] = orb
+        self._dirty[pln] = True
         if orb_tp == 'ref' and orb is not None:
             self.raw_ref_sig[pln].emit(orb)
 
+    def _get_buffers(self, pln, size):
+        bufs = self._diff[pln]
+        if bufs[0].size < size:
+            bufs[:] = [_np.zeros(size, dtype=float) for _ in bufs]
+            self._masked[pln] = _np.zeros(size, dtype=float)
+        # alternate buffers, since the GUI may still hold the last one.
+        bufs.reverse()
+        return bufs[0][:size], self._masked[pln]
+
     def update_graphic(self, pln=None):
         """."""
         if not self._isvisible:
             return
         plns = ('x', 'y') if pln is None else (pln, )
         for pln in plns:
+            if self._pending[pln] or not self._dirty[pln]:
+                continue
             orb = self.vectors['val'][pln]
             ref = self.vectors['ref'][pln]
             if orb is None or ref is None:
-                return
+                continue
+            self._dirty[pln] = False
             sz = min(orb.size, ref.size)
-            diff = (orb[:sz] - ref[:sz]) * self.UNIT
+            diff, masked = self._get_buffers(pln, sz)
+            _np.subtract(orb[:sz], ref[:sz], out=diff)
+            diff *= self.UNIT
 
             enbl = self.enbl_list[pln]
             if enbl is not None:
                 sz = min(sz, enbl.size)
-                mask = diff[:sz][enbl[:sz]]
+                enbl = enbl[:sz]
+                masked = masked[:_np.count_nonzero(enbl)]
+                _np.compress(enbl, diff[:sz], out=masked)
             else:
-                mask = diff
-            ave = float(mask.mean()) if mask.size > 0 else 0.0
-            p2p = float(mask.max() - mask.min()) if mask.size > 1 else 0.0
-            std = float(mask.std(ddof=1)) if mask.size > 1 else 0.0
-
-            self.data_sig[pln].emit(diff)
-            self.ave[pln].emit(ave)
-            self.std[pln].emit(std)
-            self.p2p[pln].emit(p2p)
-            self.ave_pstd[pln].emit(ave-std)
-            self.ave_mstd[pln].emit(ave+std)
+                masked = masked[:sz]
+                masked[:] = diff
+            ave, std, p2p = self._calc_stats(masked)
+
+            self._pending[pln] = True
+            self.frame[pln].emit(OrbitFrame(pln, diff, ave, std, p2p))
+
+    @staticmethod
+    def _calc_stats(vals):
+        """Return mean, std and p2p of vals. Modifies vals in place."""
+        size = vals.size
+        if not size:
+            return 0.0, 0.0, 0.0
+        ave = float(vals.sum() / size)
+        if size == 1:
+            return ave, 0.0, 0.0
+        p2p = float(vals.max() - vals.min())
+        vals -= ave
+        std = float(_np.sqrt(_np.dot(vals, vals) / (size - 1)))
+        return ave, std, p2p
 
 
 class Label(QLabel):
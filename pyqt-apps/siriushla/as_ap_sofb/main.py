@@ -113,7 +113,7 @@ class MainWindow(SiriusMainWindow):
         vbl.setContentsMargins(0, 0, 0, 0)
         pdm_log = PyDMLogLabel(wid_cont, init_channel=self.prefix+'Log-Mon')
         pdm_log.setAlternatingRowColors(True)
-        pdm_log.maxCount = 2000
+        pdm_log.bufferSize = 2000
         vbl.addWidget(pdm_log)
         hbl = QHBoxLayout()
         vbl.addLayout(hbl)
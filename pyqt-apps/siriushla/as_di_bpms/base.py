@@ -10,8 +10,22 @@ from siriuspy.namesys import SiriusPVName as _PVName
 from siriuspy.diagbeam.bpm.csdev import Const as _csbpm
 from siriushla.widgets import SiriusConnectionSignal, SiriusLabel, \
     SiriusSpinbox
+from siriushla.style_registry import register_styles, set_style_class
 
-_BPMDB = _csbpm.get_bpm_database()
+_BPMDB = None
+
+register_styles({
+    'QWidget[styleClass="BPMFormField"]': 'min-width:5em;',
+    'QLabel[styleClass="BPMFormLabel"]': 'min-width:8em;',
+})
+
+
+def get_bpm_database():
+    """Return BPM database, created on first use."""
+    global _BPMDB
+    if _BPMDB is None:
+        _BPMDB = _csbpm.get_bpm_database()
+    return _BPMDB
 
 
 class BaseWidget(QWidget):
@@ -22,7 +36,7 @@ class BaseWidget(QWidget):
         self.bpm = _PVName(bpm)
         self.setObjectName(self.bpm.sec+'App')
         self.data_prefix = data_prefix
-        self.bpmdb = _BPMDB
+        self.bpmdb = get_bpm_database()
         self._chans = []
 
     def channels(self):
@@ -52,7 +66,7 @@ class BaseWidget(QWidget):
                 if not_enum:
                     chan1 = self.get_pvname(pv1, is_data=isdata)
                     wid = SiriusSpinbox(self, init_channel=chan1)
-                    wid.setStyleSheet("""min-width:5em;""")
+                    set_style_class(wid, 'BPMFormField')
                     wid.showStepExponent = False
                     wid.limitsFromChannel = False
                     pvn = self.data_prefix + pv1
@@ -62,7 +76,7 @@ class BaseWidget(QWidget):
                     wid = PyDMEnumComboBox(
                         self,
                         init_channel=self.get_pvname(pv1, is_data=isdata))
-                    wid.setStyleSheet("""min-width:5em;""")
+                    set_style_class(wid, 'BPMFormField')
                 wid.setObjectName(pv1.replace('-', ''))
                 hbl.addWidget(wid)
 
@@ -70,11 +84,11 @@ class BaseWidget(QWidget):
                 self, init_channel=self.get_pvname(pv2, is_data=isdata))
             lab.setObjectName(pv2.replace('-', ''))
             lab.showUnits = True
-            lab.setStyleSheet("""min-width:5em;""")
+            set_style_class(lab, 'BPMFormField')
             hbl.addWidget(lab)
             lab = QLabel(txt)
             lab.setObjectName(pv1.split('-')[0])
-            lab.setStyleSheet("""min-width:8em;""")
+            set_style_class(lab, 'BPMFormLabel')
             fbl.addRow(lab, hbl)
         return grpbx
 
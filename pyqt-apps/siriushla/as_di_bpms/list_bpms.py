@@ -4,8 +4,18 @@ from qtpy.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLineEdit, \
 from qtpy.QtCore import Qt, Slot
 from siriushla.as_di_bpms.base import BaseWidget, GraphTime, GraphWave, \
     get_custom_widget_class
-from siriushla.widgets import PyDMLedMultiChannel
+from siriushla.widgets import PyDMLedMultiChannel, SubscriptionManager
 from siriushla.util import connect_newprocess
+from siriushla.style_registry import register_styles
+
+
+register_styles({
+    'SelectBPMs #scrollarea': 'background-color: transparent;',
+    'SinglePassSummary #scrollarea': 'background-color: transparent;',
+    'MultiTurnSummary #scrollarea': 'background-color: transparent;',
+    'SinglePassSummary GraphWave': 'min-width:20em; min-height:15em;',
+    'MultiTurnSummary GraphWave': 'min-width:20em; min-height:15em;',
+})
 
 
 class BPMSummary(BaseWidget):
@@ -58,13 +68,14 @@ class SelectBPMs(BaseWidget):
 
         scr_ar_wid = QWidget()
         scr_ar_wid.setObjectName('scrollarea')
-        scr_ar_wid.setStyleSheet(
-            '#scrollarea {background-color: transparent;}')
         gdl = QGridLayout(scr_ar_wid)
+        # only BPMs shown in the scroll area keep their channels connected
+        self.subs_manager = SubscriptionManager(scarea, parent=self)
         for i, bpm in enumerate(sorted(self.bpm_dict.keys())):
             widb = BPMSummary(scr_ar_wid, prefix=self.prefix, bpm=bpm)
             gdl.addWidget(widb, i // self.ncols, i % self.ncols)
             self.bpm_dict[bpm] = widb
+            self.subs_manager.add_widget(widb)
 
         vbl.addWidget(scarea)
         scarea.setWidget(scr_ar_wid)
@@ -116,9 +127,10 @@ class SinglePassSummary(BaseWidget):
 
         wid = QWidget()
         wid.setObjectName('scrollarea')
-        wid.setStyleSheet('#scrollarea {background-color: transparent;}')
         gdl = QGridLayout(wid)
         gdl.setSpacing(15)
+        # only graphs shown in the scroll area keep their channels connected
+        self.subs_manager = SubscriptionManager(scarea, parent=self)
         for i, bpm in enumerate(sorted(self.bpm_dict.keys())):
             widb = QWidget(wid)
             vbl2 = QVBoxLayout(widb)
@@ -129,10 +141,10 @@ class SinglePassSummary(BaseWidget):
 
             gdl.addWidget(widb, i // 3, i % 3)
             self.bpm_dict[bpm] = widb
+            self.subs_manager.add_widget(widb)
         self.gdl = gdl
         vbl.addWidget(scarea)
         scarea.setWidget(wid)
-        self.setStyleSheet('GraphWave{min-width:20em;min-height:15em;}')
         self.scarea = scarea
 
     def create_graph(self, wid, bpm, typ='pos'):
@@ -251,9 +263,10 @@ class MultiTurnSummary(BaseWidget):
 
         wid = QWidget()
         wid.setObjectName('scrollarea')
-        wid.setStyleSheet('#scrollarea {background-color: transparent;}')
         gdl = QGridLayout(wid)
         gdl.setSpacing(15)
+        # only graphs shown in the scroll area keep their channels connected
+        self.subs_manager = SubscriptionManager(scarea, parent=self)
         for i, bpm in enumerate(sorted(self.bpm_dict.keys())):
             widb = QWidget(wid)
             vbl2 = QVBoxLayout(widb)
@@ -263,10 +276,10 @@ class MultiTurnSummary(BaseWidget):
             vbl2.addWidget(wbpm)
             gdl.addWidget(widb, i // 3, i % 3)
             self.bpm_dict[bpm] = widb
+            self.subs_manager.add_widget(widb)
         self.gdl = gdl
         vbl.addWidget(scarea)
         scarea.setWidget(wid)
-        self.setStyleSheet('GraphWave{min-width:20em;min-height:15em;}')
         self.scarea = scarea
 
     def create_graph(self, wid, bpm, typ='pos'):
@@ -14,6 +14,183 @@ from siriushla.widgets import SiriusConnectionSignal as SignalChannel, \
     SiriusTimePlot
 
 
+class SmoothingBuffer:
+    """Preallocated ring buffer of acquisitions with streaming smoothing.
+
+    A running sum of the stored acquisitions is kept for the average and,
+    while the median is used, the acquisitions are also kept sorted sample
+    by sample. Adding an acquisition only replaces the oldest one in the
+    sorted buffer, which is then stably sorted again: as it is almost
+    sorted, this costs about one pass over the buffer, instead of
+    rebuilding it and selecting the median of every sample. The
+    downsampling is applied to the smoothed data in the same pass that
+    normalizes it.
+
+    Unlike averaging the whole buffer at each acquisition, as formerly
+    done, acquisitions with NaN or infinite samples are not stored: a
+    non finite value added to the running sum would remain there after
+    the acquisition is dropped, until the sum is computed again. So these
+    acquisitions are discarded and do not change the smoothed data.
+    """
+
+    METHODS = ('Average', 'Median')
+
+    def __init__(self, maxlen=1, method='Average'):
+        """Init."""
+        self._maxlen = max(int(maxlen), 0)
+        self._method = method
+        self._ring = None
+        self._start = 0
+        self._count = 0
+        self._sum = None
+        self._sorted = None
+        self._nr_appends = 0
+
+    def __len__(self):
+        """Number of stored acquisitions."""
+        return self._count
+
+    @property
+    def maxlen(self):
+        """Maximum number of stored acquisitions."""
+        return self._maxlen
+
+    @maxlen.setter
+    def maxlen(self, value):
+        value = max(int(value), 0)
+        if value == self._maxlen:
+            return
+        rows = self.rows()
+        self._maxlen = value
+        self._load(rows[max(len(rows)-value, 0):] if value else rows[:0])
+
+    @property
+    def method(self):
+        """Smoothing method, 'Average' or 'Median'."""
+        return self._method
+
+    @method.setter
+    def method(self, value):
+        if value not in self.METHODS:
+            raise ValueError('Invalid smoothing method: '+str(value))
+        if value == self._method:
+            return
+        self._method = value
+        self._load(self.rows())
+
+    def rows(self):
+        """Return stored acquisitions, from the oldest to the newest."""
+        if self._ring is None:
+            return np.zeros((0, 0))
+        idcs = (self._start + np.arange(self._count)) % len(self._ring)
+        return self._ring[idcs]
+
+    def clear(self):
+        """Remove all acquisitions."""
+        self._ring = None
+        self._sum = None
+        self._sorted = None
+        self._start = 0
+        self._count = 0
+
+    def append(self, data):
+        """Add acquisition, dropping the oldest one if buffer is full.
+
+        Acquisitions with non finite samples are discarded, see the class
+        documentation. Return False if the acquisition was discarded.
+        """
+        data = np.asarray(data, dtype=float)
+        if not self._maxlen or not np.all(np.isfinite(data)):
+            return False
+        if self._ring is None or self._ring.shape[1] != data.size:
+            self._allocate(data.size)
+
+        size = len(self._ring)
+        if self._count < size:
+            old = None
+            pos = (self._start + self._count) % size
+            self._count += 1
+        else:
+            pos = self._start
+            old = self._ring[pos].copy()
+            self._start = (self._start + 1) % size
+        self._ring[pos] = data
+
+        self._sum += data
+        if old is not None:
+            self._sum -= old
+        if self._sorted is not None:
+            if old is None:
+                self._insert_sorted(data)
+            else:
+                self._replace_sorted(old, data)
+
+        # avoid accumulation of rounding errors in the running sum
+        self._nr_appends += 1
+        if self._nr_appends >= size:
+            self._nr_appends = 0
+            self._sum = np.sum(self._ring[:self._count], axis=0)
+        return True
+
+    def smoothed(self, downsampling=1):
+        """Return smoothed acquisition, downsampled by block averages."""
+        if not self._count:
+            return None
+        cnt = self._count
+        if self._method == 'Median' and cnt > 1:
+            srt = self._sorted
+            data = srt[:, cnt//2]
+            if not cnt % 2:
+                data = (data + srt[:, cnt//2 - 1]) / 2
+            norm = 1
+        else:
+            data = self._sum
+            norm = cnt
+        if downsampling > 1:
+            data = data.reshape(-1, downsampling).sum(axis=1)
+            norm *= downsampling
+        return data / norm
+
+    def _allocate(self, nrsamples):
+        size = self._maxlen
+        self._ring = np.empty((size, nrsamples), dtype=float)
+        self._sum = np.zeros(nrsamples, dtype=float)
+        self._sorted = None
+        if self._method == 'Median':
+            # samples along lines, so that each one is sorted contiguously
+            self._sorted = np.empty((nrsamples, size), dtype=float)
+        self._start = 0
+        self._count = 0
+        self._nr_appends = 0
+
+    def _load(self, rows):
+        if not len(rows):
+            self.clear()
+            return
+        self._allocate(rows.shape[1])
+        cnt = len(rows)
+        self._ring[:cnt] = rows
+        self._count = cnt
+        self._sum = np.sum(rows, axis=0)
+        if self._sorted is not None:
+            self._sorted[:, :cnt] = np.sort(rows.T, axis=1)
+
+    def _insert_sorted(self, data):
+        """Insert data in the sorted acquisitions, which are not full."""
+        cnt = self._count
+        srt = self._sorted[:, :cnt]
+        srt[:, -1] = data
+        srt.sort(axis=1, kind='stable')
+
+    def _replace_sorted(self, old, data):
+        """Replace old by data in the sorted acquisitions."""
+        srt = self._sorted
+        # old is in srt, so idcs is the position of one of its copies
+        idcs = np.count_nonzero(srt < old[:, None], axis=1)
+        srt[np.arange(len(srt)), idcs] = data
+        srt.sort(axis=1, kind='stable')
+
+
 class DCCTMonitor(QWidget):
     """Widget to ramp status monitoring."""
 
@@ -48,7 +225,8 @@ class DCCTMonitor(QWidget):
         self._downsampling = 1
         self._smooth_method = 'Average'
         self._smooth_nracq = 1
-        self._smooth_buffer = list()
+        self._smooth_buffer = SmoothingBuffer(
+            maxlen=self._smooth_nracq, method=self._smooth_method)
 
         self._setupUi()
 
@@ -188,28 +366,15 @@ class DCCTMonitor(QWidget):
         data = raw[:samp]
 
         self._smooth_buffer.append(data)
-        if len(self._smooth_buffer) > self._smooth_nracq:
-            self._smooth_buffer.pop(0)
 
         self._updateCurve()
 
     def _updateCurve(self):
-        buff = np.array(self._smooth_buffer, dtype=float)
         self._buffSizeUpdate.emit(str(self.bufferSize))
 
-        if not len(buff):
+        fdata = self._smooth_buffer.smoothed(self._downsampling)
+        if fdata is None:
             return
-        if len(buff) > 1:
-            if self._smooth_method == 'Average':
-                fdata = np.mean(buff, axis=0)
-            elif self._smooth_method == 'Median':
-                fdata = np.median(buff, axis=0)
-        else:
-            fdata = buff[0]
-
-        down = self._downsampling
-        if down > 1:
-            fdata = np.mean(fdata.reshape(-1, down), axis=1)
 
         self.curve.receiveYWaveform(fdata)
         self.curve.redrawCurve()
@@ -222,15 +387,13 @@ class DCCTMonitor(QWidget):
     def setSmoothMethod(self, new_method):
         """Update method to perform raw readings smoothing."""
         self._smooth_method = new_method
+        self._smooth_buffer.method = new_method
         self._updateCurve()
 
     def setSmoothNrAcq(self, new_value):
         """Update number of samples to use in smoothing."""
         self._smooth_nracq = new_value
-        exc = len(self._smooth_buffer) - self._smooth_nracq
-        if exc > 0:
-            for i in range(exc):
-                self._smooth_buffer.pop(0)
+        self._smooth_buffer.maxlen = new_value
 
     @property
     def bufferSize(self):
@@ -239,7 +402,7 @@ class DCCTMonitor(QWidget):
 
     def resetBuffer(self):
         """Reset smoothing buffer."""
-        self._smooth_buffer = list()
+        self._smooth_buffer.clear()
         self._updateCurve()
 
     def updateParams(self, new_value):
@@ -5,7 +5,6 @@ from qtpy.QtWidgets import QWidget, QLabel, QPushButton, QGroupBox, \
     QGridLayout, QHBoxLayout, QVBoxLayout, QFormLayout, QSpacerItem, \
     QSizePolicy as QSzPly
 import qtawesome as qta
-import epics
 from pydm.widgets import PyDMLabel, PyDMSpinbox, PyDMEnumComboBox, \
     PyDMPushButton
 from siriuspy.diagbeam.dcct.csdev import Const as _DCCTc
@@ -13,6 +12,8 @@ from siriushla.widgets.windows import create_window_from_widget
 from siriushla.widgets import PyDMStateButton, SiriusConnectionSignal, \
     SiriusLedState, SiriusLedAlert
 from siriushla import util as _hlautil
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.as_ti_control.hl_trigger import HLTriggerSimple
 
 
@@ -269,9 +270,8 @@ class DCCTSettingsDetails(QWidget):
             parent=self, init_channel=self.dcct_prefix+'ReliableMeas-Mon',
             bit=2)
 
-        self.reliablemeas_channel = epics.PV(
-            self.dcct_prefix+'ReliableMeasLabels-Cte',
-            callback=self._updateReliableMeasLabels)
+        # acquired while shown, see showEvent and hideEvent
+        self.reliablemeas_channel = None
 
         gbox_reliablemeas = QGroupBox('Measure Reliability Status', self)
         lay_reliablemeas = QGridLayout()
@@ -569,6 +569,26 @@ class DCCTSettingsDetails(QWidget):
             self.label_reliablemeas1.setText(value[1])
             self.label_reliablemeas2.setText(value[2])
 
+    def showEvent(self, event):
+        """Acquire reliable measure labels PV when shown."""
+        if self.reliablemeas_channel is None:
+            pv = _get_pv(
+                self.dcct_prefix+'ReliableMeasLabels-Cte',
+                callback=self._updateReliableMeasLabels)
+            self.reliablemeas_channel = pv
+            # pooled PV may be connected already, with no updates to come
+            if pv.connected:
+                self._updateReliableMeasLabels(pv.pvname, pv.value)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Release reliable measure labels PV when hidden."""
+        if self.reliablemeas_channel is not None:
+            _release_pv(self.reliablemeas_channel,
+                        callback=self._updateReliableMeasLabels)
+            self.reliablemeas_channel = None
+        super().hideEvent(event)
+
     def _showMeasModeSettings(self, value):
         if value == _DCCTc.MeasModeSel.Normal:
             self.gbox_normalmode.setVisible(True)
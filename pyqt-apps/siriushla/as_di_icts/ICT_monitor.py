@@ -4,7 +4,6 @@
 import sys
 import os as _os
 import numpy as np
-import epics
 from qtpy.uic import loadUi
 from qtpy.QtCore import Slot, Qt
 from qtpy.QtGui import QColor
@@ -19,6 +18,8 @@ from pydm.utilities.macro import substitute_in_file as _substitute_in_file
 from siriuspy.namesys import SiriusPVName as _PVName
 from siriuspy.envars import VACA_PREFIX as _VACA_PREFIX
 from siriushla.sirius_application import SiriusApplication
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.widgets import SiriusMainWindow, SiriusDialog, \
     SiriusLedAlert, PyDMStateButton, PyDMLedMultiChannel
 from siriushla.widgets.windows import create_window_from_widget
@@ -231,7 +232,7 @@ class _ICTSettings(SiriusDialog):
         self.setLayout(lay)
 
     def _setupReliableMeasWidget(self):
-        self.reliablemeas_channel = epics.PV(
+        self.reliablemeas_channel = _get_pv(
             self.ict_prefix+':ReliableMeasLabels-Cte',
             callback=self._updateReliableMeasLabels)
 
@@ -388,6 +389,12 @@ class _ICTSettings(SiriusDialog):
             self.label_reliablemeas1.setText(value[1])
             self.label_reliablemeas2.setText(value[2])
 
+    def closeEvent(self, event):
+        """Release reliable measure labels PV on close."""
+        _release_pv(self.reliablemeas_channel,
+                    callback=self._updateReliableMeasLabels)
+        super().closeEvent(event)
+
 
 class _ICTCalibration(QWidget):
 
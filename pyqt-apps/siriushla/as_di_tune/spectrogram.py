@@ -63,7 +63,7 @@ class BOTuneSpectrogram(SiriusSpectrogramView):
     def process_image(self, image):
         """Process data."""
         # Flip data in X axis
-        image = np.flip(image, 0)
+        image = np.flip(image, 0).copy()
 
         # Truncate image
         if self.nravgs > 1 and len(self.buffer) >= 1:
@@ -59,18 +59,22 @@ class PSControlWindow(SiriusMainWindow):
 
     def _connect_buttons(self, widget):
         for w in widget.get_summary_widgets():
-            detail_bt = w.get_detail_button()
-            psname = detail_bt.text()
-            if not psname:
-                psname = detail_bt.toolTip()
-            psname = _PVName(psname)
-            if PSSearch.conv_psname_2_psmodel(psname) == 'REGATRON_DCLink':
-                connect_newprocess(
-                    w, ['sirius-hla-as-ps-regatron-individual',
-                        '-dev', psname], parent=self, is_pydm=True)
-            else:
-                connect_window(detail_bt, PSDetailWindow, self, psname=psname)
+            self._connect_summary_widget(w)
+        widget.summaryWidgetCreated.connect(self._connect_summary_widget)
 
-            trim_bt = w.get_trim_button()
-            if trim_bt is not None:
-                connect_window(trim_bt, PSTrimWindow, self, device=psname)
+    def _connect_summary_widget(self, w):
+        detail_bt = w.get_detail_button()
+        psname = detail_bt.text()
+        if not psname:
+            psname = detail_bt.toolTip()
+        psname = _PVName(psname)
+        if PSSearch.conv_psname_2_psmodel(psname) == 'REGATRON_DCLink':
+            connect_newprocess(
+                w, ['sirius-hla-as-ps-regatron-individual',
+                    '-dev', psname], parent=self, is_pydm=True)
+        else:
+            connect_window(detail_bt, PSDetailWindow, self, psname=psname)
+
+        trim_bt = w.get_trim_button()
+        if trim_bt is not None:
+            connect_window(trim_bt, PSTrimWindow, self, device=psname)
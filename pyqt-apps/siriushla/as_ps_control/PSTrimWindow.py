@@ -48,7 +48,11 @@ class PSTrimWindow(SiriusMainWindow):
         self.central_widget.layout.addWidget(self.trim_widget)
 
     def _connect_buttons(self, widget):
-        for widget in widget.get_summary_widgets():
-            psname = widget.devname
-            detail_bt = widget.get_detail_button()
-            connect_window(detail_bt, PSDetailWindow, self, psname=psname)
+        for w in widget.get_summary_widgets():
+            self._connect_summary_widget(w)
+        widget.summaryWidgetCreated.connect(self._connect_summary_widget)
+
+    def _connect_summary_widget(self, widget):
+        psname = widget.devname
+        detail_bt = widget.get_detail_button()
+        connect_window(detail_bt, PSDetailWindow, self, psname=psname)
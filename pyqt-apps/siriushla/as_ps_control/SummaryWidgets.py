@@ -13,6 +13,7 @@ from siriuspy.search import PSSearch
 from siriushla.widgets import PyDMStateButton, SiriusLedState, \
     SiriusLedAlert, PyDMLinEditScrollbar, PyDMLedMultiChannel, \
     SiriusEnumComboBox
+from siriushla.style_registry import register_styles, set_style_class
 
 
 Dipole = re.compile("^.*:PS-B.*$")
@@ -27,6 +28,55 @@ IsLinacSpect = re.compile("^LI-01:PS-Spect$")
 HasTrim = re.compile("^.*SI-Fam:PS-Q.*$")
 LIQuadHasNotStrength = re.compile("^LI-.*:PS-(QF1|QD1)$")
 
+PROP2WIDTH = {
+    'detail': 8.5,
+    'state': 6,
+    'intlk': 5,
+    'setpoint': 6,
+    'readback': 6,
+    'monitor': 6,
+    'opmode': 8,
+    'reset': 4,
+    'bbb': 10,
+    'udc': 10,
+    'ctrlmode': 6,
+    'ctrlloop': 8,
+    'wfmupdate': 8,
+    'conn': 5,
+    'strength_sp': 6,
+    'strength_rb': 6,
+    'strength_mon': 8,
+    'pulse': 8,
+    'trim': 2,
+}
+DCLINK_DETAIL_WIDTH = 3
+
+register_styles({
+    'SummaryWidget PyDMStateButton':
+        'min-width: 2.5em; max-width: 2.5em;'
+        'min-height: 1.5em; max-height: 1.5em;',
+    'SummaryWidget QLed':
+        'min-width: 1.5em; max-width: 1.5em;'
+        'min-height: 1.5em; max-height: 1.5em;',
+    'SummaryWidget QLabel':
+        'min-height: 1.5em; max-height: 1.5em;'
+        'qproperty-alignment: AlignCenter;',
+    'SummaryWidget #reset_bt':
+        'min-width:25px; max-width:25px; icon-size:20px;',
+    'SummaryHeader #HiddenButton': 'min-width: 10px; max-width: 10px;',
+    'SummaryHeader QLabel':
+        'font-weight: bold; qproperty-alignment: AlignCenter;',
+})
+for _cls in ('SummaryWidget', 'SummaryHeader'):
+    register_styles({
+        '{} #{}'.format(_cls, _prop):
+            'min-width: {0}em; max-width: {0}em;'.format(_wid)
+        for _prop, _wid in PROP2WIDTH.items()})
+    register_styles({
+        '{}[styleClass="DCLink"] #detail'.format(_cls):
+            'min-width: {0}em; max-width: {0}em;'.format(
+                DCLINK_DETAIL_WIDTH)})
+
 
 def get_analog_name(psname):
     """."""
@@ -54,6 +104,33 @@ def get_analog_name(psname):
                 'Undefined PS model {} setpoint PV name'.format(psmodel))
 
 
+def get_writable_pvname(psname, propty):
+    """Return name of the PV of propty of psname, or '' if it has none.
+
+    propty is 'PwrState-Sel', 'OpMode-Sel', 'Reset-Cmd', 'WfmUpdateAuto-Sel'
+    or '{analog}-SP', with '{analog}' replaced by the analog property name.
+    The PV exists only for the power supply models for which
+    SummaryWidget creates it.
+    """
+    psname = PVName(psname)
+    psmodel = PSSearch.conv_psname_2_psmodel(psname)
+    pstype = PSSearch.conv_psname_2_pstype(psname)
+    is_linac = IsLinac.match(psname)
+    is_regatron = psmodel == 'REGATRON_DCLink'
+    is_reg_slave = pstype == 'as-dclink-regatron-slave'
+    if propty in ('PwrState-Sel', '{analog}-SP'):
+        exists = not is_reg_slave
+    elif propty == 'Reset-Cmd':
+        exists = not is_linac and not is_reg_slave
+    elif propty in ('OpMode-Sel', 'WfmUpdateAuto-Sel'):
+        exists = not is_linac and not is_regatron
+    else:
+        raise ValueError('Undefined property {}'.format(propty))
+    if not exists:
+        return ''
+    return psname + ':' + propty.format(analog=get_analog_name(psname))
+
+
 def get_strength_name(psname):
     """."""
     if Dipole.match(psname):
@@ -74,41 +151,24 @@ def get_strength_name(psname):
 
 def get_prop2width(psname):
     psmodel = PSSearch.conv_psname_2_psmodel(psname)
-    detail_wid = '8.5' if psname.dev != 'DCLink' else '3'
-    dic = {
-        'detail': detail_wid,
-        'state': '6',
-        'intlk':  '5',
-        'setpoint': '6',
-        'monitor': '6',
-    }
+    props = ['detail', 'state', 'intlk', 'setpoint', 'monitor']
     if psmodel != 'REGATRON_DCLink':
-        dic.update({'readback': '6'})
+        props.append('readback')
     if psname.sec != 'LI':
-        dic.update({
-            'opmode': '8',
-            'reset': '4',
-        })
+        props.extend(['opmode', 'reset'])
         if psmodel != 'REGATRON_DCLink':
-            dic.update({
-                'bbb': 10,
-                'udc': 10,
-                'ctrlmode': '6',
-                'ctrlloop': '8',
-                'wfmupdate': '8',
-            })
+            props.extend(['bbb', 'udc', 'ctrlmode', 'ctrlloop', 'wfmupdate'])
     else:
-        dic['conn'] = '5'
+        props.append('conn')
     if get_strength_name(psname):
-        dic.update({
-            'strength_sp': '6',
-            'strength_rb': '6',
-            'strength_mon': '8'
-        })
+        props.extend(['strength_sp', 'strength_rb', 'strength_mon'])
     if psname.dis == 'PU':
-        dic.update({'pulse': '8'})
+        props.append('pulse')
     if HasTrim.match(psname):
-        dic.update({'trim': '2'})
+        props.append('trim')
+    dic = {prop: PROP2WIDTH[prop] for prop in props}
+    if psname.dev == 'DCLink':
+        dic['detail'] = DCLINK_DETAIL_WIDTH
     return sort_propties(dic)
 
 
@@ -220,6 +280,8 @@ class SummaryWidget(QWidget):
 
     def _setup_ui(self):
         """Setups widget UI."""
+        if self._name.dev == 'DCLink':
+            set_style_class(self, 'DCLink')
         lay = QHBoxLayout()
         lay.setContentsMargins(0, 0, 0, 0)
         lay.setSpacing(10)
@@ -322,30 +384,10 @@ class SummaryWidget(QWidget):
             self._widgets_dict['trim'] = self.trim_wid
             lay.addWidget(self.trim_wid)
 
-        _widths = get_prop2width(self._name)
         for name, widget in self._widgets_dict.items():
-            width = _widths[name]
-            widget.setStyleSheet(
-                '#'+name+'{min-width:'+str(width)+'em;'
-                'max-width:'+str(width)+'em;}')
             widget.setSizePolicy(QSzPlcy.Fixed, QSzPlcy.Fixed)
             widget.setVisible(name in self.visible_props)
 
-        self.setStyleSheet("""
-            PyDMStateButton{
-                min-width: 2.5em; max-width: 2.5em;
-                min-height: 1.5em; max-height: 1.5em;
-            }
-            QLed{
-                min-width: 1.5em; max-width: 1.5em;
-                min-height: 1.5em; max-height: 1.5em;
-            }
-            QLabel{
-                min-height: 1.5em; max-height: 1.5em;
-                qproperty-alignment: AlignCenter;
-            }
-        """)
-
         lay.addStretch()
         self.setLayout(lay)
 
@@ -488,8 +530,6 @@ class SummaryWidget(QWidget):
                 parent=self, init_channel=self._reset_intlk, pressValue=1)
             self.reset_bt.setIcon(qta.icon('fa5s.sync'))
             self.reset_bt.setObjectName('reset_bt')
-            self.reset_bt.setStyleSheet(
-                '#reset_bt{min-width:25px; max-width:25px; icon-size:20px;}')
             self.reset_wid.layout().addWidget(self.reset_bt)
         elif name == 'ctrlloop' and not self._is_regatron:
             self.ctrlloop_bt = PyDMStateButton(
@@ -601,7 +641,8 @@ class SummaryHeader(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        _widths = get_prop2width(self._name)
+        if self._name.dev == 'DCLink':
+            set_style_class(self, 'DCLink')
 
         lay = QHBoxLayout()
         lay.setSpacing(10)
@@ -610,16 +651,11 @@ class SummaryHeader(QWidget):
         if self._name.dis == 'PS' and 'DCLink' not in self._name.dev:
             hidden = QLabel(' ')
             hidden.setObjectName('HiddenButton')
-            hidden.setStyleSheet('min-width: 10px; max-width: 10px;')
             lay.addWidget(hidden)
         for idt, label in self.all_props.items():
             widget = QLabel(label, self)
             widget.setObjectName(idt)
-            width = _widths[idt]
             widget.setSizePolicy(QSzPlcy.Fixed, QSzPlcy.Preferred)
-            widget.setStyleSheet(
-                'font-weight: bold; qproperty-alignment: AlignCenter;'
-                'min-width: {0}em; max-width: {0}em;'.format(width))
             widget.setVisible(idt in self.visible_props)
             lay.addWidget(widget)
         lay.addStretch()
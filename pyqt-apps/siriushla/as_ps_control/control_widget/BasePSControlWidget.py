@@ -1,24 +1,66 @@
 """Base class for controlling a power supply."""
 import re
+import logging as _log
+from functools import partial as _part
 
-from qtpy.QtCore import Qt, Slot, QLocale
+from qtpy.QtCore import Qt, Slot, Signal, QLocale, QTimer, \
+    QStringListModel
 from qtpy.QtWidgets import QWidget, QVBoxLayout, QGroupBox, \
-    QGridLayout, QLabel, QHBoxLayout, QScrollArea, QLineEdit, QAction, \
-    QMenu, QInputDialog, QFrame, QPushButton, QSplitter, \
-    QSizePolicy as QSzPlcy
+    QGridLayout, QLabel, QHBoxLayout, QLineEdit, QAction, \
+    QMenu, QInputDialog, QFrame, QPushButton, QSplitter, QTableView, \
+    QAbstractItemView, QSizePolicy as QSzPlcy
 import qtawesome as qta
 from pydm.connection_inspector import ConnectionInspector
 
 from siriuspy.search import PSSearch
 from siriuspy.namesys import SiriusPVName as PVName
 from siriushla.util import connect_window, connect_newprocess
+from siriushla.common.epics.task import EpicsSetter
+from siriushla.common.epics.wrapper import PyEpicsWrapper
 from ..PSDetailWindow import PSDetailWindow
 from ..SummaryWidgets import SummaryWidget, SummaryHeader, \
-    get_prop2label, sort_propties
+    get_prop2label, get_writable_pvname, sort_propties, IsPulsed, IsLinac
+
+
+# tasks writing to power supplies without widgets, kept until deleted so
+# that they outlive the widget that started them
+_RUNNING_TASKS = set()
+
+
+class _WritablePVWrapper(PyEpicsWrapper):
+    """PyEpicsWrapper that does not put to PVs without write access."""
+
+    def put(self, value, wait=PyEpicsWrapper.TIMEOUT):
+        """Put if connected and writable."""
+        if not self._pv.wait_for_connection(wait):
+            return False
+        if not self._pv.write_access:
+            _log.warning('PV {} not writable, not set.'.format(self.pvname))
+            return False
+        return self._pv.put(value)
+
+
+def get_search_names(psname):
+    """Return names matched by the search filter of a power supply."""
+    names = [psname, ]
+    if not IsPulsed.match(psname) and not IsLinac.match(psname) and \
+            PSSearch.conv_psname_2_psmodel(psname) != 'REGATRON_DCLink':
+        names.append(PSSearch.conv_psname_2_bbbname(psname))
+        names.append(PSSearch.conv_psname_2_udc(psname))
+    dclinks = PSSearch.conv_psname_2_dclink(psname)
+    if dclinks:
+        names.extend(dclinks)
+        if PSSearch.conv_psname_2_psmodel(dclinks[0]) != 'REGATRON_DCLink':
+            for dc in dclinks:
+                names.append(PSSearch.conv_psname_2_bbbname(dc))
+                names.append(PSSearch.conv_psname_2_udc(dc))
+    return names
 
 
 class PSContainer(QWidget):
 
+    dclinkToggled = Signal(bool)
+
     def __init__(self, widget, parent=None):
         super().__init__(parent)
         self._widget = widget
@@ -94,6 +136,22 @@ class PSContainer(QWidget):
         else:
             self._hide.setIcon(qta.icon('mdi.plus'))
             self._dclink_container.setHidden(True)
+        self.dclinkToggled.emit(not self._dclink_container.isHidden())
+
+    @property
+    def summary_widget(self):
+        """Power supply SummaryWidget."""
+        return self._widget
+
+    @property
+    def dclink_visible(self):
+        """Whether DCLinks are shown."""
+        return not self._dclink_container.isHidden()
+
+    def set_dclink_visible(self, value):
+        """Show or hide DCLinks."""
+        if self.dclinks and value != self.dclink_visible:
+            self._toggle_dclink()
 
     def _fill_dclink_container(self):
         self._dclink_is_filled = True
@@ -227,12 +285,179 @@ class PSContainer(QWidget):
         c.show()
 
 
+class PSContainerList(QTableView):
+    """List of power supply containers created on demand.
+
+    Containers, with their channels, are only created for the rows shown
+    in the viewport and a margin of MARGIN rows around them. Containers
+    that move farther than RELEASE_MARGIN rows from the viewport, or whose
+    rows are hidden, are deleted and created again when needed.
+    """
+
+    MARGIN = 4
+    RELEASE_MARGIN = 16
+
+    def __init__(self, psnames, create_func, parent=None):
+        """Init.
+
+        Parameters:
+        psnames - names of the power supplies, one for each row;
+        create_func - callable returning the container of a power supply.
+        """
+        super().__init__(parent)
+        self._psnames = list(psnames)
+        self._create_func = create_func
+        self._containers = dict()
+        self._expanded = set()
+        self._row_height = None
+
+        self.setModel(QStringListModel(self._psnames, self))
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.setShowGrid(False)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setObjectName('pslist')
+        self.setStyleSheet('#pslist {background-color: transparent;}')
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update_rows)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_update)
+
+    @property
+    def psnames(self):
+        """Names of the power supplies."""
+        return list(self._psnames)
+
+    @property
+    def containers(self):
+        """Dictionary of created containers by power supply name."""
+        return {self._psnames[row]: cont
+                for row, cont in self._containers.items()}
+
+    def set_filtered(self, psnames):
+        """Show only the rows of the power supplies in psnames."""
+        for row, psname in enumerate(self._psnames):
+            self.setRowHidden(row, psname not in psnames)
+        self.scrollToTop()
+        self.schedule_update()
+
+    def schedule_update(self):
+        """Update rows in the next event loop pass."""
+        self._update_timer.start()
+
+    def update_rows(self):
+        """Create containers near the viewport and delete far ones."""
+        if not self.isVisible() or not self._psnames:
+            return
+        first, last = self._visible_range()
+        if first < 0:
+            rows = set()
+        else:
+            rows = self._band(first, last, self.MARGIN)
+            keep = self._band(first, last, self.RELEASE_MARGIN)
+        for row in list(self._containers):
+            if not rows or row not in keep:
+                self._release(row)
+        for row in sorted(rows - set(self._containers)):
+            self._create(row)
+        self._fit_width()
+        # created rows may not have the estimated height
+        if self._visible_range() != (first, last):
+            self.schedule_update()
+
+    def _visible_range(self):
+        first = self.rowAt(0)
+        if first < 0:
+            return first, first
+        last = self.rowAt(self.viewport().height() - 1)
+        if last < 0:
+            last = len(self._psnames) - 1
+        return first, last
+
+    def _band(self, first, last, margin):
+        rows = set(range(first, last + 1))
+        for step, start in ((-1, first - 1), (1, last + 1)):
+            row, count = start, 0
+            while 0 <= row < len(self._psnames) and count < margin:
+                if not self.isRowHidden(row):
+                    rows.add(row)
+                    count += 1
+                row += step
+        return {row for row in rows if not self.isRowHidden(row)}
+
+    def _create(self, row):
+        psname = self._psnames[row]
+        container = self._create_func(psname)
+        self._containers[row] = container
+        self.setIndexWidget(self.model().index(row, 0), container)
+        if psname in self._expanded:
+            container.set_dclink_visible(True)
+        container.dclinkToggled.connect(
+            lambda value: self._dclink_toggled(row, value))
+        height = container.sizeHint().height()
+        if self._row_height is None:
+            # estimate the height of the rows not created yet
+            self._row_height = height
+            self.verticalHeader().setDefaultSectionSize(height)
+        self.setRowHeight(row, height)
+
+    def _release(self, row):
+        container = self._containers.pop(row)
+        container.dclinkToggled.disconnect()
+        # the index widget is deleted when replaced
+        self.setIndexWidget(self.model().index(row, 0), None)
+
+    def _dclink_toggled(self, row, value):
+        psname = self._psnames[row]
+        if value:
+            self._expanded.add(psname)
+        else:
+            self._expanded.discard(psname)
+        container = self._containers[row]
+        container.layout().activate()
+        self.setRowHeight(row, container.sizeHint().height())
+        self.schedule_update()
+
+    def _fit_width(self):
+        width = 0
+        for container in self._containers.values():
+            container.layout().activate()
+            width = max(width, container.sizeHint().width())
+        if width:
+            self.setColumnWidth(0, width)
+
+    # Overloaded methods
+    def showEvent(self, event):
+        """Create visible containers when shown."""
+        super().showEvent(event)
+        self.schedule_update()
+
+    def resizeEvent(self, event):
+        """Create visible containers when resized."""
+        super().resizeEvent(event)
+        self.schedule_update()
+
+
 class BasePSControlWidget(QWidget):
-    """Base widget class to control power supply."""
+    """Base widget class to control power supply.
+
+    Power supply rows are created only when scrolled into view, see
+    PSContainerList. summaryWidgetCreated is emitted with the SummaryWidget
+    of each created row.
+    """
 
     HORIZONTAL = 0
     VERTICAL = 1
 
+    summaryWidgetCreated = Signal(object)
+
     def __init__(self, subsection=None, orientation=0, parent=None):
         """Class constructor.
 
@@ -271,9 +496,10 @@ class BasePSControlWidget(QWidget):
         self.visible_props = sort_propties(self.visible_props)
 
         # Data used to filter the widgets
-        self.ps_widgets_dict = dict()
-        self.containers_dict = dict()
-        self.filtered_widgets = set()  # Set with key of visible widgets
+        self.headers_dict = dict()
+        self.lists_dict = dict()
+        self.filtered_widgets = set(self._dev_list)  # names of visible PS
+        self._search_names = dict()
 
         # Setup the UI
         self.groups = self._getGroups()
@@ -330,24 +556,17 @@ class BasePSControlWidget(QWidget):
             header = SummaryHeader(pwrsupplies[0],
                                    visible_props=self.visible_props,
                                    parent=self)
-            self.containers_dict['header '+group[0]] = header
-            self.filtered_widgets.add('header '+group[0])
-
-            # Loop power supply to create all the widgets of a groupbox
-            group_widgets = list()
-            for n, psname in enumerate(pwrsupplies):
-                ps_widget = SummaryWidget(
-                    name=psname, visible_props=self.visible_props, parent=self)
-                pscontainer = PSContainer(ps_widget, self)
-                group_widgets.append(pscontainer)
-                self.containers_dict[psname] = pscontainer
-                self.filtered_widgets.add(psname)
-                self.ps_widgets_dict[psname] = ps_widget
+            self.headers_dict[group[0]] = header
+
+            # Create list, rows are filled when shown
+            pslist = PSContainerList(
+                pwrsupplies, self._create_container, self)
+            self.lists_dict[group[0]] = pslist
 
             # Create group
             wid_type = 'groupbox' if group[0] else 'widget'
             group_wid = self._createGroupWidget(
-                group[0], header, group_widgets, wid_type=wid_type)
+                group[0], header, pslist, wid_type=wid_type)
 
             # Add group box to grid layout
             if len(self.groups) == 3:
@@ -360,37 +579,40 @@ class BasePSControlWidget(QWidget):
                 self.pwrsupplies_layout.addWidget(group_wid)
 
         self.count_label.setText(
-            "Showing {} power supplies.".format(
-                len(self.filtered_widgets)-len(self.groups)))
+            "Showing {} power supplies.".format(len(self.filtered_widgets)))
         self.setLayout(self.layout)
 
-    def _createGroupWidget(self, title, header, widget_group,
+    def _createGroupWidget(self, title, header, pslist,
                            wid_type='groupbox'):
-        scr_area_wid = QWidget(self)
-        scr_area_wid.setObjectName('scr_ar_wid')
-        scr_area_wid.setStyleSheet(
-            '#scr_ar_wid {background-color: transparent;}')
-        w_lay = QVBoxLayout(scr_area_wid)
-        w_lay.setSpacing(0)
-        w_lay.setContentsMargins(0, 0, 0, 0)
-        for line, widget in enumerate(widget_group):
-            w_lay.addWidget(widget, alignment=Qt.AlignLeft)
-        w_lay.addStretch()
-
-        scr_area = QScrollArea(self)
-        scr_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scr_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scr_area.setWidgetResizable(True)
-        scr_area.setFrameShape(QFrame.NoFrame)
-        scr_area.setWidget(scr_area_wid)
-
         wid = QGroupBox(title, self) if wid_type == 'groupbox' \
             else QWidget(self)
         gb_lay = QVBoxLayout(wid)
         gb_lay.addWidget(header, alignment=Qt.AlignLeft)
-        gb_lay.addWidget(scr_area)
+        gb_lay.addWidget(pslist)
         return wid
 
+    def _create_container(self, psname):
+        ps_widget = SummaryWidget(
+            name=psname, visible_props=self.visible_props, parent=self)
+        container = PSContainer(ps_widget, self)
+        container.update_visible_props(self.visible_props)
+        self.summaryWidgetCreated.emit(ps_widget)
+        return container
+
+    @property
+    def containers_dict(self):
+        """Dictionary of created PSContainers by power supply name."""
+        containers = dict()
+        for pslist in self.lists_dict.values():
+            containers.update(pslist.containers)
+        return containers
+
+    @property
+    def ps_widgets_dict(self):
+        """Dictionary of created SummaryWidgets by power supply name."""
+        return {name: cont.summary_widget
+                for name, cont in self.containers_dict.items()}
+
     def _getSplitter(self):
         if self._orientation == self.HORIZONTAL:
             return QSplitter(Qt.Horizontal)
@@ -410,30 +632,17 @@ class BasePSControlWidget(QWidget):
 
         # Clear filtered widgets and add the ones that match the new pattern
         self.filtered_widgets.clear()
-        for name, container in self.containers_dict.items():
-            cond = 'header' in name
-            if not cond:
-                cond |= bool(pattern.search(name))
-                cond |= bool(pattern.search(container.bbbname))
-                cond |= bool(pattern.search(container.udcname))
-                for dc in container.dclinks:
-                    cond |= bool(pattern.search(dc))
-                for dc in container.dclinksbbbname:
-                    cond |= bool(pattern.search(dc))
-                for dc in container.dclinksudcname:
-                    cond |= bool(pattern.search(dc))
-            if cond:
+        for name in self._dev_list:
+            if name not in self._search_names:
+                self._search_names[name] = get_search_names(name)
+            if any(pattern.search(n) for n in self._search_names[name]):
                 self.filtered_widgets.add(name)
 
-        # Set widgets visibility and the number of widgets matched
-        self._set_widgets_visibility()
+        # Set rows visibility, scroll to top and show the number matched
+        for pslist in self.lists_dict.values():
+            pslist.set_filtered(self.filtered_widgets)
         self.count_label.setText(
-            "Showing {} power supplies".format(
-                len(self.filtered_widgets)-len(self.groups)))
-
-        # Scroll to top
-        for scroll_area in self.findChildren(QScrollArea):
-            scroll_area.verticalScrollBar().setValue(0)
+            "Showing {} power supplies".format(len(self.filtered_widgets)))
 
     def _set_widgets_visibility(self):
         """Set visibility of the widgets."""
@@ -441,27 +650,26 @@ class BasePSControlWidget(QWidget):
                  if act.isChecked()]
         self.visible_props = sort_propties(props)
         self._enable_actions()
-        for key, wid in self.containers_dict.items():
+        for header in self.headers_dict.values():
+            header.update_visible_props(props)
+            for ob in header.findChildren(QWidget):
+                name = ob.objectName()
+                ob.setVisible(name in props or 'Hidden' in name)
+        # rows not created yet are created with the new properties
+        for wid in self.containers_dict.values():
             wid.update_visible_props(props)
-            if 'header' in key:
-                for ob in wid.findChildren(QWidget):
-                    name = ob.objectName()
-                    ob.setVisible(name in props or 'Hidden' in name)
-            else:
-                vis = key in self.filtered_widgets
-                wid.setVisible(vis)
-                if not vis:
-                    continue
-                objs = wid.findChildren(SummaryWidget)
-                objs.extend(wid.findChildren(SummaryHeader))
-                for ob in objs:
-                    chil = ob.findChildren(
-                        QWidget, options=Qt.FindDirectChildrenOnly)
-                    for c in chil:
-                        name = c.objectName()
-                        if isinstance(ob, SummaryWidget) and name in props:
-                            ob.fillWidget(name)
-                        c.setVisible(name in props)
+            objs = wid.findChildren(SummaryWidget)
+            objs.extend(wid.findChildren(SummaryHeader))
+            for ob in objs:
+                chil = ob.findChildren(
+                    QWidget, options=Qt.FindDirectChildrenOnly)
+                for c in chil:
+                    name = c.objectName()
+                    if isinstance(ob, SummaryWidget) and name in props:
+                        ob.fillWidget(name)
+                    c.setVisible(name in props)
+        for pslist in self.lists_dict.values():
+            pslist.schedule_update()
 
     # Actions methods
     def _create_actions(self):
@@ -520,6 +728,7 @@ class BasePSControlWidget(QWidget):
                         widget.turn_off()
                 except TypeError:
                     pass
+        self._put_to_unloaded('PwrState-Sel', 1 if state else 0)
 
     @Slot()
     def _set_slowref(self):
@@ -530,6 +739,7 @@ class BasePSControlWidget(QWidget):
                     widget.set_opmode_slowref()
                 except TypeError:
                     pass
+        self._put_to_unloaded('OpMode-Sel', 'SlowRef')
 
     @Slot()
     def _set_current_sp(self):
@@ -547,6 +757,7 @@ class BasePSControlWidget(QWidget):
                         sp.send_value()
                     except TypeError:
                         pass
+            self._put_to_unloaded('{analog}-SP', new_value)
 
     @Slot()
     def _reset_interlocks(self):
@@ -557,6 +768,7 @@ class BasePSControlWidget(QWidget):
                     widget.reset()
                 except TypeError:
                     pass
+        self._put_to_unloaded('Reset-Cmd', 1)
 
     @Slot(bool)
     def _set_wfmupdate(self, state):
@@ -570,6 +782,30 @@ class BasePSControlWidget(QWidget):
                         widget.wfmupdate_off()
                 except TypeError:
                     pass
+        self._put_to_unloaded('WfmUpdateAuto-Sel', 1 if state else 0)
+
+    def _put_to_unloaded(self, propty, value):
+        """Write value to propty of filtered power supplies not created.
+
+        Rows scrolled out of view have no widgets, so actions are applied
+        directly to their PVs, in a thread, skipping power supplies without
+        the property and PVs without write access. '{analog}' in propty is
+        replaced by the analog property name of each power supply. The
+        thread has no parent, so closing the window does not destroy it
+        while running.
+        """
+        psnames = self.filtered_widgets - set(self.containers_dict)
+        pvnames = [get_writable_pvname(psn, propty) for psn in sorted(psnames)]
+        pvnames = [pvn for pvn in pvnames if pvn]
+        if not pvnames:
+            return
+        task = EpicsSetter(
+            pvnames, [value]*len(pvnames), [0.0]*len(pvnames),
+            _WritablePVWrapper)
+        _RUNNING_TASKS.add(task)
+        task.finished.connect(task.deleteLater)
+        task.destroyed.connect(_part(_RUNNING_TASKS.discard, task))
+        task.start()
 
     # Overloaded method
     def contextMenuEvent(self, event):
@@ -595,5 +831,8 @@ class BasePSControlWidget(QWidget):
         c.show()
 
     def get_summary_widgets(self):
-        """Return Summary Widgets."""
-        return self.findChildren(SummaryWidget)
+        """Return Summary Widgets created so far.
+
+        Connect to summaryWidgetCreated to handle the ones created later.
+        """
+        return list(self.ps_widgets_dict.values())
@@ -285,7 +285,7 @@ class CycleWindow(SiriusMainWindow):
 
         # connect tree signals
         self.pwrsupplies_tree.tree.doubleClicked.connect(self._open_ps_detail)
-        self.pwrsupplies_tree.tree.itemChanged.connect(
+        self.pwrsupplies_tree.itemsChecked.connect(
             self._handle_checked_items_changed)
         self.pwrsupplies_tree.check_requested_levels(self._checked_accs)
 
@@ -495,31 +495,32 @@ class CycleWindow(SiriusMainWindow):
 
         return pwrsupplies
 
-    def _handle_checked_items_changed(self, item):
-        psname = PVName(item.data(0, Qt.DisplayRole))
-        if not _re.match('.*-.*:.*-.*', psname):
-            return
+    def _handle_checked_items_changed(self, items):
+        tree = self.pwrsupplies_tree
+        handled = set()
+        for item in items:
+            psname = PVName(item.data(0, Qt.DisplayRole))
+            if not _re.match('.*-.*:.*-.*', psname):
+                continue
 
-        if not self._is_adv_mode and psname.sec == 'SI':
-            psname2check = Filter.process_filters(
-                self._psnames, filters={'sec': 'SI'})
-            psname2check.remove(psname)
             state2set = item.checkState(0)
-            for psn in psname2check:
-                item2check = self.pwrsupplies_tree._item_map[psn]
-                if item2check.checkState(0) != state2set:
-                    item2check.setCheckState(0, state2set)
-        else:
-            if (psname.sec in ['BO', 'SI'] and psname.dev in ['B', 'B1B2']):
+            if not self._is_adv_mode and psname.sec == 'SI':
+                # all SI power supplies get the same state at once
+                if state2set in handled:
+                    continue
+                handled.add(state2set)
+                psname2check = Filter.process_filters(
+                    self._psnames, filters={'sec': 'SI'})
+                psname2check.remove(psname)
+                psname2check = [psn for psn in psname2check
+                                if tree.check_state(psn) != state2set]
+                tree.set_check_state(psname2check, state2set)
+            elif psname.sec in ['BO', 'SI'] and psname.dev in ['B', 'B1B2']:
                 psname2check = PSSearch.get_psnames(
                     {'sec': psname.sec, 'dev': 'B.*'})
                 psname2check.remove(psname)
-                item2check = self.pwrsupplies_tree._item_map[psname2check[0]]
-
-                state2set = item.checkState(0)
-                state2change = item2check.checkState(0)
-                if state2change != state2set:
-                    item2check.setCheckState(0, state2set)
+                if tree.check_state(psname2check[0]) != state2set:
+                    tree.set_check_state(psname2check[:1], state2set)
 
         self._prepared.update(self._prepared_init_vals)
         self._needs_update_setup = True
@@ -546,8 +547,7 @@ class CycleWindow(SiriusMainWindow):
             {'sec': 'SI', 'sub': 'Fam', 'dis': 'PS'})
         has_sifam = False
         for psn in si_fams:
-            item = self.pwrsupplies_tree._item_map[psn]
-            has_sifam |= item.checkState(0) != 0
+            has_sifam |= self.pwrsupplies_tree.check_state(psn) != 0
 
         if not has_sifam:
             self.cycle_bt.setText('8. Cycle')
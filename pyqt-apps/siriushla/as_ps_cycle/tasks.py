@@ -1,11 +1,11 @@
 
-from copy import deepcopy as _dcopy
-import time as _time
+from functools import partial as _part
 from datetime import datetime as _datetime
 from qtpy.QtCore import Signal, QThread
 from siriuspy.namesys import SiriusPVName as PVName
 from siriuspy.search import PSSearch
 from siriuspy.cycle import PSCycler, LinacPSCycler, PSCyclerFBP, CycleController
+from siriushla.common.epics.task import DeviceExecutor
 
 
 TIMEOUT_CHECK = 10
@@ -38,6 +38,8 @@ class BaseTask(QThread):
             else:
                 BaseTask._controller.logger = self
         self._quit_task = False
+        self._executor = DeviceExecutor(
+            name=type(self).__name__, quit_func=lambda: self._quit_task)
 
     def size(self):
         """Return task size."""
@@ -47,6 +49,11 @@ class BaseTask(QThread):
         """Return task maximum duration."""
         raise NotImplementedError
 
+    @property
+    def timings(self):
+        """List of (phase, number of power supplies, duration) of the task."""
+        return self._executor.timings
+
     def exit_task(self):
         """Set flag to quit thread."""
         self._quit_task = True
@@ -69,43 +76,39 @@ class BaseTask(QThread):
 
     def _set(self, method, **kwargs):
         """Set."""
-        for ps in self._psnames:
+        func = _part(self._set_cycler, method, kwargs)
+        for ps, done in self._executor.run(
+                'set '+method, func, self._psnames):
             self.currentItem.emit(ps)
-            cycler = BaseTask._cyclers[ps]
-            if not cycler.wait_for_connection(TIMEOUT_CONN):
-                self.itemDone.emit(ps, False)
-                continue
-            func = getattr(cycler, method)
-            func(**kwargs)
-            self.itemDone.emit(ps, True)
-            if self._quit_task:
-                self._interrupted = True
-                break
+            self.itemDone.emit(ps, done)
+        if self._quit_task:
+            self._interrupted = True
 
     def _check(self, method, timeout=TIMEOUT_CHECK, **kwargs):
         """Check."""
         self._interrupted = False
-        need_check = _dcopy(self._psnames)
-        t = _time.time()
-        while _time.time() - t < timeout:
-            for ps in self._psnames:
-                if ps not in need_check:
-                    continue
-                cycler = BaseTask._cyclers[ps]
-                func = getattr(cycler, method)
-                if func(**kwargs):
-                    self.currentItem.emit(ps)
-                    need_check.remove(ps)
-                    self.itemDone.emit(ps, True)
-                if self._quit_task:
-                    self._interrupted = True
-                    break
-            if (not need_check) or (self._quit_task):
-                break
-            _time.sleep(TIMEOUT_SLEEP)
-        for ps in need_check:
+        func = _part(self._check_cycler, method, kwargs)
+        for ps, done in self._executor.poll(
+                'check '+method, func, self._psnames, timeout, TIMEOUT_SLEEP):
             self.currentItem.emit(ps)
-            self.itemDone.emit(ps, False)
+            self.itemDone.emit(ps, done)
+        if self._quit_task:
+            self._interrupted = True
+
+    @staticmethod
+    def _set_cycler(method, kwargs, psname):
+        cycler = BaseTask._cyclers[psname]
+        if not cycler.wait_for_connection(TIMEOUT_CONN):
+            return False
+        func = getattr(cycler, method)
+        func(**kwargs)
+        return True
+
+    @staticmethod
+    def _check_cycler(method, kwargs, psname):
+        cycler = BaseTask._cyclers[psname]
+        func = getattr(cycler, method)
+        return func(**kwargs)
 
 
 class CreateCyclers(BaseTask):
@@ -113,20 +116,28 @@ class CreateCyclers(BaseTask):
 
     def function(self):
         """Create cyclers."""
+        create = list()
         for psname in self._psnames:
-            self.currentItem.emit(psname)
             if psname not in BaseTask._cyclers:
-                if PVName(psname).sec == 'LI':
-                    c = LinacPSCycler(psname)
-                elif PSSearch.conv_psname_2_psmodel(psname) == 'FBP':
-                    c = PSCyclerFBP(psname)
-                else:
-                    c = PSCycler(psname)
-                BaseTask._cyclers[psname] = c
+                create.append(psname)
+                continue
+            self.currentItem.emit(psname)
+            self.itemDone.emit(psname, True)
+        for psname, cycler in self._executor.run(
+                'create', self._create_cycler, create):
+            BaseTask._cyclers[psname] = cycler
+            self.currentItem.emit(psname)
             self.itemDone.emit(psname, True)
-            if self._quit_task:
-                self._interrupted = True
-                break
+        if self._quit_task:
+            self._interrupted = True
+
+    @staticmethod
+    def _create_cycler(psname):
+        if PVName(psname).sec == 'LI':
+            return LinacPSCycler(psname)
+        elif PSSearch.conv_psname_2_psmodel(psname) == 'FBP':
+            return PSCyclerFBP(psname)
+        return PSCycler(psname)
 
 
 class VerifyPS(BaseTask):
@@ -0,0 +1,317 @@
+"""Models of the power supply diagnostic log tables."""
+
+from qtpy.QtCore import Qt, Signal, QTimer, QModelIndex, \
+    QAbstractTableModel, QSortFilterProxyModel
+
+
+class _FenwickTree:
+    """Binary indexed tree of counts.
+
+    Allows to update counts, compute prefix sums and find the position of
+    the k-th count in logarithmic time.
+    """
+
+    def __init__(self, size):
+        self._size = size
+        self._tree = [0]*(size + 1)
+        self._msb = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, idx, value):
+        """Add value to count of position idx."""
+        idx += 1
+        while idx <= self._size:
+            self._tree[idx] += value
+            idx += idx & -idx
+
+    def prefix(self, idx):
+        """Return sum of counts of positions 0 to idx."""
+        idx += 1
+        total = 0
+        while idx > 0:
+            total += self._tree[idx]
+            idx -= idx & -idx
+        return total
+
+    def find(self, k):
+        """Return smallest position whose prefix sum is k, with k >= 1."""
+        pos = 0
+        bit = self._msb
+        while bit:
+            nxt = pos + bit
+            if nxt <= self._size and self._tree[nxt] < k:
+                pos = nxt
+                k -= self._tree[nxt]
+            bit >>= 1
+        return pos
+
+    def rebuild(self, counts):
+        """Rebuild tree from list of counts."""
+        tree = [0] + list(counts)
+        for idx in range(1, self._size + 1):
+            parent = idx + (idx & -idx)
+            if parent <= self._size:
+                tree[parent] += tree[idx]
+        self._tree = tree
+
+
+class _LogEntry:
+    """Log entry: row values, insertion number and ring buffer position."""
+
+    __slots__ = ('values', 'key', 'seq', 'slot')
+
+    def __init__(self, values, key, seq):
+        self.values = values
+        self.key = key
+        self.seq = seq
+        self.slot = None
+
+
+class LogTableModel(QAbstractTableModel):
+    """Table model of log entries kept in a bounded ring buffer.
+
+    Rows are ordered from the newest to the oldest entry and, once the
+    buffer is full, new entries drop the oldest ones. Entries are indexed
+    by key, the values of the (logtype, psname, propty) columns, so they
+    are removed without scanning the table. In unique mode, adding an
+    entry replaces the one with the same key.
+
+    Added entries are inserted in batches, once per event loop pass, and
+    the updated signal is emitted after each change of the table.
+
+    Data of SortRole is the column value followed by the insertion number
+    of the entry, so that entries with equal values are sorted by age.
+    """
+
+    KEY_COLUMNS = (2, 3, 4)
+    SortRole = Qt.UserRole
+
+    updated = Signal()
+
+    def __init__(self, headers, capacity=10000, unique=False, parent=None):
+        """Init."""
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._capacity = capacity
+        self._unique = unique
+        self._slots = [None]*capacity
+        self._live = _FenwickTree(capacity)
+        self._head = 0
+        self._count = 0
+        self._seq = 0
+        self._index = dict()
+        self._pending = dict()
+        self._pending_seq = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def capacity(self):
+        """Maximum number of entries."""
+        return self._capacity
+
+    # --- QAbstractTableModel interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return number of entries."""
+        if parent.isValid():
+            return 0
+        return self._count
+
+    def columnCount(self, parent=QModelIndex()):
+        """Return number of columns."""
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return header labels."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return entry values."""
+        if not index.isValid() or index.row() >= self._count:
+            return None
+        if role == Qt.DisplayRole:
+            return self._entry_at(index.row()).values[index.column()]
+        elif role == self.SortRole:
+            entry = self._entry_at(index.row())
+            return '{} {:012d}'.format(entry.values[index.column()], entry.seq)
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    # --- entries handling ---
+
+    def rowData(self, row):
+        """Return values of entry at row."""
+        return self._entry_at(row).values
+
+    def add(self, values):
+        """Add entry with values, one for each column.
+
+        The entry is inserted in the next event loop pass.
+        """
+        key = tuple(values[col] for col in self.KEY_COLUMNS)
+        if self._unique:
+            # keep only the last pending entry with this key
+            self._pending.pop(key, None)
+            self._pending[key] = values
+        else:
+            self._pending[self._pending_seq] = values
+            self._pending_seq += 1
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def remove(self, key):
+        """Remove all entries, pending or not, with key."""
+        if self._unique:
+            self._pending.pop(key, None)
+        elif self._pending:
+            self._pending = {
+                seq: vals for seq, vals in self._pending.items()
+                if tuple(vals[col] for col in self.KEY_COLUMNS) != key}
+        entries = self._index.get(key)
+        if not entries:
+            return
+        for entry in list(entries):
+            self._remove_entry(entry)
+        self.updated.emit()
+
+    def clear(self):
+        """Remove all entries."""
+        self.beginResetModel()
+        self._slots = [None]*self._capacity
+        self._live = _FenwickTree(self._capacity)
+        self._head = 0
+        self._count = 0
+        self._index = dict()
+        self._pending = dict()
+        self.endResetModel()
+        self.updated.emit()
+
+    def flush(self):
+        """Insert pending entries."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending = list(self._pending.values())[-self._capacity:]
+        self._pending = dict()
+
+        entries = list()
+        for values in pending:
+            key = tuple(values[col] for col in self.KEY_COLUMNS)
+            if self._unique and self._index.get(key):
+                for entry in list(self._index[key]):
+                    self._remove_entry(entry)
+            entries.append(_LogEntry(values, key, self._seq))
+            self._seq += 1
+
+        # drop oldest entries to make room for the new ones
+        nr_drop = self._count + len(entries) - self._capacity
+        if nr_drop > 0:
+            self.beginRemoveRows(
+                QModelIndex(), self._count - nr_drop, self._count - 1)
+            for _ in range(nr_drop):
+                slot = self._slot_of_row(self._count - 1)
+                self._release(self._slots[slot])
+            self.endRemoveRows()
+
+        # entries removed from the middle of the buffer leave holes that
+        # must be packed before the head reaches them
+        cap = self._capacity
+        if any(self._slots[(self._head + i) % cap] is not None
+               for i in range(len(entries))):
+            self._compact()
+
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        for entry in entries:
+            slot = self._head
+            entry.slot = slot
+            self._slots[slot] = entry
+            self._live.add(slot, 1)
+            self._head = (slot + 1) % cap
+            self._count += 1
+            self._index.setdefault(entry.key, dict())[entry] = None
+        self.endInsertRows()
+        self.updated.emit()
+
+    # --- ring buffer helpers ---
+
+    def _entry_at(self, row):
+        return self._slots[self._slot_of_row(row)]
+
+    def _slot_of_row(self, row):
+        # rows go from the slot before the head backwards, wrapping around
+        newest = (self._head - 1) % self._capacity
+        nr_before = self._live.prefix(newest)
+        k = (nr_before - row - 1) % self._count + 1
+        return self._live.find(k)
+
+    def _row_of_slot(self, slot):
+        newest = (self._head - 1) % self._capacity
+        nr_before = self._live.prefix(newest)
+        if slot <= newest:
+            return nr_before - self._live.prefix(slot)
+        return nr_before + self._count - self._live.prefix(slot)
+
+    def _remove_entry(self, entry):
+        row = self._row_of_slot(entry.slot)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._release(entry)
+        self.endRemoveRows()
+
+    def _release(self, entry):
+        self._slots[entry.slot] = None
+        self._live.add(entry.slot, -1)
+        self._count -= 1
+        entries = self._index[entry.key]
+        del entries[entry]
+        if not entries:
+            del self._index[entry.key]
+
+    def _compact(self):
+        """Pack entries at the beginning of the buffer, keeping rows order."""
+        cap = self._capacity
+        entries = list()
+        for i in range(cap):
+            entry = self._slots[(self._head + i) % cap]
+            if entry is not None:
+                entries.append(entry)
+        self._slots = [None]*cap
+        for slot, entry in enumerate(entries):
+            entry.slot = slot
+            self._slots[slot] = entry
+        self._live.rebuild(
+            1 if entry is not None else 0 for entry in self._slots)
+        self._head = len(entries) % cap
+
+
+class LogFilterProxyModel(QSortFilterProxyModel):
+    """Sort and filter log entries.
+
+    Rows are accepted if every pattern matches its column. Rows with equal
+    values in the sorted column are ordered by age.
+    """
+
+    def __init__(self, parent=None):
+        """Init."""
+        super().__init__(parent)
+        self._patterns = list()
+        self.setSortRole(LogTableModel.SortRole)
+        self.setDynamicSortFilter(True)
+
+    def setPatterns(self, patterns):
+        """Set list of (compiled regular expression, column) to filter."""
+        self._patterns = list(patterns)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Return whether all patterns match row."""
+        if not self._patterns:
+            return True
+        values = self.sourceModel().rowData(source_row)
+        return all(pat.search(values[col]) for pat, col in self._patterns)
@@ -9,7 +9,6 @@ from pcaspy import Severity as _Sev
 
 import numpy as _np
 
-from qtpy.QtGui import QStandardItemModel, QStandardItem
 from qtpy.QtCore import Qt, Slot, Signal
 from qtpy.QtWidgets import QWidget, QLabel, QPushButton, \
     QGridLayout, QSpacerItem, QSizePolicy as QSzPlcy, QLineEdit, \
@@ -32,6 +31,7 @@ from siriushla.widgets import SiriusMainWindow, SiriusConnectionSignal, \
     PyDMLedMultiChannel, PyDMLed, PyDMLedMultiConnection, QLed
 
 from siriushla.as_ps_diag.util import asps2filters, lips2filters, sips2filters
+from siriushla.as_ps_diag.log_model import LogTableModel, LogFilterProxyModel
 
 
 class PSDiag(SiriusMainWindow):
@@ -199,7 +199,6 @@ class PSDiag(SiriusMainWindow):
         self._status = LogTable(cw, channels, table_label2px, is_status=True)
         self._status.setObjectName('status_table')
         self._status.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        self._status.updated.connect(self._filter_table)
         self._log = LogTable(cw, channels, table_label2px)
         self._log.setObjectName('log_table')
         self._log.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
@@ -345,16 +344,7 @@ class PSDiag(SiriusMainWindow):
         except Exception:
             return
 
-        m = self._visible_table.model()
-        for row in range(m.rowCount()):
-            for pat, col in pats:
-                if not pat.search(m.data(m.index(row, col))):
-                    self._visible_table.setRowHidden(
-                        row, self._visible_table.rootIndex(), True)
-                    break
-            else:
-                self._visible_table.setRowHidden(
-                    row, self._visible_table.rootIndex(), False)
+        self._visible_table.setFilterPatterns(pats)
 
     def _toggle_table(self, i, toggle):
         if not toggle:
@@ -362,12 +352,8 @@ class PSDiag(SiriusMainWindow):
 
         self._tables_stack.setCurrentIndex(i)
         if i == 0:
-            self._log.updated.disconnect(self._filter_table)
-            self._status.updated.connect(self._filter_table)
             self._visible_table = self._status
         else:
-            self._status.updated.disconnect(self._filter_table)
-            self._log.updated.connect(self._filter_table)
             self._visible_table = self._log
         self._filter_table()
 
@@ -388,9 +374,12 @@ class LogTable(QTreeView, PyDMWidget):
         self._date_fmt = ' %Y/%m/%d '
         self._time_fmt = ' %H:%M:%S '
         self.headerLabels = label2width.keys()
-        self._model = QStandardItemModel()
-        self._model.setHorizontalHeaderLabels(self.headerLabels)
-        self.setModel(self._model)
+        self._model = LogTableModel(
+            self.headerLabels, capacity=10000, unique=is_status, parent=self)
+        self._model.updated.connect(self.updated)
+        self._proxy = LogFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self.setModel(self._proxy)
         self.setUniformRowHeights(True)
         self.setHeader(QHeaderView(Qt.Horizontal))
         for idx, width in enumerate(label2width.values()):
@@ -436,22 +425,13 @@ class LogTable(QTreeView, PyDMWidget):
         self.add_log(new_value)
 
     def add_log(self, new_value):
-        if self._is_status:
-            self.remove_log(new_value)
-
+        # in status mode the model replaces the entry with the same key
         datetime_now = _datetime.now()
-        item_data = [QStandardItem(text) for text in (
+        self._model.add([
             datetime_now.date().strftime(self._date_fmt),
             datetime_now.time().strftime(self._time_fmt),
             new_value['logtype'], new_value['psname'],
-            new_value['propty'], new_value['value'])]
-        for item in item_data:
-            item.setTextAlignment(Qt.AlignCenter)
-
-        self._model.insertRow(0, item_data)
-        if self._model.rowCount() > 10000:
-            self._model.removeRow(self._model.rowCount()-1)
-        self.updated.emit()
+            new_value['propty'], new_value['value']])
 
     def remove_log_slot(self, updated):
         new_value = self._get_newitem_data(updated)
@@ -460,18 +440,12 @@ class LogTable(QTreeView, PyDMWidget):
         self.remove_log(new_value)
 
     def remove_log(self, new_value):
-        for row in range(self._model.rowCount()):
-            logtype = self._model.data(self._model.index(row, 2))
-            if logtype != new_value['logtype']:
-                continue
-            psname = self._model.data(self._model.index(row, 3))
-            if psname != new_value['psname']:
-                continue
-            propty = self._model.data(self._model.index(row, 4))
-            if propty != new_value['propty']:
-                continue
-            self._model.removeRow(row)
-        self.updated.emit()
+        self._model.remove(
+            (new_value['logtype'], new_value['psname'], new_value['propty']))
+
+    def setFilterPatterns(self, patterns):
+        """Show only rows matching list of (regular expression, column)."""
+        self._proxy.setPatterns(patterns)
 
     def alarm_severity_changed(self, new_alarm_severity):
         """Reimplement alarm_severity_changed."""
@@ -525,7 +499,10 @@ class LogTable(QTreeView, PyDMWidget):
     def mouseDoubleClickEvent(self, ev):
         """Trigger open PS detail window."""
         idx = self.selectedIndexes()
-        text = self._model.data(self._model.index(idx[0].row(), 3))
+        if not idx:
+            super().mouseDoubleClickEvent(ev)
+            return
+        text = idx[0].sibling(idx[0].row(), 3).data()
         text = SiriusPVName(text)
         if text.dis == 'PS':
             _run_newprocess(['sirius-hla-as-ps-detail.py', text])
@@ -11,7 +11,7 @@ from siriuspy.diagsys.rfdiag.csdev import get_rf_diag_status_labels
 from siriuspy.namesys import SiriusPVName
 
 from siriushla.sirius_application import SiriusApplication
-from siriushla.widgets import SiriusLedAlert
+from siriushla.widgets import SiriusLedMatrix
 from siriushla.widgets.dialog.pv_status_dialog import StatusDetailDialog
 from siriushla.util import run_newprocess
 from .util import get_label2devices, get_dev2sub_labels, get_col2dev_count, \
@@ -64,17 +64,10 @@ class PSMonitor(QWidget):
         layout.setColumnStretch(0, 6)
         layout.setColumnStretch(1, 5)
 
-        self.setStyleSheet("""
-            QLed {
-                min-height: 1.1em; max-height: 1.1em;
-                min-width: 1.1em; max-width: 1.1em;}
-        """)
-
     def _make_groupbox(self, sec):
         status = QGroupBox(sec, self)
         status_lay = QGridLayout()
         status_lay.setAlignment(Qt.AlignTop)
-        status.setStyleSheet("QLabel{max-height: 1.4em;}")
         status.setLayout(status_lay)
 
         def update_gridpos(row, col, col_count, offset=0):
@@ -86,18 +79,17 @@ class PSMonitor(QWidget):
         for label, devices in self.get_label2devices(sec).items():
             if not devices:
                 continue
-            grid = QGridLayout()
-            grid.setVerticalSpacing(6)
-            grid.setHorizontalSpacing(6)
+            # all leds of a group are painted by a single widget
+            grid = SiriusLedMatrix(status)
+            grid.cellDoubleClicked.connect(self._open_detail)
+            grid.cellRightClicked.connect(self._show_status)
             if sec == 'BO' and label in ['CH', 'CV']:
-                grid.addWidget(QLabel(label, self), 0, 0)
+                grid.add_label(0, 0, label)
                 for i in range(5):
-                    lbh = QLabel('{0:02d}'.format(i*2+1),
-                                 self, alignment=Qt.AlignCenter)
-                    grid.addWidget(lbh, 0, i+1)
-                    lbv = QLabel('{0:02d}'.format(i*10),
-                                 self, alignment=Qt.AlignCenter)
-                    grid.addWidget(lbv, i+1, 0)
+                    grid.add_label(0, i+1, '{0:02d}'.format(i*2+1),
+                                   alignment=Qt.AlignCenter)
+                    grid.add_label(i+1, 0, '{0:02d}'.format(i*10),
+                                   alignment=Qt.AlignCenter)
                 aux_row, aux_col, offset = 1, 1, 1
                 if label == 'CV':
                     aux = devices.pop(-1)
@@ -113,35 +105,33 @@ class PSMonitor(QWidget):
                 if label in ['QS', 'Trims']:
                     aux_col, offset = 1, (1 if label == 'QS' else 0)
                     for i in range(1, 21):
-                        lb = QLabel('{0:02d}'.format(i), self)
-                        grid.addWidget(lb, i+1, (0 if label == 'QS' else 15))
+                        grid.add_label(
+                            i+1, (0 if label == 'QS' else 15),
+                            '{0:02d}'.format(i))
                 if label in ['QS', 'CH', 'CV', 'Trims']:
                     i = 0
                     for text in self.get_dev2sub_labels(label):
-                        lbh = QLabel(text, self, alignment=Qt.AlignCenter)
-                        grid.addWidget(lbh, 1, offset+i)
+                        grid.add_label(
+                            1, offset+i, text, alignment=Qt.AlignCenter)
                         i += 1
                 else:
                     aux_row, aux_col, offset = 1, 0, 0
-                grid.addWidget(QLabel(label, self), 0, offset, 1, 4)
+                grid.add_label(0, offset, label, colspan=4)
             else:
-                grid.addWidget(QLabel(label, self), 0, 0, 1, 4)
+                grid.add_label(0, 0, label, colspan=4)
                 aux_row, aux_col, offset = 1, 0, 0
             for name in devices:
                 if label == 'Trims' and aux_row in (2, 6, 10, 14, 18) \
                         and aux_col in (0, 3):
-                    grid.addWidget(QLabel(''), aux_row, aux_col)
                     aux_col += 1
-                led = MyLed(self)
-                led.setObjectName(name)
-                led.setToolTip(name)
-                led.channel = self._prefix+name+':DiagStatus-Mon'
-                grid.addWidget(led, aux_row, aux_col)
+                grid.add_led(
+                    aux_row, aux_col, self._prefix+name+':DiagStatus-Mon',
+                    name=name)
                 aux_row, aux_col = update_gridpos(
                     aux_row, aux_col, self.get_col2dev_count(sec, label),
                     offset)
             row, col, rowc, colc = self.get_sec2dev_laypos(sec, label)
-            status_lay.addLayout(grid, row, col, rowc, colc,
+            status_lay.addWidget(grid, row, col, rowc, colc,
                                  alignment=Qt.AlignTop)
 
         if sec == 'LI':
@@ -175,12 +165,8 @@ class PSMonitor(QWidget):
 
         return status
 
-
-class MyLed(SiriusLedAlert):
-
-    def mouseDoubleClickEvent(self, _):
-        """Reimplement mouseDoubleClickEvent."""
-        dev = SiriusPVName(self.objectName())
+    def _open_detail(self, name):
+        dev = SiriusPVName(name)
         if dev.dis == 'PS':
             run_newprocess(['sirius-hla-as-ps-detail.py', dev])
         elif dev.dis == 'PU':
@@ -193,22 +179,19 @@ class MyLed(SiriusLedAlert):
         elif dev.dis == 'EG':
             run_newprocess('sirius-hla-li-eg-control.py')
 
-    def mousePressEvent(self, event):
-        """Reimplement mousePressEvent."""
-        pvn = SiriusPVName(self.channels()[0].address)
-        if event.button() == Qt.RightButton:
-            if pvn.dis == 'PS':
-                labels = get_ps_diag_status_labels(pvn.device_name)
-            elif pvn.dis == 'PU':
-                labels = get_pu_diag_status_labels()
-            elif pvn.sec == 'LI':
-                labels = get_li_diag_status_labels(pvn.device_name)
-            elif pvn.dis == 'RF':
-                labels = get_rf_diag_status_labels(pvn.device_name)
-            self.msg = StatusDetailDialog(
-                parent=self.parent(), pvname=pvn, labels=labels)
-            self.msg.open()
-        super().mousePressEvent(event)
+    def _show_status(self, name):
+        pvn = SiriusPVName(self._prefix+name+':DiagStatus-Mon')
+        if pvn.dis == 'PS':
+            labels = get_ps_diag_status_labels(pvn.device_name)
+        elif pvn.dis == 'PU':
+            labels = get_pu_diag_status_labels()
+        elif pvn.sec == 'LI':
+            labels = get_li_diag_status_labels(pvn.device_name)
+        elif pvn.dis == 'RF':
+            labels = get_rf_diag_status_labels(pvn.device_name)
+        self.msg = StatusDetailDialog(
+            parent=self, pvname=pvn, labels=labels)
+        self.msg.open()
 
 
 if __name__ == '__main__':
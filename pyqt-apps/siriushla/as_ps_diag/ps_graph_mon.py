@@ -1,7 +1,8 @@
 """PS Graph Monitor."""
 from copy import deepcopy as _dcopy
+from functools import partial as _part
+from threading import Thread as _Thread
 import numpy as _np
-from epics import PV as _PV
 
 from qtpy.QtCore import Qt, QSize, QTimer, Slot, Signal
 from qtpy.QtGui import QColor
@@ -21,6 +22,8 @@ from siriuspy.search import PSSearch as _PSSearch, \
 from siriuspy.pwrsupply.csdev import Const as _PSConst
 
 from siriushla.util import run_newprocess
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
 from siriushla.widgets import SiriusMainWindow
 
 
@@ -92,6 +95,11 @@ class PSGraphMonWindow(SiriusMainWindow):
         c = ConnectionInspector(self)
         c.show()
 
+    def closeEvent(self, event):
+        """Close graph widget, releasing its PVs."""
+        self.graph.close()
+        super().closeEvent(event)
+
 
 class PSGraphDevicesSelWidget(QWidget):
     """Power supply selection widget."""
@@ -372,10 +380,10 @@ class PSGraph(PyDMWaveformPlot):
 
     @y_data.setter
     def y_data(self, new):
-        if not new or any([n is None for n in new]):
+        if not len(new):
             self._y_data = _np.array([0, ])
         else:
-            self._y_data = _np.array(new)
+            self._y_data = _np.asarray(new, dtype=float)
 
         self.curve.receiveYWaveform(self._y_data)
         self.curve.opts['symbolPen'] = self._all_pen
@@ -383,7 +391,7 @@ class PSGraph(PyDMWaveformPlot):
         self.curve.redrawCurve()
 
         self.mean.receiveYWaveform(
-            _np.array([_np.mean(self._y_data)]*len(self._y_data)))
+            _np.full(len(self._y_data), _np.mean(self._y_data)))
         self.mean.redrawCurve()
 
     @property
@@ -394,17 +402,11 @@ class PSGraph(PyDMWaveformPlot):
     @symbols.setter
     def symbols(self, new):
         self._symbols = new
-        if new:
-            all_brush, all_pen = [], []
-            for sym in self._symbols:
-                if sym:
-                    all_pen.append(self._ok_pen)
-                    all_brush.append(self._ok_brush)
-                else:
-                    all_pen.append(self._nok_pen)
-                    all_brush.append(self._nok_brush)
-            self._all_pen = all_pen
-            self._all_brush = all_brush
+        if len(new):
+            self._all_pen = [
+                self._ok_pen if sym else self._nok_pen for sym in new]
+            self._all_brush = [
+                self._ok_brush if sym else self._nok_brush for sym in new]
         else:
             self._all_pen = [self._none_pen, ]
             self._all_brush = [self._none_brush, ]
@@ -436,18 +438,29 @@ class PSGraph(PyDMWaveformPlot):
 
 
 class PSGraphMonWidget(QWidget):
-    """Power supply graph monitor widget."""
+    """Power supply graph monitor widget.
+
+    PV values are received by monitor callbacks and stored in arrays
+    indexed by power supply. The graph is redrawn by a timer, at most
+    MAX_FRAMERATE times per second and only if some value has changed.
+    """
 
-    _pvs = dict()
+    MAX_FRAMERATE = 10  # [Hz]
 
     def __init__(self, parent=None, prefix=_vaca_prefix, psnames=''):
         super().__init__(parent)
 
+        self._pvs = dict()
         self._prefix = prefix
         self._psnames = psnames
         self._property_line = 'Current-Mon'
         self._property_symb = 'DiagStatus-Mon'
 
+        self._generation = 0
+        self._line_values = _np.zeros(0)
+        self._symb_values = _np.zeros(0, dtype=bool)
+        self._changed = False
+
         self.propsymb_2_defval = {
             'DiagStatus-Mon': 0,
             'IntlkSoft-Mon': 0,
@@ -464,15 +477,15 @@ class PSGraphMonWidget(QWidget):
         self._setupUi()
         self._create_commands()
 
-        self._timer = QTimer()
+        self._timer = QTimer(self)
         self._timer.timeout.connect(self._update_graph)
-        self._timer.setInterval(250)
+        self._timer.setInterval(1000 // self.MAX_FRAMERATE)
         self._timer.start()
 
     def _setupUi(self):
         self.graph = PSGraph(self)
         self.graph.setObjectName('graph')
-        self._update_graph()
+        self._setup_monitors()
 
         lay = QGridLayout(self)
         lay.addWidget(self.graph, 0, 0)
@@ -481,79 +494,105 @@ class PSGraphMonWidget(QWidget):
 
     def update_psnames(self, psnames):
         self._psnames = _dcopy(psnames)
-        self._update_graph()
+        self._setup_monitors()
 
     @Slot(str)
     def update_property_line(self, text):
         self._property_line = text
+        self._setup_monitors()
 
     @Slot(str)
     def update_property_symb(self, text):
         self._property_symb = text
+        self._setup_monitors()
+
+    def closeEvent(self, event):
+        """Release PVs on close."""
+        self._timer.stop()
+        self._release_pvs()
+        super().closeEvent(event)
 
     def _update_graph(self):
-        self._create_pvs(self._property_line)
-        self._create_pvs(self._property_symb)
-        self.graph.psnames = _dcopy(self._psnames)
-        self._psnames = self.graph.psnames
-        self.graph.symbols = self._get_values(self._property_symb)
-        self.graph.y_data = self._get_values(self._property_line)
+        if not self._changed:
+            return
+        self._changed = False
+        self.graph.symbols = self._symb_values.copy()
+        self.graph.y_data = self._line_values.copy()
 
     # ---------- pv handler methods ----------
 
-    def _create_pvs(self, propty):
-        new_pvs = dict()
-        for psn in self._psnames:
-            pvname = self._prefix+psn+':'+propty
-            if pvname in PSGraphMonWidget._pvs:
-                continue
-            new_pvs[pvname] = _PV(pvname, connection_timeout=0.05)
-        PSGraphMonWidget._pvs.update(new_pvs)
-
-    def _get_values(self, propty):
-        if not self._psnames:
-            return []
-
-        for psn in self._psnames:
-            pvname = self._prefix+psn+':'+propty
-            PSGraphMonWidget._pvs[pvname].wait_for_connection()
-
-        values = list()
-        for psn in self._psnames:
-            pvname = self._prefix+psn+':'+propty
-            val = PSGraphMonWidget._pvs[pvname].get()
-            val = val if val is not None else 0
-            if propty in self.propsymb_2_defval.keys():
-                defval = self.propsymb_2_defval[propty]
-                val = 1 if val == defval else 0
-            values.append(val)
-        return values
+    def _setup_monitors(self):
+        """Subscribe to current properties of current power supplies.
+
+        Previous subscriptions are released. Monitor callbacks carry a
+        generation number, so late updates of previous subscriptions are
+        ignored.
+        """
+        self._release_pvs()
+        self._generation += 1
+        self.graph.psnames = _dcopy(self._psnames)
+        self._psnames = self.graph.psnames
+        self._line_values = _np.zeros(len(self._psnames))
+        self._symb_values = _np.zeros(len(self._psnames), dtype=bool)
+        for idx, psn in enumerate(self._psnames):
+            for propty, func in ((self._property_line, self._update_line),
+                                 (self._property_symb, self._update_symb)):
+                pvname = self._prefix+psn+':'+propty
+                callback = _part(func, self._generation, idx)
+                pv = _get_pv(
+                    pvname, callback=callback, connection_timeout=0.05)
+                self._pvs[pvname] = (pv, callback)
+                if pv.connected and pv.value is not None:
+                    callback(value=pv.value)
+        self._changed = True
+
+    def _release_pvs(self):
+        pvs, self._pvs = self._pvs, dict()
+        for pv, callback in pvs.values():
+            _release_pv(pv, callback=callback)
+
+    def _update_line(self, generation, idx, value=None, **kws):
+        values = self._line_values
+        if generation != self._generation or value is None:
+            return
+        values[idx] = value
+        self._changed = True
+
+    def _update_symb(self, generation, idx, value=None, **kws):
+        values = self._symb_values
+        if generation != self._generation or value is None:
+            return
+        values[idx] = value == self.propsymb_2_defval[self._property_symb]
+        self._changed = True
 
     def _set_values(self, propty, value):
-        for psn in self._psnames:
-            pvname = self._prefix+psn+':'+propty
-            pv = PSGraphMonWidget._pvs[pvname]
+        """Set propty of all power supplies in a separate thread."""
+        pvnames = [self._prefix+psn+':'+propty for psn in self._psnames]
+        _Thread(target=self._do_set_values, args=(pvnames, value),
+                daemon=True).start()
+
+    @staticmethod
+    def _do_set_values(pvnames, value):
+        pvs = [_get_pv(pvn, connection_timeout=0.05) for pvn in pvnames]
+        for pv in pvs:
             if pv.wait_for_connection():
                 pv.put(value)
+            _release_pv(pv)
 
     def _cmd_set_opmode_slowref(self):
         """Set power supplies OpMode to SlowRef."""
-        self._create_pvs('OpMode-Sel')
         self._set_values('OpMode-Sel', _PSConst.OpMode.SlowRef)
 
     def _cmd_turn_on(self):
         """Turn power supplies on."""
-        self._create_pvs('PwrState-Sel')
         self._set_values('PwrState-Sel', _PSConst.PwrStateSel.On)
 
     def _cmd_turn_off(self):
         """Turn power supplies off."""
-        self._create_pvs('PwrState-Sel')
         self._set_values('PwrState-Sel', _PSConst.PwrStateSel.Off)
 
     def _cmd_set_current(self):
         """Set power supplies current."""
-        self._create_pvs('Current-SP')
         value, ok = QInputDialog.getDouble(
             self, "Insert current setpoint", "Value")
         if ok:
@@ -561,7 +600,6 @@ class PSGraphMonWidget(QWidget):
 
     def _cmd_reset(self):
         """Reset power supplies."""
-        self._create_pvs('Reset-Cmd')
         self._set_values('Reset-Cmd', 1)
 
     def _create_commands(self):
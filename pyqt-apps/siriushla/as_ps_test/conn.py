@@ -2,12 +2,14 @@
 
 import time as _time
 import numpy as _np
-from epics import PV as _PV
 
 from siriuspy.envars import VACA_PREFIX as VACA_PREFIX
 from siriuspy.search import PSSearch
 from siriuspy.pwrsupply.csdev import Const as _PSC
 
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
+
 
 DEFAULT_CAP_BANK_VOLT = {
     'FBP_DCLink': 100,
@@ -59,6 +61,12 @@ class _TesterBase:
                 return False
         return True
 
+    def release(self):
+        """Release PVs back to the pool."""
+        for pv in self._pvs.values():
+            _release_pv(pv)
+        self._pvs = dict()
+
 
 class _TesterPSBase(_TesterBase):
     """Tester PS base."""
@@ -115,7 +123,7 @@ class TesterDCLinkFBP(_TesterPSBase):
         """Init."""
         super().__init__(device)
         for ppty in TesterDCLinkFBP.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -159,7 +167,7 @@ class TesterDCLink(_TesterPSBase):
         """Init."""
         super().__init__(device)
         for ppty in TesterDCLink.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -214,7 +222,7 @@ class TesterDCLinkRegatron(_TesterBase):
         """Init."""
         super().__init__(device)
         for ppty in TesterDCLinkRegatron.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -276,7 +284,7 @@ class TesterPS(_TesterPSBase):
         """Init."""
         super().__init__(device)
         for ppty in self.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -349,7 +357,7 @@ class TesterPSLinac(_TesterBase):
     def __init__(self, device):
         super().__init__(device)
         for ppty in TesterPSLinac.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -416,7 +424,7 @@ class _TesterPUBase(_TesterBase):
         """Init."""
         super().__init__(device)
         for ppty in self.properties:
-            self._pvs[ppty] = _PV(
+            self._pvs[ppty] = _get_pv(
                 VACA_PREFIX + device + ':' + ppty,
                 connection_timeout=TIMEOUT_CONN)
 
@@ -19,7 +19,7 @@ from siriushla.widgets.windows import create_window_from_widget
 from siriushla.widgets.dialog import ProgressDialog
 from siriushla.as_ti_control import HLTriggerDetailed
 
-from .tasks import CreateTesters, \
+from .tasks import BaseTask, CreateTesters, \
     CheckStatus, \
     ResetIntlk, CheckIntlk, \
     SetSOFBMode, CheckSOFBMode, \
@@ -834,6 +834,11 @@ class PSTestWindow(SiriusMainWindow):
                             alldclinks.add(dcl)
         return list(alldclinks)
 
+    def closeEvent(self, event):
+        """Release testers on close."""
+        BaseTask.release_testers()
+        super().closeEvent(event)
+
     def _open_detail(self, index):
         name = PVName(index.data())
         if name.dis == 'TI':
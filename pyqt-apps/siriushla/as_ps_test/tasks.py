@@ -1,13 +1,16 @@
 """."""
 
 from copy import deepcopy as _dcopy
+from functools import partial as _part
 import time as _time
-from epics import PV as _PV
 from qtpy.QtCore import Signal, QThread
 from siriuspy.search import HLTimeSearch as _HLTimeSearch, \
     PSSearch as _PSSearch
 from siriuspy.csdev import Const
 from siriuspy.namesys import Filter, SiriusPVName as _PVName
+from siriushla.common.epics import get_pv as _get_pv, \
+    release_pv as _release_pv
+from siriushla.common.epics.task import DeviceExecutor
 from .conn import TesterDCLink, TesterDCLinkFBP, TesterPS, TesterPSLinac, \
     TesterPSFBP, TesterPUKckr, TesterPUSept, TesterDCLinkRegatron, \
     DEFAULT_CAP_BANK_VOLT
@@ -33,11 +36,18 @@ class BaseTask(QThread):
         self._state = state
         self._is_test = is_test
         self._quit_task = False
+        self._executor = DeviceExecutor(
+            name=type(self).__name__, quit_func=lambda: self._quit_task)
 
     def size(self):
         """Task size."""
         return len(self._devices)
 
+    @property
+    def timings(self):
+        """List of (phase, number of devices, duration) of the task."""
+        return self._executor.timings
+
     def exit_task(self):
         """Set quit flag."""
         self._quit_task = True
@@ -52,76 +62,84 @@ class BaseTask(QThread):
         """Must be reimplemented in each class."""
         raise NotImplementedError
 
+    @staticmethod
+    def release_testers():
+        """Release all testers and their PVs."""
+        for tester in BaseTask._testers.values():
+            tester.release()
+        BaseTask._testers.clear()
+
     def _set(self, method, **kwargs):
         """Set."""
-        for dev in self._devices:
+        func = _part(self._set_tester, method, kwargs)
+        for dev, done in self._executor.run(
+                'set '+method, func, self._devices):
             self.currentItem.emit(dev)
-            tester = BaseTask._testers[dev]
-            if not tester.wait_for_connection(TIMEOUT_CONN):
-                self.itemDone.emit(dev, False)
-                continue
-            func = getattr(tester, method)
-            func(**kwargs)
-            self.itemDone.emit(dev, True)
-            if self._quit_task:
-                break
+            self.itemDone.emit(dev, done)
 
     def _check(self, method, timeout=TIMEOUT_CHECK, **kwargs):
         """Check."""
-        need_check = _dcopy(self._devices)
-        t = _time.time()
-        while _time.time() - t < timeout:
-            for dev in self._devices:
-                if dev not in need_check:
-                    continue
-                tester = BaseTask._testers[dev]
-                if not tester.wait_for_connection(TIMEOUT_CONN):
-                    continue
-                func = getattr(tester, method)
-                if func(**kwargs):
-                    self.currentItem.emit(dev)
-                    need_check.remove(dev)
-                    self.itemDone.emit(dev, True)
-                if self._quit_task:
-                    break
-            if (not need_check) or (self._quit_task):
-                break
-            _time.sleep(TIMEOUT_SLEEP)
-        for dev in need_check:
+        func = _part(self._check_tester, method, kwargs)
+        for dev, done in self._executor.poll(
+                'check '+method, func, self._devices, timeout, TIMEOUT_SLEEP):
             self.currentItem.emit(dev)
-            self.itemDone.emit(dev, False)
+            self.itemDone.emit(dev, done)
+
+    @staticmethod
+    def _set_tester(method, kwargs, dev):
+        tester = BaseTask._testers[dev]
+        if not tester.wait_for_connection(TIMEOUT_CONN):
+            return False
+        func = getattr(tester, method)
+        func(**kwargs)
+        return True
+
+    @staticmethod
+    def _check_tester(method, kwargs, dev):
+        tester = BaseTask._testers[dev]
+        if not tester.wait_for_connection(TIMEOUT_CONN):
+            return False
+        func = getattr(tester, method)
+        return func(**kwargs)
 
 
 class CreateTesters(BaseTask):
 
     def function(self):
+        create = list()
         for dev in self._devices:
-            self.currentItem.emit(dev)
             if dev not in BaseTask._testers:
-                devname = _PVName(dev)
-                if devname.sec == 'LI':
-                    t = TesterPSLinac(dev)
-                elif _PSSearch.conv_psname_2_psmodel(dev) == 'FBP_DCLink':
-                    t = TesterDCLinkFBP(dev)
-                elif 'bo-dclink' in _PSSearch.conv_psname_2_pstype(dev):
-                    t = TesterDCLink(dev)
-                elif _PSSearch.conv_psname_2_psmodel(dev) == 'REGATRON_DCLink':
-                    t = TesterDCLinkRegatron(dev)
-                elif _PSSearch.conv_psname_2_psmodel(dev) == 'FBP':
-                    t = TesterPSFBP(dev)
-                elif devname.dis == 'PS':
-                    t = TesterPS(dev)
-                elif devname.dis == 'PU' and 'Kckr' in devname.dev:
-                    t = TesterPUKckr(dev)
-                elif devname.dis == 'PU' and 'Sept' in devname.dev:
-                    t = TesterPUSept(dev)
-                else:
-                    raise NotImplementedError(
-                        'There is no Tester defined to '+dev+'.')
-                BaseTask._testers[dev] = t
+                create.append(dev)
+                continue
+            self.currentItem.emit(dev)
+            self.itemDone.emit(dev, True)
+        for dev, tester in self._executor.run(
+                'create', self._create_tester, create):
+            BaseTask._testers[dev] = tester
+            self.currentItem.emit(dev)
             self.itemDone.emit(dev, True)
-            if self._quit_task:
-                break
+
+    @staticmethod
+    def _create_tester(dev):
+        devname = _PVName(dev)
+        if devname.sec == 'LI':
+            return TesterPSLinac(dev)
+        elif _PSSearch.conv_psname_2_psmodel(dev) == 'FBP_DCLink':
+            return TesterDCLinkFBP(dev)
+        elif 'bo-dclink' in _PSSearch.conv_psname_2_pstype(dev):
+            return TesterDCLink(dev)
+        elif _PSSearch.conv_psname_2_psmodel(dev) == 'REGATRON_DCLink':
+            return TesterDCLinkRegatron(dev)
+        elif _PSSearch.conv_psname_2_psmodel(dev) == 'FBP':
+            return TesterPSFBP(dev)
+        elif devname.dis == 'PS':
+            return TesterPS(dev)
+        elif devname.dis == 'PU' and 'Kckr' in devname.dev:
+            return TesterPUKckr(dev)
+        elif devname.dis == 'PU' and 'Sept' in devname.dev:
+            return TesterPUSept(dev)
+        raise NotImplementedError(
+            'There is no Tester defined to '+dev+'.')
 
 
 class CheckStatus(BaseTask):
@@ -330,10 +348,13 @@ class TriggerTask(QThread):
         self._dis = dis
         filt = {'dev': 'Mags'} if dis == 'PS' else {'dev': '.*(Kckr|Sept).*'}
         self._triggers = _HLTimeSearch.get_hl_triggers(filters=filt)
-        self._pvs_sp = {trg: _PV(trg+':State-Sel', connection_timeout=0.05)
-                        for trg in self._triggers}
-        self._pvs_rb = {trg: _PV(trg+':State-Sts', connection_timeout=0.05)
-                        for trg in self._triggers}
+        self._pvs_sp = {
+            trg: _get_pv(trg+':State-Sel', connection_timeout=0.05)
+            for trg in self._triggers}
+        self._pvs_rb = {
+            trg: _get_pv(trg+':State-Sts', connection_timeout=0.05)
+            for trg in self._triggers}
+        self.finished.connect(self._release_pvs)
 
         for trg, pv in self._pvs_rb.items():
             pv.get()  # force connection
@@ -370,6 +391,12 @@ class TriggerTask(QThread):
     def function(self, ):
         raise NotImplementedError
 
+    def _release_pvs(self):
+        """Release PVs back to the pool."""
+        for pv in list(self._pvs_sp.values()) + list(self._pvs_rb.values()):
+            _release_pv(pv)
+        self._pvs_sp, self._pvs_rb = dict(), dict()
+
     def _get_trigger_by_psname(self, devices):
         """Return triggers corresponding to devices."""
         devices = set(devices)
@@ -11,6 +11,18 @@ from pydm.widgets.base import PyDMPrimitiveWidget
 from siriuspy.namesys import SiriusPVName as _PVName
 
 from ..widgets import SiriusLabel, SiriusSpinbox, SiriusEnumComboBox
+from ..style_registry import register_styles, set_style_class
+
+
+register_styles({
+    'QLabel[styleClass="TIFormLabel"]': 'min-width:7em;',
+    'QWidget[styleClass="TIFormField"]':
+        'min-width:6em; max-width:6em; min-height:1.29em;',
+    'BaseList #wid': 'background-color: transparent;',
+    'BaseList > QPushButton#but':
+        'min-width:35px; max-width:35px; min-height:25px;'
+        'max-height:25px; icon-size:25px;',
+})
 
 
 class BaseWidget(QWidget):
@@ -37,20 +49,16 @@ class BaseWidget(QWidget):
             hbl = self._create_propty_layout(pv1)
             lab = QLabel(txt)
             lab.setObjectName(pv1.split('-')[0])
-            lab.setStyleSheet("""min-width:7em;""")
+            set_style_class(lab, 'TIFormLabel')
             fbl.addRow(lab, hbl)
         return grpbx
 
-    def _create_propty_layout(self, propty, width=6.0):
+    def _create_propty_layout(self, propty):
         """Return layout that handles a property according to 'propty_type'."""
         layout = QHBoxLayout()
         not_enum = propty.endswith('-SP')
         pv2 = propty.replace('-SP', '-RB').replace('-Sel', '-Sts')
 
-        style = """
-        min-width:wvalem; max-width:wvalem;
-        min-height:1.29em;""".replace('wval', str(width))
-
         if pv2 != propty:
             chan1 = self.get_pvname(propty)
             if not_enum:
@@ -59,12 +67,12 @@ class BaseWidget(QWidget):
                 wid.setAlignment(Qt.AlignCenter)
             else:
                 wid = SiriusEnumComboBox(self, init_channel=chan1)
-            wid.setStyleSheet(style)
+            set_style_class(wid, 'TIFormField')
             layout.addWidget(wid)
 
         label = SiriusLabel(
             parent=self, init_channel=self.get_pvname(pv2))
-        label.setStyleSheet(style)
+        set_style_class(label, 'TIFormField')
         label.setAlignment(Qt.AlignCenter)
         label.setObjectName(pv2.replace('-', ''))
         label.showUnits = True
@@ -88,6 +96,16 @@ class BaseList(CustomGroupBox):
     _LABELS = {}
     _ALL_PROPS = tuple()
 
+    def __init_subclass__(cls, **kwargs):
+        """Register column widths of subclass."""
+        super().__init_subclass__(**kwargs)
+        if '_MIN_WIDs' not in cls.__dict__:
+            return
+        register_styles({
+            '{} #{}'.format(cls.__name__, prop):
+                'min-width:{0:.1f}em; max-width:{0:.1f}em;'.format(wid)
+            for prop, wid in cls._MIN_WIDs.items()})
+
     def __init__(self, name=None, parent=None, prefix='', props=set(),
                  obj_names=list(), has_search=True, props2search=set()):
         """Initialize object."""
@@ -120,10 +138,6 @@ class BaseList(CustomGroupBox):
             pbt.setToolTip('Choose which columns to show')
             pbt.setObjectName('but')
             pbt.setIcon(qta.icon('mdi.view-column'))
-            pbt.setStyleSheet(
-                '#but{min-width:35px; max-width:35px;\
-                min-height:25px; max-height:25px;\
-                icon-size:25px;}')
             hbl.addWidget(pbt)
             self.search_menu = QMenu(pbt)
             self.search_menu.triggered.connect(self.filter_lines)
@@ -141,14 +155,6 @@ class BaseList(CustomGroupBox):
         objs = self.getLine(header=True)
         for prop, obj in objs:
             headerlay.addLayout(obj)
-            for idx in range(obj.count()):
-                wid = obj.itemAt(idx).widget()
-                name = wid.objectName() or 'obj'
-                wid.setObjectName(name)
-                wid.setStyleSheet(
-                    '#{0:s}{{min-width:{1:.1f}em;\
-                    max-width: {1:.1f}em;}}'.format(
-                        name, self._MIN_WIDs[prop]))
 
         # Create scrollarea
         sc_area = QScrollArea()
@@ -160,7 +166,6 @@ class BaseList(CustomGroupBox):
         wid = QWidget()
         sc_area.setWidget(wid)
         wid.setObjectName('wid')
-        wid.setStyleSheet('#wid {background-color: transparent;}')
         lay = QVBoxLayout()
         lay.setSpacing(15)
         lay.setContentsMargins(0, 0, 0, 0)
@@ -178,14 +183,6 @@ class BaseList(CustomGroupBox):
             lay.addLayout(hlay)
             for prop, obj in objs:
                 hlay.addLayout(obj)
-                for idx in range(obj.count()):
-                    wid = obj.itemAt(idx).widget()
-                    name = wid.objectName() or 'obj'
-                    wid.setObjectName(name)
-                    wid.setStyleSheet(
-                        '#{0:s}{{min-width:{1:.1f}em;\
-                        max-width: {1:.1f}em;}}'.format(
-                            name, self._MIN_WIDs[prop]))
 
     def getLine(self, prefix=None, header=False):
         objects = list()
@@ -204,8 +201,9 @@ class BaseList(CustomGroupBox):
         visi = prop in self.props
         for i, ob in enumerate(objs):
             lv.addWidget(ob)
-            ob.setVisible(visi)
+            # name before showing, to be polished by the column rules
             ob.setObjectName(prop)
+            ob.setVisible(visi)
             ob.setSizePolicy(QSzPol.MinimumExpanding, QSzPol.Maximum)
         return lv
 
@@ -269,7 +267,6 @@ class BaseList(CustomGroupBox):
 
     def _headerLabel(self, prefix, prop):
         lb = QLabel('<h4>' + self._LABELS[prop] + '</h4>', self)
-        lb.setStyleSheet("""min-height:1.55em; max-height:1.55em;""")
         lb.setAlignment(Qt.AlignHCenter)
         return (lb, )
 
@@ -18,11 +18,19 @@ from ..widgets import PyDMLed, SiriusLedAlert, PyDMStateButton, \
     SiriusLabel, SiriusSpinbox, PyDMLedMultiChannel, \
     SiriusEnumComboBox as _MyComboBox
 from ..widgets.windows import create_window_from_widget
+from ..style_registry import register_styles
 
 from .base import BaseList, BaseWidget, MySpinBox as _MySpinBox
 from .low_level_devices import LLTriggerList, OTPList, OUTList, AFCOUTList
 
 
+register_styles({
+    'HLTriggerList #detailed #but':
+        'min-width:25px; max-width:25px; min-height:25px;'
+        'max-height:25px; icon-size:20px;',
+})
+
+
 class HLTriggerSimple(BaseWidget):
 
     def __init__(self, parent, prefix, delay=True, duration=False,
@@ -409,10 +417,6 @@ class HLTriggerList(BaseList):
             but.setToolTip('Open Detailed View Window')
             but.setIcon(qta.icon('fa5s.list-ul'))
             but.setObjectName('but')
-            but.setStyleSheet(
-                '#but{min-width:25px; max-width:25px;\
-                min-height:25px; max-height:25px;\
-                icon-size:20px;}')
             icon = qta.icon(
                 'mdi.timer', color=get_appropriate_color(prefix.sec))
             Window = create_window_from_widget(
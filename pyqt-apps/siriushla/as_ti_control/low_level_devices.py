@@ -16,11 +16,18 @@ from siriuspy.timesys import csdev as _cstime
 from ..widgets import PyDMLed, PyDMStateButton, SiriusLedState, \
     SiriusEnumComboBox as _MyComboBox, SiriusLedAlert, SiriusLabel
 from ..widgets.windows import create_window_from_widget
+from ..style_registry import register_styles
 from ..util import connect_window, get_appropriate_color
 
 from .base import BaseList, MySpinBox as _MySpinBox, BaseWidget
 
 
+register_styles({
+    'EventList #ext_trig #but':
+        'min-width:40px; min-height:30px; icon-size:20px;',
+})
+
+
 # ###################### Event Generator ######################
 class BucketListLineEdit(PyDMLineEdit):
 
@@ -521,8 +528,6 @@ class EventList(BaseList):
                 sp, init_channel=prefix+'ExtTrig-Cmd', pressValue=1)
             but.setIcon(qta.icon('fa5s.step-forward'))
             but.setObjectName('but')
-            but.setStyleSheet(
-                '#but{min-width:40px; min-height:30px; icon-size:20px;}')
             but.setToolTip('Run event asynchronously')
             hbl = QHBoxLayout(sp)
             hbl.addWidget(but)
@@ -1166,8 +1171,6 @@ class LLTriggerList(BaseList):
                 self, icon=qta.icon('fa5s.sync'), label='',
                 init_channel=pvname, pressValue=1)
             sp.setObjectName('rst')
-            sp.setStyleSheet(
-                '#rst{min-width:25px; max-width:25px; icon-size:20px;}')
         if rb is None:
             return (sp, )
         return sp, rb
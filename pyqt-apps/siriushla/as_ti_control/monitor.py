@@ -3,14 +3,14 @@
 from qtpy.QtCore import Qt, QPoint
 from qtpy.QtGui import QPainter
 from qtpy.QtWidgets import QLabel, QWidget, QGridLayout, QGroupBox, \
-    QHBoxLayout, QApplication, QVBoxLayout
+    QApplication, QVBoxLayout
 import qtawesome as qta
 
 from siriuspy.namesys import SiriusPVName as PVName
 from siriuspy.search import LLTimeSearch, HLTimeSearch
 
-from ..widgets import SiriusLedAlert, SiriusMainWindow, \
-    PyDMLedMultiChannel
+from ..widgets import SiriusMainWindow, PyDMLedMultiChannel, \
+    SiriusLedMatrix
 from ..util import get_appropriate_color, connect_window, \
     get_monitor_icon
 from ..widgets.windows import create_window_from_widget
@@ -74,24 +74,6 @@ class LLButton(QWidget):
         lay.addWidget(led, alignment=Qt.AlignCenter)
 
 
-class HLButton(QWidget):
-
-    def __init__(self, trigger, parent=None):
-        super().__init__(parent=parent)
-        hl = QHBoxLayout()
-        self.setLayout(hl)
-        self.layout().setContentsMargins(0, 0, 0, 0)
-        led = SiriusLedAlert(self)
-        led.setToolTip(trigger)
-        led.channel = trigger.substitute(propty='Status-Mon')
-        self.layout().addWidget(led)
-        icon = qta.icon('mdi.timer', color=get_appropriate_color(trigger.sec))
-        Window = create_window_from_widget(
-            HLTriggerDetailed, title=trigger, icon=icon)
-        led.clicked.connect(lambda: QApplication.instance().open_window(
-            Window, parent=None, prefix=trigger + ':'))
-
-
 class MonitorHL(QGroupBox):
 
     def __init__(self, parent=None, prefix=''):
@@ -101,7 +83,7 @@ class MonitorHL(QGroupBox):
         self.setObjectName('ASApp')
 
     def _setupui(self):
-        lay = QGridLayout()
+        lay = QVBoxLayout()
         self.setLayout(lay)
         hltrigs = HLTimeSearch.get_hl_triggers()
         secs = set(map(lambda x: x.sec, hltrigs))
@@ -110,16 +92,29 @@ class MonitorHL(QGroupBox):
         for trig in hltrigs:
             secs[trig.sec].append(trig)
 
+        # all leds are painted by a single widget
+        leds = SiriusLedMatrix(self, led_size=1.29)
+        leds.cellClicked.connect(self._open_trigger)
+        lay.addWidget(leds)
+        row = 0
         for sec in ('AS', 'LI', 'TB', 'BO', 'TS', 'SI'):
-            lab = QLabel(sec)
-            lab.setStyleSheet('font-weight: bold;')
-            lay.addWidget(lab, lay.rowCount(), 0, 1, nrcols)
-            row = lay.rowCount()
+            leds.add_label(row, 0, sec, colspan=nrcols, bold=True)
+            row += 1
             for i, trig in enumerate(sorted(secs[sec])):
                 if i and not i % nrcols:
-                    row = lay.rowCount()
-                but = HLButton(trig, self)
-                lay.addWidget(but, row, i % nrcols)
+                    row += 1
+                leds.add_led(
+                    row, i % nrcols, trig.substitute(propty='Status-Mon'),
+                    name=trig)
+            row += 1
+
+    def _open_trigger(self, trigger):
+        icon = qta.icon('mdi.timer', color=get_appropriate_color(
+            PVName(trigger).sec))
+        Window = create_window_from_widget(
+            HLTriggerDetailed, title=trigger, icon=icon)
+        QApplication.instance().open_window(
+            Window, parent=None, prefix=trigger + ':')
 
 
 class MonitorLL(QGroupBox):
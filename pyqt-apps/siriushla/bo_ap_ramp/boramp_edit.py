@@ -23,6 +23,8 @@ from siriuspy.search import MASearch as _MASearch, PSSearch as _PSSearch
 from siriuspy.ramp import ramp, exceptions
 from siriuspy.ramp.magnet import get_magnet as _get_magnet
 from siriuspy.ramp.conn import ConnSOFB as _ConnSOFB
+from siriuspy.magnet.util import \
+    get_magnet_family_name as _get_magnet_family_name
 from siriuspy.namesys import SiriusPVName as _PVName
 
 from siriushla.widgets import MatplotlibWidget
@@ -769,6 +771,10 @@ class MultipolesRamp(QWidget):
 
         self._ps_to_plot = []
         self.plot_unit = 'Strengths'
+        # psname: (revision key, times, values) of plotted waveforms
+        self._wfm_cache = dict()
+        self._blit_background = None
+        self._blit_artists_ready = False
 
         self._tunecorr_configname = tunecorr_configname
         self._chromcorr_configname = chromcorr_configname
@@ -880,6 +886,7 @@ class MultipolesRamp(QWidget):
         th.start()
         self.m_inj, = self.ax.plot([0], [0], ls='', marker='o', c='#787878')
         self.m_ej, = self.ax.plot([0], [0], ls='', marker='o', c='#787878')
+        self.graph.mpl_connect('draw_event', self._handleGraphDraw)
 
         self.toolbar = NavigationToolbar(self.graph, self)
         self.toolbar.setObjectName('toolbar')
@@ -1276,10 +1283,82 @@ class MultipolesRamp(QWidget):
         else:
             _flag_stack_next_command = True
 
+    def _getWaveformKeys(self):
+        """Return revision keys of the waveforms of plotted power supplies.
+
+        A waveform depends on the ramp parameters, on the normalized
+        strengths of its power supply and on those of its family.
+        """
+        value = self.ramp_config.value
+        nconfigs = value.pop('ps_normalized_configs*')
+        times = sorted(nconfigs)
+        base = (self.plot_unit, repr(value), tuple(times))
+        keys = dict()
+        for psname in self._ps_to_plot:
+            family = _get_magnet_family_name(psname)
+            keys[psname] = base + (
+                tuple(nconfigs[t].get(psname) for t in times),
+                tuple(nconfigs[t].get(family) for t in times)
+                if family else None)
+        return keys
+
+    def _updateLineData(self, psname, key):
+        """Update line data of psname if its waveform changed."""
+        cached = self._wfm_cache.get(psname)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        xd = self.ramp_config.ps_waveform_get_times(psname)
+        if self.plot_unit == 'Strengths':
+            yd = self.ramp_config.ps_waveform_get_strengths(psname)
+        elif self.plot_unit == 'Currents':
+            yd = self.ramp_config.ps_waveform_get_currents(psname)
+        self._wfm_cache[psname] = (key, xd, yd)
+        self.lines[psname].set_xdata(xd)
+        self.lines[psname].set_ydata(yd)
+        return xd, yd
+
+    def _getAnimatedArtists(self):
+        artists = [self.lines[psn] for psn in self._ps_to_plot
+                   if psn in self.lines]
+        artists.extend([self.m_inj, self.m_ej])
+        return artists
+
+    def _handleGraphDraw(self, event):
+        """Store graph background and draw curves after full redraws."""
+        canvas = self.graph.figure.canvas
+        self._blit_background = canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._getAnimatedArtists():
+            self.ax.draw_artist(artist)
+
+    def _blitGraph(self):
+        """Redraw only curves and markers over the stored background."""
+        canvas = self.graph.figure.canvas
+        if self._blit_background is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._blit_background)
+            for artist in self._getAnimatedArtists():
+                self.ax.draw_artist(artist)
+            canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
     def updateGraph(self, update_axis=False):
-        """Update and redraw graph."""
+        """Update and redraw graph.
+
+        Waveforms are cached per power supply and only recomputed when
+        their revision key changes. Curves and markers are animated, so
+        unless axes have to change they are just blitted over the graph
+        background.
+        """
         if self.ramp_config is None:
             return
+        if not self._blit_artists_ready and \
+                len(self.lines) == len(self.psnames):
+            for artist in list(self.lines.values()) + [self.m_inj, self.m_ej]:
+                artist.set_animated(True)
+            self._blit_artists_ready = True
+            update_axis = True
+        full_redraw = update_axis
         if not self.ramp_config.ps_normalized_configs:
             for psname in self.psnames:
                 self.lines[psname].set_linewidth(0)
@@ -1292,22 +1371,15 @@ class MultipolesRamp(QWidget):
             xds_max = list()
             yds_min = list()
             yds_max = list()
+            keys = self._getWaveformKeys()
             for psname in self.psnames:
                 if psname in self._ps_to_plot:
                     self.lines[psname].set_linewidth(1.5)
-                    # x data
-                    xd = self.ramp_config.ps_waveform_get_times(psname)
+                    xd, yd = self._updateLineData(psname, keys[psname])
                     xds_min.append(xd.min())
                     xds_max.append(xd.max())
-                    self.lines[psname].set_xdata(xd)
-                    # y data
-                    if self.plot_unit == 'Strengths':
-                        yd = self.ramp_config.ps_waveform_get_strengths(psname)
-                    elif self.plot_unit == 'Currents':
-                        yd = self.ramp_config.ps_waveform_get_currents(psname)
                     yds_min.append(yd.min())
                     yds_max.append(yd.max())
-                    self.lines[psname].set_ydata(yd)
                 else:
                     self.lines[psname].set_linewidth(0)
 
@@ -1341,18 +1413,15 @@ class MultipolesRamp(QWidget):
                         break
                 else:
                     ylabel = 'Kick [urad]'
-
-                if ylabel:
-                    self.ax.set_ylabel(ylabel)
-                else:
-                    self.ax.set_ylabel('Int. Strengths')
+                ylabel = ylabel or 'Int. Strengths'
             else:
-                self.ax.set_ylabel('Currents [A]')
+                ylabel = 'Currents [A]'
+            if ylabel != self.ax.get_ylabel():
+                self.ax.set_ylabel(ylabel)
+                full_redraw = True
 
             inj_time = self.ramp_config.ti_params_injection_time
-            self.m_inj.set_xdata(inj_time)
             ej_time = self.ramp_config.ti_params_ejection_time
-            self.m_ej.set_xdata(ej_time)
 
             inj_marker_value = list()
             ej_marker_value = list()
@@ -1363,11 +1432,16 @@ class MultipolesRamp(QWidget):
             for psname in self._ps_to_plot:
                 inj_marker_value.append(func(psname, inj_time))
                 ej_marker_value.append(func(psname, ej_time))
+            self.m_inj.set_xdata([inj_time]*len(inj_marker_value))
             self.m_inj.set_ydata(inj_marker_value)
+            self.m_ej.set_xdata([ej_time]*len(ej_marker_value))
             self.m_ej.set_ydata(ej_marker_value)
 
-        self.graph.figure.canvas.draw()
-        self.graph.figure.canvas.flush_events()
+        if full_redraw or not self._blit_artists_ready:
+            self.graph.figure.canvas.draw()
+            self.graph.figure.canvas.flush_events()
+        else:
+            self._blitGraph()
 
     def updateTable(self):
         """Update and rebuild table."""
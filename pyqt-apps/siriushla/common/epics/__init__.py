@@ -0,0 +1,3 @@
+"""Epics package init."""
+
+from .pool import PVPool, get_pv, release_pv, get_pool
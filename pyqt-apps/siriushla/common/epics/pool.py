@@ -0,0 +1,158 @@
+"""Process-wide pool of shared EPICS channels."""
+import time as _time
+from threading import RLock as _RLock, Timer as _Timer
+import logging as _log
+
+from epics import PV as _PV
+
+
+class PVPool:
+    """Pool of epics.PV objects shared by all modules of the process.
+
+    Channels are reference counted: get_pv returns the pooled PV of a name,
+    creating it if needed, and release_pv drops one reference. Channels
+    with no references are kept for idle_timeout seconds, so that a window
+    reopened shortly after being closed reuses them, and are disconnected
+    afterwards.
+
+    Since PV objects are shared, keyword arguments of get_pv (such as
+    connection_timeout or auto_monitor) only take effect when the channel
+    is created. Value callbacks must be registered through the callback
+    argument of get_pv and are removed by release_pv.
+    """
+
+    def __init__(self, idle_timeout=60.0):
+        """Init."""
+        self._idle_timeout = idle_timeout
+        self._lock = _RLock()
+        self._pvs = dict()
+        self._refcount = dict()
+        self._idle_since = dict()
+        self._timer = None
+        self._stats = {
+            'created': 0, 'reused': 0, 'evicted': 0,
+            'connections': 0, 'disconnections': 0}
+
+    @property
+    def idle_timeout(self):
+        """Time, in seconds, unreferenced channels are kept alive."""
+        return self._idle_timeout
+
+    @idle_timeout.setter
+    def idle_timeout(self, value):
+        self._idle_timeout = value
+
+    @property
+    def stats(self):
+        """Return dictionary with pool statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['channels'] = len(self._pvs)
+            stats['idle'] = len(self._idle_since)
+            stats['in_use'] = stats['channels'] - stats['idle']
+            stats['connected'] = sum(
+                1 for pv in self._pvs.values() if pv.connected)
+        return stats
+
+    def refcount(self, pvname):
+        """Return number of references to pvname."""
+        with self._lock:
+            return self._refcount.get(pvname, 0)
+
+    def get_pv(self, pvname, callback=None, **kwargs):
+        """Return shared PV object and increase its reference count."""
+        with self._lock:
+            pv = self._pvs.get(pvname)
+            if pv is None:
+                pv = _PV(pvname, **kwargs)
+                pv.connection_callbacks.append(self._connection_callback)
+                self._pvs[pvname] = pv
+                self._refcount[pvname] = 0
+                self._stats['created'] += 1
+            else:
+                self._stats['reused'] += 1
+            self._refcount[pvname] += 1
+            self._idle_since.pop(pvname, None)
+        if callback is not None:
+            pv.add_callback(callback)
+        return pv
+
+    def release_pv(self, pv, callback=None):
+        """Drop one reference to pv, given as PV object or name.
+
+        If callback is given, it is removed from the PV callbacks.
+        """
+        pvname = pv if isinstance(pv, str) else pv.pvname
+        with self._lock:
+            pv = self._pvs.get(pvname)
+            if pv is None or not self._refcount[pvname]:
+                _log.warning('PV {} released more than acquired.'.format(
+                    pvname))
+                return
+            if callback is not None:
+                for idx, (func, _) in list(pv.callbacks.items()):
+                    if func == callback:
+                        pv.remove_callback(idx)
+                        break
+            self._refcount[pvname] -= 1
+            if not self._refcount[pvname]:
+                self._idle_since[pvname] = _time.time()
+                self._schedule_eviction()
+
+    def evict_idle(self, max_idle=None):
+        """Disconnect channels unreferenced for more than max_idle seconds.
+
+        If max_idle is None, idle_timeout is used. Return number of
+        evicted channels.
+        """
+        max_idle = self._idle_timeout if max_idle is None else max_idle
+        now = _time.time()
+        with self._lock:
+            evict = [pvn for pvn, tstamp in self._idle_since.items()
+                     if now - tstamp >= max_idle]
+            pvs = list()
+            for pvn in evict:
+                del self._idle_since[pvn]
+                del self._refcount[pvn]
+                pvs.append(self._pvs.pop(pvn))
+            self._stats['evicted'] += len(evict)
+            if self._idle_since:
+                self._schedule_eviction()
+        for pv in pvs:
+            pv.disconnect()
+        return len(pvs)
+
+    def _schedule_eviction(self):
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = _Timer(self._idle_timeout, self._evict)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _evict(self):
+        with self._lock:
+            self._timer = None
+        self.evict_idle()
+
+    def _connection_callback(self, pvname=None, conn=None, **kws):
+        with self._lock:
+            key = 'connections' if conn else 'disconnections'
+            self._stats[key] += 1
+
+
+_POOL = PVPool()
+
+
+def get_pv(pvname, callback=None, **kwargs):
+    """Return PV from the process-wide pool, increasing its refcount."""
+    return _POOL.get_pv(pvname, callback=callback, **kwargs)
+
+
+def release_pv(pv, callback=None):
+    """Release PV acquired from the process-wide pool with get_pv."""
+    _POOL.release_pv(pv, callback=callback)
+
+
+def get_pool():
+    """Return the process-wide PV pool."""
+    return _POOL
@@ -5,3 +5,5 @@ from .setter import EpicsSetter
 from .checker import EpicsChecker
 from .connector import EpicsConnector
 from .wait import EpicsWait
+from .watcher import EpicsConvergenceWatcher, get_readback_name
+from .executor import DeviceExecutor
@@ -16,13 +16,20 @@ class EpicsChecker(EpicsTask):
     def run(self):
         """Thread execution."""
         if not self._quit_task:
-            for i, pvn in enumerate(self._pvnames):
+            conn = dict(self._connect_pvs())
+            for i, equal in self._run_parallel(
+                    lambda i: self._check(i, conn.get(self._pvnames[i])),
+                    range(len(self._pvnames))):
+                pvn = self._pvnames[i]
                 self.currentItem.emit(pvn)
-                pv = self.get_pv(pvn)
-                val = self._values[i]
-                equal = pv.check(val, wait=self._timeout)
                 self.itemChecked.emit(pvn, equal)
                 self.itemDone.emit()
                 if self._quit_task:
                     break
         self.completed.emit()
+
+    def _check(self, idx, connected):
+        if not connected:
+            return False
+        pv = self.get_pv(self._pvnames[idx])
+        return pv.check(self._values[idx], wait=self._timeout)
@@ -22,9 +22,8 @@ class EpicsConnector(EpicsTask):
         if self._quit_task:
             self.completed.emit()
             return
-        for pvn in self._pvnames:
+        for pvn, _ in self._connect_pvs():
             self.currentItem.emit(pvn)
-            self.get_pv(pvn)
             self.itemDone.emit()
             if self._quit_task:
                 break
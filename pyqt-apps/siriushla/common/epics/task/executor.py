@@ -0,0 +1,108 @@
+"""Concurrent execution of operations over several devices."""
+import time
+import logging as _log
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class DeviceExecutor:
+    """Fan out operations over devices to a pool of worker threads.
+
+    A task is split in phases (create, set, check...). Within a phase the
+    operations on a device run in sequence, in a single worker, while
+    different devices are handled concurrently. A phase only finishes after
+    all its devices are handled, so phases are applied to every device in
+    the order they are run.
+
+    The duration of each phase is logged and kept in timings.
+    """
+
+    MAX_WORKERS = 32
+
+    def __init__(self, name='', max_workers=MAX_WORKERS, quit_func=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        name - name used to identify the phases in the log [optional]
+        max_workers - maximum number of worker threads [optional]
+        quit_func - callable returning True if pending operations must be
+            abandoned [optional]
+        """
+        self._name = name
+        self._max_workers = max_workers
+        self._quit_func = quit_func or (lambda: False)
+        self._timings = list()
+
+    @property
+    def timings(self):
+        """List of (phase, number of devices, duration in seconds)."""
+        return list(self._timings)
+
+    def run(self, phase, func, devices):
+        """Apply func to each device concurrently.
+
+        Yield (device, result) as soon as each result is available. Pending
+        calls are cancelled when quit_func returns True.
+        """
+        devices = list(devices)
+        t0 = time.time()
+        try:
+            if not devices:
+                return
+            nworkers = min(self._max_workers, len(devices))
+            with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                futures = {executor.submit(func, dev): dev for dev in devices}
+                for fut in as_completed(futures):
+                    yield futures[fut], fut.result()
+                    if self._quit_func():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        finally:
+            self._add_timing(phase, len(devices), time.time() - t0)
+
+    def poll(self, phase, func, devices, timeout, interval):
+        """Call func on each device concurrently until it returns True.
+
+        Devices are polled in sweeps, spaced by interval seconds, until all
+        of them succeed or timeout expires. Yield (device, True) as soon as
+        a device succeeds and, at the end, (device, False) for the devices
+        that did not.
+        """
+        need_check = list(devices)
+        size = len(need_check)
+        t0 = time.time()
+        try:
+            if not size:
+                return
+            nworkers = min(self._max_workers, len(need_check))
+            with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                while time.time() - t0 < timeout:
+                    futures = {
+                        executor.submit(func, dev): dev for dev in need_check}
+                    quit_task = False
+                    for fut in as_completed(futures):
+                        if not fut.result():
+                            continue
+                        dev = futures[fut]
+                        need_check.remove(dev)
+                        yield dev, True
+                        if self._quit_func():
+                            quit_task = True
+                            break
+                    if quit_task or self._quit_func():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    if not need_check:
+                        break
+                    time.sleep(interval)
+            for dev in need_check:
+                yield dev, False
+        finally:
+            self._add_timing(phase, size, time.time() - t0)
+
+    def _add_timing(self, phase, size, duration):
+        self._timings.append((phase, size, duration))
+        _log.info('{}: {} of {} devices took {:.3f} s'.format(
+            self._name, phase, size, duration))
@@ -17,9 +17,11 @@ class EpicsGetter(EpicsTask):
     def run(self):
         """Thread execution."""
         if not self._quit_task:
-            for pvn in self._pvnames:
+            conn = dict(self._connect_pvs())
+            for pvn, value in self._run_parallel(
+                    lambda pvn: self._get(pvn, conn.get(pvn)),
+                    self._pvnames):
                 self.currentItem.emit(pvn)
-                value = self.get_pv(pvn).get(self._timeout)
                 if value is not None:
                     self.itemRead.emit(pvn, QVariant(value))
                 else:
@@ -28,3 +30,8 @@ class EpicsGetter(EpicsTask):
                 if self._quit_task:
                     break
         self.completed.emit()
+
+    def _get(self, pvn, connected):
+        if not connected:
+            return None
+        return self.get_pv(pvn).get(self._timeout)
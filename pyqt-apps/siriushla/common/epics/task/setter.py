@@ -5,21 +5,47 @@ from .task import EpicsTask
 
 
 class EpicsSetter(EpicsTask):
-    """Set the value of a set of PVs."""
+    """Set the value of a set of PVs.
+
+    Consecutive PVs whose delays are not larger than GROUP_DELAY carry no
+    ordering constraint among them and are put in parallel, as a group.
+    A PV with a larger delay closes its group: the group is put and then
+    the task sleeps for that delay before starting the next group.
+    """
+
+    GROUP_DELAY = 1e-2
+    GROUP_SIZE = 256
 
     def run(self):
         """Thread execution."""
         if not self._quit_task:
+            conn = dict(self._connect_pvs())
+            group = list()
             for i, pvn in enumerate(self._pvnames):
-                self.currentItem.emit(pvn)
-                pv = self.get_pv(pvn)
-                try:
-                    pv.put(self._values[i])
-                    time.sleep(self._delays[i])
-                except TypeError:
-                    _log.warning('PV {} not set with value: {}'.format(
-                        pvn, self._values[i]))
-                self.itemDone.emit()
+                group.append(i)
+                if self._delays[i] <= self.GROUP_DELAY and \
+                        len(group) < self.GROUP_SIZE and \
+                        i < len(self._pvnames) - 1:
+                    continue
+                for j, _ in self._run_parallel(
+                        lambda j: self._put(j, conn.get(self._pvnames[j])),
+                        group):
+                    self.currentItem.emit(self._pvnames[j])
+                    self.itemDone.emit()
+                    if self._quit_task:
+                        break
                 if self._quit_task:
                     break
+                time.sleep(max(self._delays[j] for j in group))
+                group = list()
         self.completed.emit()
+
+    def _put(self, idx, connected):
+        pvn, value = self._pvnames[idx], self._values[idx]
+        if not connected:
+            _log.warning('PV {} not connected, not set.'.format(pvn))
+            return
+        try:
+            self.get_pv(pvn).put(value)
+        except TypeError:
+            _log.warning('PV {} not set with value: {}'.format(pvn, value))
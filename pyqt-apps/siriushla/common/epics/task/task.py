@@ -1,4 +1,6 @@
 """EpicsTask interface."""
+import time
+from concurrent.futures import ThreadPoolExecutor
 from qtpy.QtCore import QThread, Signal
 from ..wrapper import PyEpicsWrapper
 
@@ -14,7 +16,7 @@ class EpicsTask(QThread):
     exit_task (method)
     """
 
-    PVs = dict()
+    MAX_WORKERS = 32
     currentItem = Signal(str)
     itemDone = Signal()
     completed = Signal()
@@ -26,7 +28,8 @@ class EpicsTask(QThread):
         Parameters
         ----------
         pv_list - a list of PVs
-        cls_epics - epics class that implements interface (put, get, check)
+        cls_epics - epics class that implements interface (put, get, check
+            and, optionally, wait_for_connection)
         values - values associated with the PVs [optional]
         parent - parent QObject [optional]
         """
@@ -37,6 +40,8 @@ class EpicsTask(QThread):
         self._cls_epics = cls_epics
         self._quit_task = False
         self._timeout = timeout
+        self._pvs = dict()
+        self.finished.connect(self._release_pvs)
 
     def size(self):
         """Task Size."""
@@ -47,8 +52,57 @@ class EpicsTask(QThread):
         self._quit_task = True
 
     def get_pv(self, pvn):
-        pv = self.PVs.get(pvn)
+        pv = self._pvs.get(pvn)
         if pv is None:
             pv = self._cls_epics(pvn)
-            self.PVs[pvn] = pv
+            self._pvs[pvn] = pv
         return pv
+
+    def _release_pvs(self):
+        """Release PVs, if the epics class supports it."""
+        pvs, self._pvs = self._pvs, dict()
+        for pv in pvs.values():
+            if hasattr(pv, 'release'):
+                pv.release()
+
+    def _connect_pvs(self, pvnames=None):
+        """Create all channels up front and wait for them collectively.
+
+        Yield (pvname, connected) in the order of pvnames. The channels
+        connect concurrently, so the waiting deadline is shared: it is
+        renewed whenever some PV connects and a set of dead PVs costs a
+        single timeout instead of one per PV.
+        """
+        pvnames = self._pvnames if pvnames is None else pvnames
+        pvs = [self.get_pv(pvn) for pvn in pvnames]
+        deadline = time.time() + self._timeout
+        for pvn, pv in zip(pvnames, pvs):
+            if self._quit_task:
+                break
+            wait_conn = getattr(pv, 'wait_for_connection', None)
+            if wait_conn is None:
+                yield pvn, True
+                continue
+            conn = wait_conn(max(deadline - time.time(), 0))
+            if conn:
+                deadline = time.time() + self._timeout
+            yield pvn, conn
+
+    def _run_parallel(self, func, items):
+        """Apply func to each item using a pool of worker threads.
+
+        Yield (item, result) in the order of items, as soon as each result
+        is available. Pending calls are cancelled if the task is exited.
+        """
+        items = list(items)
+        if not items:
+            return
+        nworkers = min(self.MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            for item, fut in zip(items, futures):
+                if self._quit_task:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                yield item, fut.result()
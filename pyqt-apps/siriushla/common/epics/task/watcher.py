@@ -0,0 +1,185 @@
+"""Epics Convergence Watcher."""
+import time
+import logging as _log
+from threading import Event
+from functools import partial as _part
+
+import numpy as _np
+from qtpy.QtCore import Signal
+
+from .task import EpicsTask
+from ..wrapper import PyEpicsWrapper, values_close
+
+
+def get_readback_name(pvname):
+    """Return name of the readback of pvname.
+
+    Only meant for PVs whose readbacks are equivalent to their setpoints.
+    Readbacks may be quantized or, for -Sel/-Sts pairs, use other enums.
+    """
+    if pvname.endswith('-SP'):
+        return pvname[:-3] + '-RB'
+    elif pvname.endswith('-Sel'):
+        return pvname[:-4] + '-Sts'
+    return pvname
+
+
+class EpicsConvergenceWatcher(EpicsTask):
+    """Wait for the readbacks of a set of PVs to reach their values.
+
+    Replaces a fixed wait followed by an EpicsChecker. Readbacks are
+    monitored and each PV is checked as soon as its readback changes, so
+    the task completes when every readback is within tolerance of its
+    value, or has timed out.
+
+    The deadline of each PV is its delay plus settle_timeout seconds, and
+    is renewed whenever its readback changes, since a readback still
+    moving is likely to converge. It is never extended beyond its delay
+    plus max_timeout seconds after the task starts.
+
+    Readbacks are named by readbacks or, by default, are the PVs themselves.
+    Callers whose readbacks are equivalent to their setpoints may name them
+    with get_readback_name. If a readback does not connect, the PV itself is
+    watched. If cls_epics
+    does not implement add_callback, readbacks are polled.
+
+    The time each PV took to converge is kept in settling_times and a
+    histogram of them is logged when the task finishes.
+    """
+
+    itemChecked = Signal(str, bool)
+
+    SETTLE_TIMEOUT = 2.0
+    MAX_TIMEOUT = 30.0
+    POLL_INTERVAL = 0.1
+    HISTOGRAM_BINS = (0, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, _np.inf)
+
+    def __init__(self, pvs, values, delays, cls_epics=PyEpicsWrapper,
+                 parent=None, timeout=PyEpicsWrapper.TIMEOUT, readbacks=None,
+                 settle_timeout=SETTLE_TIMEOUT, max_timeout=MAX_TIMEOUT,
+                 rtol=1e-06, atol=0.0):
+        super().__init__(pvs, values, delays, cls_epics, parent, timeout)
+        self._readbacks = list(readbacks) if readbacks is not None else \
+            list(pvs)
+        self._settle_timeout = settle_timeout
+        self._max_timeout = max_timeout
+        self._rtol = rtol
+        self._atol = atol
+        self._settling_times = dict()
+        self._updated = Event()
+        self._latest = dict()
+
+    @property
+    def settling_times(self):
+        """Dictionary of time, in seconds, PVs took to converge."""
+        return dict(self._settling_times)
+
+    def histogram(self, bins=HISTOGRAM_BINS):
+        """Return counts and bin edges of the settling times."""
+        return _np.histogram(list(self._settling_times.values()), bins=bins)
+
+    def report(self):
+        """Return lines of text with the settling times histogram."""
+        counts, edges = self.histogram()
+        lines = ['Settling times of {} of {} PVs:'.format(
+            len(self._settling_times), self.size())]
+        for cnt, low, high in zip(counts, edges[:-1], edges[1:]):
+            if cnt:
+                lines.append('  {:>5.1f} - {:>5.1f} s: {:d}'.format(
+                    low, high, cnt))
+        return lines
+
+    def run(self):
+        """Thread execution."""
+        if not self._quit_task:
+            self._watch()
+            for line in self.report():
+                _log.info(line)
+        self.completed.emit()
+
+    def _watch(self):
+        t0 = time.time()
+        watched = self._get_watched()
+        callbacks = self._subscribe(watched)
+        try:
+            pending = set(range(len(self._pvnames)))
+            deadlines = {
+                i: t0 + self._delays[i] + self._settle_timeout
+                for i in pending}
+            limits = {
+                i: t0 + self._delays[i] + self._max_timeout for i in pending}
+            previous = dict()
+            while pending and not self._quit_task:
+                self._updated.clear()
+                now = time.time()
+                for i in sorted(pending):
+                    if i in callbacks:
+                        value = self._latest.get(i)
+                    else:
+                        value = watched[i] and watched[i].get(wait=0)
+                    if values_close(value, self._values[i],
+                                    self._rtol, self._atol):
+                        self._settling_times[self._pvnames[i]] = now - t0
+                        self._item_checked(i, True)
+                        pending.remove(i)
+                        continue
+                    if value is not None and i in previous and \
+                            not values_close(value, previous[i], 0.0, 0.0):
+                        # readback is moving, give it more time
+                        deadlines[i] = min(
+                            now + self._settle_timeout, limits[i])
+                    previous[i] = value
+                    if watched[i] is None or now > deadlines[i]:
+                        self._item_checked(i, False)
+                        pending.remove(i)
+                if not pending:
+                    break
+                wait = min(deadlines[i] for i in pending) - now
+                if len(callbacks) < len(pending):
+                    wait = min(wait, self.POLL_INTERVAL)
+                self._updated.wait(max(wait, 0))
+        finally:
+            for i, index in callbacks.items():
+                watched[i].remove_callback(index)
+
+    def _get_watched(self):
+        """Return list of readback epics objects, None if not connected."""
+        conn = dict(self._connect_pvs(self._readbacks))
+        missing = [
+            pvn for pvn, rbn in zip(self._pvnames, self._readbacks)
+            if not conn.get(rbn) and pvn != rbn]
+        conn.update(self._connect_pvs(missing))
+        watched = list()
+        for pvn, rbn in zip(self._pvnames, self._readbacks):
+            if conn.get(rbn):
+                watched.append(self.get_pv(rbn))
+            elif conn.get(pvn):
+                _log.warning('Readback {} not connected, checking {}'.format(
+                    rbn, pvn))
+                watched.append(self.get_pv(pvn))
+            else:
+                watched.append(None)
+        return watched
+
+    def _subscribe(self, watched):
+        """Monitor watched objects. Return callback indices by PV index."""
+        callbacks = dict()
+        for i, obj in enumerate(watched):
+            if obj is None or not hasattr(obj, 'add_callback'):
+                continue
+            callbacks[i] = obj.add_callback(_part(self._value_updated, i))
+        # values received before subscribing
+        for i, value in self._run_parallel(
+                lambda i: watched[i].get(wait=self._timeout), callbacks):
+            self._latest.setdefault(i, value)
+        return callbacks
+
+    def _value_updated(self, idx, value=None, **kwargs):
+        self._latest[idx] = value
+        self._updated.set()
+
+    def _item_checked(self, idx, status):
+        pvn = self._pvnames[idx]
+        self.currentItem.emit(pvn)
+        self.itemChecked.emit(pvn, status)
+        self.itemDone.emit()
@@ -1,3 +1,3 @@
 """Wrapper package init."""
 
-from .pyepics import PyEpicsWrapper
+from .pyepics import PyEpicsWrapper, values_close
@@ -1,32 +1,63 @@
-import epics
 from math import isclose
 import numpy as _np
 from siriuspy.envars import VACA_PREFIX as _VACA_PREFIX
+from ..pool import get_pv as _get_pv, release_pv as _release_pv
 
 _TIMEOUT = 0.5
 
 
+def values_close(pvv, value, rtol=1e-06, atol=0.0):
+    """Return whether PV value pvv is close to value."""
+    if pvv is None:
+        return False
+    elif isinstance(pvv, (_np.ndarray, list, tuple)) or \
+            isinstance(value, (_np.ndarray, list, tuple)):
+        try:
+            if len(pvv) != len(value):
+                return False
+        except TypeError:
+            return False  # one of them is not an array
+        return _np.allclose(pvv, value, rtol=rtol, atol=atol)
+    elif isinstance(pvv, float) or isinstance(value, float):
+        return isclose(pvv, value, rel_tol=rtol, abs_tol=atol)
+    return bool(pvv == value)
+
+
 class PyEpicsWrapper:
     """Wraps a PV object.
 
     Implements:
     pvname
+    connected
+    wait_for_connection
     put
     check
     get
+    add_callback
+    remove_callback
+    release
     """
 
     TIMEOUT = _TIMEOUT
 
     def __init__(self, pv):
-        """Create PV object."""
-        self._pv = epics.get_pv(_VACA_PREFIX + pv)
+        """Get PV object from the process-wide pool."""
+        self._pv = _get_pv(_VACA_PREFIX + pv)
 
     @property
     def pvname(self):
         """PV Name."""
         return self._pv.pvname
 
+    @property
+    def connected(self):
+        """Return whether PV is connected."""
+        return self._pv.connected
+
+    def wait_for_connection(self, wait=_TIMEOUT):
+        """Wait for PV connection. Return connection status."""
+        return self._pv.wait_for_connection(wait)
+
     def put(self, value, wait=_TIMEOUT):
         """Put if connected."""
         if not self._pv.wait_for_connection(wait):
@@ -35,26 +66,23 @@ class PyEpicsWrapper:
 
     def check(self, value, wait=_TIMEOUT):
         """Do timed get."""
-        pvv = self.get(wait=wait)
-        if pvv is None:
-            return False
-        elif self._isarray(pvv) or self._isarray(value):
-            try:
-                if len(pvv) != len(value):
-                    return False
-            except TypeError:
-                return False  # one of them is not an array
-            return _np.allclose(pvv, value, rtol=1e-06, atol=0.0)
-        elif isinstance(pvv, float) or isinstance(value, float):
-            return isclose(pvv, value, rel_tol=1e-06, abs_tol=0.0)
-        elif pvv == value:
-            return True
-        return False
+        return values_close(self.get(wait=wait), value)
 
     def get(self, wait=_TIMEOUT):
         """Return PV value."""
         if self._pv.wait_for_connection(wait):
             return self._pv.get(timeout=wait)
 
-    def _isarray(self, value):
-        return isinstance(value, (_np.ndarray, list, tuple))
+    def add_callback(self, callback):
+        """Call callback(value=...) on value updates. Return its index."""
+        return self._pv.add_callback(callback)
+
+    def remove_callback(self, index):
+        """Remove callback of index returned by add_callback."""
+        self._pv.remove_callback(index)
+
+    def release(self):
+        """Release PV object back to the pool."""
+        if self._pv is not None:
+            _release_pv(self._pv)
+            self._pv = None
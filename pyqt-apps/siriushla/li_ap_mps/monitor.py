@@ -1,8 +1,9 @@
 """Control of EVG Timing Device."""
 
 from qtpy.QtCore import Qt
-from qtpy.QtWidgets import QWidget, QGridLayout, QLabel, QGroupBox
-from siriushla.widgets import PyDMLed, PyDMLedMultiChannel
+from qtpy.QtWidgets import QWidget, QGridLayout, QLabel, QGroupBox, \
+    QVBoxLayout
+from siriushla.widgets import PyDMLed, SiriusLedMatrix
 from .util import MPS_PREFIX, SEC_2_POS, SEC_2_STATUS
 
 
@@ -19,61 +20,49 @@ class MPSMonitor(QWidget):
         lay = QGridLayout(self)
         lay.setAlignment(Qt.AlignTop)
 
-        self.title = QLabel('<h2>LI MPS Monitor</h2>', self)
+        self.title = QLabel(
+            '<h2>LI MPS Monitor</h2>', self, alignment=Qt.AlignCenter)
         lay.addWidget(self.title, 0, 0, 1, 2)
 
         for sec, status in SEC_2_STATUS.items():
             gbox = QGroupBox(sec, self)
-            grid = QGridLayout(gbox)
+            # all leds of a group are painted by a single widget
+            grid = SiriusLedMatrix(gbox)
+            QVBoxLayout(gbox).addWidget(grid)
+            center = Qt.AlignCenter
             if isinstance(status, dict):
                 if 'Header' in status.keys():
                     for i, text in enumerate(status['Header']):
-                        grid.addWidget(QLabel(text, self), 0, i+1,
-                                       alignment=Qt.AlignCenter)
+                        grid.add_label(0, i+1, text, alignment=center)
                     aux_row = 1
                     for text, ch_grp in status.items():
                         if text == 'Header':
                             continue
-                        grid.addWidget(QLabel(text, self), aux_row, 0,
-                                       alignment=Qt.AlignCenter)
+                        grid.add_label(aux_row, 0, text, alignment=center)
                         for ch in ch_grp:
                             if not ch:
                                 continue
                             aux_col = ch_grp.index(ch)
                             k = (MPS_PREFIX if 'RF' not in ch[0] else '')+ch[0]
-                            ch2vals = {k: ch[1]}
-                            led = PyDMLedMultiChannel(self)
-                            led.set_channels2values(ch2vals)
-                            grid.addWidget(led, aux_row, aux_col+1,
-                                           alignment=Qt.AlignCenter)
+                            grid.add_led(aux_row, aux_col+1, k, desired=ch[1])
                         aux_row += 1
                 else:
                     aux_row = 0
                     for text, ch in status.items():
-                        grid.addWidget(QLabel(text, self), aux_row, 0)
-                        ch2vals = {MPS_PREFIX + ch[0]: ch[1]}
-                        led = PyDMLedMultiChannel(self)
-                        led.set_channels2values(ch2vals)
-                        if 'Heartbeat' in text:
-                            led.setOffColor(PyDMLed.Yellow)
-                        grid.addWidget(led, aux_row, 1,
-                                       alignment=Qt.AlignCenter)
+                        grid.add_label(aux_row, 0, text, alignment=center)
+                        fault_color = PyDMLed.Yellow \
+                            if 'Heartbeat' in text else None
+                        grid.add_led(
+                            aux_row, 1, MPS_PREFIX + ch[0], desired=ch[1],
+                            fault_color=fault_color)
                         aux_row += 1
             elif isinstance(status, list):
                 for ch_grp in status:
                     aux_row = status.index(ch_grp)
                     for ch in ch_grp:
                         aux_col = ch_grp.index(ch)
-                        ch2vals = {MPS_PREFIX + ch[0]: ch[1]}
-                        led = PyDMLedMultiChannel(self)
-                        led.set_channels2values(ch2vals)
-                        grid.addWidget(led, aux_row, aux_col,
-                                       alignment=Qt.AlignCenter)
+                        grid.add_led(
+                            aux_row, aux_col, MPS_PREFIX + ch[0],
+                            desired=ch[1])
             row, col, rowc, colc = SEC_2_POS[sec]
             lay.addWidget(gbox, row, col, rowc, colc)
-
-            self.setStyleSheet("""
-                QLabel { qproperty-alignment: AlignCenter; }
-                QLed { min-width: 1.1em; max-width: 1.1em;
-                       min-height: 1.1em; max-height: 1.1em; }
-            """)
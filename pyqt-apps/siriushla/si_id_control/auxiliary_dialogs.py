@@ -229,9 +229,13 @@ class APUCorrs(SiriusDialog):
 
     def _connect_corrs_buttons(self, widget):
         for w in widget.get_summary_widgets():
-            detail_bt = w.get_detail_button()
-            psname = detail_bt.text()
-            if not psname:
-                psname = detail_bt.toolTip()
-            psname = _PVName(psname)
-            connect_window(detail_bt, PSDetailWindow, self, psname=psname)
+            self._connect_corr_button(w)
+        widget.summaryWidgetCreated.connect(self._connect_corr_button)
+
+    def _connect_corr_button(self, w):
+        detail_bt = w.get_detail_button()
+        psname = detail_bt.text()
+        if not psname:
+            psname = detail_bt.toolTip()
+        psname = _PVName(psname)
+        connect_window(detail_bt, PSDetailWindow, self, psname=psname)
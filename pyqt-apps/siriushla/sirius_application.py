@@ -10,6 +10,7 @@ from qtpy.QtWidgets import QMessageBox
 from pydm import PyDMApplication, data_plugins
 
 from .util import get_window_id, set_style
+from .startup import get_profiler
 
 
 # Create log file
@@ -29,13 +30,24 @@ _log.basicConfig(
     filename=LOGFILE, filemode='a')
 
 
-# Set QT_SCALE_FACTOR
-res = sub.getoutput('xrandr')
-if 'current' in res:
-    res = sub.getoutput('xrandr | grep current')
-    res = int(res.split(',')[1].split()[3])
-    if res > 2000:
-        os.environ['QT_SCALE_FACTOR'] = '1.5'
+_SCALE_FACTOR_SET = False
+
+
+def set_scale_factor():
+    """Set QT_SCALE_FACTOR according to screen resolution, once.
+
+    Must be called before the application is created.
+    """
+    global _SCALE_FACTOR_SET
+    if _SCALE_FACTOR_SET:
+        return
+    _SCALE_FACTOR_SET = True
+    res = sub.getoutput('xrandr')
+    if 'current' in res:
+        res = sub.getoutput('xrandr | grep current')
+        res = int(res.split(',')[1].split()[3])
+        if res > 2000:
+            os.environ['QT_SCALE_FACTOR'] = '1.5'
 
 
 # https://riverbankcomputing.com/pipermail/pyqt/2009-May/022961.html
@@ -96,6 +108,7 @@ class SiriusApplication(PyDMApplication):
     def __init__(self, ui_file=None, command_line_args=[],
                  use_main_window=False, **kwargs):
         """Create an attribute to hold open windows."""
+        set_scale_factor()
         super().__init__(ui_file=ui_file, command_line_args=command_line_args,
                          use_main_window=use_main_window, **kwargs)
         font = self.font()
@@ -109,6 +122,9 @@ class SiriusApplication(PyDMApplication):
         self.setFont(font)
         set_style(self)
         self._windows = dict()
+        self._profiler = get_profiler()
+        if self._profiler is not None:
+            self._profiler.watch_channels()
 
     def open_window(self, w_class, parent=None, **kwargs):
         """Open new window.
@@ -133,6 +149,7 @@ class SiriusApplication(PyDMApplication):
             self._windows[wid].showNormal()
 
     def _create_and_show(self, wid, w_class, parent, **kwargs):
+        t0 = time.time()
         with data_plugins.connection_queue():
             try:
                 window = w_class(parent=parent, **kwargs)
@@ -144,6 +161,10 @@ class SiriusApplication(PyDMApplication):
             else:
                 self._windows[wid] = window
                 self._windows[wid].show()
+                if self._profiler is not None:
+                    self._profiler.add_window(
+                        w_class.__name__, t0, time.time() - t0)
+                    self._profiler.schedule_report()
 
     def _get_desktop_geometry(self):
         screen = self.primaryScreen()
@@ -0,0 +1,314 @@
+"""Startup profiling and lazy imports of siriushla applications.
+
+Applications are profiled when run with the --profile-startup option,
+optionally followed by '=' and the name of the report file:
+
+    sirius-hla-si-ap-sofb.py --profile-startup
+    sirius-hla-si-ap-sofb.py --profile-startup=/tmp/sofb.txt
+
+The option is handled, and removed from sys.argv, when siriushla is
+imported, so that imports done afterwards are recorded. The report lists
+the modules that took longer to import, the connection time of the
+channels and the construction time of the windows opened by
+SiriusApplication. It is written some seconds after the first window is
+shown, or when the application quits.
+
+This module must not import Qt or other heavy modules at module level.
+"""
+
+import os as _os
+import sys as _sys
+import time as _time
+import types as _types
+import builtins as _builtins
+import importlib as _importlib
+import importlib.util as _imputil
+from functools import partial as _part
+
+
+PROFILE_OPTION = '--profile-startup'
+
+_PROFILER = None
+
+
+def lazy_import(name):
+    """Return module that is only imported when one of its attributes is used.
+
+    Use it for heavy dependencies only needed by some features:
+
+        _scyopt = lazy_import('scipy.optimize')
+        ...
+        _scyopt.curve_fit(...)
+    """
+    module = _sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
+
+
+class _LazyModule(_types.ModuleType):
+
+    def __getattr__(self, attr):
+        module = _importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(_importlib.import_module(self.__name__))
+
+
+def lazy_attributes(module_name, attributes):
+    """Import attributes of a module from its submodules on first use.
+
+    attributes is a dictionary of attribute names to the names, relative to
+    module_name, of the submodules defining them. Used in package __init__
+    files to defer importing heavy submodules:
+
+        lazy_attributes(__name__, {'MatplotlibWidget': '.matplotlib'})
+    """
+    module = _sys.modules[module_name]
+
+    class _LazyAttributesModule(type(module)):
+
+        def __getattr__(self, attr):
+            submodule = attributes.get(attr)
+            if submodule is None:
+                raise AttributeError('module {} has no attribute {}'.format(
+                    module_name, attr))
+            value = getattr(
+                _importlib.import_module(submodule, module_name), attr)
+            setattr(self, attr, value)
+            return value
+
+        def __dir__(self):
+            return sorted(set(super().__dir__()) | set(attributes))
+
+    module.__class__ = _LazyAttributesModule
+
+
+def get_profiler():
+    """Return the active StartupProfiler, or None."""
+    return _PROFILER
+
+
+def profile_from_argv(argv=None):
+    """Start profiler if PROFILE_OPTION is in argv, removing it.
+
+    argv defaults to sys.argv. Return the profiler, or None.
+    """
+    global _PROFILER
+    argv = _sys.argv if argv is None else argv
+    for idx, arg in enumerate(argv):
+        if arg == PROFILE_OPTION or arg.startswith(PROFILE_OPTION + '='):
+            break
+    else:
+        return _PROFILER
+    del argv[idx]
+    fname = arg.partition('=')[2]
+    if _PROFILER is None:
+        _PROFILER = StartupProfiler(fname)
+        _PROFILER.start()
+    return _PROFILER
+
+
+class StartupProfiler:
+    """Record import, channel connection and window construction times.
+
+    Imports are timed by replacing builtins.__import__, recording the
+    cumulative and the self time of each module loaded by an import
+    statement. Channel connections are timed from the moment a PyDM plugin
+    adds them until they connect. Windows are recorded by SiriusApplication
+    with add_window.
+    """
+
+    REPORT_DELAY = 10.0
+    NR_ITEMS = 30
+
+    def __init__(self, filename=''):
+        """Init."""
+        if not filename:
+            script = _os.path.basename(_sys.argv[0]) or 'python'
+            filename = '/tmp/sirius-hla-startup-{}-{}.txt'.format(
+                script, _os.getpid())
+        self._filename = filename
+        self._t0 = _time.time()
+        self._orig_import = None
+        self._stack = list()
+        self._imports = dict()
+        self._channels = dict()
+        self._windows = list()
+        self._report_written = False
+
+    @property
+    def filename(self):
+        """Name of the report file."""
+        return self._filename
+
+    @property
+    def imports(self):
+        """Dictionary of (cumulative, self) import times by module."""
+        return dict(self._imports)
+
+    @property
+    def channels(self):
+        """Dictionary of [request time, connection time] by address."""
+        return {addr: list(tms) for addr, tms in self._channels.items()}
+
+    @property
+    def windows(self):
+        """List of (window, construction start, construction time)."""
+        return list(self._windows)
+
+    def start(self):
+        """Start recording imports."""
+        if self._orig_import is None:
+            self._orig_import = _builtins.__import__
+            _builtins.__import__ = self._import
+
+    def stop(self):
+        """Stop recording imports."""
+        if self._orig_import is not None:
+            _builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def watch_channels(self):
+        """Start recording channel connections. Needs pydm."""
+        from pydm.data_plugins.plugin import PyDMPlugin
+        orig_add = PyDMPlugin.add_connection
+        if getattr(orig_add, '_profiled', False):
+            return
+
+        def add_connection(plugin, channel):
+            orig_add(plugin, channel)
+            self._channel_added(plugin, channel)
+        add_connection._profiled = True
+        PyDMPlugin.add_connection = add_connection
+
+    def add_window(self, name, start, duration):
+        """Record construction of window."""
+        self._windows.append((name, start - self._t0, duration))
+
+    def schedule_report(self):
+        """Write report REPORT_DELAY seconds after the first window."""
+        from qtpy.QtCore import QTimer
+        from qtpy.QtWidgets import QApplication
+        if len(self._windows) != 1:
+            return
+        QTimer.singleShot(int(self.REPORT_DELAY*1000), self.write_report)
+        QApplication.instance().aboutToQuit.connect(self.write_report)
+
+    def write_report(self):
+        """Write report to file, once."""
+        if self._report_written:
+            return
+        self._report_written = True
+        try:
+            with open(self._filename, 'w') as fil:
+                fil.write(self.report())
+        except OSError as err:
+            print('StartupProfiler: {}'.format(err))
+        else:
+            print('StartupProfiler: report written to ' + self._filename)
+
+    def report(self):
+        """Return report text."""
+        lines = [
+            'Startup profile of ' + ' '.join(_sys.argv),
+            'Python {}'.format(_sys.version.split()[0]), '']
+
+        imports = sorted(
+            self._imports.items(), key=lambda x: x[1][1], reverse=True)
+        total = sum(tms[1] for _, tms in imports)
+        lines.append('Imports: {} modules, {:.3f} s'.format(
+            len(imports), total))
+        lines.append('{:>10s} {:>10s}  {}'.format('self', 'cumul.', 'module'))
+        for name, (cumul, self_) in imports[:self.NR_ITEMS]:
+            lines.append('{:10.4f} {:10.4f}  {}'.format(self_, cumul, name))
+        lines.append('')
+
+        lines.append('Windows:')
+        lines.append('{:>10s} {:>10s}  {}'.format('start', 'build', 'window'))
+        for name, start, duration in self._windows:
+            lines.append('{:10.4f} {:10.4f}  {}'.format(start, duration, name))
+        lines.append('')
+
+        conn = sorted(
+            ((tms[1] - tms[0], addr) for addr, tms in self._channels.items()
+             if tms[1] is not None), reverse=True)
+        nconn = [addr for addr, tms in self._channels.items()
+                 if tms[1] is None]
+        lines.append('Channels: {} requested, {} connected'.format(
+            len(self._channels), len(conn)))
+        if conn:
+            durs = sorted(dur for dur, _ in conn)
+            lines.append(
+                'connection time: median {:.4f} s, max {:.4f} s'.format(
+                    durs[len(durs)//2], durs[-1]))
+            last = max(tms[1] for tms in self._channels.values()
+                       if tms[1] is not None)
+            lines.append('all connected {:.4f} s after start'.format(
+                last - self._t0))
+        for dur, addr in conn[:self.NR_ITEMS]:
+            lines.append('{:10.4f}  {}'.format(dur, addr))
+        for addr in sorted(nconn)[:self.NR_ITEMS]:
+            lines.append('{:>10s}  {}'.format('not conn.', addr))
+        lines.append('')
+        return '\n'.join(lines)
+
+    # --- import hook ---
+
+    def _import(self, name, globals=None, locals=None, fromlist=(),
+                level=0):
+        nr_mods = len(_sys.modules)
+        self._stack.append(0.0)
+        t0 = _time.perf_counter()
+        try:
+            return self._orig_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = _time.perf_counter() - t0
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += duration
+            if len(_sys.modules) != nr_mods:
+                name = self._get_import_name(name, globals, fromlist, level)
+                cumul, self_ = self._imports.get(name, (0.0, 0.0))
+                self._imports[name] = (
+                    cumul + duration, self_ + duration - children)
+
+    @staticmethod
+    def _get_import_name(name, globals, fromlist, level):
+        if level and globals:
+            pkg = globals.get('__package__') or ''
+            if pkg:
+                name = _imputil.resolve_name('.'*level + name, pkg)
+        if fromlist and len(fromlist) == 1 and fromlist[0] != '*':
+            # may be a submodule imported by 'from package import module'
+            submodule = name + '.' + fromlist[0]
+            if submodule in _sys.modules:
+                name = submodule
+        return name
+
+    # --- channels ---
+
+    def _channel_added(self, plugin, channel):
+        address = channel.address
+        if address in self._channels:
+            return
+        self._channels[address] = [_time.time(), None]
+        if hasattr(plugin, 'get_connection_id'):
+            conn_id = plugin.get_connection_id(channel)
+        else:
+            conn_id = plugin.get_address(channel)
+        conn = plugin.connections.get(conn_id)
+        if conn is None:
+            return
+        if getattr(conn, 'connected', False):
+            self._channels[address][1] = self._channels[address][0]
+            return
+        conn.connection_state_signal.connect(
+            _part(self._channel_connected, address))
+
+    def _channel_connected(self, address, conn):
+        tms = self._channels[address]
+        if conn and tms[1] is None:
+            tms[1] = _time.time()
@@ -0,0 +1,96 @@
+"""Registry of stylesheet rules applied at the application level.
+
+Setting a stylesheet on a widget makes Qt parse it and polish the widget
+subtree with a style of its own, which dominates the construction time of
+windows with thousands of widgets. Instead, modules register their rules
+here, when they are imported, and util.set_style applies them once, with
+the application stylesheet:
+
+    register_styles({'SummaryWidget #state': 'min-width: 6em;'})
+
+Rules select widgets by class and objectName. Widgets that can not be
+told apart by those are given a style class, which rules select with the
+'styleClass' property:
+
+    register_styles({'QLabel[styleClass="FormLabel"]': 'min-width: 7em;'})
+    set_style_class(label, 'FormLabel')
+
+Setting the application stylesheet again polishes every open window, so
+modules should be imported before util.set_style is called. New rules
+registered after that, by modules imported later, set it again.
+"""
+
+import re as _re
+import logging as _log
+
+
+STYLE_CLASS = 'styleClass'
+
+_RULES = dict()
+_SHEET = None
+_APP_STYLE = None
+
+
+def normalize(declarations):
+    """Return declarations as 'property: value;' separated by spaces."""
+    decls = list()
+    for decl in declarations.split(';'):
+        prop, _, value = decl.partition(':')
+        if prop.strip():
+            decls.append('{}: {};'.format(
+                prop.strip(), _re.sub(r'\s+', ' ', value.strip())))
+    return ' '.join(decls)
+
+
+def register_style(selector, declarations):
+    """Register rule of selector."""
+    register_styles({selector: declarations})
+
+
+def register_styles(rules):
+    """Register dictionary of declarations by selector."""
+    global _SHEET
+    changed = False
+    for selector, decls in rules.items():
+        selector = _re.sub(r'\s+', ' ', selector.strip())
+        decls = normalize(decls)
+        old = _RULES.get(selector)
+        if old == decls:
+            continue
+        if old is not None:
+            _log.warning('Style of {} redefined from "{}" to "{}"'.format(
+                selector, old, decls))
+        _RULES[selector] = decls
+        _SHEET = None
+        changed = True
+    if changed and _APP_STYLE is not None:
+        app, style = _APP_STYLE
+        app.setStyleSheet(style + '\n' + get_stylesheet())
+
+
+def set_style_class(widget, name):
+    """Set style class of widget, selected by rules as [styleClass="name"].
+
+    Unlike widget.setStyleSheet, this does not create a style for widget.
+    """
+    widget.setProperty(STYLE_CLASS, name)
+
+
+def _get_sheet(selectors):
+    return '\n'.join(
+        '{} {{{}}}'.format(sel, _RULES[sel]) for sel in selectors)
+
+
+def get_stylesheet():
+    """Return stylesheet of registered rules."""
+    global _SHEET
+    if _SHEET is None:
+        _SHEET = _get_sheet(_RULES)
+    return _SHEET
+
+
+def set_application_style(app, style):
+    """Set stylesheet of app to style followed by registered rules."""
+    global _APP_STYLE
+    _APP_STYLE = (app, style)
+    app.setStyleSheet(style + '\n' + get_stylesheet())
@@ -3,7 +3,6 @@ import os as _os
 import time as _time
 import pathlib as _pathlib
 import subprocess as _subprocess
-import pkg_resources as _pkg_resources
 from functools import partial as _part
 
 from qtpy.QtCore import QFile as _QFile, Signal as _Signal, QThread as _QThread
@@ -13,13 +12,16 @@ from qtpy.QtWidgets import QPushButton, QAction, QApplication, QDialog, \
 import qtawesome as qta
 from pydm.utilities.stylesheet import _get_style_data as pydm_get_style_data
 import siriushla.resources as _resources
+from siriushla import zygote as _zygote
+from siriushla import style_registry as _style_registry
 
 
 THREAD = None
 
 
 def get_package_version():
-    fname = _pkg_resources.resource_filename(__name__, 'VERSION')
+    # not with pkg_resources, whose import delays the start of every app
+    fname = _os.path.join(_os.path.dirname(__file__), 'VERSION')
     with open(fname, 'r') as _f:
         version = _f.read().strip()
     return version
@@ -47,7 +49,8 @@ def set_style(app, force_default=False):
         style = str(stream.readAll(), 'utf-8')
         stream.close()
         pydm_style = pydm_get_style_data()
-        app.setStyleSheet(style + '\n' + pydm_style)
+        _style_registry.set_application_style(
+            app, style + '\n' + pydm_style)
     else:
         print('set_style: "{0}": {1}'.format(fname, stream.errorString()))
     _resources.qCleanupResources()
@@ -134,12 +137,25 @@ def check_window_by_pid(pid, comm):
     return window
 
 
+def find_window(cmd, is_window=True, is_pydm=False):
+    """Return pid and window of cmd, checking first the zygote table."""
+    if not is_pydm:
+        pid, window = _zygote.find_window(cmd)
+        if pid:
+            return str(pid), window
+    return check_process(cmd, is_window=is_window, is_pydm=is_pydm)
+
+
 def run_newprocess(cmd, is_window=True, is_pydm=False, **kwargs):
-    pid, window = check_process(cmd, is_window=is_window, is_pydm=is_pydm)
+    # apps started outside the zygote server are found by check_process
+    pid, window = find_window(cmd, is_window=is_window, is_pydm=is_pydm)
     if window:
         _subprocess.run(
             "wmctrl -iR " + window, stdin=_subprocess.PIPE, shell=True)
-    elif not pid:
+    elif pid:
+        return
+    # python scripts are forked from the warm zygote server, if running
+    elif is_pydm or kwargs or _zygote.run(cmd) is None:
         _subprocess.Popen(cmd, **kwargs)
 
 
@@ -198,7 +214,7 @@ class LoadingThread(_QThread):
         self.openmessage.emit()
         wind = ''
         for _ in range(500):
-            _, wind = check_process(self.cmd, is_pydm=self.is_pydm)
+            _, wind = find_window(self.cmd, is_pydm=self.is_pydm)
             if wind:
                 break
             _time.sleep(0.01)
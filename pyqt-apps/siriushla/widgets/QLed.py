@@ -6,11 +6,10 @@ https://pypi.python.org/pypi/QLed or https://github.com/jazzycamel/QLed.
 
 import os as _os
 from colorsys import rgb_to_hls, hls_to_rgb
-from qtpy.QtWidgets import QApplication, QWidget, QGridLayout, \
-                            QStyleOption, QFrame
-from qtpy.QtGui import QPainter, QColor
+from qtpy.QtWidgets import QApplication, QWidget, QGridLayout, QFrame
+from qtpy.QtGui import QPainter, QColor, QPixmap
 from qtpy.QtCore import Signal, Qt, QSize, QTimer, QByteArray, \
-                        QRectF, Property, Q_ENUMS, QFile
+                        QPointF, Property, Q_ENUMS, QFile
 from qtpy.QtSvg import QSvgRenderer
 
 # This line is necessary for correct imports in designer-qt
@@ -59,6 +58,12 @@ class QLed(QFrame, ShapeMap):
     NotSelColor1 = QColor(251, 244, 252)
     NotSelColor2 = QColor(173, 173, 173)
 
+    # pixmaps shared by all leds, by (shape, color, selected, enabled,
+    # width, height, device pixel ratio)
+    PIXMAP_CACHE_SIZE = 4096
+    _pixmaps = dict()
+    _renderer = None
+
     clicked = Signal()
     selected = Signal(bool)
 
@@ -73,7 +78,6 @@ class QLed(QFrame, ShapeMap):
 
         self._pressed = False
         self._isselected = False
-        self.renderer = QSvgRenderer()
 
     def getState(self):
         """Value property getter."""
@@ -81,6 +85,8 @@ class QLed(QFrame, ShapeMap):
 
     def setState(self, value):
         """Value property setter."""
+        if value == self.m_state:
+            return
         self.m_state = value
         self.update()
 
@@ -120,6 +126,7 @@ class QLed(QFrame, ShapeMap):
                 len(new_colors) < 2 or not isinstance(new_colors[0], QColor):
             return
         self.m_stateColors = list(new_colors)
+        self.update()
 
     def getDsblColor(self):
         """Disabled color property getter."""
@@ -151,7 +158,8 @@ class QLed(QFrame, ShapeMap):
             return QSize(72, 36)
         return QSize(36, 36)
 
-    def adjust(self, r, g, b):
+    @staticmethod
+    def adjust(r, g, b):
         """Adjust the color to set on svg code."""
         def normalise(x):
             return x/255.0
@@ -167,7 +175,8 @@ class QLed(QFrame, ShapeMap):
 
         return (denormalise(nr), denormalise(ng), denormalise(nb))
 
-    def getRGBfromQColor(self, qcolor):
+    @staticmethod
+    def getRGBfromQColor(qcolor):
         """Convert QColors to a tupple of rgb colors to set on svg code."""
         redhex = qcolor.red()
         greenhex = qcolor.green()
@@ -176,13 +185,8 @@ class QLed(QFrame, ShapeMap):
 
     def paintEvent(self, event):
         """Handle appearence of the widget on state updates."""
-        self.style().unpolish(self)
-        self.style().polish(self)
-        option = QStyleOption()
-        option.initFrom(self)
-
-        h = option.rect.height()
-        w = option.rect.width()
+        h = self.height()
+        w = self.width()
         if self.m_shape in (self.ShapeMap.Triangle, self.ShapeMap.Round):
             aspect = (4/3.0) if self.m_shape == self.ShapeMap.Triangle else 2.0
             ah = w/aspect
@@ -190,41 +194,72 @@ class QLed(QFrame, ShapeMap):
             if ah > h:
                 ah = h
                 aw = h*aspect
-            x = abs(aw-w)/2.0
-            y = abs(ah-h)/2.0
-            bounds = QRectF(x, y, aw, ah)
         else:
-            size = min(w, h)
-            x = abs(size-w)/2.0
-            y = abs(size-h)/2.0
-            bounds = QRectF(x, y, size, size)
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+            aw = ah = min(w, h)
+        if aw < 1 or ah < 1:
+            return
 
-        ind = self.m_state % len(self.m_stateColors)
-        dark_r, dark_g, dark_b = self.getRGBfromQColor(self.m_stateColors[ind])
-        if not self.isEnabled():
-            dark_r, dark_g, dark_b = self.getRGBfromQColor(self.m_dsblColor)
+        if self.isEnabled():
+            color = self.m_stateColors[self.m_state % len(self.m_stateColors)]
+        else:
+            color = self.m_dsblColor
+        pixmap = self.get_pixmap(
+            self.m_shape, color, self._isselected, self.isEnabled(),
+            aw, ah, self.devicePixelRatioF())
 
-        sel1_r, sel1_g, sel1_b = self.getRGBfromQColor(self.SelColor)
-        sel2_r, sel2_g, sel2_b = self.getRGBfromQColor(self.SelColor)
+        painter = QPainter(self)
+        painter.drawPixmap(QPointF(abs(aw-w)/2.0, abs(ah-h)/2.0), pixmap)
+
+    @classmethod
+    def get_pixmap(cls, shape, color, selected, enabled, width, height, dpr):
+        """Return pixmap of led, of width x height logical pixels.
+
+        Pixmaps are rendered once and shared by all leds.
+        """
+        key = (shape, color.rgb(), selected, enabled,
+               round(width*dpr), round(height*dpr), dpr)
+        pixmap = QLed._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = cls._render_pixmap(
+                shape, color, selected, key[4], key[5], dpr)
+            if len(QLed._pixmaps) >= cls.PIXMAP_CACHE_SIZE:
+                QLed._pixmaps.clear()
+            QLed._pixmaps[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _render_pixmap(cls, shape, color, selected, width, height, dpr):
+        """Render svg of shape with color in a new pixmap."""
+        dark_r, dark_g, dark_b = cls.getRGBfromQColor(color)
+
+        sel1_r, sel1_g, sel1_b = cls.getRGBfromQColor(cls.SelColor)
+        sel2_r, sel2_g, sel2_b = cls.getRGBfromQColor(cls.SelColor)
         opc = '1.000'
-        if not self.isSelected():
-            sel1_r, sel1_g, sel1_b = self.getRGBfromQColor(self.NotSelColor1)
-            sel2_r, sel2_g, sel2_b = self.getRGBfromQColor(self.NotSelColor2)
+        if not selected:
+            sel1_r, sel1_g, sel1_b = cls.getRGBfromQColor(cls.NotSelColor1)
+            sel2_r, sel2_g, sel2_b = cls.getRGBfromQColor(cls.NotSelColor2)
             opc = '0.145'
 
         dark_str = "rgb(%d,%d,%d)" % (dark_r, dark_g, dark_b)
-        light_str = "rgb(%d,%d,%d)" % self.adjust(dark_r, dark_g, dark_b)
+        light_str = "rgb(%d,%d,%d)" % cls.adjust(dark_r, dark_g, dark_b)
         sel1_str = "rgb(%d,%d,%d)" % (sel1_r, sel1_g, sel1_b)
         sel2_str = "rgb(%d,%d,%d)" % (sel2_r, sel2_g, sel2_b)
 
-        shape_bytes = bytes(self.shapesdict[self.m_shape] % (
+        shape_bytes = bytes(cls.shapesdict[shape] % (
             sel1_str, opc, sel2_str, dark_str, light_str), 'utf-8')
 
-        self.renderer.load(QByteArray(shape_bytes))
-        self.renderer.render(painter, bounds)
+        if QLed._renderer is None:
+            QLed._renderer = QSvgRenderer()
+        QLed._renderer.load(QByteArray(shape_bytes))
+
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        QLed._renderer.render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
 
     def mousePressEvent(self, event):
         """Handle mouse press event."""
@@ -1,10 +1,10 @@
 from .QLed import QLed
 from .led import PyDMLed, SiriusLedAlert, SiriusLedState, \
     PyDMLedMultiChannel, PyDMLedMultiConnection
+from .led_matrix import SiriusLedMatrix
 from .log_label import PyDMLogLabel
 from .QDoubleScrollBar import QDoubleScrollBar
 from .scrollbar import PyDMScrollBar
-from .matplotlib import MatplotlibWidget
 from .state_button import PyDMStateButton
 from .windows import SiriusMainWindow, SiriusDialog
 from .ledit_scrollbar import PyDMLinEditScrollbar
@@ -22,3 +22,8 @@ from .enum_combo_box import SiriusEnumComboBox
 from .frame import SiriusFrame
 from .process_image import SiriusProcessImage
 from .detachable_tabwidget import DetachableTabWidget
+from .subscription_manager import SubscriptionManager
+
+# matplotlib is only imported by applications that use MatplotlibWidget
+from ..startup import lazy_attributes as _lazy_attributes
+_lazy_attributes(__name__, {'MatplotlibWidget': '.matplotlib'})
@@ -1,13 +1,14 @@
 """This module defines a widget that represent a PV as bar graph."""
 import logging
 
-import epics
 import numpy as np
 import pyqtgraph as pg
 
 from pydm.widgets.channel import PyDMChannel
 from qtpy.QtCore import QTimer, QSize
 
+from ..common.epics import get_pv as _get_pv, release_pv as _release_pv
+
 logging.basicConfig(level=logging.DEBUG)
 
 
@@ -66,6 +67,7 @@ class EpicsBarGraphModel:
         update_interval - interval to read PV and update view
         """
         self._pvname = None
+        self.pv = None
 
         self._size = 0
         self.x = range(self.size)
@@ -89,6 +91,10 @@ class EpicsBarGraphModel:
 
         self.x = range(self._size)
 
+    def release(self):
+        """Release PV back to the pool."""
+        self.pvname = None
+
     @property
     def waveform(self):
         """Retrun the value read from PV."""
@@ -110,8 +116,10 @@ class EpicsBarGraphModel:
         return self.pv.status
 
     def _connect(self):
+        if self.pv is not None:
+            _release_pv(self.pv)
         if self.pvname is not None:
-            self.pv = epics.PV(self.pvname)
+            self.pv = _get_pv(self.pvname)
             self.pv.wait_for_connection(timeout=self.TIMEOUT)
             if self.pv is None:
                 logging.warning("Failed to connect to PV.")
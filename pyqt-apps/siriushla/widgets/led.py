@@ -6,7 +6,7 @@ from copy import deepcopy as _dcopy
 import logging as _log
 import numpy as _np
 from qtpy.QtGui import QColor
-from qtpy.QtCore import Property, Slot, Signal
+from qtpy.QtCore import Property, Slot, Signal, QTimer
 from pydm.widgets.base import PyDMWidget
 from pydm.widgets.channel import PyDMChannel
 from pydm.widgets import PyDMWaveformPlot
@@ -139,6 +139,10 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
             - 'comp' (a string that select the type of comparision, can be
                       'eq', 'ne', 'gt', 'lt', 'ge', 'le');
             - and 'bit' (select a bit of the pv to compare to 'value').
+
+    The number of channels not in the desired state and of disconnected
+    channels are kept as running counters, updated in O(1) on each channel
+    event, and the led state is recomputed at most once per event loop pass.
     """
 
     warning = Signal(list)
@@ -168,7 +172,15 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
         self._address2conn = dict()
         self._address2status = dict()
         self._address2currvals = dict()
-        self.set_channels2values(_dcopy(channels2values))
+        self._nr_bad = 0
+        self._nr_disconn = 0
+        self._nr_failing = 0
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._update_statuses)
+
+        self.set_channels2values(channels2values)
 
     @property
     def channels2values(self):
@@ -180,50 +192,56 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
         """Return channels2status dict."""
         return _dcopy(self._address2status)
 
-    def set_channels2values(self, new_channels2values):
-        """Set channels2values."""
-        self._address2values = _dcopy(new_channels2values)
+    @property
+    def nr_failing_channels(self):
+        """Number of channels disconnected or not in the desired state."""
+        return self._nr_failing
 
-        if not new_channels2values:
-            self.setEnabled(False)
-        else:
-            self.setEnabled(True)
+    def set_channels2values(self, new_channels2values):
+        """Set channels2values.
 
-        # Check which channel can be removed
-        address2pop = list()
-        for address in self._address2channel.keys():
-            if address not in new_channels2values.keys():
-                address2pop.append(address)
+        Channels already set are kept with their connection state and
+        current value, so only added and removed channels are connected
+        and disconnected, and only channels whose desired value changed
+        are compared again.
+        """
+        old_values = self._address2values
+        self._address2values = dict(new_channels2values)
+        self.setEnabled(bool(new_channels2values))
 
         # Remove channels
-        for address in address2pop:
-            self._address2channel[address].disconnect()
-            self._address2channel.pop(address)
+        for address in set(self._address2channel) - set(new_channels2values):
+            self._count(address, -1)
+            self._address2channel.pop(address).disconnect()
             self._address2status.pop(address)
             self._address2conn.pop(address)
             self._address2currvals.pop(address)
 
         # Add new channels
-        for address, value in new_channels2values.items():
-            if address not in self._address2channel.keys():
-                self._address2conn[address] = False
-                self._address2status[address] = 'UNDEF'
-                self._address2currvals[address] = 'UNDEF'
-                channel = PyDMChannel(
-                    address=address,
-                    connection_slot=self.connection_changed,
-                    value_slot=self.value_changed)
-                channel.connect()
-                self._address2channel[address] = channel
-            self._address2values[address] = value
+        for address in new_channels2values:
+            if address in self._address2channel:
+                continue
+            self._address2conn[address] = False
+            self._address2status[address] = 'UNDEF'
+            self._address2currvals[address] = 'UNDEF'
+            self._count(address, 1)
+            channel = PyDMChannel(
+                address=address,
+                connection_slot=self.connection_changed,
+                value_slot=self.value_changed)
+            channel.connect()
+            self._address2channel[address] = channel
 
         self._channels = list(self._address2channel.values())
 
-        # redo comparisions
+        # redo comparisions of new channels and changed desired values
         for ad, des in self._address2values.items():
-            self._address2status[ad] = self._check_status(
-                ad, des, self._address2currvals[ad])
+            if ad in old_values and self._is_same(old_values[ad], des):
+                continue
+            self._set_status(
+                ad, self._check_status(ad, des, self._address2currvals[ad]))
 
+        self._update_connection()
         self._update_statuses()
 
     def value_changed(self, new_val):
@@ -235,12 +253,49 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
         self._address2currvals[address] = new_val
 
         is_desired = self._check_status(address, desired, new_val)
-        self._address2status[address] = is_desired
+        self._set_status(address, is_desired)
         if not is_desired:
             self.warning.emit([address, new_val])
         else:
             self.normal.emit([address, new_val])
-        self._update_statuses()
+        self._update_timer.start()
+
+    @staticmethod
+    def _is_same(desired1, desired2):
+        if desired1 is desired2:
+            return True
+        try:
+            return bool(desired1 == desired2)
+        except ValueError:  # comparision of numpy arrays
+            return False
+
+    @staticmethod
+    def _is_bad(status):
+        return status == 'UNDEF' or not status
+
+    def _count(self, address, sign):
+        """Add (sign=1) or remove (sign=-1) address from counters."""
+        bad = self._is_bad(self._address2status[address])
+        disconn = not self._address2conn[address]
+        self._nr_bad += sign*bad
+        self._nr_disconn += sign*disconn
+        self._nr_failing += sign*(bad or disconn)
+
+    def _set_status(self, address, status):
+        self._count(address, -1)
+        self._address2status[address] = status
+        self._count(address, 1)
+
+    def _set_conn(self, address, conn):
+        self._count(address, -1)
+        self._address2conn[address] = conn
+        self._count(address, 1)
+
+    def _update_connection(self):
+        allconn = bool(self._address2conn) and not self._nr_disconn
+        if allconn != self._connected:
+            PyDMWidget.connection_changed(self, allconn)
+            self._connected = allconn
 
     def _check_status(self, address, desired, current):
         if current is None:
@@ -280,14 +335,12 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
         return is_desired
 
     def _update_statuses(self):
-        state = 1
         if not self._connected:
             state = 2
+        elif self._nr_bad:
+            state = 0
         else:
-            for status in self._address2status.values():
-                if status == 'UNDEF' or not status:
-                    state = 0
-                    break
+            state = 1
         self.setState(state)
 
     @Slot(bool)
@@ -296,13 +349,9 @@ class PyDMLedMultiChannel(QLed, PyDMWidget):
         if not self.sender():   # do nothing when sender is None
             return
         address = self.sender().address
-        self._address2conn[address] = conn
-        allconn = True
-        for conn in self._address2conn.values():
-            allconn &= conn
-        PyDMWidget.connection_changed(self, allconn)
-        self._connected = allconn
-        self._update_statuses()
+        self._set_conn(address, conn)
+        self._update_connection()
+        self._update_timer.start()
 
     @staticmethod
     def _eq(val1, val2, **kws):
@@ -430,6 +479,12 @@ class PyDMLedMultiConnection(QLed, PyDMWidget):
 
         self._address2conn = dict()
         self._address2channel = dict()
+        self._nr_disconn = 0
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._update_state)
+
         self.set_channels(channels)
 
     @property
@@ -437,29 +492,31 @@ class PyDMLedMultiConnection(QLed, PyDMWidget):
         """Return dict with connection state of each channel."""
         return _dcopy(self._address2conn)
 
+    @property
+    def nr_failing_channels(self):
+        """Number of disconnected channels."""
+        return self._nr_disconn
+
     def set_channels(self, new_channels):
-        if not new_channels:
-            self.setEnabled(False)
-        else:
-            self.setEnabled(True)
+        """Set channels.
 
-        # Check which channel can be removed
-        address2pop = list()
-        for address in self._address2channel.keys():
-            if address not in new_channels:
-                address2pop.append(address)
-            else:
-                new_channels.remove(address)
+        Channels already set are kept with their connection state, so
+        only added and removed channels are connected and disconnected.
+        """
+        new_channels = dict.fromkeys(new_channels)
+        self.setEnabled(bool(new_channels))
 
         # Remove channels
-        for address in address2pop:
-            self._address2channel[address].disconnect()
-            self._address2channel.pop(address)
-            self._address2conn.pop(address)
+        for address in set(self._address2channel) - set(new_channels):
+            self._address2channel.pop(address).disconnect()
+            self._nr_disconn -= not self._address2conn.pop(address)
 
         # Add new channels
         for address in new_channels:
+            if address in self._address2channel:
+                continue
             self._address2conn[address] = False
+            self._nr_disconn += 1
             channel = PyDMChannel(
                 address=address, connection_slot=self.connection_changed)
             channel.connect()
@@ -479,13 +536,12 @@ class PyDMLedMultiConnection(QLed, PyDMWidget):
             self.warning.emit([address, conn])
         else:
             self.normal.emit([address, conn])
-        self._address2conn[address] = conn
-        self._update_state()
+        self._nr_disconn += self._address2conn[address] - bool(conn)
+        self._address2conn[address] = bool(conn)
+        self._update_timer.start()
 
     def _update_state(self):
-        allconn = True
-        for conn in self._address2conn.values():
-            allconn &= conn
+        allconn = not self._nr_disconn
         self.setState(allconn)
         self._connected = allconn
 
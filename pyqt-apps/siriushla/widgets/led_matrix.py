@@ -0,0 +1,399 @@
+"""Matrix of leds painted by a single widget."""
+
+import logging as _log
+from functools import partial as _part
+
+import numpy as _np
+from qtpy.QtCore import Qt, Signal, QEvent, QRect, QSize
+from qtpy.QtGui import QPainter, QFont, QFontMetrics
+from qtpy.QtWidgets import QWidget, QToolTip, QSizePolicy
+from pydm.widgets.channel import PyDMChannel
+
+from .QLed import QLed
+from .led import PyDMLed
+
+
+def _disconnect_channels(channels, *args):
+    for chan in channels:
+        chan.disconnect()
+
+
+class SiriusLedMatrix(QWidget):
+    """Matrix of leds and labels painted in a single paintEvent.
+
+    Used in monitors with hundreds of leds, instead of grid layouts of
+    SiriusLedAlert or PyDMLedMultiChannel widgets with one channel each.
+
+    Leds are added with add_led, at a row and column of the matrix, with
+    the address of a channel and its desired value. A led is green when the
+    channel value is the desired value, red (or its fault color) when it is
+    not and gray while the channel is disconnected. Labels are added with
+    add_label.
+
+    The states of the leds are kept in a numpy array, in the order the leds
+    were added. Leds under the mouse are found by a binary search of the
+    column and row edges, to show their tool tips and to emit cellClicked,
+    cellDoubleClicked and cellRightClicked with their names.
+
+    Rows and columns are as tall and wide as their contents, like in a
+    QGridLayout, and the extra width is distributed equally among columns.
+    """
+
+    OK, FAULT, DISCONNECTED = 0, 1, 2
+
+    OkColor = PyDMLed.LightGreen
+    FaultColor = PyDMLed.Red
+    DsblColor = QLed.Gray
+
+    cellClicked = Signal(str)
+    cellDoubleClicked = Signal(str)
+    cellRightClicked = Signal(str)
+
+    def __init__(self, parent=None, led_size=1.1, spacing=6):
+        """Init.
+
+        led_size is the size of the leds in em, spacing is the space
+        between rows and columns in pixels.
+        """
+        super().__init__(parent)
+        self._led_size = led_size
+        self._spacing = spacing
+        self._shape = QLed.Circle
+
+        # leds
+        self._names = list()
+        self._tooltips = list()
+        self._positions = list()
+        self._desired = list()
+        self._states = _np.zeros(0, dtype=_np.int8)
+        self._color_idcs = _np.zeros(0, dtype=_np.int8)
+        self._ok = _np.zeros(0, dtype=bool)
+        self._conn = _np.zeros(0, dtype=bool)
+        self._colors = [self.OkColor, self.FaultColor, self.DsblColor]
+        self._cells = dict()
+        self._address2leds = dict()
+        self._channels = list()
+        self.destroyed.connect(_part(_disconnect_channels, self._channels))
+
+        # labels, as (row, col, rowspan, colspan, text, alignment, bold)
+        self._labels = list()
+
+        # geometry, computed when needed
+        self._dirty = True
+        self._hint = QSize()
+        self._led_px = 0
+        self._col_x = self._col_w = _np.zeros(0, dtype=int)
+        self._row_y = self._row_h = _np.zeros(0, dtype=int)
+        self._led_x = self._led_y = _np.zeros(0, dtype=int)
+        self._label_rects = list()
+
+        self._pressed = -1
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+    @property
+    def names(self):
+        """Names of the leds."""
+        return list(self._names)
+
+    @property
+    def states(self):
+        """Array of led states: OK, FAULT or DISCONNECTED."""
+        return self._states[:len(self._names)].copy()
+
+    def channels(self):
+        """Return channels of the leds."""
+        return list(self._channels)
+
+    def add_led(self, row, col, address, name='', desired=0,
+                fault_color=None, tooltip=''):
+        """Add led at row and col monitoring the channel address.
+
+        If address is empty, the led state is only set by set_value and
+        set_connected. Return the index of the led.
+        """
+        idx = len(self._names)
+        if idx == self._states.size:
+            size = max(64, 2*idx)
+            self._states = _np.resize(self._states, size)
+            self._color_idcs = _np.resize(self._color_idcs, size)
+            self._ok = _np.resize(self._ok, size)
+            self._conn = _np.resize(self._conn, size)
+        name = name or address
+        self._names.append(name)
+        self._tooltips.append(tooltip or name)
+        self._positions.append((row, col))
+        self._desired.append(desired)
+        self._states[idx] = self.DISCONNECTED
+        self._ok[idx] = False
+        self._conn[idx] = False
+        if fault_color is None:
+            self._color_idcs[idx] = self.FAULT
+        else:
+            if fault_color not in self._colors:
+                self._colors.append(fault_color)
+            self._color_idcs[idx] = self._colors.index(fault_color)
+        self._cells[(row, col)] = idx
+        self._set_dirty()
+
+        if address:
+            leds = self._address2leds.setdefault(address, list())
+            leds.append(idx)
+            if len(leds) == 1:
+                channel = PyDMChannel(
+                    address=address,
+                    connection_slot=self.connection_changed,
+                    value_slot=self.value_changed)
+                self._channels.append(channel)
+                channel.connect()
+        return idx
+
+    def add_label(self, row, col, text, rowspan=1, colspan=1,
+                  alignment=Qt.AlignLeft | Qt.AlignVCenter, bold=False):
+        """Add label at row and col, spanning rowspan and colspan cells."""
+        self._labels.append(
+            (row, col, rowspan, colspan, text, alignment, bold))
+        self._set_dirty()
+
+    def set_value(self, idx, value):
+        """Set value of channel of led idx."""
+        if isinstance(value, _np.ndarray):
+            _log.warning('SiriusLedMatrix received a numpy array to ' +
+                         self._names[idx]+' ('+str(value)+')!')
+            return
+        self._ok[idx] = value == self._desired[idx]
+        self._update_state(idx)
+
+    def set_connected(self, idx, conn):
+        """Set connection state of channel of led idx."""
+        self._conn[idx] = conn
+        self._update_state(idx)
+
+    def value_changed(self, new_val):
+        """Receive new value of a channel."""
+        if not self.sender():   # do nothing when sender is None
+            return
+        for idx in self._address2leds.get(self.sender().address, ()):
+            self.set_value(idx, new_val)
+
+    def connection_changed(self, conn):
+        """Receive new connection state of a channel."""
+        if not self.sender():   # do nothing when sender is None
+            return
+        for idx in self._address2leds.get(self.sender().address, ()):
+            self.set_connected(idx, conn)
+
+    def led_at(self, pos):
+        """Return index of the led at pos, or -1."""
+        self._update_geometry()
+        col = _np.searchsorted(self._col_x, pos.x(), side='right') - 1
+        row = _np.searchsorted(self._row_y, pos.y(), side='right') - 1
+        if col < 0 or row < 0 or \
+                pos.x() >= self._col_x[col] + self._col_w[col] or \
+                pos.y() >= self._row_y[row] + self._row_h[row]:
+            return -1
+        return self._cells.get((int(row), int(col)), -1)
+
+    def sizeHint(self):
+        """Return size needed by the rows and columns."""
+        self._update_geometry()
+        return self._hint
+
+    def minimumSizeHint(self):
+        """Return size needed by the rows and columns."""
+        return self.sizeHint()
+
+    # --- events ---
+
+    def paintEvent(self, event):
+        """Paint labels and the leds in the exposed rectangle."""
+        self._update_geometry()
+        rect = event.rect()
+        painter = QPainter(self)
+        font = painter.font()
+        for lrect, text, alignment, bold in self._label_rects:
+            if not lrect.intersects(rect):
+                continue
+            font.setBold(bold)
+            painter.setFont(font)
+            painter.drawText(lrect, alignment, text)
+
+        nleds = len(self._names)
+        if not nleds:
+            return
+        size = self._led_px
+        ledx, ledy = self._led_x, self._led_y
+        exposed = (ledx <= rect.right()) & (ledx + size > rect.left()) & \
+            (ledy <= rect.bottom()) & (ledy + size > rect.top())
+        states = self._states[:nleds]
+        color_idcs = _np.where(
+            states == self.OK, self.OK, _np.where(
+                states == self.FAULT, self._color_idcs[:nleds],
+                self.DISCONNECTED))[exposed]
+        ledx, ledy = ledx[exposed], ledy[exposed]
+        dpr = self.devicePixelRatioF()
+        for cidx in _np.unique(color_idcs):
+            pixmap = QLed.get_pixmap(
+                self._shape, self._colors[cidx], False,
+                cidx != self.DISCONNECTED, size, size, dpr)
+            sel = color_idcs == cidx
+            for x, y in zip(ledx[sel].tolist(), ledy[sel].tolist()):
+                painter.drawPixmap(x, y, pixmap)
+
+    def event(self, event):
+        """Show tool tip of the led under the mouse."""
+        if event.type() == QEvent.ToolTip:
+            idx = self.led_at(event.pos())
+            if idx < 0:
+                QToolTip.hideText()
+                event.ignore()
+                return True
+            text = self._tooltips[idx]
+            if not self._conn[idx]:
+                text += '\nPV is disconnected.'
+            QToolTip.showText(
+                event.globalPos(), text, self, self._led_rect(idx))
+            return True
+        return super().event(event)
+
+    def changeEvent(self, event):
+        """Recompute geometry when the font changes."""
+        if event.type() == QEvent.FontChange:
+            self._set_dirty()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        """Distribute extra width among the columns."""
+        self._dirty = True
+        super().resizeEvent(event)
+
+    def mousePressEvent(self, event):
+        """Emit cellRightClicked or store the pressed led."""
+        idx = self.led_at(event.pos())
+        if idx >= 0 and event.button() == Qt.RightButton:
+            self.cellRightClicked.emit(self._names[idx])
+        elif event.button() == Qt.LeftButton:
+            self._pressed = idx
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Emit cellClicked if the pressed led is released."""
+        idx = self.led_at(event.pos())
+        if event.button() == Qt.LeftButton and idx >= 0 and \
+                idx == self._pressed:
+            self.cellClicked.emit(self._names[idx])
+        self._pressed = -1
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        """Emit cellDoubleClicked."""
+        idx = self.led_at(event.pos())
+        if idx >= 0 and event.button() == Qt.LeftButton:
+            self.cellDoubleClicked.emit(self._names[idx])
+        super().mouseDoubleClickEvent(event)
+
+    # --- private methods ---
+
+    def _update_state(self, idx):
+        if not self._conn[idx]:
+            state = self.DISCONNECTED
+        else:
+            state = self.OK if self._ok[idx] else self.FAULT
+        if state == self._states[idx]:
+            return
+        self._states[idx] = state
+        if self._dirty:
+            self.update()
+        else:
+            self.update(self._led_rect(idx))
+
+    def _led_rect(self, idx):
+        return QRect(int(self._led_x[idx]), int(self._led_y[idx]),
+                     self._led_px, self._led_px)
+
+    def _set_dirty(self):
+        self._dirty = True
+        self.updateGeometry()
+        self.update()
+
+    def _update_geometry(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        fmt = self.fontMetrics()
+        bold = QFont(self.font())
+        bold.setBold(True)
+        fmt_bold = QFontMetrics(bold)
+        self._led_px = size = round(self._led_size * fmt.height())
+
+        nrows = ncols = 0
+        for row, col in self._positions:
+            nrows, ncols = max(nrows, row+1), max(ncols, col+1)
+        for row, col, rspan, cspan, *_ in self._labels:
+            nrows, ncols = max(nrows, row+rspan), max(ncols, col+cspan)
+        col_w = _np.zeros(ncols, dtype=int)
+        row_h = _np.zeros(nrows, dtype=int)
+        for row, col in self._positions:
+            col_w[col] = max(col_w[col], size)
+            row_h[row] = max(row_h[row], size)
+
+        lsizes = list()
+        for row, col, rspan, cspan, text, alignment, isbold in self._labels:
+            lsize = (fmt_bold if isbold else fmt).boundingRect(
+                QRect(), int(alignment), text).size()
+            lsizes.append(lsize)
+            if cspan == 1:
+                col_w[col] = max(col_w[col], lsize.width())
+            if rspan == 1:
+                row_h[row] = max(row_h[row], lsize.height())
+        # spanning labels enlarge the cells they span, if needed
+        for (row, col, rspan, cspan, *_), lsize in zip(self._labels, lsizes):
+            if cspan > 1:
+                self._enlarge(col_w, col, cspan, lsize.width())
+            if rspan > 1:
+                self._enlarge(row_h, row, rspan, lsize.height())
+
+        width = self._span(col_w, 0, ncols)
+        height = self._span(row_h, 0, nrows)
+        self._hint = QSize(width, height)
+
+        # distribute extra width among non empty columns
+        used = col_w > 0
+        extra = max(self.width() - width, 0) if self.width() else 0
+        if used.any():
+            col_w[used] += extra // int(used.sum())
+        self._col_x, self._col_w = self._edges(col_w), col_w
+        self._row_y, self._row_h = self._edges(row_h), row_h
+
+        if self._positions:
+            rows, cols = _np.array(self._positions).T
+            self._led_x = self._col_x[cols] + (self._col_w[cols] - size)//2
+            self._led_y = self._row_y[rows] + (self._row_h[rows] - size)//2
+        self._label_rects = list()
+        for row, col, rspan, cspan, text, alignment, isbold in self._labels:
+            lrect = QRect(
+                int(self._col_x[col]), int(self._row_y[row]),
+                self._span(col_w, col, cspan), self._span(row_h, row, rspan))
+            self._label_rects.append((lrect, text, alignment, isbold))
+
+    def _span(self, sizes, start, count):
+        """Return size of count cells from start, with spacing."""
+        sizes = sizes[start:start+count]
+        used = int(_np.count_nonzero(sizes))
+        return int(sizes.sum()) + self._spacing*max(used-1, 0)
+
+    def _enlarge(self, sizes, start, count, size):
+        """Enlarge non empty cells from start to span at least size."""
+        need = size - self._span(sizes, start, count)
+        if need <= 0:
+            return
+        cells = sizes[start:start+count]
+        used = cells > 0
+        if not used.any():
+            used[:] = True
+            need -= self._spacing*(count-1)
+        cells[used] += -(-need // int(used.sum()))
+
+    def _edges(self, sizes):
+        """Return start of cells, with spacing between non empty ones."""
+        steps = sizes + self._spacing*(sizes > 0)
+        return _np.concatenate(([0], _np.cumsum(steps)[:-1])).astype(int)
@@ -1,14 +1,178 @@
 import datetime as _datetime
-from qtpy.QtWidgets import QListWidget, QListWidgetItem
-from qtpy.QtCore import Property, Q_ENUMS
+import logging as _log
+from qtpy.QtWidgets import QListView
+from qtpy.QtCore import Qt, Property, Q_ENUMS, Signal, QTimer, \
+    QModelIndex, QAbstractListModel
 from qtpy.QtGui import QColor
 from pydm.widgets.base import PyDMWidget, TextFormatter
 from pydm.widgets.display_format import DisplayFormat, parse_value_for_display
 
 
-class PyDMLogLabel(QListWidget, TextFormatter, PyDMWidget, DisplayFormat):
+class LogListModel(QAbstractListModel):
+    """List model of log messages kept in a bounded ring buffer.
+
+    Rows are ordered from the oldest to the newest message and, once the
+    buffer is full, new messages drop the oldest ones. Dropped messages
+    are appended to the spill file, if one is set.
+
+    Added messages are inserted in batches, once per event loop pass, and
+    the aboutToFlush signal is emitted before each batch.
     """
-    A QListWidget with support for Channels and more from PyDM.
+
+    aboutToFlush = Signal()
+
+    def __init__(self, capacity=1000, parent=None):
+        """Init."""
+        super().__init__(parent)
+        self._capacity = max(int(capacity), 1)
+        self._slots = [None]*self._capacity
+        self._start = 0
+        self._count = 0
+        self._pending = list()
+        self._spill_file = ''
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def capacity(self):
+        """Maximum number of messages."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        value = max(int(value), 1)
+        if value == self._capacity:
+            return
+        self.flush()
+        messages = self._messages()
+        nr_drop = max(len(messages) - value, 0)
+        if nr_drop:
+            self.beginRemoveRows(QModelIndex(), 0, nr_drop - 1)
+            self._spill(messages[:nr_drop])
+            messages = messages[nr_drop:]
+        self._capacity = value
+        self._slots = messages + [None]*(value - len(messages))
+        self._start = 0
+        self._count = len(messages)
+        if nr_drop:
+            self.endRemoveRows()
+
+    @property
+    def spill_file(self):
+        """Path of the file where dropped messages are appended."""
+        return self._spill_file
+
+    @spill_file.setter
+    def spill_file(self, value):
+        self._spill_file = str(value)
+
+    # --- QAbstractListModel interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return number of messages."""
+        if parent.isValid():
+            return 0
+        return self._count
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return message text and color."""
+        if not index.isValid() or index.row() >= self._count:
+            return None
+        text, color = self._slots[
+            (self._start + index.row()) % self._capacity]
+        if role == Qt.DisplayRole:
+            return text
+        elif role == Qt.ForegroundRole:
+            return color
+        return None
+
+    # --- messages handling ---
+
+    def add(self, text, color=None):
+        """Add message with text and color.
+
+        The message is inserted in the next event loop pass.
+        """
+        self._pending.append((text, color))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def clear(self):
+        """Remove all messages, pending or not."""
+        self._flush_timer.stop()
+        self.beginResetModel()
+        self._slots = [None]*self._capacity
+        self._start = 0
+        self._count = 0
+        self._pending = list()
+        self.endResetModel()
+
+    def flush(self):
+        """Insert pending messages."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        self.aboutToFlush.emit()
+        cap = self._capacity
+        pending = self._pending
+        self._pending = list()
+        if len(pending) > cap:
+            self._spill(self._messages())
+            self._spill(pending[:-cap])
+            pending = pending[-cap:]
+            self.beginResetModel()
+            self._slots = pending + [None]*(cap - len(pending))
+            self._start = 0
+            self._count = len(pending)
+            self.endResetModel()
+            return
+
+        # drop oldest messages to make room for the new ones
+        nr_drop = self._count + len(pending) - cap
+        if nr_drop > 0:
+            self.beginRemoveRows(QModelIndex(), 0, nr_drop - 1)
+            self._spill([
+                self._slots[(self._start + i) % cap]
+                for i in range(nr_drop)])
+            self._start = (self._start + nr_drop) % cap
+            self._count -= nr_drop
+            self.endRemoveRows()
+
+        self.beginInsertRows(
+            QModelIndex(), self._count, self._count + len(pending) - 1)
+        for i, msg in enumerate(pending):
+            self._slots[(self._start + self._count + i) % cap] = msg
+        self._count += len(pending)
+        self.endInsertRows()
+
+    # --- ring buffer helpers ---
+
+    def _messages(self):
+        cap = self._capacity
+        return [
+            self._slots[(self._start + i) % cap] for i in range(self._count)]
+
+    def _spill(self, messages):
+        if not self._spill_file or not messages:
+            return
+        try:
+            with open(self._spill_file, 'a') as fil:
+                fil.writelines(text + '\n' for text, _ in messages)
+        except OSError as err:
+            _log.warning('Could not spill log messages to {}: {}'.format(
+                self._spill_file, err))
+
+
+class PyDMLogLabel(QListView, TextFormatter, PyDMWidget, DisplayFormat):
+    """
+    A QListView of log messages with support for Channels and more from PyDM.
+
+    Messages are kept in a LogListModel, which drops the oldest messages
+    when the buffer is full and inserts new ones once per event loop pass.
+    The view scrolls to the newest message after each batch only if it
+    was already showing the last message.
 
     Parameters
     ----------
@@ -25,19 +189,34 @@ class PyDMLogLabel(QListWidget, TextFormatter, PyDMWidget, DisplayFormat):
     warncolor = QColor(200, 200, 0)
 
     def __init__(self, parent=None, init_channel=None):
-        QListWidget.__init__(self, parent)
+        QListView.__init__(self, parent)
         PyDMWidget.__init__(self, init_channel=init_channel)
         self._buffer_size = 1000
         self._prepend_date_time = True
         self._display_format_type = DisplayFormat.String
         self._string_encoding = "utf_8"
         self._date_time_fmt = '%Y/%m/%d-%H:%M:%S'
+        self._at_bottom = True
+        self.setUniformItemSizes(True)
+        self._model = LogListModel(self._buffer_size, self)
+        self._model.aboutToFlush.connect(self._check_at_bottom)
+        self._model.rowsInserted.connect(self._scroll_to_bottom)
+        self._model.modelReset.connect(self._scroll_to_bottom)
+        self.setModel(self._model)
+
+    def count(self):
+        """Return number of messages shown."""
+        return self._model.rowCount()
+
+    def clear(self):
+        """Remove all messages."""
+        self._model.clear()
 
     def value_changed(self, new_value):
         """
         Callback invoked when the Channel value is changed.
 
-        Sets the value of new_value accordingly at the Label.
+        Adds new_value to the messages shown in the next event loop pass.
 
         Parameters
         ----------
@@ -53,40 +232,43 @@ class PyDMLogLabel(QListWidget, TextFormatter, PyDMWidget, DisplayFormat):
             string_encoding=self._string_encoding,
             widget=self)
 
-        if self.count() > self._buffer_size:
-            self.clear()
-
         prefix = ''
         if self._prepend_date_time:
             prefix += _datetime.datetime.now().strftime(self._date_time_fmt)
             prefix += ' '
         # If the value is a string, just display it as-is, no formatting
         # needed.
-        item = None
+        color = None
         if isinstance(new_value, str):
-            item = QListWidgetItem(prefix + new_value)
+            text = prefix + new_value
             if new_value.lower().startswith(('err', 'fatal')):
-                item.setForeground(self.errorcolor)
+                color = self.errorcolor
             elif new_value.lower().startswith('warn'):
-                item.setForeground(self.warncolor)
+                color = self.warncolor
         # If the value is an enum, display the appropriate enum string for
         # the value.
         elif self.enum_strings is not None and isinstance(new_value, int):
             try:
-                item = QListWidgetItem(prefix + self.enum_strings[new_value])
+                text = prefix + self.enum_strings[new_value]
             except IndexError:
-                item = QListWidgetItem("**INVALID**")
+                text = "**INVALID**"
         # If the value is a number (float or int), display it using a
         # format string if necessary.
         elif isinstance(new_value, (int, float)):
-            item = QListWidgetItem(prefix+self.format_string.format(new_value))
+            text = prefix + self.format_string.format(new_value)
         # If you made it this far, just turn whatever the heck the value
         # is into a string and display it.
         else:
-            item = QListWidgetItem(prefix + str(new_value))
+            text = prefix + str(new_value)
 
-        if item is not None:
-            self.addItem(item)
+        self._model.add(text, color)
+
+    def _check_at_bottom(self):
+        sbar = self.verticalScrollBar()
+        self._at_bottom = sbar.value() >= sbar.maximum()
+
+    def _scroll_to_bottom(self):
+        if self._at_bottom:
             self.scrollToBottom()
 
     @Property(DisplayFormat)
@@ -122,7 +304,7 @@ class PyDMLogLabel(QListWidget, TextFormatter, PyDMWidget, DisplayFormat):
         """
         The maximum number of entries to show.
 
-        When maximum is exceeded the widget is cleared.
+        When maximum is exceeded the oldest entries are dropped.
 
         Returns
         -------
@@ -135,13 +317,40 @@ class PyDMLogLabel(QListWidget, TextFormatter, PyDMWidget, DisplayFormat):
         """
         The maximum number of entries to show.
 
-        When maximum is exceeded the widget is cleared.
+        When maximum is exceeded the oldest entries are dropped.
 
         Parameters
         ----------
         value : int
         """
-        self._buffer_size = int(value)
+        self._buffer_size = max(int(value), 1)
+        self._model.capacity = self._buffer_size
+
+    @Property(str)
+    def spillFile(self):
+        """
+        Path of the file where dropped entries are appended.
+
+        If empty, dropped entries are discarded.
+
+        Returns
+        -------
+        str
+        """
+        return self._model.spill_file
+
+    @spillFile.setter
+    def spillFile(self, value):
+        """
+        Path of the file where dropped entries are appended.
+
+        If empty, dropped entries are discarded.
+
+        Parameters
+        ----------
+        value : str
+        """
+        self._model.spill_file = value
 
     @Property(bool)
     def prependDateTime(self):
@@ -40,4 +40,4 @@ class MatplotlibWidget(FigureCanvas):
             if labels:
                 axes[0].legend(handles, labels, fontsize=fontsize)
 
-            self.figure.canvas.draw()
+            self.figure.canvas.draw_idle()
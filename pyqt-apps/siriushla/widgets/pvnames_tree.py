@@ -1,148 +1,351 @@
 """PVName selection tree view."""
 import re
-import uuid
 from copy import deepcopy as _dcopy
-from qtpy.QtCore import Qt, QSize, Signal, QThread, Slot
-from qtpy.QtWidgets import QTreeWidget, QTreeWidgetItem, QProgressDialog, \
-    QAction, QMenu, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, \
-    QHeaderView
+from qtpy.QtCore import Qt, QSize, Signal, Slot, QAbstractItemModel, \
+    QModelIndex
+from qtpy.QtWidgets import QTreeView, QAction, QMenu, QLabel, QWidget, \
+    QVBoxLayout, QHBoxLayout, QLineEdit, QHeaderView
 
 from siriuspy.namesys import SiriusPVName
 
 
-class QTreeItem(QTreeWidgetItem):
-    """Tree Item."""
+class TreeNode:
+    """Tree node.
 
-    def __init__(self, string_list, parent=None):
-        """Init."""
-        super().__init__(parent, string_list)
-        self._shown = set()
-        self._status = {
-            Qt.Checked: set(), Qt.Unchecked: set(), Qt.PartiallyChecked: set()}
-        self._myhash = uuid.uuid4()
+    Nodes are plain python objects: Qt only sees them through the model
+    indexes created on demand for the rows the view actually shows.
+    """
 
-    @property
-    def myhash(self):
-        return self._myhash
+    __slots__ = ('model', 'key', 'row', 'parent', 'children', 'shown',
+                 'index_row', 'visible', 'checked', 'nr_leafs',
+                 'nr_checked')
+
+    def __init__(self, model, key, row, parent=None):
+        """Init."""
+        self.model = model
+        self.key = key
+        self.row = row
+        self.parent = parent
+        self.children = list()
+        self.shown = list()
+        self.index_row = 0
+        self.visible = True
+        self.checked = False
+        self.nr_leafs = 0
+        self.nr_checked = 0
+        if parent is not None:
+            parent.children.append(self)
 
     def isLeaf(self):
         """Return if is Leaf."""
-        if self.childCount() > 0:
+        return not self.children
+
+    def isHidden(self):
+        """Return whether node is hidden by filter."""
+        return not self.visible
+
+    def data(self, column=0, role=Qt.DisplayRole):
+        """Return node data."""
+        if role == Qt.CheckStateRole:
+            return self.checkState(column)
+        if role == Qt.DisplayRole and column < len(self.row):
+            return self.row[column]
+        return None
+
+    def checkState(self, column=0):
+        """Return check state."""
+        if not self.children:
+            return Qt.Checked if self.checked else Qt.Unchecked
+        if not self.nr_checked:
+            return Qt.Unchecked
+        elif self.nr_checked == self.nr_leafs:
+            return Qt.Checked
+        return Qt.PartiallyChecked
+
+    def setCheckState(self, column, state):
+        """Set check state of node and its visible descendants."""
+        self.model.set_check_state([self, ], state)
+
+    def visible_leafs(self):
+        """Return visible leafs below this node."""
+        if not self.children:
+            return [self, ] if self.visible else []
+        leafs, stack = list(), [self, ]
+        while stack:
+            node = stack.pop()
+            for child in reversed(node.shown):
+                if child.children:
+                    stack.append(child)
+                else:
+                    leafs.append(child)
+        return leafs
+
+
+class PVNameTreeModel(QAbstractItemModel):
+    """Model of a tree of PV names with check states and filtering."""
+
+    itemsChecked = Signal(list)
+
+    def __init__(self, parent=None):
+        """Init."""
+        super().__init__(parent)
+        self._headers = ['Name', 'Value', 'Delay']
+        self._root = TreeNode(self, '', [])
+        self._leafs = list()
+        self._names = list()
+        self._filter_text = ''
+        self._matched = None
+
+    @property
+    def root(self):
+        """Invisible root node."""
+        return self._root
+
+    @property
+    def leafs(self):
+        """Leaf nodes, in insertion order."""
+        return self._leafs
+
+    @property
+    def nr_checked(self):
+        """Number of checked leafs."""
+        return self._root.nr_checked
+
+    @property
+    def nr_shown(self):
+        """Number of leafs not hidden by the filter."""
+        if self._matched is None:
+            return len(self._leafs)
+        return len(self._matched)
+
+    def set_headers(self, headers):
+        """Set header labels."""
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers)-1)
+
+    def clear(self):
+        """Remove all nodes."""
+        self.beginResetModel()
+        self._root = TreeNode(self, '', [])
+        self._leafs = list()
+        self._names = list()
+        self._filter_text = ''
+        self._matched = None
+        self.endResetModel()
+
+    def populate(self, root, leafs):
+        """Replace tree by the one with given root and leafs."""
+        self.beginResetModel()
+        self._root = root
+        self._leafs = leafs
+        self._names = [leaf.row[0].lower() for leaf in leafs]
+        self._matched = None
+        self._filter_text = ''
+        self._update_shown()
+        self.endResetModel()
+
+    # --- QAbstractItemModel interface ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        """Return index of item."""
+        node = parent.internalPointer() if parent.isValid() else self._root
+        if row < 0 or row >= len(node.shown):
+            return QModelIndex()
+        return self.createIndex(row, column, node.shown[row])
+
+    def parent(self, index):
+        """Return parent index."""
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.index_row, 0, node)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return number of visible children."""
+        if parent.column() > 0:
+            return 0
+        node = parent.internalPointer() if parent.isValid() else self._root
+        return len(node.shown)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Return number of columns."""
+        return len(self._headers)
+
+    def hasChildren(self, parent=QModelIndex()):
+        """Return whether parent has visible children."""
+        return self.rowCount(parent) > 0
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return data."""
+        if not index.isValid():
+            return None
+        if role == Qt.CheckStateRole and index.column() != 0:
+            return None
+        return index.internalPointer().data(index.column(), role)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Set check state."""
+        if not index.isValid() or role != Qt.CheckStateRole:
             return False
+        node = index.internalPointer()
+        if node.checkState() == Qt.PartiallyChecked:
+            value = Qt.Unchecked
+        self.set_check_state([node, ], value)
         return True
 
-    def setHidden(self, status):
-        """Overhide setHidden method."""
-        super().setHidden(status)
-        if isinstance(self.parent(), QTreeItem):
-            self.parent().childHidden(self, status)
-
-    def childHidden(self, child, status):
-        """Set child hidden."""
-        getattr(self._shown, 'discard' if status else 'add')(child.myhash)
-        status = not self._shown
-        super().setHidden(status)
-        if isinstance(self.parent(), QTreeItem):
-            self.parent().childHidden(self, status)
-
-    def setData(self, column, role, value):
-        """Set data."""
-        if column == 0 and role == Qt.CheckStateRole:
-            if self.checkState(0) == Qt.PartiallyChecked:
-                value = Qt.Unchecked
-            # Trigger parent check
-            if isinstance(self.parent(), QTreeItem):
-                self.parent().childChecked(self, column, value)
-            # Trigger children check
-            if value in (Qt.Checked, Qt.Unchecked):
-                if self.childCount() == 0:
-                    if self.checkState(column) != value:
-                        self.treeWidget().parent().itemChecked.emit(
-                            self, column, value)
-                    super().setData(column, role, value)
-                else:
-                    for chil in range(self.childCount()):
-                        if not self.child(chil).isHidden():
-                            self.child(chil).setData(
-                                column, Qt.CheckStateRole, value)
-        else:
-            super().setData(column, role, value)
-
-    def _check_children(self):
-        """Child was checked."""
-        check = self._status
-        if check[Qt.PartiallyChecked]:
-            return Qt.PartiallyChecked
-        elif check[Qt.Checked] and check[Qt.Unchecked]:
-            return Qt.PartiallyChecked
-        elif check[Qt.Checked]:
-            return Qt.Checked
-        return Qt.Unchecked
-
-    def childChecked(self, child, column, status):
-        """Child was checked."""
-        self._status[status].add(child.myhash)
-        left = self._status.keys() - {status, }
-        for sts in left:
-            self._status[sts].discard(child.myhash)
-
-        mystate = self.checkState(column)
-        if status == Qt.PartiallyChecked:
-            status = Qt.PartiallyChecked
-        elif status != mystate:
-            status = self._check_children()
+    def flags(self, index):
+        """Return item flags."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return header labels."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and \
+                section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    # --- check state ---
+
+    def set_check_state(self, nodes, state):
+        """Set check state of nodes at once.
+
+        Leaf nodes are set even if hidden by the filter, while non leaf
+        nodes propagate the state to their visible leafs only.
+        Emit itemsChecked with the leafs that changed state.
+        """
+        value = state == Qt.Checked
+        changed, touched = list(), dict()
+        for node in nodes:
+            leafs = node.visible_leafs() if node.children else [node, ]
+            for leaf in leafs:
+                if leaf.checked == value:
+                    continue
+                leaf.checked = value
+                changed.append(leaf)
+                touched[id(leaf)] = leaf
+                parent = leaf.parent
+                while parent is not None:
+                    parent.nr_checked += 1 if value else -1
+                    touched[id(parent)] = parent
+                    parent = parent.parent
+        if not changed:
+            return
+        self._notify_changed(touched.values())
+        self.itemsChecked.emit(changed)
+
+    def _notify_changed(self, nodes):
+        rows = dict()
+        for node in nodes:
+            if not node.visible or node.parent is None:
+                continue
+            prows = rows.setdefault(id(node.parent), [node.parent, ])
+            prows.append(node.index_row)
+        for parent, *prows in rows.values():
+            if parent is self._root:
+                pidx = QModelIndex()
+            else:
+                pidx = self.createIndex(parent.index_row, 0, parent)
+            self.dataChanged.emit(
+                self.index(min(prows), 0, pidx),
+                self.index(max(prows), 0, pidx), [Qt.CheckStateRole, ])
+
+    # --- filter ---
+
+    def filter(self, text):
+        """Show only leafs matching regular expression text.
+
+        Return False if text is not a valid regular expression.
+        """
+        if not text:
+            matched = None
+        elif re.escape(text) == text:
+            text_lower = text.lower()
+            # narrow previous literal search when text was extended
+            if self._matched is not None and self._filter_text and \
+                    text.startswith(self._filter_text) and \
+                    re.escape(self._filter_text) == self._filter_text:
+                candidates = self._matched
+            else:
+                candidates = range(len(self._names))
+            names = self._names
+            matched = [i for i in candidates if text_lower in names[i]]
         else:
-            status = mystate
-
-        super().setData(column, Qt.CheckStateRole, status)
-        if isinstance(self.parent(), QTreeItem):
-            self.parent().childChecked(self, column, status)
+            try:
+                pattern = re.compile(text, re.I)
+            except Exception:
+                return False
+            matched = [i for i, name in enumerate(self._names)
+                       if pattern.search(name)]
+        self._filter_text = text
+        self._matched = matched
+
+        self.layoutAboutToBeChanged.emit()
+        old_idcs = self.persistentIndexList()
+        old_nodes = [idx.internalPointer() for idx in old_idcs]
+        self._update_shown()
+        new_idcs = [
+            self.createIndex(node.index_row, idx.column(), node)
+            if self._is_shown(node) else QModelIndex()
+            for idx, node in zip(old_idcs, old_nodes)]
+        self.changePersistentIndexList(old_idcs, new_idcs)
+        self.layoutChanged.emit()
+        return True
 
+    def _is_shown(self, node):
+        while node is not None and node is not self._root:
+            if not node.visible:
+                return False
+            node = node.parent
+        return True
 
-class BuildTree(QThread):
-    """QThread to build tree."""
+    def _update_shown(self):
+        nodes, stack = list(), [self._root, ]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children)
+        if self._matched is None:
+            for node in nodes:
+                node.visible = True
+        else:
+            for node in nodes:
+                node.visible = False
+            for i in self._matched:
+                node = self._leafs[i]
+                while node is not None and not node.visible:
+                    node.visible = True
+                    node = node.parent
+        for node in nodes:
+            node.shown = [child for child in node.children if child.visible]
+            for row, child in enumerate(node.shown):
+                child.index_row = row
 
-    currentItem = Signal(str)
-    itemDone = Signal()
-    completed = Signal()
 
-    def __init__(self, obj):
-        """Init."""
-        super().__init__(obj)
-        self.obj = obj
-        self._quit_task = False
-
-    def size(self):
-        """Return task size."""
-        return len(self.obj.items)
-
-    def exit_task(self):
-        """Set flag to quit thread."""
-        self._quit_task = True
-
-    def run(self):
-        """Build tree."""
-        for item in self.obj.items:
-            if self._quit_task:
-                break
-            name = item
-            if not isinstance(name, str):
-                name = item[0]
-            self.currentItem.emit(name)
-            self.obj._add_item(item)
-            self.itemDone.emit()
-        self.completed.emit()
-
-
-class Tree(QTreeWidget):
+class Tree(QTreeView):
 
     def __init__(self, parent=None):
         super().__init__(parent)
         # self.header().setSectionsMovable(False)
 
+    def setColumnCount(self, count):
+        """Show only the first count columns."""
+        for col in range(self.model().columnCount()):
+            self.setColumnHidden(col, col >= count)
+
+    def setHeaderLabels(self, labels):
+        """Set header labels."""
+        self.model().set_headers(labels)
+
     def resizeEvent(self, event):
         # self.setColumnWidth(0, self.width()*3/6)
-        self.setColumnWidth(1, self.width()*1.3/6)
+        self.setColumnWidth(1, int(self.width()*1.3/6))
         # self.setColumnWidth(2, self.width()*0.4/6)
         if not self.header().isHidden():
             self.header().setSectionResizeMode(0, QHeaderView.Stretch)
@@ -155,7 +358,15 @@ class Tree(QTreeWidget):
 class PVNameTree(QWidget):
     """Build a tree with SiriusPVNames."""
 
-    itemChecked = Signal(QTreeItem, int, int)
+    itemsChecked = Signal(list)
+
+    # fixed tree keys of PVs not following the naming system
+    _SPECIAL_KEYS = {
+        'LA': ({'sec': 'LI', 'dis': 'RF', 'dev': 'LLRF'}, 'DLLRF'),
+        'BR': ({'sec': 'BO', 'dis': 'RF', 'dev': 'DLLRF'}, 'DLLRF'),
+        'SR': ({'sec': 'SI', 'dis': 'RF', 'dev': 'DLLRF'}, 'DLLRF'),
+        'RF': ({'sec': 'AS', 'dis': 'RF', 'dev': 'RFGen'}, 'RFGen'),
+    }
 
     def __init__(self, items=tuple(), tree_levels=tuple(),
                  checked_levels=tuple(), parent=None):
@@ -165,8 +376,7 @@ class PVNameTree(QWidget):
         self._item_map = dict()
 
         self._pnames = tree_levels
-        self._leafs = list()
-        self._nr_checked_items = 0
+        self._items = tuple()
 
         self._setup_ui()
         self._create_actions()
@@ -174,9 +384,8 @@ class PVNameTree(QWidget):
         self.check_children = True
         self.check_parent = True
 
+        self.items = items
         self.check_requested_levels(checked_levels)
-
-        self.items = _dcopy(items)
         self.tree.expanded.connect(
             lambda idx: self.tree.resizeColumnToContents(idx.column()))
 
@@ -185,13 +394,14 @@ class PVNameTree(QWidget):
 
         # Add Selection Tree
         self._check_count = QLabel(self)
+        self._model = PVNameTreeModel(self)
+        self._model.itemsChecked.connect(self._items_checked)
         self.tree = Tree(self)
-        self.tree.setColumnCount(3)
+        self.tree.setModel(self._model)
+        self.tree.setUniformRowHeights(True)
         self.tree.setHeaderHidden(False)
         self.tree.setHeaderLabels(['Name', 'Value', 'Delay'])
 
-        self.itemChecked.connect(self._item_checked)
-
         # Add filter for tree
         self._filter_le = QLineEdit(self)
         self._filter_le.setPlaceholderText("Filter Items...")
@@ -218,10 +428,9 @@ class PVNameTree(QWidget):
     def clear(self):
         """Clear tree."""
         self._items = tuple()
-        self._leafs = list()
         self._item_map = dict()
-        self.tree.clear()
-        self._nr_checked_items = 0
+        self._model.clear()
+        self._update_count()
 
     @property
     def message(self):
@@ -238,28 +447,40 @@ class PVNameTree(QWidget):
 
     @items.setter
     def items(self, value):
-        self.tree.clear()
         self._items = _dcopy(value)
         self._add_items()
         self._filter_items(self._filter_le.text())
+        self._update_count()
+
+    @property
+    def model(self):
+        """Tree model."""
+        return self._model
+
+    @property
+    def _leafs(self):
+        return self._model.leafs
 
     def check_all(self):
         """Check all items."""
-        for item in self._leafs:
-            if not item.isHidden():
-                item.setCheckState(0, Qt.Checked)
+        self._model.set_check_state([self._model.root, ], Qt.Checked)
 
     def uncheck_all(self):
         """Uncheck all items."""
-        for item in self._leafs:
-            if not item.isHidden():
-                item.setCheckState(0, Qt.Unchecked)
+        self._model.set_check_state([self._model.root, ], Qt.Unchecked)
+
+    def set_check_state(self, keys, state):
+        """Set check state of items or levels given by their keys."""
+        self._model.set_check_state(
+            [self._item_map[key] for key in keys], state)
+
+    def check_state(self, key):
+        """Return check state of item or level given by its key."""
+        return self._item_map[key].checkState()
 
     def expand_all(self):
         """Expand all items."""
-        for item in self._item_map.values():
-            if item.childCount() > 0:
-                item.setExpanded(True)
+        self.tree.expandAll()
 
     def collapse_all(self):
         self.tree.collapseAll()
@@ -301,11 +522,24 @@ class PVNameTree(QWidget):
 
     def check_requested_levels(self, levels):
         """Set requested levels checked."""
-        for level in levels:
-            self._item_map[level].setCheckState(0, Qt.Checked)
+        self.set_check_state(levels, Qt.Checked)
 
-    def _add_item(self, item):
+    def _level_keys(self, pvname):
+        if pvname[:2] in self._SPECIAL_KEYS:
+            dic_, default = self._SPECIAL_KEYS[pvname[:2]]
+            return [dic_.get(p, default) for p in self._pnames]
+        elif isinstance(pvname, SiriusPVName):
+            keys = list()
+            for p in self._pnames:
+                try:
+                    key = getattr(pvname, p)
+                except AttributeError:
+                    key = getattr(PVNameTree, p)(pvname)
+                keys.append(key)
+            return keys
+        return [pvname[:2], ]
 
+    def _add_item(self, item, root, leafs):
         if isinstance(item, str):
             pvname = item
             row = [item, ]
@@ -315,155 +549,43 @@ class PVNameTree(QWidget):
             pvname = item[0]
             row = [item[0], ]
             row.extend([str(i) for i in item[1:]])
-        # pvals = []
-        parent = self.tree.invisibleRootItem()
-        parent_key = ''
-        # if pvname.count(':') == 2 and pvname.count('-') == 3:
+
         try:
             pvname = SiriusPVName(pvname)
         except (IndexError, ValueError):
             pass
-        # Deal with LI LLRF PVs:
-        if pvname.startswith('LA'):
-            dic_ = {'sec': 'LI', 'dis': 'RF', 'dev': 'LLRF'}
-            for p in self._pnames:
-                key = dic_.get(p, 'DLLRF')
-                if key:
-                    item_key = parent_key + key
-                    # item = self._item_map.symbol(item_key)
-                    item = self._item_map[item_key] \
-                        if item_key in self._item_map else None
-                    if item is not None:
-                        parent = item
-                    else:
-                        new_item = QTreeItem([key], parent)
-                        new_item.setCheckState(0, Qt.Unchecked)
-                        # self._item_map.add_symbol(item_key, new_item)
-                        self._item_map[item_key] = new_item
-                        # parent.addChild(new_item)
-                        parent = new_item
-                    parent_key = item_key
-        # Deal with BO LLRF PVs:
-        elif pvname.startswith('BR'):
-            dic_ = {'sec': 'BO', 'dis': 'RF', 'dev': 'DLLRF'}
-            for p in self._pnames:
-                key = dic_.get(p, 'DLLRF')
-                if key:
-                    item_key = parent_key + key
-                    # item = self._item_map.symbol(item_key)
-                    item = self._item_map[item_key] \
-                        if item_key in self._item_map else None
-                    if item is not None:
-                        parent = item
-                    else:
-                        new_item = QTreeItem([key], parent)
-                        new_item.setCheckState(0, Qt.Unchecked)
-                        # self._item_map.add_symbol(item_key, new_item)
-                        self._item_map[item_key] = new_item
-                        # parent.addChild(new_item)
-                        parent = new_item
-                    parent_key = item_key
-        elif pvname.startswith('SR'):
-            dic_ = {'sec': 'SI', 'dis': 'RF', 'dev': 'DLLRF'}
-            for p in self._pnames:
-                key = dic_.get(p, 'DLLRF')
-                if key:
-                    item_key = parent_key + key
-                    # item = self._item_map.symbol(item_key)
-                    item = self._item_map[item_key] \
-                        if item_key in self._item_map else None
-                    if item is not None:
-                        parent = item
-                    else:
-                        new_item = QTreeItem([key], parent)
-                        new_item.setCheckState(0, Qt.Unchecked)
-                        # self._item_map.add_symbol(item_key, new_item)
-                        self._item_map[item_key] = new_item
-                        # parent.addChild(new_item)
-                        parent = new_item
-                    parent_key = item_key
-        elif pvname.startswith('RF'):
-            dic_ = {'sec': 'AS', 'dis': 'RF', 'dev': 'RFGen'}
-            for p in self._pnames:
-                key = dic_.get(p, 'RFGen')
-                if key:
-                    item_key = parent_key + key
-                    # item = self._item_map.symbol(item_key)
-                    item = self._item_map[item_key] \
-                        if item_key in self._item_map else None
-                    if item is not None:
-                        parent = item
-                    else:
-                        new_item = QTreeItem([key], parent)
-                        new_item.setCheckState(0, Qt.Unchecked)
-                        # self._item_map.add_symbol(item_key, new_item)
-                        self._item_map[item_key] = new_item
-                        # parent.addChild(new_item)
-                        parent = new_item
-                    parent_key = item_key
-        elif isinstance(pvname, SiriusPVName):
-            # Parse it with SiriusPVName
-            pvname = SiriusPVName(pvname)
-            # Parse PVName
-            for p in self._pnames:
-                try:
-                    key = getattr(pvname, p)
-                except AttributeError:
-                    key = getattr(PVNameTree, p)(pvname)
-                if key:
-                    item_key = parent_key + key
-                    # item = self._item_map.symbol(item_key)
-                    item = self._item_map[item_key] \
-                        if item_key in self._item_map else None
-                    if item is not None:
-                        parent = item
-                    else:
-                        new_item = QTreeItem([key], parent)
-                        new_item.setCheckState(0, Qt.Unchecked)
-                        # self._item_map.add_symbol(item_key, new_item)
-                        self._item_map[item_key] = new_item
-                        # parent.addChild(new_item)
-                        parent = new_item
-                    parent_key = item_key
-        else:
-            key = pvname[:2]
+
+        parent = root
+        parent_key = ''
+        for key in self._level_keys(pvname):
+            if not key:
+                continue
             item_key = parent_key + key
-            item = self._item_map[item_key] \
-                if item_key in self._item_map else None
-            if item is None:
-                new_item = QTreeItem([key], parent)
-                new_item.setCheckState(0, Qt.Unchecked)
-                self._item_map[item_key] = new_item
-                parent = new_item
-            else:
-                parent = item
+            node = self._item_map.get(item_key)
+            if node is None:
+                node = TreeNode(self._model, item_key, [key, ], parent)
+                self._item_map[item_key] = node
+            parent = node
+            parent_key = item_key
         # Insert leaf node pvname
-        new_item = QTreeItem(row, parent)
-        new_item.setCheckState(0, Qt.Unchecked)
-        self._item_map[pvname] = new_item
-        self._leafs.append(new_item)
+        node = TreeNode(self._model, pvname, row, parent)
+        self._item_map[pvname] = node
+        leafs.append(node)
+        while parent is not None:
+            parent.nr_leafs += 1
+            parent = parent.parent
 
     def _add_items(self):
-        # Connect signals
-        t = BuildTree(self)
-        t.finished.connect(t.deleteLater)
-        dlg = None
-        if len(self.items) > 1500:
-            dlg = QProgressDialog(
-                labelText='Building Tree',
-                minimum=0, maximum=len(self._items), parent=self)
-            t.itemDone.connect(lambda: dlg.setValue(dlg.value() + 1))
-            t.finished.connect(dlg.close)
-        # Start
-        t.start()
-        if dlg:
-            dlg.exec_()
-        t.wait()
+        self._item_map = dict()
+        root = TreeNode(self._model, '', [])
+        leafs = list()
+        for item in self._items:
+            self._add_item(item, root, leafs)
+        self._model.populate(root, leafs)
 
     def checked_items(self):
         """Return checked items."""
-        return [item.data(0, Qt.DisplayRole) for item in self._leafs
-                if item.checkState(0) == Qt.Checked]
+        return [item.row[0] for item in self._model.leafs if item.checked]
 
     def sizeHint(self):
         """Override sizehint."""
@@ -482,30 +604,18 @@ class PVNameTree(QWidget):
     @Slot(str)
     def _filter_items(self, text):
         """Filter pvnames based on text inserted at line edit."""
-        selected_pvs = 0
-        try:
-            pattern = re.compile(text, re.I)
-        except Exception:
+        if not self._model.filter(text):
             return
+        self._msg.setText('Showing {} Items.'.format(self._model.nr_shown))
 
-        for node in self._leafs:
-            if pattern.search(node.data(0, 0)):
-                node.setHidden(False)
-                selected_pvs += 1
-            else:
-                # node.setCheckState(0, Qt.Unchecked)
-                node.setHidden(True)
-        self._msg.setText('Showing {} Items.'.format(selected_pvs))
-
-    @Slot(QTreeItem, int, int)
-    def _item_checked(self, item, column, value):
-        if item.childCount() == 0:
-            if value == Qt.Checked:
-                self._nr_checked_items += 1
-            elif value == Qt.Unchecked:
-                self._nr_checked_items -= 1
+    @Slot(list)
+    def _items_checked(self, items):
+        self._update_count()
+        self.itemsChecked.emit(items)
+
+    def _update_count(self):
         self._check_count.setText(
-            '{} Items checked.'.format(self._nr_checked_items))
+            '{} Items checked.'.format(self._model.nr_checked))
 
 
 if __name__ == "__main__":
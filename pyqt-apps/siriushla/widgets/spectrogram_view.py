@@ -3,8 +3,10 @@
 Based on ImageView from pydm and GradientLegend from pyqtgraph.
 """
 
-import numpy as np
+import time
 import logging
+from threading import Condition
+import numpy as np
 from qtpy.QtWidgets import QActionGroup, QToolTip
 from qtpy.QtGui import QColor, QLinearGradient, QBrush, QPen
 from qtpy.QtCore import Signal, Slot, Property, QTimer, Q_ENUMS, \
@@ -160,57 +162,153 @@ class _GradientLegend(GraphicsWidget):
 
 
 class SpectrogramUpdateThread(QThread):
-    """Thread to update image."""
+    """Long-lived thread to process the images of a spectrogram.
+
+    Frames are posted by the GUI thread with post and the latest frame
+    wins: a frame that is still waiting to be processed is replaced by a
+    newer one, except in waterfall mode, where the new rows of both frames
+    are kept. Images are copied into preallocated float32 buffers that are
+    alternated between frames, so a new frame is only processed after the
+    displayed one is released with frame_done.
+
+    In waterfall mode, frames carry only new rows, which are processed and
+    appended to a circular image of waterfall_length rows.
+
+    The processing time of each frame, in seconds, is emitted by the
+    frameProcessed signal. A stopped thread may be started again.
+    """
 
     updateSignal = Signal(list)
+    frameProcessed = Signal(float)
 
-    def __init__(self, spectrogram_view):
+    def __init__(self, process_func, parent=None):
         """Initialize Thread."""
-        QThread.__init__(self)
-        self.spectrogram_view = spectrogram_view
+        QThread.__init__(self, parent)
+        self._process_func = process_func
+        self._cond = Condition()
+        self._frame = None
+        self._busy = False
+        self._running = True
+        self._buffers = [None, None]
+        self._buffer_idx = 0
+        self._ring = None
+        self._ring_start = 0
+        self._ring_count = 0
+        self.processed_frames = 0
+        self.dropped_frames = 0
+
+    def post(self, frame):
+        """Queue frame to be processed, replacing a pending one."""
+        with self._cond:
+            old = self._frame
+            if old is not None:
+                self.dropped_frames += 1
+                if frame['waterfall'] and old['waterfall']:
+                    frame['rows'] = np.vstack(
+                        [old['rows'], frame['rows']])[-frame['length']:]
+            self._frame = frame
+            self._cond.notify()
+
+    @Slot()
+    def frame_done(self):
+        """Release the last processed frame."""
+        with self._cond:
+            self._busy = False
+            self._cond.notify()
+
+    def start(self, *args):
+        """Start thread."""
+        with self._cond:
+            self._running = True
+        super().start(*args)
+
+    @Slot()
+    def stop(self):
+        """Stop thread, discarding the pending frame, and wait for it."""
+        with self._cond:
+            self._running = False
+            self._frame = None
+            self._cond.notify()
+        self.wait()
 
     def run(self):
         """Thread main."""
-        img = self.spectrogram_view.image_waveform
-        needs_redraw = self.spectrogram_view.needs_redraw
-        image_dimensions = len(img.shape)
-        width = self.spectrogram_view.imageWidth
-        reading_order = self.spectrogram_view.readingOrder
-        normalize_data = self.spectrogram_view._normalize_data
-        cm_min = self.spectrogram_view.cm_min
-        cm_max = self.spectrogram_view.cm_max
-        if not needs_redraw:
-            logging.debug(
-                "ImageUpdateThread - needs redraw is False. Aborting.")
-            return
-        if image_dimensions == 1:
-            if width < 1:
-                # We don't have a width for this image yet, so we can't draw it
-                logging.debug(
-                    "ImageUpdateThread - no width available. Aborting.")
-                return
+        while True:
+            with self._cond:
+                while self._running and (self._busy or self._frame is None):
+                    self._cond.wait()
+                if not self._running:
+                    break
+                frame, self._frame = self._frame, None
+                self._busy = True
+            t0 = time.time()
+            try:
+                if frame['waterfall']:
+                    data = self._process_rows(frame)
+                else:
+                    data = self._process_image(frame)
+            except Exception:
+                logger.exception('Error while processing image.')
+                data = None
+            if data is None:
+                self.frame_done()
+                continue
+            self.processed_frames += 1
+            self.frameProcessed.emit(time.time() - t0)
+            logging.debug("ImageUpdateThread - Emit Update Signal")
+            self.updateSignal.emit(data)
+
+    def _process_image(self, frame):
+        img = frame['image']
+        if img.ndim == 1:
+            width = frame['width']
             try:
-                if reading_order == ReadingOrder.Clike:
+                if frame['reading_order'] == ReadingOrder.Clike:
                     img = img.reshape((-1, width), order='C')
                 else:
                     img = img.reshape((width, -1), order='F')
             except ValueError:
                 logger.error("Invalid width for image during reshape: %d",
                              width)
+                return None
         if len(img) <= 0:
-            return
+            return None
+        self._buffer_idx ^= 1
+        buf = self._buffers[self._buffer_idx]
+        if buf is None or buf.shape != img.shape:
+            buf = np.empty(img.shape, dtype=np.float32)
+            self._buffers[self._buffer_idx] = buf
+        np.copyto(buf, img, casting='unsafe')
         logging.debug("ImageUpdateThread - Will Process Image")
-        img = self.spectrogram_view.process_image(img)
-        if normalize_data:
-            mini = img.min()
-            maxi = img.max()
-        else:
-            mini = cm_min
-            maxi = cm_max
-        logging.debug("ImageUpdateThread - Emit Update Signal")
-        self.updateSignal.emit([mini, maxi, img])
-        logging.debug("ImageUpdateThread - Set Needs Redraw -> False")
-        self.spectrogram_view.needs_redraw = False
+        img = self._process_func(buf)
+        return self._get_levels(frame, img) + [img, ]
+
+    def _process_rows(self, frame):
+        rows = self._process_func(frame['rows'])
+        length = frame['length']
+        width = rows.shape[1]
+        ring = self._ring
+        if ring is None or ring.shape != (2*length, width):
+            ring = np.empty((2*length, width), dtype=np.float32)
+            self._ring = ring
+            self._ring_start = 0
+            self._ring_count = 0
+        rows = rows[-length:]
+        size = len(rows)
+        pos = (self._ring_start + self._ring_count + np.arange(size)) % length
+        ring[pos] = rows
+        ring[pos + length] = rows
+        overflow = max(self._ring_count + size - length, 0)
+        self._ring_start = (self._ring_start + overflow) % length
+        self._ring_count = min(self._ring_count + size, length)
+        img = ring[self._ring_start:self._ring_start+self._ring_count]
+        return self._get_levels(frame, img) + [img, ]
+
+    @staticmethod
+    def _get_levels(frame, img):
+        if frame['normalize']:
+            return [img.min(), img.max()]
+        return [frame['cm_min'], frame['cm_max']]
 
 
 class SiriusSpectrogramView(
@@ -226,7 +324,15 @@ class SiriusSpectrogramView(
     the minimum and maximum values of the image.
 
     Use the :attr:`newImageSignal` to hook up to a signal that is emitted when
-    a new image is rendered in the widget.
+    a new image is rendered in the widget and the :attr:`frameProcessedSignal`
+    to get the processing time, in seconds, of each image.
+
+    Images are processed in a single long-lived thread, which runs only
+    while the widget is shown. If the
+    :attr:`waterfallMode` property is set, each value of the image channel is
+    taken as one or more new rows of :attr:`imageWidth` points, which are
+    appended to a circular image of :attr:`waterfallLength` rows, so only the
+    new rows are processed.
 
     Parameters
     ----------
@@ -258,7 +364,8 @@ class SiriusSpectrogramView(
         """Initialize widget."""
         GraphicsLayoutWidget.__init__(self, parent)
         PyDMWidget.__init__(self)
-        self.thread = None
+        self.thread = SpectrogramUpdateThread(self.process_image, self)
+        self.thread.updateSignal.connect(self._updateDisplay)
         self._imagechannel = None
         self._xaxischannel = None
         self._yaxischannel = None
@@ -279,6 +386,9 @@ class SiriusSpectrogramView(
         self._last_yaxis_data = None
         self._last_xaxis_data = None
         self._auto_colorbar_lims = True
+        self._waterfall_mode = False
+        self._waterfall_length = 256
+        self._waterfall_rows = list()
         self.format_tooltip = '{0:.4g}, {1:.4g}'
 
         # ViewBox and imageItem.
@@ -350,6 +460,7 @@ class SiriusSpectrogramView(
         self._redraw_rate = 30
         self.maxRedrawRate = self._redraw_rate
         self.newImageSignal = self._image_item.sigImageChanged
+        self.frameProcessedSignal = self.thread.frameProcessed
 
         # Set Channels.
         self.imageChannel = image_channel
@@ -611,6 +722,9 @@ class SiriusSpectrogramView(
         """
         if new_image is None or new_image.size == 0:
             return
+        if self._waterfall_mode:
+            self._append_rows(new_image)
+            return
         logging.debug("SpectrogramView Received New Image: Needs Redraw->True")
         self.image_waveform = new_image
         self.needs_redraw = True
@@ -737,6 +851,12 @@ class SiriusSpectrogramView(
            This code runs in a separated QThread so it **MUST** not try to
            write to QWidgets.
 
+        .. warning::
+           The image is a float32 buffer that is reused by the next images,
+           so it must be copied if a reference to it is kept.
+
+        In waterfall mode, only the new rows are given to this method.
+
         Parameters
         ----------
         image : np.ndarray
@@ -751,22 +871,60 @@ class SiriusSpectrogramView(
 
     def redrawImage(self):
         """
-        Set the image data into the ImageItem, if needed.
+        Post the image data to be processed and displayed, if needed.
 
-        If necessary, reshape the image to 2D first.
+        If necessary, the image is reshaped to 2D first. Nothing is posted
+        while the widget is hidden.
         """
-        if self.thread is not None and not self.thread.isFinished():
-            logger.warning(
-                "Image processing has taken longer than the refresh rate.")
+        if not self.isVisible():
             return
-        self.thread = SpectrogramUpdateThread(self)
-        self.thread.updateSignal.connect(self._updateDisplay)
-        logging.debug("SpectrogramView RedrawImage Thread Launched")
-        self.thread.start()
+        if self._waterfall_mode:
+            if not self._waterfall_rows:
+                return
+            rows = np.vstack(self._waterfall_rows)
+            self._waterfall_rows = list()
+            frame = dict(waterfall=True, rows=rows,
+                         length=self._waterfall_length)
+        else:
+            if not self.needs_redraw:
+                return
+            img = self.image_waveform
+            width = int(self.imageWidth)
+            if img.ndim == 1 and width < 1:
+                # We don't have a width for this image yet, so we can't draw it
+                return
+            frame = dict(waterfall=False, image=img, width=width,
+                         reading_order=self.readingOrder)
+            self.needs_redraw = False
+        frame.update(normalize=self._normalize_data,
+                     cm_min=self.cm_min, cm_max=self.cm_max)
+        if not self.thread.isRunning():
+            self.thread.start()
+        logging.debug("SpectrogramView RedrawImage Frame Posted")
+        self.thread.post(frame)
+
+    def _append_rows(self, new_image):
+        width = int(self.imageWidth)
+        if new_image.ndim == 1:
+            if width < 1 or new_image.size % width:
+                logger.error("Invalid width for waterfall rows: %d", width)
+                return
+            new_image = new_image.reshape((-1, width))
+        self._waterfall_rows.append(new_image)
+        if sum(len(r) for r in self._waterfall_rows) > self._waterfall_length:
+            rows = np.vstack(self._waterfall_rows)
+            self._waterfall_rows = [rows[-self._waterfall_length:], ]
 
     @Slot(list)
     def _updateDisplay(self, data):
         logging.debug("SpectrogramView Update Display with new image")
+        try:
+            self._setDisplayData(data)
+        finally:
+            self.thread.frame_done()
+
+    def _setDisplayData(self, data):
+        img = data[2]
 
         # Update axis
         if self._last_xaxis_data is not None:
@@ -783,6 +941,10 @@ class SiriusSpectrogramView(
             szy = self._last_yaxis_data.size
             yMin = self._last_yaxis_data.min()
             yMax = self._last_yaxis_data.max()
+        elif self._waterfall_mode:
+            szy = img.shape[0]
+            yMin = 0
+            yMax = szy
         else:
             szy = self.imageHeight if self.readingOrder == self.Clike \
                 else self.imageWidth
@@ -799,12 +961,13 @@ class SiriusSpectrogramView(
         if self.autoSetColorbarLims:
             self.colorbar.setLimits(data)
         mini, maxi = data[0], data[1]
-        img = data[2]
         self._image_item.setLevels([mini, maxi])
         self._image_item.setImage(
             img,
             autoLevels=False,
             autoDownsample=self.autoDownsample)
+        # render now, since the buffer is reused once the frame is released
+        self._image_item.render()
 
     # ROI update methods
     def redrawROI(self):
@@ -1055,6 +1218,54 @@ class SiriusSpectrogramView(
         if self._normalize_data != new_norm:
             self._normalize_data = new_norm
 
+    @Property(bool)
+    def waterfallMode(self):
+        """
+        Return True if image channel values are appended as new rows.
+
+        Returns
+        -------
+        bool
+        """
+        return self._waterfall_mode
+
+    @waterfallMode.setter
+    @Slot(bool)
+    def waterfallMode(self, new_mode):
+        """
+        Define if image channel values are appended as new rows.
+
+        Parameters
+        ----------
+        new_mode: bool
+        """
+        if self._waterfall_mode != new_mode:
+            self._waterfall_mode = new_mode
+            self._waterfall_rows = list()
+
+    @Property(int)
+    def waterfallLength(self):
+        """
+        Return the number of rows kept in waterfall mode.
+
+        Returns
+        -------
+        int
+        """
+        return self._waterfall_length
+
+    @waterfallLength.setter
+    def waterfallLength(self, new_length):
+        """
+        Set the number of rows kept in waterfall mode.
+
+        Parameters
+        ----------
+        new_length: int
+        """
+        if new_length >= 1:
+            self._waterfall_length = int(new_length)
+
     @Property(ReadingOrder)
     def readingOrder(self):
         """
@@ -1117,6 +1328,11 @@ class SiriusSpectrogramView(
         self.redraw_timer.setInterval(int((1.0 / self._redraw_rate) * 1000))
 
     # --- Events rederivations ---
+    def hideEvent(self, ev):
+        """Stop processing images while hidden."""
+        self.thread.stop()
+        super().hideEvent(ev)
+
     def keyPressEvent(self, ev):
         """Handle keypress events."""
         return
@@ -0,0 +1,135 @@
+"""Pause channels of widgets that are not exposed."""
+
+from functools import partial as _part
+
+from qtpy.QtCore import QObject, QEvent, QTimer, QRect, QPoint
+from qtpy.QtWidgets import QWidget
+from pydm.widgets.channel import PyDMChannel
+
+
+class SubscriptionManager(QObject):
+    """Connect channels of widgets only while they are exposed.
+
+    Widgets are registered with add_widget. Channels of a registered widget
+    and of all its children are disconnected while the widget is hidden,
+    is in a background tab or is scrolled out of the viewport of the scroll
+    area, enlarged by margin pixels. They are connected again as soon as
+    the widget is exposed.
+
+    Exposure is checked once per event loop pass after the widgets or the
+    scroll area are shown, hidden, moved, resized or scrolled.
+    """
+
+    _EVENTS = {QEvent.Show, QEvent.Hide, QEvent.Move, QEvent.Resize}
+
+    def __init__(self, scrollarea, margin=0, parent=None):
+        """Init."""
+        super().__init__(parent or scrollarea)
+        self._scrollarea = scrollarea
+        self._margin = margin
+        self._widgets = list()
+        self._paused = dict()
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update)
+
+        scrollarea.installEventFilter(self)
+        scrollarea.viewport().installEventFilter(self)
+        scrollarea.verticalScrollBar().valueChanged.connect(
+            self.schedule_update)
+        scrollarea.horizontalScrollBar().valueChanged.connect(
+            self.schedule_update)
+
+    @property
+    def widgets(self):
+        """Registered widgets."""
+        return list(self._widgets)
+
+    @property
+    def paused_widgets(self):
+        """Registered widgets whose channels are disconnected."""
+        return list(self._paused)
+
+    @property
+    def nr_paused_channels(self):
+        """Number of disconnected channels."""
+        return sum(len(chans) for chans in self._paused.values())
+
+    def add_widget(self, widget):
+        """Register widget."""
+        if widget in self._widgets:
+            return
+        self._widgets.append(widget)
+        widget.installEventFilter(self)
+        widget.destroyed.connect(_part(self._forget, widget))
+        self.schedule_update()
+
+    def remove_widget(self, widget):
+        """Unregister widget, connecting its channels if paused."""
+        if widget not in self._widgets:
+            return
+        self._widgets.remove(widget)
+        widget.removeEventFilter(self)
+        self._resume(widget)
+
+    def schedule_update(self):
+        """Check widgets exposure in the next event loop pass."""
+        self._update_timer.start()
+
+    def update(self):
+        """Pause channels of hidden widgets and resume the exposed ones."""
+        viewport = self._scrollarea.viewport()
+        area = viewport.rect().adjusted(
+            -self._margin, -self._margin, self._margin, self._margin)
+        for widget in self._widgets:
+            exposed = widget.isVisible() and area.intersects(QRect(
+                widget.mapTo(viewport, QPoint(0, 0)), widget.size()))
+            if exposed:
+                self._resume(widget)
+            else:
+                self._pause(widget)
+
+    def eventFilter(self, obj, event):
+        """Schedule update when watched widgets change."""
+        if event.type() in self._EVENTS:
+            self.schedule_update()
+        return False
+
+    def _pause(self, widget):
+        if widget in self._paused:
+            return
+        chans = self._get_channels(widget)
+        for chan in chans:
+            chan.disconnect()
+        self._paused[widget] = chans
+
+    def _resume(self, widget):
+        chans = self._paused.pop(widget, None)
+        if chans is None:
+            return
+        for chan in chans:
+            chan.connect()
+
+    def _forget(self, widget, *args):
+        # channels of destroyed widgets are disconnected by PyDM
+        if widget in self._widgets:
+            self._widgets.remove(widget)
+        self._paused.pop(widget, None)
+
+    @staticmethod
+    def _get_channels(widget):
+        chans = list()
+        ids = set()
+        for wid in [widget, ] + widget.findChildren(QWidget):
+            func = getattr(wid, 'channels', None)
+            if not callable(func):
+                continue
+            for chan in func() or list():
+                if not isinstance(chan, PyDMChannel) or not chan.address:
+                    continue
+                if id(chan) not in ids:
+                    ids.add(id(chan))
+                    chans.append(chan)
+        return chans
@@ -9,6 +9,15 @@ from pydm.connection_inspector import ConnectionInspector
 from ..util import get_package_version
 
 
+def _set_label_fontsize(axis, fontsize_str):
+    """Set font size of pyqtgraph axis label, if it changed."""
+    sty = axis.labelStyle
+    if sty.get('font-size') == fontsize_str:
+        return
+    sty['font-size'] = fontsize_str
+    axis.setLabel(text=None, **sty)
+
+
 def _create_siriuswindow(qt_type):
     """Create a _SiriusWindow that inherits from qt_type."""
     class _SiriusWindow(qt_type):
@@ -42,15 +51,11 @@ def _create_siriuswindow(qt_type):
 
         def keyPressEvent(self, event):
             """Override keyPressEvent."""
-            font = self.app.font()
+            fontsize = self.app.font().pointSize()
             if event.matches(QKeySequence.ZoomIn):
-                font.setPointSize(font.pointSize() + 1)
-                self.app.setFont(font)
-                self.changeFontSize()
-            elif event.matches(QKeySequence.ZoomOut) and font.pointSize() > 6:
-                font.setPointSize(font.pointSize() - 1)
-                self.app.setFont(font)
-                self.changeFontSize()
+                self.changeFontSize(fontsize + 1)
+            elif event.matches(QKeySequence.ZoomOut) and fontsize > 6:
+                self.changeFontSize(fontsize - 1)
             super().keyPressEvent(event)
 
         def contextMenuEvent(self, event):
@@ -83,44 +88,72 @@ def _create_siriuswindow(qt_type):
             c = ConnectionInspector(self)
             c.show()
 
-        def changeFontSize(self):
-            """."""
-            fontsize = self.app.font().pointSize()
+        def changeFontSize(self, fontsize=None):
+            """Set font size of application and window in a single pass.
+
+            fontsize defaults to the application font size. Updates of the
+            window are suspended while the font propagates from the window
+            to its children, so that the window is laid out and repainted
+            only once. Children whose font did not change by inheritance
+            are set individually.
+            """
+            if fontsize is None:
+                fontsize = self.app.font().pointSize()
             self.ensurePolished()
-            for w in self.findChildren(QWidget):
-                font = w.font()
+            self.setUpdatesEnabled(False)
+            try:
+                font = self.app.font()
+                if font.pointSize() != fontsize:
+                    font.setPointSize(fontsize)
+                    self.app.setFont(font)
+                font = self.font()
                 font.setPointSize(fontsize)
-                w.setFont(font)
-            self.adjustSize()
-
+                self.setFont(font)
+                # a single walk of the children, as each one is costly.
+                # Children with fonts of their own, set explicitly or by
+                # the stylesheet, do not inherit the font of the window.
+                plots = list()
+                for w in self.findChildren(QWidget):
+                    if isinstance(w, QGraphicsView):
+                        plots.append(w)
+                    font = w.font()
+                    if font.pointSize() != fontsize:
+                        font.setPointSize(fontsize)
+                        w.setFont(font)
+                self._update_plots_fontsize(plots, fontsize)
+                self.adjustSize()
+            finally:
+                self.setUpdatesEnabled(True)
+
+        @staticmethod
+        def _update_plots_fontsize(plots, fontsize):
             # handle resizing of pyqtgraph plots labels
             fontsize_str = str(fontsize)+'pt'
-            for w in self.findChildren(pg.PlotWidget):
+            for w in plots:
+                if isinstance(w, pg.GraphicsLayoutWidget):
+                    _set_label_fontsize(w.xaxis, fontsize_str)
+                    _set_label_fontsize(w.yaxis, fontsize_str)
+                    continue
+                elif not isinstance(w, pg.PlotWidget):
+                    continue
                 # axes labels
                 for ax in w.getPlotItem().axes.values():
-                    sty = ax['item'].labelStyle
-                    sty['font-size'] = fontsize_str
-                    ax['item'].setLabel(text=None, **sty)
+                    _set_label_fontsize(ax['item'], fontsize_str)
                 # legend
                 if w.plotItem.legend:
                     legw = 0
                     for item in w.plotItem.legend.items:
-                        item[1].opts['size'] = fontsize_str
-                        item[1].setText(text=item[1].text, **item[1].opts)
+                        if item[1].opts.get('size') != fontsize_str:
+                            item[1].opts['size'] = fontsize_str
+                            item[1].setText(text=item[1].text, **item[1].opts)
                         legw = max(legw, 20+item[1].width())
                     w.plotItem.legend.updateSize()
                     w.plotItem.legend.setFixedWidth(legw)
                 # title
                 wtitle = w.plotItem.titleLabel
-                wtitle.opts['size'] = fontsize_str
-                wtitle.setText(text=wtitle.text, **wtitle.opts)
-            for w in self.findChildren(pg.GraphicsLayoutWidget):
-                sty = w.xaxis.labelStyle
-                sty['font-size'] = fontsize_str
-                w.xaxis.setLabel(text=None, **sty)
-                sty = w.yaxis.labelStyle
-                sty['font-size'] = fontsize_str
-                w.yaxis.setLabel(text=None, **sty)
+                if wtitle.opts.get('size') != fontsize_str:
+                    wtitle.opts['size'] = fontsize_str
+                    wtitle.setText(text=wtitle.text, **wtitle.opts)
 
     return _SiriusWindow
 
@@ -0,0 +1,438 @@
+"""Resident server that starts applications from a warm interpreter.
+
+Starting an application script in a new interpreter imports Qt, PyDM,
+siriuspy, numpy and matplotlib again and runs the setup of
+sirius_application. The zygote server imports these modules once and
+starts each application in a forked child, which runs the script with
+the modules already loaded.
+
+The server keeps a table of the applications it started, so a request to
+start an application that is already running raises its window instead,
+without scanning the process list.
+
+Run the server with:
+
+    python -m siriushla.zygote
+
+Clients use run and find_window, which return None and '' if the server
+is not running. The output of the server started by start_server, and of
+the applications it starts, is appended to sirius-hla-zygote.log, in the
+directory of the socket.
+"""
+
+import os as _os
+import sys as _sys
+import json as _json
+import time as _time
+import shlex as _shlex
+import shutil as _shutil
+import socket as _socket
+import select as _select
+import struct as _struct
+import sysconfig as _sysconfig
+import tempfile as _tempfile
+import runpy as _runpy
+import hashlib as _hashlib
+import importlib as _importlib
+import importlib.util as _importlib_util
+import subprocess as _subprocess
+import logging as _log
+
+
+SOCKET_NAME = 'sirius-hla-zygote.sock'
+LOG_NAME = 'sirius-hla-zygote.log'
+SCRIPT_PREFIX = 'sirius-hla-'
+
+# time clients have to send their request, the server being single threaded
+REQUEST_TIMEOUT = 2.0
+
+# packages and environment variables that, when changed, require the
+# server to be restarted
+FINGERPRINT_PACKAGES = ('siriushla', 'siriuspy', 'pydm', 'qtpy')
+FINGERPRINT_ENVARS = (
+    'PATH', 'PYTHONPATH', 'LD_LIBRARY_PATH', 'DISPLAY', 'EPICS_', 'SIRIUS',
+    'QT_', 'PYQTGRAPH')
+
+PRELOAD = (
+    'numpy', 'matplotlib', 'qtpy.QtCore', 'qtpy.QtGui', 'qtpy.QtWidgets',
+    'qtawesome', 'pydm', 'pydm.widgets', 'siriuspy.envars',
+    'siriuspy.namesys', 'siriuspy.search', 'siriushla.sirius_application',
+    'siriushla.widgets')
+
+
+def get_cmd_key(cmd):
+    """Return command as a tuple of strings, used to identify it."""
+    if isinstance(cmd, str):
+        cmd = _shlex.split(cmd)
+    return tuple(str(arg) for arg in cmd)
+
+
+def get_runtime_dir():
+    """Return directory private to the user for the socket, or ''.
+
+    It is XDG_RUNTIME_DIR or, if it is not set, a directory created in the
+    temporary directory with mode 0700. '' is returned if the directory is
+    not owned by the user or other users have access to it.
+    """
+    path = _os.environ.get('XDG_RUNTIME_DIR', '')
+    if not path or not _os.path.isdir(path):
+        path = _os.path.join(
+            _tempfile.gettempdir(), 'sirius-hla-{}'.format(_os.getuid()))
+        try:
+            _os.makedirs(path, mode=0o700, exist_ok=True)
+        except OSError:
+            return ''
+    stat = _os.stat(path)
+    if stat.st_uid != _os.getuid() or stat.st_mode & 0o077:
+        _log.warning('zygote: {} is not private'.format(path))
+        return ''
+    return path
+
+
+def get_socket_path():
+    """Return path of the server socket, or '' if there is none."""
+    path = get_runtime_dir()
+    return _os.path.join(path, SOCKET_NAME) if path else ''
+
+
+def get_scripts_dirs():
+    """Return directories where sirius-hla scripts are installed."""
+    dirs = {_sysconfig.get_path('scripts'),
+            _os.path.dirname(_sys.executable)}
+    try:
+        dirs.add(_sysconfig.get_path(
+            'scripts', _os.name + '_user'))
+    except KeyError:
+        pass
+    return {_os.path.realpath(path) for path in dirs if path}
+
+
+def get_script_path(cmd):
+    """Return path of the sirius-hla script run by cmd, or '' if it is not.
+
+    Only python scripts named sirius-hla-* installed in the scripts
+    directories of the running interpreter are considered.
+    """
+    path = _shutil.which(get_cmd_key(cmd)[0])
+    if not path:
+        return ''
+    if not _os.path.basename(path).startswith(SCRIPT_PREFIX) or \
+            _os.path.realpath(_os.path.dirname(path)) \
+            not in get_scripts_dirs():
+        return ''
+    try:
+        with open(path, 'rb') as fil:
+            first_line = fil.readline()
+    except OSError:
+        return ''
+    return path if first_line.startswith(b'#!') and \
+        b'python' in first_line else ''
+
+
+def get_fingerprint():
+    """Return hash of the interpreter, packages and environment.
+
+    Packages are identified by the modification time of their directories,
+    which changes when they are installed again.
+    """
+    items = [_sys.executable, ]
+    for name in FINGERPRINT_PACKAGES:
+        try:
+            spec = _importlib_util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or not spec.origin:
+            items.append(name + ':')
+            continue
+        path = _os.path.dirname(spec.origin)
+        items.append('{}:{}:{}'.format(
+            name, path, _os.stat(path).st_mtime_ns))
+    items.extend(
+        '{}={}'.format(key, val) for key, val in sorted(_os.environ.items())
+        if key.startswith(FINGERPRINT_ENVARS))
+    return _hashlib.md5('\n'.join(items).encode()).hexdigest()
+
+
+def get_windows():
+    """Return dictionary of window ids by pid, listed by wmctrl."""
+    out = _subprocess.getoutput('wmctrl -lp')
+    windows = dict()
+    for line in out.split('\n'):
+        fields = line.split()
+        if len(fields) < 3 or not fields[2].isdigit():
+            continue
+        windows.setdefault(int(fields[2]), fields[0])
+    return windows
+
+
+class ZygoteServer:
+    """Fork applications on request of clients in a UNIX socket.
+
+    Requests and replies are JSON objects, one per connection. Requests
+    have an 'op' field:
+        - 'run': start 'cmd', a list of arguments, or raise its window if it
+          is running. The reply 'status' is 'started', 'raised', 'running'
+          (not shown yet) or 'refused' (cmd is not a sirius-hla script);
+        - 'find': reply 'pid' and 'window' of the running 'cmd', or 0 and '';
+        - 'list': reply 'apps', a list of [pid, cmd, start time], and
+          'fingerprint', the get_fingerprint of the server at start;
+        - 'stop': stop the server.
+    """
+
+    def __init__(self, path=None, preload=PRELOAD):
+        """Init."""
+        self._path = path or get_socket_path()
+        self._preload = preload
+        self._sock = None
+        self._conn = None
+        self._running = False
+        self._fingerprint = get_fingerprint()
+        # pid: (cmd key, start time)
+        self._apps = dict()
+
+    @property
+    def apps(self):
+        """Dictionary of (cmd key, start time) of running apps by pid."""
+        self._reap()
+        return dict(self._apps)
+
+    def preload(self):
+        """Import preloaded modules."""
+        t0 = _time.time()
+        for mod in self._preload:
+            try:
+                _importlib.import_module(mod)
+            except Exception as err:
+                _log.warning('zygote: could not preload {}: {}'.format(
+                    mod, err))
+        # applications started by the server do not run xrandr again
+        app_mod = _sys.modules.get('siriushla.sirius_application')
+        if app_mod is not None:
+            app_mod.set_scale_factor()
+        _log.info('zygote: preload took {:.3f} s'.format(_time.time() - t0))
+
+    def serve_forever(self):
+        """Preload modules and handle requests until stopped."""
+        if not self._path:
+            raise OSError('zygote: no private directory for the socket')
+        self.preload()
+        if _os.path.exists(self._path):
+            _os.unlink(self._path)
+        self._sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        # only the user can connect to the socket
+        umask = _os.umask(0o177)
+        try:
+            self._sock.bind(self._path)
+        finally:
+            _os.umask(umask)
+        _os.chmod(self._path, 0o600)
+        self._sock.listen(16)
+        self._running = True
+        try:
+            while self._running:
+                ready, _, _ = _select.select([self._sock], [], [], 1.0)
+                self._reap()
+                if ready:
+                    conn, _ = self._sock.accept()
+                    if self._is_same_user(conn):
+                        self._handle(conn)
+                    else:
+                        conn.close()
+        finally:
+            self._sock.close()
+            if _os.path.exists(self._path):
+                _os.unlink(self._path)
+
+    @staticmethod
+    def _is_same_user(conn):
+        if not hasattr(_socket, 'SO_PEERCRED'):
+            return True
+        fmt = '3i'
+        creds = conn.getsockopt(
+            _socket.SOL_SOCKET, _socket.SO_PEERCRED, _struct.calcsize(fmt))
+        _, uid, _ = _struct.unpack(fmt, creds)
+        return uid == _os.getuid()
+
+    def _handle(self, conn):
+        self._conn = conn
+        conn.settimeout(REQUEST_TIMEOUT)
+        with conn:
+            try:
+                request = _json.loads(_recv_all(conn))
+                reply = self._process(request)
+            except (ValueError, KeyError, OSError) as err:
+                reply = {'status': 'error', 'error': str(err)}
+            try:
+                conn.sendall(_json.dumps(reply).encode())
+            except OSError:
+                pass
+
+    def _process(self, request):
+        oper = request['op']
+        if oper == 'run':
+            return self._run(get_cmd_key(request['cmd']))
+        elif oper == 'find':
+            pid, window = self._find(get_cmd_key(request['cmd']))
+            return {'status': 'ok', 'pid': pid, 'window': window}
+        elif oper == 'list':
+            return {'status': 'ok', 'fingerprint': self._fingerprint,
+                    'apps': [[pid, list(key), tstamp]
+                             for pid, (key, tstamp) in self.apps.items()]}
+        elif oper == 'stop':
+            self._running = False
+            return {'status': 'ok'}
+        raise ValueError('unknown operation {}'.format(oper))
+
+    def _find(self, key):
+        self._reap()
+        pids = [pid for pid, (k, _) in self._apps.items() if k == key]
+        if not pids:
+            return 0, ''
+        windows = get_windows()
+        for pid in pids:
+            if pid in windows:
+                return pid, windows[pid]
+        return pids[0], ''
+
+    def _run(self, key):
+        pid, window = self._find(key)
+        if window:
+            _subprocess.run(['wmctrl', '-iR', window])
+            return {'status': 'raised', 'pid': pid}
+        elif pid:
+            return {'status': 'running', 'pid': pid}
+        path = get_script_path(key)
+        if not path:
+            return {'status': 'refused'}
+
+        pid = _os.fork()
+        if pid:
+            self._apps[pid] = (key, _time.time())
+            _log.info('zygote: started {} with pid {}'.format(
+                ' '.join(key), pid))
+            return {'status': 'started', 'pid': pid}
+        self._exec_child(path, key)
+
+    def _exec_child(self, path, key):
+        code = 0
+        try:
+            # the client waits for the connection to be closed
+            self._conn.close()
+            self._sock.close()
+            _os.setsid()
+            _sys.argv = [path, ] + list(key[1:])
+            _runpy.run_path(path, run_name='__main__')
+        except SystemExit as err:
+            code = err.code if isinstance(err.code, int) else \
+                int(err.code is not None)
+        except BaseException:
+            _log.exception('zygote: {} failed'.format(' '.join(key)))
+            code = 1
+        finally:
+            _os._exit(code)
+
+    def _reap(self):
+        while self._apps:
+            try:
+                pid, _ = _os.waitpid(-1, _os.WNOHANG)
+            except ChildProcessError:
+                self._apps.clear()
+                break
+            if not pid:
+                break
+            self._apps.pop(pid, None)
+
+
+def _recv_all(conn):
+    data = b''
+    while True:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data.decode()
+
+
+def request(data, path=None, timeout=2.0):
+    """Send request to the server and return its reply.
+
+    Return None if the server is not running. path defaults to
+    get_socket_path().
+    """
+    path = path or get_socket_path()
+    if not path:
+        return None
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        sock.sendall(_json.dumps(data).encode())
+        sock.shutdown(_socket.SHUT_WR)
+        return _json.loads(_recv_all(sock))
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+def is_running(path=None):
+    """Return whether the server is running."""
+    return request({'op': 'list'}, path=path) is not None
+
+
+def run(cmd, path=None):
+    """Start cmd in the server, or raise its window if it is running.
+
+    Return the reply status, or None if cmd could not be handled by the
+    server and must be started in a new process.
+    """
+    reply = request({'op': 'run', 'cmd': list(get_cmd_key(cmd))}, path=path)
+    if reply is None or reply['status'] in ('refused', 'error'):
+        return None
+    return reply['status']
+
+
+def find_window(cmd, path=None):
+    """Return (pid, window id) of cmd started by the server.
+
+    Return (0, '') if it is not running or the server is not running.
+    """
+    reply = request({'op': 'find', 'cmd': list(get_cmd_key(cmd))}, path=path)
+    if reply is None or reply['status'] != 'ok':
+        return 0, ''
+    return reply['pid'], reply['window']
+
+
+def start_server(path=None):
+    """Start the server in a detached process, if it is not running.
+
+    A running server is restarted if the packages or the environment
+    changed since it started.
+    """
+    path = path or get_socket_path()
+    if not path:
+        return
+    reply = request({'op': 'list'}, path=path)
+    if reply is not None:
+        if reply.get('fingerprint') == get_fingerprint():
+            return
+        # packages or environment changed since the server started
+        _log.info('zygote: restarting server')
+        request({'op': 'stop'}, path=path)
+        for _ in range(50):
+            if not _os.path.exists(path):
+                break
+            _time.sleep(0.1)
+    # the output of the server and of the applications it starts is
+    # appended to a log file next to the socket
+    logpath = _os.path.join(_os.path.dirname(path), LOG_NAME)
+    with open(logpath, 'ab') as logfile:
+        _subprocess.Popen(
+            [_sys.executable, '-m', 'siriushla.zygote', path],
+            stdin=_subprocess.DEVNULL, stdout=logfile, stderr=logfile,
+            start_new_session=True)
+
+
+if __name__ == '__main__':
+    # logging is configured by sirius_application when it is preloaded
+    ZygoteServer(*_sys.argv[1:2]).serve_forever()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks
+    Benchmarks of the widgets optimized for large windows. Each benchmark
+    compares the former implementation, reproduced here, with the current
+    one, and prints the best time of each.
+
+    Usage:
+        benchmarks.py                   run all benchmarks
+        benchmarks.py NAME [ARGS...]    run benchmark NAME, with integer
+                                        arguments of its function
+
+    Benchmarks:
+        log_label     bursts of messages in PyDMLogLabel
+        qled          repaint of a grid of QLed
+        led_matrix    build and repaint of a SiriusLedMatrix
+        zoom          zoom in and out of a SiriusMainWindow
+        stylesheets   build of PSTabControlWindow and of timing lists
+
+    Run with QT_QPA_PLATFORM=offscreen to benchmark without a display.
+"""
+
+import os
+import sys
+import time
+from contextlib import ExitStack
+from unittest import mock
+
+os.environ.setdefault('PYDM_DEFAULT_PROTOCOL', 'ca')
+
+from qtpy.QtCore import QByteArray, QRectF
+from qtpy.QtGui import QPainter
+from qtpy.QtSvg import QSvgRenderer
+from qtpy.QtWidgets import QApplication, QWidget, QLabel, QPushButton, \
+    QHBoxLayout, QVBoxLayout, QGridLayout, QDoubleSpinBox, QStyleOption, \
+    QListWidget, QListWidgetItem
+import pyqtgraph as pg
+
+from siriuspy.namesys import SiriusPVName as _PVName, Filter
+from siriuspy.search import PSSearch, HLTimeSearch, LLTimeSearch
+from siriushla.util import set_style
+from siriushla.widgets import SiriusMainWindow, SiriusLedAlert, \
+    SiriusLedMatrix
+from siriushla.widgets.QLed import QLed
+from siriushla.widgets.log_label import PyDMLogLabel
+from siriushla.as_ps_control import PSTabControlWindow
+from siriushla.as_ps_control.control_widget.BasePSControlWidget import \
+    PSContainerList
+from siriushla.as_ti_control.hl_trigger import HLTriggerList
+from siriushla.as_ti_control.low_level_devices import EventList, OTPList
+
+
+def best_time(func, repeat=3, setup=None, teardown=None):
+    """Return best time, in seconds, of repeat calls of func.
+
+    setup is called before each call and its result is passed to func.
+    teardown is called after each call with the result of setup or, if
+    there is no setup, of func. Neither is timed.
+    """
+    elapsed = list()
+    for _ in range(repeat):
+        args = () if setup is None else (setup(), )
+        t0 = time.perf_counter()
+        result = func(*args)
+        elapsed.append(time.perf_counter() - t0)
+        if teardown is not None:
+            teardown(*(args or (result, )))
+    return min(elapsed)
+
+
+def report(name, elapsed, count=None, unit=''):
+    """Print elapsed time and, if count is given, time per unit."""
+    line = '{:<32s} {:10.4f} s'.format(name, elapsed)
+    if count:
+        line += ' {:10.2f} us/{}'.format(1e6*elapsed/count, unit)
+    print(line)
+
+
+def close(window):
+    """Close and delete window."""
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+
+# --- log_label ---
+
+class ListWidgetLog(QListWidget):
+    """Log adding one item per message, as formerly done."""
+
+    def __init__(self, buffer_size):
+        super().__init__()
+        self._buffer_size = buffer_size
+
+    def value_changed(self, value):
+        if self.count() > self._buffer_size:
+            self.clear()
+        self.addItem(QListWidgetItem(value))
+        self.scrollToBottom()
+
+
+def create_model_log(buffer_size):
+    log = PyDMLogLabel()
+    log.bufferSize = buffer_size
+    log.prependDateTime = False
+    return log
+
+
+def bench_log_label(app, nr_msgs=500, repeat=10, buffer_size=1000):
+    """Receive bursts of messages in a QListWidget, adding one item and
+    scrolling to the bottom per message, as formerly done, and in the
+    PyDMLogLabel ring buffer model, which inserts messages in batches."""
+    print('messages per burst: {}, buffer size: {}'.format(
+        nr_msgs, buffer_size))
+
+    def burst(log):
+        for i in range(nr_msgs):
+            log.value_changed('message number {}'.format(i))
+        app.processEvents()
+        log.repaint()
+
+    for name, create in (('QListWidget item per message', ListWidgetLog),
+                         ('ring buffer model', create_model_log)):
+        log = create(buffer_size)
+        log.show()
+        app.processEvents()
+        report(name, best_time(lambda: burst(log), repeat), nr_msgs,
+               'message')
+        close(log)
+
+
+# --- qled ---
+
+class SvgLed(QLed):
+    """QLed rendering the svg on each paint, as formerly done."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.renderer = QSvgRenderer()
+
+    def paintEvent(self, event):
+        self.style().unpolish(self)
+        self.style().polish(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        h = option.rect.height()
+        w = option.rect.width()
+        size = min(w, h)
+        bounds = QRectF(abs(size-w)/2.0, abs(size-h)/2.0, size, size)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        ind = self.m_state % len(self.m_stateColors)
+        dark = self.getRGBfromQColor(self.m_stateColors[ind])
+        sel1 = self.getRGBfromQColor(self.NotSelColor1)
+        sel2 = self.getRGBfromQColor(self.NotSelColor2)
+        shape_bytes = bytes(self.shapesdict[self.m_shape] % (
+            "rgb(%d,%d,%d)" % sel1, '0.145', "rgb(%d,%d,%d)" % sel2,
+            "rgb(%d,%d,%d)" % dark, "rgb(%d,%d,%d)" % self.adjust(*dark)),
+            'utf-8')
+        self.renderer.load(QByteArray(shape_bytes))
+        self.renderer.render(painter, bounds)
+
+
+def bench_qled(app, nr_leds=5000, nr_cols=100, repeat=5):
+    """Repaint a grid of leds rendering the svg on each paint, as formerly
+    done, and painting cached pixmaps."""
+    print('leds: {}'.format(nr_leds))
+    for name, cls in (('svg per paint', SvgLed), ('cached pixmap', QLed)):
+        window = QWidget()
+        lay = QGridLayout(window)
+        leds = list()
+        for i in range(nr_leds):
+            led = cls(window)
+            led.setFixedSize(18, 18)
+            lay.addWidget(led, i // nr_cols, i % nr_cols)
+            leds.append(led)
+        window.show()
+        app.processEvents()
+
+        def repaint():
+            for led in leds:
+                led.toggleValue()
+            window.repaint()
+
+        report(name, best_time(repaint, repeat), nr_leds, 'led')
+        close(window)
+
+
+# --- led_matrix ---
+
+def build_led_widgets(nr_leds, nr_cols):
+    window = QWidget()
+    grid = QGridLayout(window)
+    grid.setSpacing(6)
+    leds = list()
+    for i in range(nr_leds):
+        led = SiriusLedAlert(window)
+        led.setFixedSize(18, 18)
+        grid.addWidget(led, i // nr_cols, i % nr_cols)
+        leds.append(led)
+
+    def update(value):
+        for led in leds:
+            led.setState(value)
+    return window, update
+
+
+def build_led_matrix(nr_leds, nr_cols):
+    window = QWidget()
+    matrix = SiriusLedMatrix(window)
+    QVBoxLayout(window).addWidget(matrix)
+    for i in range(nr_leds):
+        matrix.add_led(i // nr_cols, i % nr_cols, '')
+        matrix.set_connected(i, True)
+
+    def update(value):
+        for i in range(nr_leds):
+            matrix.set_value(i, value)
+    return window, update
+
+
+def bench_led_matrix(app, nr_leds=3000, nr_cols=50, repeat=3):
+    """Build, show and repaint a monitor of leds made of one SiriusLedAlert
+    per led in a grid layout, as formerly done, and of a single
+    SiriusLedMatrix."""
+    print('leds: {}'.format(nr_leds))
+    for name, build in (('one widget per led', build_led_widgets),
+                        ('SiriusLedMatrix', build_led_matrix)):
+        def build_show():
+            window, update = build(nr_leds, nr_cols)
+            window.show()
+            app.processEvents()
+            return window, update
+
+        def repaint(built):
+            window, update = built
+            for value in (1, 0):
+                update(value)
+                window.repaint()
+
+        report(name + ' build+show', best_time(
+            build_show, repeat, teardown=lambda built: close(built[0])))
+        report(name + ' repaint', best_time(
+            repaint, repeat, setup=build_show,
+            teardown=lambda built: close(built[0]))/2)
+
+
+# --- zoom ---
+
+def change_font_per_widget(window, fontsize):
+    """Set font size of each widget and plot label, as formerly done."""
+    font = window.app.font()
+    font.setPointSize(fontsize)
+    window.app.setFont(font)
+    window.ensurePolished()
+    for w in window.findChildren(QWidget):
+        font = w.font()
+        font.setPointSize(fontsize)
+        w.setFont(font)
+    window.adjustSize()
+    fontsize_str = str(fontsize)+'pt'
+    for w in window.findChildren(pg.PlotWidget):
+        for ax in w.getPlotItem().axes.values():
+            sty = ax['item'].labelStyle
+            sty['font-size'] = fontsize_str
+            ax['item'].setLabel(text=None, **sty)
+        wtitle = w.plotItem.titleLabel
+        wtitle.opts['size'] = fontsize_str
+        wtitle.setText(text=wtitle.text, **wtitle.opts)
+    for w in window.findChildren(pg.GraphicsLayoutWidget):
+        for axis in (w.xaxis, w.yaxis):
+            sty = axis.labelStyle
+            sty['font-size'] = fontsize_str
+            axis.setLabel(text=None, **sty)
+
+
+def build_zoom_window(nr_rows, nr_cols, nr_plots):
+    window = SiriusMainWindow()
+    cwid = QWidget(window)
+    vbl = QVBoxLayout(cwid)
+    hbl = QHBoxLayout()
+    for i in range(nr_plots):
+        plot = pg.PlotWidget(cwid, title='plot {}'.format(i))
+        plot.setLabel('left', 'y')
+        plot.setLabel('bottom', 'x')
+        hbl.addWidget(plot)
+    vbl.addLayout(hbl)
+    for _ in range(nr_rows):
+        row = QWidget(cwid)
+        rhbl = QHBoxLayout(row)
+        rhbl.addWidget(QPushButton('button', row))
+        for col in range(nr_cols):
+            wid = QLabel('label', row) if col % 2 else QDoubleSpinBox(row)
+            rhbl.addWidget(wid)
+        vbl.addWidget(row)
+    window.setCentralWidget(cwid)
+    return window
+
+
+def bench_zoom(app, nr_rows=300, nr_cols=12, nr_plots=4, repeat=3):
+    """Zoom in and out a window with a large list of widgets and a few
+    plots setting the font of each widget, as formerly done, and with
+    SiriusMainWindow.changeFontSize, which sets the font of the window in
+    a single pass."""
+    fontsize = app.font().pointSize()
+    nr_widgets = nr_rows * (nr_cols + 2)
+    print('widgets: {}, plots: {}'.format(nr_widgets, nr_plots))
+    for name, zoom in (('setFont per widget', change_font_per_widget),
+                       ('changeFontSize', SiriusMainWindow.changeFontSize)):
+        def show():
+            window = build_zoom_window(nr_rows, nr_cols, nr_plots)
+            window.show()
+            app.processEvents()
+            return window
+
+        def zoom_in_out(window):
+            for size in (fontsize + 1, fontsize):
+                zoom(window, size)
+                app.processEvents()
+
+        elapsed = best_time(zoom_in_out, repeat, setup=show, teardown=close)
+        report(name, elapsed/2, nr_widgets, 'widget')
+
+
+# --- stylesheets ---
+
+DCLINK = 'PA-RaPSA01:PS-DCLink-SI1'
+PS_DEVICES = {
+    'si-dipole-b1b2-fam': ('B1B2-1', 'B1B2-2'),
+    'si-quadrupole-q14-fam': ('Q1', 'Q2', 'Q3', 'Q4'),
+    'si-quadrupole-q30-fam': (
+        'QFA', 'QFB', 'QFP', 'QDA', 'QDB1', 'QDB2', 'QDP1', 'QDP2'),
+    'si-sextupole-s15-fam': tuple(
+        'S' + plane + sub + str(idx) for sub in 'ABP'
+        for plane, nr_idcs in (('D', 4), ('F', 3)) for idx in range(nr_idcs)),
+}
+
+
+def get_fake_psnames():
+    psnames = dict()
+    for pstype, devs in PS_DEVICES.items():
+        for dev in devs:
+            psnames[_PVName('SI-Fam:PS-' + dev)] = (pstype, 'FBP')
+    psnames[_PVName(DCLINK)] = ('as-dclink-fbp', 'FBP_DCLink')
+    return psnames
+
+
+def patch_search(psnames):
+    """Serve power supply and timing names from psnames, a fake database,
+    so that no connection to the naming servers is needed."""
+    def get_psnames(filters=None):
+        return sorted(Filter.process_filters(list(psnames), filters))
+
+    patches = (
+        mock.patch.multiple(
+            PSSearch,
+            get_psnames=get_psnames,
+            conv_psname_2_pstype=lambda name: psnames[name][0],
+            conv_psname_2_psmodel=lambda name: psnames[name][1],
+            conv_psname_2_bbbname=lambda name: 'IA-01RaCtrl:CO-PSCtrl-SI1',
+            conv_psname_2_udc=lambda name: 'PA-RaPSA01:PS-UDC-SI1',
+            conv_psname_2_dclink=lambda name: [DCLINK]),
+        mock.patch.multiple(
+            HLTimeSearch,
+            has_delay_type=lambda name: True,
+            get_hl_from_ll_triggers=lambda name: 'SI-Glob:TI-Mags'),
+        mock.patch.multiple(
+            LLTimeSearch,
+            get_channel_internal_trigger_pvname=_PVName,
+            get_channel_output_port_pvname=_PVName),
+    )
+    stack = ExitStack()
+    for patch in patches:
+        stack.enter_context(patch)
+    return stack
+
+
+def build_timing_lists(nr_rows):
+    window = SiriusMainWindow()
+    cwid = QWidget(window)
+    vbl = QVBoxLayout(cwid)
+    vbl.addWidget(HLTriggerList(
+        parent=cwid, prefix='', obj_names=[
+            'SI-{:02d}M1:TI-Trig{}'.format(i % 20 + 1, i)
+            for i in range(nr_rows)]))
+    vbl.addWidget(EventList(
+        parent=cwid, prefix='AS-RaMO:TI-EVG:', obj_names=[
+            'Evt{:02d}'.format(i) for i in range(nr_rows//4)]))
+    vbl.addWidget(OTPList(
+        parent=cwid, prefix='', obj_names=[
+            'SI-{:02d}SA:TI-AMCFPGAEVR:OTP{:02d}'.format(i % 20 + 1, i % 24)
+            for i in range(nr_rows)]))
+    window.setCentralWidget(cwid)
+    return window
+
+
+def scroll_ps_lists(window):
+    for table in window.findChildren(PSContainerList):
+        table.scrollToBottom()
+    return window
+
+
+def bench_stylesheets(app, nr_rows=200):
+    """Build and show the storage ring PSTabControlWindow and a window with
+    the timing lists, each with the other windows still open, and count
+    how many times the application stylesheet is set meanwhile."""
+    nr_sets = [0]
+    set_style_sheet = app.setStyleSheet
+
+    def count_sets(sheet):
+        nr_sets[0] += 1
+        set_style_sheet(sheet)
+
+    app.setStyleSheet = count_sets
+    windows = list()
+    cases = (
+        ('PSTabControlWindow SI', lambda: PSTabControlWindow('SI')),
+        ('timing lists', lambda: build_timing_lists(nr_rows)),
+        ('scroll PS lists', lambda: scroll_ps_lists(windows[0])),
+        ('PSTabControlWindow SI again', lambda: PSTabControlWindow('SI')),
+    )
+    try:
+        with patch_search(get_fake_psnames()):
+            for name, build in cases:
+                nr_sets[0] = 0
+                t0 = time.perf_counter()
+                window = build()
+                window.show()
+                app.processEvents()
+                elapsed = time.perf_counter() - t0
+                if window not in windows:
+                    windows.append(window)
+                report(name, elapsed, len(window.findChildren(QWidget)),
+                       'widget')
+                print('{:<32s} {:10d}'.format(
+                    '  application sheet sets', nr_sets[0]))
+    finally:
+        app.setStyleSheet = set_style_sheet
+        for window in windows:
+            close(window)
+
+
+BENCHMARKS = {
+    'log_label': bench_log_label,
+    'qled': bench_qled,
+    'led_matrix': bench_led_matrix,
+    'zoom': bench_zoom,
+    'stylesheets': bench_stylesheets,
+}
+
+
+def main(args):
+    app = QApplication.instance() or QApplication(sys.argv)
+    set_style(app)
+    if args:
+        names, bench_args = args[:1], [int(arg) for arg in args[1:]]
+    else:
+        names, bench_args = list(BENCHMARKS), []
+    for name in names:
+        print('--- {} ---'.format(name))
+        BENCHMARKS[name](app, *bench_args)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
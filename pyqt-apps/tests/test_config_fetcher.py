@@ -0,0 +1,218 @@
+"""Test configuration database fetcher."""
+import time
+import unittest
+from unittest import mock
+from threading import Event
+
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication
+
+from siriuspy.clientconfigdb import ConfigDBException
+from siriushla.as_ap_configdb.models import ConfigDBFetcher, LRUCache, \
+    ConfigDbTableModel
+from siriushla.as_ap_configdb.client_configdb import JsonTreeModel
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test LRUCache."""
+
+    def setUp(self):
+        """Set test object."""
+        self.cache = LRUCache(maxsize=3)
+        for key in 'abc':
+            self.cache.put(key, key.upper())
+
+    def test_get(self):
+        """Test get."""
+        self.assertEqual(len(self.cache), 3)
+        self.assertIn('a', self.cache)
+        self.assertEqual(self.cache.get('b'), 'B')
+        self.assertIsNone(self.cache.get('d'))
+        self.assertEqual(self.cache.get('d', 0), 0)
+
+    def test_drop_least_recently_used(self):
+        """Test the least recently used entry is dropped when full."""
+        self.cache.get('a')
+        self.cache.put('d', 'D')
+        self.assertEqual(len(self.cache), 3)
+        self.assertNotIn('b', self.cache)
+        for key in 'acd':
+            self.assertIn(key, self.cache)
+
+    def test_put_existing(self):
+        """Test putting existing key updates it without dropping others."""
+        self.cache.put('a', 'A2')
+        self.cache.put('d', 'D')
+        self.assertEqual(self.cache.get('a'), 'A2')
+        self.assertNotIn('b', self.cache)
+
+    def test_clear(self):
+        """Test clear."""
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertNotIn('a', self.cache)
+
+
+class TestConfigDBFetcher(unittest.TestCase):
+    """Test ConfigDBFetcher."""
+
+    TIMEOUT = 5
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application to deliver results."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        # DB Connection Mock
+        self.db = mock.Mock()
+        self.db.get_config_info.side_effect = \
+            lambda name, **kws: {'name': name, 'modified': [1.0]}
+        self.db.get_config_value.side_effect = \
+            lambda name, **kws: {'pvs': [name]}
+        self.fetcher = ConfigDBFetcher(self.db)
+        self.fetched = list()
+        self.failed = list()
+        self.fetcher.fetched.connect(
+            lambda *args: self.fetched.append(args))
+        self.fetcher.failed.connect(
+            lambda *args: self.failed.append(args))
+
+    def tearDown(self):
+        """Stop fetcher workers."""
+        self.fetcher.shutdown()
+
+    def _wait(self, nr_results=1):
+        t0 = time.time()
+        while len(self.fetched) + len(self.failed) < nr_results:
+            self.assertLess(time.time() - t0, self.TIMEOUT)
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.app.processEvents()
+
+    def test_get_configs(self):
+        """Test configurations are fetched with their values."""
+        req_id = self.fetcher.get_configs('ch', [('t', 'c1'), ('t', 'c2')])
+        self._wait()
+        self.assertEqual(len(self.fetched), 1)
+        channel, rid, configs = self.fetched[0]
+        self.assertEqual((channel, rid), ('ch', req_id))
+        self.assertEqual([c['value'] for c in configs],
+                         [{'pvs': ['c1']}, {'pvs': ['c2']}])
+
+    def test_values_cached(self):
+        """Test values are fetched again only if modified."""
+        for nr_results in (1, 2):
+            self.fetcher.get_configs('ch', [('t', 'c1')])
+            self._wait(nr_results)
+        self.assertEqual(self.db.get_config_info.call_count, 2)
+        self.assertEqual(self.db.get_config_value.call_count, 1)
+
+        self.db.get_config_info.side_effect = \
+            lambda name, **kws: {'name': name, 'modified': [1.0, 2.0]}
+        self.fetcher.get_configs('ch', [('t', 'c1')])
+        self._wait(3)
+        self.assertEqual(self.db.get_config_value.call_count, 2)
+
+    def test_discarded_not_shared(self):
+        """Test discarded configurations are cached apart."""
+        self.fetcher.get_configs('ch', [('t', 'c1')])
+        self._wait()
+        self.fetcher.get_configs('ch', [('t', 'c1')], discarded=True)
+        self._wait(2)
+        self.assertEqual(self.db.get_config_value.call_count, 2)
+
+    def test_server_error(self):
+        """Test configurations not found are replaced by server code."""
+        def get_info(name, **kws):
+            if name == 'c2':
+                raise ConfigDBException({'code': 404, 'message': 'None'})
+            return {'name': name, 'modified': [1.0]}
+
+        self.db.get_config_info.side_effect = get_info
+        self.fetcher.get_configs('ch', [('t', 'c1'), ('t', 'c2')])
+        self._wait()
+        configs = self.fetched[0][2]
+        self.assertEqual(configs[0]['name'], 'c1')
+        self.assertEqual(configs[1], 404)
+
+    def test_failed(self):
+        """Test any exception is delivered by failed."""
+        for err in (ConfigDBException({'code': 500, 'message': 'Error'}),
+                    ConnectionError('refused')):
+            self.db.find_configs.side_effect = err
+            self.failed.clear()
+            req_id = self.fetcher.find_configs('ch', 't')
+            self._wait()
+            self.assertEqual(self.failed, [('ch', req_id, err)])
+        self.assertEqual(self.fetched, [])
+
+    def test_superseded_request(self):
+        """Test only the last request of a channel is delivered."""
+        release = Event()
+
+        def find_configs(config_type, **kws):
+            if config_type == 'old':
+                release.wait(self.TIMEOUT)
+            return [config_type]
+
+        self.db.find_configs.side_effect = find_configs
+        self.fetcher.find_configs('ch', 'old')
+        req_id = self.fetcher.find_configs('ch', 'new')
+        self._wait()
+        release.set()
+        time.sleep(0.05)
+        self.app.processEvents()
+        self.assertEqual(self.fetched, [('ch', req_id, ['new'])])
+
+    def test_cancel(self):
+        """Test result of cancelled request is dropped."""
+        release = Event()
+        self.db.find_configs.side_effect = \
+            lambda **kws: release.wait(self.TIMEOUT) and []
+        self.fetcher.find_configs('ch', 't')
+        self.fetcher.cancel('ch')
+        release.set()
+        time.sleep(0.05)
+        self.app.processEvents()
+        self.assertEqual(self.fetched, [])
+        self.assertEqual(self.failed, [])
+
+
+class TestModelFetcher(unittest.TestCase):
+    """Test fetchers created by the configuration models."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application to delete models."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Patch fetcher shutdown."""
+        self.db = mock.Mock()
+        self.db.find_configs.return_value = []
+        patcher = mock.patch.object(ConfigDBFetcher, 'shutdown')
+        self.shutdown = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _delete(self, model):
+        model.deleteLater()
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def test_own_fetcher(self):
+        """Test fetcher created by a model is shut down with it."""
+        for cls, args in ((ConfigDbTableModel, ('t', self.db)),
+                          (JsonTreeModel, ('t', 'c1', self.db))):
+            self.shutdown.reset_mock()
+            model = cls(*args)
+            self.assertIs(model._fetcher.parent(), model)
+            self._delete(model)
+            self.shutdown.assert_called_once()
+
+    def test_shared_fetcher(self):
+        """Test fetcher given to a model is not shut down with it."""
+        fetcher = ConfigDBFetcher(self.db)
+        self._delete(ConfigDbTableModel('t', self.db, fetcher=fetcher))
+        self._delete(JsonTreeModel('t', 'c1', self.db, fetcher=fetcher))
+        self.shutdown.assert_not_called()
@@ -0,0 +1,109 @@
+"""Test device executor."""
+import time
+import unittest
+from threading import Barrier, Lock
+
+from siriushla.common.epics.task import DeviceExecutor
+
+
+class TestDeviceExecutor(unittest.TestCase):
+    """Test DeviceExecutor."""
+
+    DEVICES = ('D1', 'D2', 'D3', 'D4')
+
+    def setUp(self):
+        """Set test object."""
+        self.quit = False
+        self.executor = DeviceExecutor(
+            'test', max_workers=4, quit_func=lambda: self.quit)
+
+    def test_run(self):
+        """Test run yields the result of every device."""
+        results = dict(self.executor.run('set', str.lower, self.DEVICES))
+        self.assertEqual(results, {dev: dev.lower() for dev in self.DEVICES})
+
+    def test_run_concurrently(self):
+        """Test devices are handled concurrently."""
+        barrier = Barrier(len(self.DEVICES), timeout=5)
+        results = dict(self.executor.run(
+            'set', lambda dev: barrier.wait() is not None, self.DEVICES))
+        self.assertTrue(all(results.values()))
+
+    def test_max_workers(self):
+        """Test at most max_workers devices are handled at a time."""
+        executor = DeviceExecutor(max_workers=2)
+        lock = Lock()
+        running = [0, 0]
+
+        def func(dev):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        list(executor.run('set', func, self.DEVICES))
+        self.assertEqual(running[1], 2)
+
+    def test_run_error(self):
+        """Test exceptions of func are raised by run."""
+        def func(dev):
+            raise ValueError(dev)
+
+        with self.assertRaises(ValueError):
+            list(self.executor.run('set', func, self.DEVICES))
+        self.assertEqual(len(self.executor.timings), 1)
+
+    def test_run_quit(self):
+        """Test pending devices are abandoned when quit_func is True."""
+        executor = DeviceExecutor(max_workers=1, quit_func=lambda: True)
+        results = list(executor.run('set', str.lower, self.DEVICES))
+        self.assertEqual(len(results), 1)
+
+    def test_timings(self):
+        """Test duration of each phase is kept."""
+        list(self.executor.run('create', str.lower, self.DEVICES))
+        list(self.executor.run('set', str.lower, []))
+        timings = self.executor.timings
+        self.assertEqual([t[:2] for t in timings], [('create', 4), ('set', 0)])
+        self.assertTrue(all(t[2] >= 0 for t in timings))
+
+    def test_poll(self):
+        """Test devices are polled until they succeed."""
+        calls = {dev: 0 for dev in self.DEVICES}
+        lock = Lock()
+
+        def func(dev):
+            with lock:
+                calls[dev] += 1
+            return calls[dev] > int(dev[1])
+
+        results = list(self.executor.poll(
+            'check', func, self.DEVICES, timeout=5, interval=0.01))
+        self.assertEqual(
+            sorted(results), [(dev, True) for dev in self.DEVICES])
+        self.assertEqual(calls, {dev: int(dev[1]) + 1 for dev in calls})
+
+    def test_poll_timeout(self):
+        """Test devices that do not succeed are yielded at the end."""
+        results = list(self.executor.poll(
+            'check', lambda dev: dev == 'D1', self.DEVICES, timeout=0.1,
+            interval=0.01))
+        self.assertEqual(results[0], ('D1', True))
+        self.assertEqual(
+            sorted(results[1:]), [(dev, False) for dev in self.DEVICES[1:]])
+        self.assertEqual(self.executor.timings[0][:2], ('check', 4))
+
+    def test_poll_quit(self):
+        """Test polling stops when quit_func is True."""
+        def func(dev):
+            self.quit = True
+            return dev == 'D1'
+
+        t0 = time.time()
+        results = dict(self.executor.poll(
+            'check', func, self.DEVICES, timeout=5, interval=0.01))
+        self.assertLess(time.time() - t0, 1)
+        self.assertEqual(results, {
+            dev: dev == 'D1' for dev in self.DEVICES})
@@ -0,0 +1,196 @@
+"""Test EPICS convergence watcher."""
+import time
+import unittest
+from threading import Timer
+
+from siriushla.common.epics.task import EpicsConvergenceWatcher, \
+    get_readback_name
+
+
+class FakeEpics:
+    """Fake epics wrapper with monitors, backed by class dictionaries."""
+
+    values = dict()
+    connected = dict()
+    objs = dict()
+
+    def __init__(self, pvname):
+        self.pvname = pvname
+        self._callbacks = dict()
+
+    @classmethod
+    def set_value(cls, pvname, value):
+        cls.values[pvname] = value
+        for obj in cls.objs.get(pvname, ()):
+            for callback in list(obj._callbacks.values()):
+                callback(value=value)
+
+    def wait_for_connection(self, wait):
+        return self.connected.get(self.pvname, True)
+
+    def get(self, wait=0):
+        return self.values.get(self.pvname)
+
+    def add_callback(self, callback):
+        self.objs.setdefault(self.pvname, list()).append(self)
+        index = len(self._callbacks) + 1
+        self._callbacks[index] = callback
+        return index
+
+    def remove_callback(self, index):
+        del self._callbacks[index]
+
+
+class PolledEpics(FakeEpics):
+    """Fake epics wrapper without monitors."""
+
+    def __getattribute__(self, name):
+        if name == 'add_callback':
+            raise AttributeError(name)
+        return super().__getattribute__(name)
+
+
+class TestEpicsConvergenceWatcher(unittest.TestCase):
+    """Test EpicsConvergenceWatcher."""
+
+    cls_epics = FakeEpics
+
+    def setUp(self):
+        """Reset fake PVs."""
+        FakeEpics.values = {'A-SP': 1.0, 'A-RB': 0.0, 'B-Sel': 1, 'B-Sts': 0}
+        FakeEpics.connected = dict()
+        FakeEpics.objs = dict()
+        self.timers = list()
+
+    def tearDown(self):
+        """Stop timers."""
+        for timer in self.timers:
+            timer.cancel()
+
+    def _later(self, delay, pvname, value):
+        timer = Timer(delay, FakeEpics.set_value, (pvname, value))
+        timer.daemon = True
+        self.timers.append(timer)
+        timer.start()
+
+    def _watch(self, pvs=('A-SP', 'B-Sel'), values=(1.0, 1), **kwargs):
+        kwargs.setdefault(
+            'readbacks', [get_readback_name(pvn) for pvn in pvs])
+        watcher = EpicsConvergenceWatcher(
+            list(pvs), list(values), [0]*len(pvs), cls_epics=self.cls_epics,
+            **kwargs)
+        checked = list()
+        watcher.itemChecked.connect(
+            lambda pvn, status: checked.append((pvn, status)))
+        t0 = time.time()
+        watcher.run()
+        return watcher, dict(checked), time.time() - t0
+
+    def test_converged(self):
+        """Test readbacks already at their values."""
+        FakeEpics.values.update({'A-RB': 1.0, 'B-Sts': 1})
+        watcher, checked, elapsed = self._watch()
+        self.assertEqual(checked, {'A-SP': True, 'B-Sel': True})
+        self.assertEqual(set(watcher.settling_times), {'A-SP', 'B-Sel'})
+        self.assertLess(elapsed, 1)
+
+    def test_converge_later(self):
+        """Test readbacks are checked as soon as they converge."""
+        self._later(0.1, 'A-RB', 1.0)
+        self._later(0.2, 'B-Sts', 1)
+        watcher, checked, elapsed = self._watch(settle_timeout=2)
+        self.assertEqual(checked, {'A-SP': True, 'B-Sel': True})
+        times = watcher.settling_times
+        self.assertGreaterEqual(times['B-Sel'], 0.15)
+        self.assertLess(times['A-SP'], times['B-Sel'])
+        self.assertLess(elapsed, 1.5)
+
+    def test_tolerance(self):
+        """Test readbacks within tolerance converge."""
+        FakeEpics.values.update({'A-RB': 1.05})
+        _, checked, _ = self._watch(
+            pvs=('A-SP', ), values=(1.0, ), atol=0.1, settle_timeout=0.1)
+        self.assertEqual(checked, {'A-SP': True})
+
+    def test_timeout(self):
+        """Test readbacks that do not converge time out."""
+        watcher, checked, elapsed = self._watch(settle_timeout=0.2)
+        self.assertEqual(checked, {'A-SP': False, 'B-Sel': False})
+        self.assertEqual(watcher.settling_times, dict())
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 1)
+
+    def test_moving_readback(self):
+        """Test readbacks still moving are given more time."""
+        for i in range(1, 6):
+            self._later(0.1*i, 'A-RB', 0.2*i)
+        _, checked, elapsed = self._watch(
+            pvs=('A-SP', ), values=(1.0, ), settle_timeout=0.25)
+        self.assertEqual(checked, {'A-SP': True})
+        self.assertGreaterEqual(elapsed, 0.45)
+
+    def test_max_timeout(self):
+        """Test deadline is not extended beyond max_timeout."""
+        for i in range(1, 30):
+            self._later(0.05*i, 'A-RB', 0.01*i)
+        _, checked, elapsed = self._watch(
+            pvs=('A-SP', ), values=(1.0, ), settle_timeout=0.2,
+            max_timeout=0.4)
+        self.assertEqual(checked, {'A-SP': False})
+        self.assertLess(elapsed, 0.8)
+
+    def test_readback_not_connected(self):
+        """Test PV itself is watched if its readback does not connect."""
+        FakeEpics.connected['A-RB'] = False
+        with self.assertLogs(level='WARNING'):
+            _, checked, _ = self._watch(
+                pvs=('A-SP', ), values=(1.0, ), settle_timeout=0.1)
+        self.assertEqual(checked, {'A-SP': True})
+
+    def test_not_connected(self):
+        """Test PVs not connected fail at once."""
+        FakeEpics.connected.update({'A-SP': False, 'A-RB': False})
+        _, checked, elapsed = self._watch(
+            pvs=('A-SP', ), values=(1.0, ), settle_timeout=5)
+        self.assertEqual(checked, {'A-SP': False})
+        self.assertLess(elapsed, 1)
+
+    def test_readbacks(self):
+        """Test readbacks given explicitly."""
+        FakeEpics.values['A-Mon'] = 1.0
+        _, checked, _ = self._watch(
+            pvs=('A-SP', ), values=(1.0, ), readbacks=('A-Mon', ),
+            settle_timeout=0.1)
+        self.assertEqual(checked, {'A-SP': True})
+
+    def test_default_readbacks(self):
+        """Test PVs themselves are watched by default."""
+        _, checked, elapsed = self._watch(readbacks=None, settle_timeout=5)
+        self.assertEqual(checked, {'A-SP': True, 'B-Sel': True})
+        self.assertLess(elapsed, 1)
+
+    def test_readbacks_with_other_enums(self):
+        """Test Sel PVs whose Sts enums differ are checked by themselves."""
+        FakeEpics.values.update({'B-Sel': 0, 'B-Sts': 3})
+        _, checked, _ = self._watch(
+            pvs=('B-Sel', ), values=(0, ), readbacks=None, settle_timeout=0.1)
+        self.assertEqual(checked, {'B-Sel': True})
+        _, checked, _ = self._watch(
+            pvs=('B-Sel', ), values=(0, ), settle_timeout=0.1)
+        self.assertEqual(checked, {'B-Sel': False})
+
+    def test_quit(self):
+        """Test task exited before running checks nothing."""
+        watcher = EpicsConvergenceWatcher(
+            ['A-SP'], [1.0], [0], cls_epics=self.cls_epics)
+        checked = list()
+        watcher.itemChecked.connect(lambda *args: checked.append(args))
+        watcher.exit_task()
+        watcher.run()
+        self.assertEqual(checked, [])
+
+
+class TestEpicsConvergenceWatcherPolled(TestEpicsConvergenceWatcher):
+    """Test EpicsConvergenceWatcher with readbacks that are polled."""
+
+    cls_epics = PolledEpics
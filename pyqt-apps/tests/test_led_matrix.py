@@ -0,0 +1,93 @@
+"""Test led matrix widget."""
+import unittest
+
+from qtpy.QtCore import QPoint
+from qtpy.QtWidgets import QApplication
+
+from siriushla.widgets import SiriusLedMatrix
+
+
+class TestSiriusLedMatrix(unittest.TestCase):
+    """Test SiriusLedMatrix."""
+
+    # row and column of leds, with an empty cell at (1, 0)
+    POSITIONS = ((0, 0), (0, 2), (1, 1), (2, 0), (2, 2))
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.matrix = SiriusLedMatrix(spacing=6)
+        for idx, (row, col) in enumerate(self.POSITIONS):
+            self.matrix.add_led(row, col, '', name='led{}'.format(idx))
+        self.matrix.add_label(3, 0, 'a label spanning columns', colspan=3)
+        self.matrix.resize(self.matrix.sizeHint())
+
+    def tearDown(self):
+        """Delete widget."""
+        self.matrix.deleteLater()
+
+    def _led_rect(self, idx):
+        return self.matrix._led_rect(idx)
+
+    def test_led_at_center(self):
+        """Test leds are found at their centers."""
+        for idx in range(len(self.POSITIONS)):
+            self.assertEqual(
+                self.matrix.led_at(self._led_rect(idx).center()), idx)
+
+    def test_led_at_corners(self):
+        """Test leds are found up to their borders."""
+        for idx in range(len(self.POSITIONS)):
+            rect = self._led_rect(idx)
+            for pos in (rect.topLeft(), rect.bottomRight()):
+                self.assertEqual(self.matrix.led_at(pos), idx)
+
+    def test_empty_cell(self):
+        """Test no led is found in an empty cell."""
+        pos = QPoint(
+            self._led_rect(0).center().x(), self._led_rect(2).center().y())
+        self.assertEqual(self.matrix.led_at(pos), -1)
+
+    def test_spacing(self):
+        """Test no led is found in the spacing between cells."""
+        center = self._led_rect(0).center()
+        col_x, row_y = self.matrix._col_x, self.matrix._row_y
+        self.assertEqual(self.matrix.led_at(
+            QPoint(int(col_x[1]) - 3, center.y())), -1)
+        self.assertEqual(self.matrix.led_at(
+            QPoint(center.x(), int(row_y[1]) - 3)), -1)
+
+    def test_outside(self):
+        """Test no led is found outside the matrix or on labels."""
+        hint = self.matrix.sizeHint()
+        for pos in (QPoint(-1, -1), QPoint(hint.width() + 10, 0),
+                    QPoint(0, hint.height() + 10),
+                    QPoint(2, hint.height() - 2)):
+            self.assertEqual(self.matrix.led_at(pos), -1)
+
+    def test_resized(self):
+        """Test leds are found after extra width is distributed."""
+        hint = self.matrix.sizeHint()
+        self.matrix.resize(hint.width() + 300, hint.height())
+        rect1 = self._led_rect(1)
+        self.assertGreater(rect1.left(), hint.width())
+        for idx in range(len(self.POSITIONS)):
+            self.assertEqual(
+                self.matrix.led_at(self._led_rect(idx).center()), idx)
+
+    def test_states(self):
+        """Test led states follow connection and value."""
+        mat = self.matrix
+        self.assertEqual(mat.states[0], mat.DISCONNECTED)
+        mat.set_connected(0, True)
+        mat.set_value(0, 1)
+        self.assertEqual(mat.states[0], mat.FAULT)
+        mat.set_value(0, 0)
+        self.assertEqual(mat.states[0], mat.OK)
+        mat.set_connected(0, False)
+        self.assertEqual(mat.states[0], mat.DISCONNECTED)
+        self.assertEqual(mat.names, ['led{}'.format(i) for i in range(5)])
@@ -0,0 +1,129 @@
+"""Test leds of several channels."""
+import unittest
+from unittest import mock
+
+from qtpy.QtWidgets import QApplication
+
+from siriushla.widgets import PyDMLedMultiChannel, PyDMLedMultiConnection
+
+
+class _ChannelsMixin:
+    """Replace PyDMChannel of led module by mocks."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Patch channels."""
+        self.channels = dict()
+        patcher = mock.patch(
+            'siriushla.widgets.led.PyDMChannel', side_effect=self._channel)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _channel(self, address, **kws):
+        chan = mock.Mock(address=address, **kws)
+        self.channels.setdefault(address, list()).append(chan)
+        return chan
+
+    def _emit(self, address, slot, value):
+        """Call slot of led as if sent by the channel of address."""
+        chan = self.channels[address][-1]
+        with mock.patch.object(self.led, 'sender', return_value=chan):
+            getattr(self.led, slot)(value)
+
+    def _check_created_once(self, addresses):
+        for address in addresses:
+            chans = self.channels[address]
+            self.assertEqual(len(chans), 1)
+            chans[0].connect.assert_called_once()
+
+
+class TestPyDMLedMultiChannel(_ChannelsMixin, unittest.TestCase):
+    """Test PyDMLedMultiChannel."""
+
+    def setUp(self):
+        """Set test object."""
+        super().setUp()
+        self.led = PyDMLedMultiChannel(channels2values={'A': 1, 'B': 2})
+        self.addCleanup(self.led.deleteLater)
+        for address, value in (('A', 1), ('B', 2)):
+            self._emit(address, 'connection_changed', True)
+            self._emit(address, 'value_changed', value)
+
+    def test_all_desired(self):
+        """Test led is on when every channel has its desired value."""
+        self.assertEqual(self.led.nr_failing_channels, 0)
+        self.led._update_statuses()
+        self.assertEqual(self.led.state, 1)
+
+    def test_kept_channels(self):
+        """Test kept channels are not reconnected nor compared again."""
+        self.led.set_channels2values({'B': 2, 'C': 3})
+        self._check_created_once(['B', 'C'])
+        self.channels['A'][0].disconnect.assert_called_once()
+        self.channels['B'][0].disconnect.assert_not_called()
+        self.assertEqual(self.led.channels2status, {'B': True, 'C': False})
+        self.assertEqual(self.led.nr_failing_channels, 1)
+        self.assertEqual(self.led.state, 2)
+        self._emit('C', 'connection_changed', True)
+        self._emit('C', 'value_changed', 3)
+        self.assertEqual(self.led.nr_failing_channels, 0)
+        self.led._update_statuses()
+        self.assertEqual(self.led.state, 1)
+
+    def test_changed_desired_value(self):
+        """Test kept channels are compared again to new desired values."""
+        self.led.set_channels2values({'A': 1, 'B': 5})
+        self._check_created_once(['A', 'B'])
+        self.assertEqual(self.led.channels2status, {'A': True, 'B': False})
+        self.assertEqual(self.led.nr_failing_channels, 1)
+        self.assertEqual(self.led.state, 0)
+
+    def test_removed_channels(self):
+        """Test counters of removed channels are discounted."""
+        self._emit('B', 'connection_changed', False)
+        self._emit('A', 'value_changed', 0)
+        self.assertEqual(self.led.nr_failing_channels, 2)
+        self.led.set_channels2values({'A': 0})
+        self.assertEqual(self.led.nr_failing_channels, 0)
+        self.assertEqual(self.led.state, 1)
+        self.led.set_channels2values(dict())
+        self.assertEqual(self.led.nr_failing_channels, 0)
+        self.assertFalse(self.led.isEnabled())
+
+
+class TestPyDMLedMultiConnection(_ChannelsMixin, unittest.TestCase):
+    """Test PyDMLedMultiConnection."""
+
+    def setUp(self):
+        """Set test object."""
+        super().setUp()
+        self.led = PyDMLedMultiConnection(channels=['A', 'B'])
+        self.addCleanup(self.led.deleteLater)
+        for address in ('A', 'B'):
+            self._emit(address, 'connection_changed', True)
+
+    def test_kept_channels(self):
+        """Test kept channels are not reconnected."""
+        self.led.set_channels(['B', 'C'])
+        self._check_created_once(['B', 'C'])
+        self.channels['A'][0].disconnect.assert_called_once()
+        self.channels['B'][0].disconnect.assert_not_called()
+        self.assertEqual(self.led.channels2conn, {'B': True, 'C': False})
+        self.assertEqual(self.led.nr_failing_channels, 1)
+        self.assertEqual(self.led.state, 0)
+        self._emit('C', 'connection_changed', True)
+        self.assertEqual(self.led.nr_failing_channels, 0)
+
+    def test_removed_channels(self):
+        """Test disconnected channels removed are discounted."""
+        self._emit('A', 'connection_changed', False)
+        self.assertEqual(self.led.nr_failing_channels, 1)
+        self.led.set_channels(['B'])
+        self.assertEqual(self.led.nr_failing_channels, 0)
+        self.assertEqual(self.led.state, 1)
+        self.led.set_channels(['B', 'B'])
+        self._check_created_once(['B'])
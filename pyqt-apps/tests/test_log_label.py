@@ -0,0 +1,135 @@
+"""Test log label model."""
+import os
+import tempfile
+import unittest
+
+from qtpy.QtCore import Qt
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QApplication
+
+from siriushla.widgets.log_label import LogListModel
+
+
+class TestLogListModel(unittest.TestCase):
+    """Test LogListModel ring buffer."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application to run flush timers."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.model = LogListModel(capacity=5)
+        self.nr_flushes = 0
+        self.model.aboutToFlush.connect(self._count_flush)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spill_file = os.path.join(self.tmpdir.name, 'spill.log')
+        self.nr_msgs = 0
+
+    def tearDown(self):
+        """Remove spill file."""
+        self.tmpdir.cleanup()
+
+    def _count_flush(self):
+        self.nr_flushes += 1
+
+    def _add(self, nr_msgs, flush=True):
+        for _ in range(nr_msgs):
+            self.model.add('m{}'.format(self.nr_msgs))
+            self.nr_msgs += 1
+        if flush:
+            self.model.flush()
+
+    def _texts(self):
+        return [self.model.data(self.model.index(row))
+                for row in range(self.model.rowCount())]
+
+    def _spilled(self):
+        if not os.path.exists(self.spill_file):
+            return []
+        with open(self.spill_file) as fil:
+            return fil.read().splitlines()
+
+    def test_batch(self):
+        """Test messages are inserted in the next event loop pass."""
+        self._add(3, flush=False)
+        self.assertEqual(self.model.rowCount(), 0)
+        self.app.processEvents()
+        self.assertEqual(self._texts(), ['m0', 'm1', 'm2'])
+        self.assertEqual(self.nr_flushes, 1)
+
+    def test_data(self):
+        """Test text and color of messages."""
+        color = QColor(255, 0, 0)
+        self.model.add('error', color)
+        self.model.flush()
+        index = self.model.index(0)
+        self.assertEqual(self.model.data(index), 'error')
+        self.assertEqual(self.model.data(index, Qt.ForegroundRole), color)
+        self.assertIsNone(self.model.data(self.model.index(1)))
+
+    def test_wrap(self):
+        """Test oldest messages are dropped once the buffer is full."""
+        for nr_msgs in (3, 4, 1, 2, 5, 3):
+            self._add(nr_msgs)
+            first = max(self.nr_msgs - 5, 0)
+            self.assertEqual(
+                self._texts(),
+                ['m{}'.format(i) for i in range(first, self.nr_msgs)])
+
+    def test_burst_larger_than_capacity(self):
+        """Test a batch larger than the buffer keeps its newest messages."""
+        self.model.spill_file = self.spill_file
+        self._add(3)
+        self._add(8)
+        self.assertEqual(self._texts(), ['m6', 'm7', 'm8', 'm9', 'm10'])
+        self.assertEqual(
+            self._spilled(), ['m{}'.format(i) for i in range(6)])
+
+    def test_spill(self):
+        """Test dropped messages are appended to the spill file."""
+        self._add(4)
+        self.model.spill_file = self.spill_file
+        self._add(3)
+        self._add(2)
+        self.assertEqual(self._spilled(), ['m0', 'm1', 'm2', 'm3'])
+        self.assertEqual(self._texts(), ['m4', 'm5', 'm6', 'm7', 'm8'])
+
+    def test_no_spill_file(self):
+        """Test messages are dropped when there is no spill file."""
+        self._add(7)
+        self.assertEqual(len(self._texts()), 5)
+        self.assertEqual(self._spilled(), [])
+
+    def test_shrink_capacity(self):
+        """Test reducing capacity keeps the newest messages."""
+        self.model.spill_file = self.spill_file
+        self._add(6)
+        self._add(2, flush=False)
+        self.model.capacity = 3
+        self.assertEqual(self.model.capacity, 3)
+        self.assertEqual(self._texts(), ['m5', 'm6', 'm7'])
+        self.assertEqual(
+            self._spilled(), ['m{}'.format(i) for i in range(5)])
+        self._add(1)
+        self.assertEqual(self._texts(), ['m6', 'm7', 'm8'])
+
+    def test_grow_capacity(self):
+        """Test increasing capacity keeps all messages."""
+        self._add(7)
+        self.model.capacity = 8
+        self.assertEqual(self._texts(), ['m2', 'm3', 'm4', 'm5', 'm6'])
+        self._add(4)
+        self.assertEqual(
+            self._texts(), ['m{}'.format(i) for i in range(3, 11)])
+
+    def test_clear(self):
+        """Test clear removes pending messages too."""
+        self._add(7)
+        self._add(2, flush=False)
+        self.model.clear()
+        self.app.processEvents()
+        self.assertEqual(self.model.rowCount(), 0)
+        self._add(1)
+        self.assertEqual(self._texts(), ['m9'])
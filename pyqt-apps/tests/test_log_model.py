@@ -0,0 +1,151 @@
+"""Test power supply diagnostic log model."""
+import random
+import unittest
+
+from qtpy.QtWidgets import QApplication
+
+from siriushla.as_ps_diag.log_model import LogTableModel, _FenwickTree
+
+
+class TestFenwickTree(unittest.TestCase):
+    """Test _FenwickTree."""
+
+    def setUp(self):
+        """Set test object."""
+        self.counts = [1, 0, 1, 1, 0, 0, 1, 1, 0, 1]
+        self.tree = _FenwickTree(len(self.counts))
+        self.tree.rebuild(self.counts)
+
+    def test_prefix(self):
+        """Test prefix sums."""
+        for idx in range(len(self.counts)):
+            self.assertEqual(
+                self.tree.prefix(idx), sum(self.counts[:idx+1]))
+
+    def test_find(self):
+        """Test position of the k-th count."""
+        positions = [i for i, cnt in enumerate(self.counts) if cnt]
+        for k, pos in enumerate(positions, 1):
+            self.assertEqual(self.tree.find(k), pos)
+
+    def test_add(self):
+        """Test updated counts match a rebuilt tree."""
+        self.tree.add(1, 1)
+        self.tree.add(9, -1)
+        self.counts[1] += 1
+        self.counts[9] -= 1
+        rebuilt = _FenwickTree(len(self.counts))
+        rebuilt.rebuild(self.counts)
+        for idx in range(len(self.counts)):
+            self.assertEqual(self.tree.prefix(idx), rebuilt.prefix(idx))
+
+
+class TestLogTableModel(unittest.TestCase):
+    """Test LogTableModel."""
+
+    HEADERS = ('Date', 'Time', 'Type', 'PS Name', 'Property', 'Value')
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _model(self, capacity=5, unique=False):
+        model = LogTableModel(self.HEADERS, capacity=capacity, unique=unique)
+        self.updates = [0]
+        model.updated.connect(
+            lambda: self.updates.__setitem__(0, self.updates[0] + 1))
+        return model
+
+    @staticmethod
+    def _values(idx, psname=None):
+        psname = psname or 'PS-{}'.format(idx)
+        return ['d', 't{}'.format(idx), 'type', psname, 'prop', str(idx)]
+
+    @staticmethod
+    def _rows(model):
+        return [model.rowData(row)[5] for row in range(model.rowCount())]
+
+    def test_flush(self):
+        """Test entries are inserted on flush, newest first."""
+        model = self._model()
+        for idx in range(3):
+            model.add(self._values(idx))
+        self.assertEqual(model.rowCount(), 0)
+        model.flush()
+        self.assertEqual(self._rows(model), ['2', '1', '0'])
+        self.assertEqual(self.updates[0], 1)
+        model.flush()
+        self.assertEqual(self.updates[0], 1)
+
+    def test_flush_in_event_loop(self):
+        """Test pending entries are flushed in the next event loop pass."""
+        model = self._model()
+        model.add(self._values(0))
+        self.app.processEvents()
+        self.assertEqual(self._rows(model), ['0'])
+
+    def test_capacity(self):
+        """Test oldest entries are dropped once the buffer is full."""
+        model = self._model(capacity=3)
+        for idx in range(4):
+            model.add(self._values(idx))
+        model.flush()
+        self.assertEqual(self._rows(model), ['3', '2', '1'])
+        for idx in range(4, 9):
+            model.add(self._values(idx))
+            model.flush()
+        self.assertEqual(self._rows(model), ['8', '7', '6'])
+
+    def test_unique(self):
+        """Test entries with the same key replace each other."""
+        model = self._model(unique=True)
+        model.add(self._values(0, 'A'))
+        model.add(self._values(1, 'B'))
+        model.add(self._values(2, 'A'))
+        model.flush()
+        self.assertEqual(self._rows(model), ['2', '1'])
+        model.add(self._values(3, 'B'))
+        model.flush()
+        self.assertEqual(self._rows(model), ['3', '2'])
+
+    def test_remove(self):
+        """Test entries, pending or not, are removed by key."""
+        model = self._model()
+        for idx, psn in enumerate('ABAB'):
+            model.add(self._values(idx, psn))
+        model.flush()
+        model.add(self._values(4, 'A'))
+        model.remove(('type', 'A', 'prop'))
+        model.flush()
+        self.assertEqual(self._rows(model), ['3', '1'])
+        updates = self.updates[0]
+        model.remove(('type', 'C', 'prop'))
+        self.assertEqual(self.updates[0], updates)
+
+    def test_compaction(self):
+        """Test holes left by removed entries are packed when reached."""
+        model = self._model(capacity=6)
+        expected = list()
+        rnd = random.Random(0)
+        for idx in range(60):
+            psn = rnd.choice('ABCD')
+            model.add(self._values(idx, psn))
+            model.flush()
+            expected.insert(0, (str(idx), psn))
+            expected = expected[:6]
+            if idx % 7 == 6:
+                psn = rnd.choice('ABCD')
+                model.remove(('type', psn, 'prop'))
+                expected = [exp for exp in expected if exp[1] != psn]
+            self.assertEqual(self._rows(model), [exp[0] for exp in expected])
+
+    def test_clear(self):
+        """Test clear removes entries and pending entries."""
+        model = self._model()
+        model.add(self._values(0))
+        model.flush()
+        model.add(self._values(1))
+        model.clear()
+        model.flush()
+        self.assertEqual(model.rowCount(), 0)
@@ -0,0 +1,77 @@
+"""Test profile analysis."""
+import unittest
+
+import numpy as np
+
+from siriushla.as_ap_measure.profile_analysis import ProfileAnalyzer, \
+    ProfileSettings
+
+
+class TestProfileAnalyzerTracking(unittest.TestCase):
+    """Test ProfileAnalyzer region of interest tracking."""
+
+    SHAPE = (500, 600)
+    SIGMA = (12, 8)
+
+    def setUp(self):
+        """Set test object."""
+        self.rng = np.random.RandomState(0)
+        self.analyzer = ProfileAnalyzer()
+        self.settings = ProfileSettings(
+            'fit', (60, 60), None, 0, False, (0.01, 0.01))
+
+    def _frame(self, cen=None):
+        image = self.rng.normal(20, 3, self.SHAPE)
+        if cen is not None:
+            y, x = np.mgrid[:self.SHAPE[0], :self.SHAPE[1]]
+            image += 200*np.exp(
+                -(x - cen[0])**2/(2*self.SIGMA[0]**2)
+                - (y - cen[1])**2/(2*self.SIGMA[1]**2))
+        return np.clip(image, 0, None).astype(np.uint16)
+
+    def _analyse(self, cen=None):
+        rec, _, _ = self.analyzer.analyse(self._frame(cen), self.settings)
+        return rec
+
+    def _assert_beam(self, rec, cen):
+        self.assertIsNotNone(rec.sigma_x)
+        self.assertIsNotNone(rec.sigma_y)
+        self.assertAlmostEqual(rec.params_x[1], cen[0], delta=1)
+        self.assertAlmostEqual(rec.params_y[1], cen[1], delta=1)
+        self.assertAlmostEqual(abs(rec.params_x[2]), self.SIGMA[0], delta=1)
+        self.assertAlmostEqual(abs(rec.params_y[2]), self.SIGMA[1], delta=1)
+
+    def _assert_no_beam(self, rec):
+        self.assertIsNone(rec.cen_x)
+        self.assertIsNone(rec.sigma_x)
+        self.assertIsNone(rec.cen_y)
+        self.assertIsNone(rec.sigma_y)
+
+    def test_off_center_beam(self):
+        """Test beam far from the image center is found."""
+        self._assert_beam(self._analyse((100, 400)), (100, 400))
+
+    def test_beam_jump(self):
+        """Test region of interest follows beam that jumps."""
+        for _ in range(2):
+            self._assert_beam(self._analyse((300, 250)), (300, 250))
+        # beam left the region of interest: frame rejected
+        self._assert_no_beam(self._analyse((80, 60)))
+        for _ in range(2):
+            self._assert_beam(self._analyse((80, 60)), (80, 60))
+
+    def test_beam_lost_and_back(self):
+        """Test noise is not taken as beam and beam is found again."""
+        self._assert_beam(self._analyse((300, 250)), (300, 250))
+        for _ in range(3):
+            self._assert_no_beam(self._analyse())
+        self._assert_beam(self._analyse((500, 100)), (500, 100))
+
+    def test_moments(self):
+        """Test moments method tracks beam."""
+        self.settings = self.settings._replace(method='moments')
+        self.analyzer.analyse(self._frame((300, 250)), self.settings)
+        rec, _, _ = self.analyzer.analyse(
+            self._frame((300, 250)), self.settings)
+        self.assertAlmostEqual(rec.params_x[1], 300, delta=2)
+        self.assertAlmostEqual(rec.params_y[1], 250, delta=2)
@@ -0,0 +1,131 @@
+"""Test list of power supply containers created on demand."""
+import unittest
+
+from qtpy.QtCore import Signal, QEvent
+from qtpy.QtWidgets import QApplication, QWidget, QVBoxLayout
+
+from siriushla.as_ps_control.control_widget.BasePSControlWidget import \
+    PSContainerList
+
+
+class _Container(QWidget):
+    """Container with the interface used by PSContainerList."""
+
+    dclinkToggled = Signal(bool)
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.dclink_visible = False
+        self.setFixedHeight(20)
+        QVBoxLayout(self)
+
+    def set_dclink_visible(self, visible):
+        """Set visibility of DCLinks."""
+        self.dclink_visible = visible
+
+
+class TestPSContainerList(unittest.TestCase):
+    """Test PSContainerList."""
+
+    NR_ROWS = 200
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.created = list()
+        self.alive = set()
+        self.psnames = ['PS-{:03d}'.format(i) for i in range(self.NR_ROWS)]
+        self.table = PSContainerList(self.psnames, self._create)
+        self.table.resize(200, 200)
+        self.table.show()
+        self._process()
+
+    def tearDown(self):
+        """Delete widget."""
+        self.table.hide()
+        self.table.deleteLater()
+        self._process()
+
+    def _create(self, psname):
+        container = _Container(psname)
+        self.created.append(psname)
+        self.alive.add(psname)
+        container.destroyed.connect(lambda: self.alive.discard(psname))
+        return container
+
+    def _process(self):
+        # updates are scheduled again until row heights settle
+        for _ in range(10):
+            self.app.processEvents()
+            if not self.table._update_timer.isActive():
+                break
+        self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def _visible_rows(self):
+        table = self.table
+        first = table.rowAt(0)
+        last = table.rowAt(table.viewport().height() - 1)
+        return set(range(first, last + 1))
+
+    def test_create_near_viewport(self):
+        """Test only rows near the viewport are created."""
+        rows = self._visible_rows()
+        names = set(self.table.containers)
+        self.assertTrue({self.psnames[row] for row in rows} <= names)
+        self.assertEqual(
+            names, set(self.psnames[:max(rows) + 1 + PSContainerList.MARGIN]))
+        self.assertEqual(self.alive, names)
+
+    def test_release_on_scroll(self):
+        """Test rows far from the viewport are released and deleted."""
+        first = set(self.table.containers)
+        self.table.scrollToBottom()
+        self._process()
+        names = set(self.table.containers)
+        self.assertIn(self.psnames[-1], names)
+        self.assertFalse(first & names)
+        self.assertEqual(self.alive, names)
+        self.table.scrollToTop()
+        self._process()
+        self.assertEqual(set(self.table.containers), first)
+        self.assertEqual(self.alive, first)
+        self.assertEqual(self.created.count(self.psnames[0]), 2)
+
+    def test_filtered(self):
+        """Test hidden rows are released and not created."""
+        shown = set(self.psnames[100::10])
+        self.table.set_filtered(shown)
+        self._process()
+        self.assertEqual(set(self.table.containers), shown)
+        self.assertEqual(self.alive, shown)
+        self.table.set_filtered(set(self.psnames))
+        self._process()
+        self.assertIn(self.psnames[0], self.table.containers)
+
+    def test_not_updated_while_hidden(self):
+        """Test containers are not created while the table is hidden."""
+        names = set(self.table.containers)
+        self.table.hide()
+        self.table.scrollToBottom()
+        self._process()
+        self.assertEqual(set(self.table.containers), names)
+        self.table.show()
+        self._process()
+        self.assertIn(self.psnames[-1], self.table.containers)
+
+    def test_dclink_expanded(self):
+        """Test expanded DCLinks are restored when rows are created again."""
+        psname = self.psnames[0]
+        self.table.containers[psname].dclinkToggled.emit(True)
+        self.table.scrollToBottom()
+        self._process()
+        self.assertNotIn(psname, self.alive)
+        self.table.scrollToTop()
+        self._process()
+        self.assertTrue(self.table.containers[psname].dclink_visible)
+        self.assertFalse(self.table.containers[self.psnames[1]].dclink_visible)
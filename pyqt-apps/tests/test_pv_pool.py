@@ -0,0 +1,121 @@
+"""Test PV pool."""
+import unittest
+from unittest import mock
+
+from siriushla.common.epics import PVPool
+
+
+class FakePV:
+    """Fake epics.PV with callbacks."""
+
+    def __init__(self, pvname, **kwargs):
+        self.pvname = pvname
+        self.kwargs = kwargs
+        self.connected = False
+        self.callbacks = dict()
+        self.connection_callbacks = list()
+        self.disconnect = mock.Mock()
+
+    def add_callback(self, callback):
+        index = len(self.callbacks) + 1
+        self.callbacks[index] = (callback, dict())
+        return index
+
+    def remove_callback(self, index):
+        self.callbacks.pop(index)
+
+
+class TestPVPool(unittest.TestCase):
+    """Test PVPool."""
+
+    def setUp(self):
+        """Set test object."""
+        patcher = mock.patch(
+            'siriushla.common.epics.pool._PV', side_effect=FakePV)
+        self.pv_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = PVPool(idle_timeout=3600)
+
+    def tearDown(self):
+        """Stop eviction timer."""
+        if self.pool._timer is not None:
+            self.pool._timer.cancel()
+
+    def test_shared(self):
+        """Test PVs are created once and shared."""
+        pv1 = self.pool.get_pv('A', connection_timeout=1)
+        pv2 = self.pool.get_pv('A', connection_timeout=2)
+        self.assertIs(pv1, pv2)
+        self.assertEqual(pv1.kwargs, {'connection_timeout': 1})
+        self.assertEqual(self.pv_class.call_count, 1)
+        self.assertEqual(self.pool.refcount('A'), 2)
+        stats = self.pool.stats
+        self.assertEqual((stats['created'], stats['reused']), (1, 1))
+        self.assertEqual(stats['in_use'], 1)
+
+    def test_release(self):
+        """Test release by object or name decreases reference count."""
+        pv = self.pool.get_pv('A')
+        self.pool.get_pv('A')
+        self.pool.release_pv(pv)
+        self.assertEqual(self.pool.refcount('A'), 1)
+        self.assertEqual(self.pool.stats['idle'], 0)
+        self.pool.release_pv('A')
+        self.assertEqual(self.pool.refcount('A'), 0)
+        self.assertEqual(self.pool.stats['idle'], 1)
+
+    def test_release_more_than_acquired(self):
+        """Test extra releases only warn."""
+        pv = self.pool.get_pv('A')
+        self.pool.release_pv(pv)
+        with self.assertLogs(level='WARNING'):
+            self.pool.release_pv(pv)
+        with self.assertLogs(level='WARNING'):
+            self.pool.release_pv('B')
+        self.assertEqual(self.pool.refcount('A'), 0)
+
+    def test_callbacks(self):
+        """Test callbacks are added by get_pv and removed by release_pv."""
+        def callback1(**kws):
+            pass
+
+        def callback2(**kws):
+            pass
+
+        pv = self.pool.get_pv('A', callback=callback1)
+        self.pool.get_pv('A', callback=callback2)
+        self.assertEqual(len(pv.callbacks), 2)
+        self.pool.release_pv(pv, callback=callback1)
+        funcs = [func for func, _ in pv.callbacks.values()]
+        self.assertEqual(funcs, [callback2])
+
+    def test_reuse_idle(self):
+        """Test idle PVs are reused before they are evicted."""
+        pv = self.pool.get_pv('A')
+        self.pool.release_pv(pv)
+        self.assertIs(self.pool.get_pv('A'), pv)
+        self.assertEqual(self.pool.stats['idle'], 0)
+        self.assertEqual(self.pool.evict_idle(0), 0)
+
+    def test_evict_idle(self):
+        """Test only PVs idle for max_idle seconds are disconnected."""
+        pva = self.pool.get_pv('A')
+        pvb = self.pool.get_pv('B')
+        self.pool.release_pv(pva)
+        self.assertEqual(self.pool.evict_idle(), 0)
+        self.assertEqual(self.pool.evict_idle(0), 1)
+        pva.disconnect.assert_called_once_with()
+        pvb.disconnect.assert_not_called()
+        self.assertEqual(self.pool.stats['channels'], 1)
+        self.assertIsNot(self.pool.get_pv('A'), pva)
+        self.assertEqual(self.pv_class.call_count, 3)
+
+    def test_connection_stats(self):
+        """Test connection changes are counted."""
+        pv = self.pool.get_pv('A')
+        for conn in (True, False, True):
+            for callback in pv.connection_callbacks:
+                callback(pvname='A', conn=conn)
+        stats = self.pool.stats
+        self.assertEqual(stats['connections'], 2)
+        self.assertEqual(stats['disconnections'], 1)
@@ -0,0 +1,74 @@
+"""Test PV names tree widget."""
+import unittest
+
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QApplication
+
+from siriushla.widgets.pvnames_tree import PVNameTree
+
+
+class TestPVNameTree(unittest.TestCase):
+    """Test PVNameTree."""
+
+    ITEMS = (
+        ('SI-Fam:PS-QFA:Current-SP', 0.0, 0.0),
+        ('SI-Fam:PS-QDA:Current-SP', 0.0, 0.0),
+        ('BO-Fam:PS-QF:Current-SP', 0.0, 0.0),
+        ('BO-Fam:PS-QD:Current-SP', 0.0, 0.0),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.tree = PVNameTree(
+            items=self.ITEMS, tree_levels=('sec', 'dev'))
+        self.changed = list()
+        self.tree.itemsChecked.connect(self.changed.extend)
+
+    def tearDown(self):
+        """Delete widget."""
+        self.tree.deleteLater()
+
+    def _checked(self):
+        return sorted(
+            leaf.row[0] for leaf in self.tree.model.leafs if leaf.checked)
+
+    def test_check_level(self):
+        """Test levels check all their leafs."""
+        self.tree.set_check_state(['SI', ], Qt.Checked)
+        self.assertEqual(self._checked(), sorted(
+            item[0] for item in self.ITEMS[:2]))
+        self.assertEqual(self.tree.check_state('SI'), Qt.Checked)
+        self.assertEqual(self.tree.check_state('BO'), Qt.Unchecked)
+        self.assertEqual(len(self.changed), 2)
+
+    def test_check_level_filtered(self):
+        """Test levels check only leafs shown by the filter."""
+        self.tree._filter_items('QFA')
+        self.tree.set_check_state(['SI', ], Qt.Checked)
+        self.assertEqual(self._checked(), [self.ITEMS[0][0], ])
+        self.assertEqual(self.tree.check_state('SI'), Qt.PartiallyChecked)
+
+    def test_check_leaf_filtered(self):
+        """Test leafs given by their keys are set even if hidden."""
+        self.tree._filter_items('QFA')
+        keys = [item[0] for item in self.ITEMS[1:3]]
+        self.tree.set_check_state(keys, Qt.Checked)
+        self.assertEqual(self._checked(), sorted(keys))
+        self.assertEqual(
+            sorted(leaf.row[0] for leaf in self.changed), sorted(keys))
+        self.tree.set_check_state(keys, Qt.Unchecked)
+        self.assertEqual(self._checked(), [])
+
+    def test_check_all_filtered(self):
+        """Test check all checks only leafs shown by the filter."""
+        self.tree._filter_items('BO-')
+        self.tree.check_all()
+        self.assertEqual(self._checked(), sorted(
+            item[0] for item in self.ITEMS[2:]))
+        self.tree._filter_items('')
+        self.assertEqual(self.tree.model.nr_checked, 2)
@@ -0,0 +1,84 @@
+"""Test DCCT smoothing buffer."""
+import unittest
+
+import numpy as np
+
+from siriushla.as_di_dccts.graphics import SmoothingBuffer
+
+
+class TestSmoothingBuffer(unittest.TestCase):
+    """Test SmoothingBuffer."""
+
+    def setUp(self):
+        """Set test object."""
+        self.rng = np.random.default_rng(0)
+        self.data = self.rng.normal(size=(20, 8))
+
+    def _check(self, buff, rows):
+        np.testing.assert_allclose(buff.rows(), rows)
+        func = np.mean if buff.method == 'Average' else np.median
+        np.testing.assert_allclose(buff.smoothed(), func(rows, axis=0))
+
+    def test_wrap_around(self):
+        """Test only the last maxlen acquisitions are smoothed."""
+        for method in SmoothingBuffer.METHODS:
+            buff = SmoothingBuffer(maxlen=4, method=method)
+            for i, data in enumerate(self.data):
+                self.assertTrue(buff.append(data))
+                self.assertEqual(len(buff), min(i + 1, 4))
+                self._check(buff, self.data[max(i - 3, 0):i + 1])
+
+    def test_median_repeated_values(self):
+        """Test median with repeated values across acquisitions."""
+        buff = SmoothingBuffer(maxlen=3, method='Median')
+        data = self.rng.integers(0, 3, size=(30, 5)).astype(float)
+        for i, row in enumerate(data):
+            buff.append(row)
+            self._check(buff, data[max(i - 2, 0):i + 1])
+
+    def test_non_finite_discarded(self):
+        """Test acquisitions with non finite samples are discarded."""
+        for method in SmoothingBuffer.METHODS:
+            buff = SmoothingBuffer(maxlen=3, method=method)
+            buff.append(self.data[0])
+            for value in (np.nan, np.inf, -np.inf):
+                data = self.data[1].copy()
+                data[2] = value
+                self.assertFalse(buff.append(data))
+            self.assertEqual(len(buff), 1)
+            for data in self.data[1:5]:
+                buff.append(data)
+            self._check(buff, self.data[2:5])
+            self.assertTrue(np.all(np.isfinite(buff.smoothed())))
+
+    def test_downsampling(self):
+        """Test smoothed acquisition is averaged in blocks."""
+        buff = SmoothingBuffer(maxlen=2)
+        buff.append(self.data[0])
+        buff.append(self.data[1])
+        mean = self.data[:2].mean(axis=0)
+        np.testing.assert_allclose(
+            buff.smoothed(4), mean.reshape(-1, 4).mean(axis=1))
+
+    def test_resize(self):
+        """Test changing maxlen and method keeps the last acquisitions."""
+        buff = SmoothingBuffer(maxlen=5)
+        for data in self.data[:7]:
+            buff.append(data)
+        buff.maxlen = 3
+        self._check(buff, self.data[4:7])
+        buff.method = 'Median'
+        self._check(buff, self.data[4:7])
+        buff.append(self.data[7])
+        self._check(buff, self.data[5:8])
+        buff.maxlen = 0
+        self.assertEqual(len(buff), 0)
+        self.assertIsNone(buff.smoothed())
+        self.assertFalse(buff.append(self.data[0]))
+
+    def test_new_size(self):
+        """Test acquisitions of a new size restart the buffer."""
+        buff = SmoothingBuffer(maxlen=3)
+        buff.append(self.data[0])
+        buff.append(np.arange(4))
+        self._check(buff, np.arange(4)[None, :])
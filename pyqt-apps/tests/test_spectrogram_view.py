@@ -0,0 +1,89 @@
+"""Test spectrogram view widget."""
+import time
+import unittest
+
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+from siriushla.widgets import SiriusSpectrogramView
+
+
+class TestSiriusSpectrogramView(unittest.TestCase):
+    """Test SiriusSpectrogramView."""
+
+    WIDTH = 4
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.view = SiriusSpectrogramView(image_width=self.WIDTH)
+        self.view.redraw_timer.stop()
+        self.images = list()
+        self.view.newImageSignal.connect(
+            lambda: self.images.append(self.view._image_item.image.copy()))
+        self.view.show()
+
+    def tearDown(self):
+        """Delete widget."""
+        self.view.hide()
+        self.view.deleteLater()
+
+    def _draw(self, image):
+        count = len(self.images)
+        self.view.image_value_changed(np.asarray(image, dtype=float))
+        self.view.redrawImage()
+        timeout = time.time() + 5
+        while len(self.images) == count and time.time() < timeout:
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.assertGreater(len(self.images), count)
+        return self.images[-1]
+
+    def test_image(self):
+        """Test flat images are reshaped to imageWidth."""
+        img = self._draw(np.arange(8))
+        np.testing.assert_array_equal(img, np.arange(8).reshape(2, 4))
+
+    def test_worker_reused(self):
+        """Test a single thread processes every image."""
+        thread = self.view.thread
+        for i in range(3):
+            self._draw(np.full(8, i))
+        self.assertIs(self.view.thread, thread)
+        self.assertIs(thread.parent(), self.view)
+        self.assertEqual(thread.processed_frames, 3)
+
+    def test_stopped_while_hidden(self):
+        """Test thread stops when hidden and starts again when shown."""
+        self._draw(np.zeros(8))
+        self.view.hide()
+        self.assertFalse(self.view.thread.isRunning())
+        self.view.image_value_changed(np.ones(8))
+        self.view.redrawImage()
+        self.assertFalse(self.view.thread.isRunning())
+        self.view.show()
+        img = self._draw(np.ones(8))
+        np.testing.assert_array_equal(img, np.ones((2, 4)))
+        self.assertTrue(self.view.thread.isRunning())
+
+    def test_waterfall(self):
+        """Test rows are appended to a circular image of waterfallLength."""
+        self.view.waterfallMode = True
+        self.view.waterfallLength = 3
+        img = self._draw(np.full(4, 0))
+        np.testing.assert_array_equal(img, np.zeros((1, 4)))
+        img = self._draw(np.repeat([1, 2], 4))
+        np.testing.assert_array_equal(img, np.repeat([[0], [1], [2]], 4, 1))
+        img = self._draw(np.repeat([3, 4], 4))
+        np.testing.assert_array_equal(img, np.repeat([[2], [3], [4]], 4, 1))
+
+    def test_waterfall_invalid_width(self):
+        """Test rows not multiple of imageWidth are discarded."""
+        self.view.waterfallMode = True
+        with self.assertLogs(level='ERROR'):
+            self.view.image_value_changed(np.zeros(5))
+        self.assertEqual(self.view._waterfall_rows, [])
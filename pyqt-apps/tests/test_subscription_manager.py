@@ -0,0 +1,167 @@
+"""Test subscription manager."""
+import unittest
+from unittest import mock
+
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QWidget, QScrollArea, \
+    QVBoxLayout, QTabWidget
+from pydm.widgets.channel import PyDMChannel
+
+from siriushla.widgets import SubscriptionManager
+
+
+class _ChannelWidget(QWidget):
+    """Widget with PyDM channels."""
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(100, 100)
+        self._channels = [
+            PyDMChannel(address='ca://{}-{}'.format(name, i))
+            for i in range(2)]
+        for chan in self._channels:
+            chan.connect = mock.Mock()
+            chan.disconnect = mock.Mock()
+
+    def channels(self):
+        """Return channels of widget."""
+        return self._channels
+
+
+class TestSubscriptionManager(unittest.TestCase):
+    """Test SubscriptionManager."""
+
+    NR_WIDGETS = 20
+
+    @classmethod
+    def setUpClass(cls):
+        """Create application."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set test object."""
+        self.scrollarea = QScrollArea()
+        self.scrollarea.resize(200, 300)
+        wid = QWidget()
+        lay = QVBoxLayout(wid)
+        self.widgets = list()
+        for i in range(self.NR_WIDGETS):
+            cwid = QWidget(wid)
+            QVBoxLayout(cwid).addWidget(_ChannelWidget(i, cwid))
+            lay.addWidget(cwid)
+            self.widgets.append(cwid)
+        self.scrollarea.setWidget(wid)
+        self.manager = SubscriptionManager(self.scrollarea, margin=0)
+        for cwid in self.widgets:
+            self.manager.add_widget(cwid)
+        self.scrollarea.show()
+        self.app.processEvents()
+
+    def tearDown(self):
+        """Delete widget."""
+        self.scrollarea.hide()
+        self.scrollarea.deleteLater()
+        self.app.processEvents()
+
+    @staticmethod
+    def _channels(widget):
+        return widget.findChild(_ChannelWidget).channels()
+
+    def _check_paused(self, paused):
+        for cwid in self.widgets:
+            is_paused = cwid in paused
+            self.assertEqual(cwid in self.manager.paused_widgets, is_paused)
+            for chan in self._channels(cwid):
+                self.assertEqual(chan.disconnect.call_count, int(is_paused))
+                chan.disconnect.reset_mock()
+                chan.connect.reset_mock()
+
+    def _exposed(self):
+        return [cwid for cwid in self.widgets
+                if cwid not in self.manager.paused_widgets]
+
+    def test_pause_out_of_viewport(self):
+        """Test channels of widgets out of the viewport are disconnected."""
+        exposed = self._exposed()
+        self.assertTrue(exposed)
+        self.assertLess(len(exposed), self.NR_WIDGETS)
+        self.assertIs(exposed[0], self.widgets[0])
+        paused = [cwid for cwid in self.widgets if cwid not in exposed]
+        self._check_paused(paused)
+        self.assertEqual(self.manager.nr_paused_channels, 2*len(paused))
+
+    def test_resume_on_scroll(self):
+        """Test channels are connected again when scrolled into view."""
+        self._check_paused(self.widgets[len(self._exposed()):])
+        self.scrollarea.verticalScrollBar().setValue(
+            self.scrollarea.verticalScrollBar().maximum())
+        self.app.processEvents()
+        self.assertIn(self.widgets[-1], self._exposed())
+        self.assertNotIn(self.widgets[0], self._exposed())
+        for chan in self._channels(self.widgets[-1]):
+            chan.connect.assert_called_once()
+            chan.disconnect.assert_not_called()
+        for chan in self._channels(self.widgets[0]):
+            chan.disconnect.assert_called_once()
+            chan.connect.assert_not_called()
+
+    def test_margin(self):
+        """Test widgets within margin of the viewport are kept connected."""
+        manager = SubscriptionManager(self.scrollarea, margin=300)
+        for cwid in self.widgets:
+            manager.add_widget(cwid)
+        manager.update()
+        self.assertLess(
+            len(manager.paused_widgets), len(self.manager.paused_widgets))
+
+    def test_hidden(self):
+        """Test channels of hidden widgets are disconnected."""
+        cwid = self.widgets[0]
+        cwid.hide()
+        self.app.processEvents()
+        self.assertIn(cwid, self.manager.paused_widgets)
+        cwid.show()
+        self.app.processEvents()
+        self.assertNotIn(cwid, self.manager.paused_widgets)
+        for chan in self._channels(cwid):
+            chan.connect.assert_called_once()
+
+    def test_background_tab(self):
+        """Test channels of widgets in background tabs are disconnected."""
+        tabs = QTabWidget()
+        managers = list()
+        for i in range(2):
+            scrollarea = QScrollArea(tabs)
+            scrollarea.setWidget(_ChannelWidget('tab{}'.format(i)))
+            manager = SubscriptionManager(scrollarea)
+            manager.add_widget(scrollarea.widget())
+            tabs.addTab(scrollarea, str(i))
+            managers.append(manager)
+        tabs.show()
+        self.app.processEvents()
+        self.assertEqual(managers[0].nr_paused_channels, 0)
+        self.assertEqual(managers[1].nr_paused_channels, 2)
+        tabs.setCurrentIndex(1)
+        self.app.processEvents()
+        self.assertEqual(managers[0].nr_paused_channels, 2)
+        self.assertEqual(managers[1].nr_paused_channels, 0)
+        tabs.deleteLater()
+
+    def test_remove_widget(self):
+        """Test removed widgets have their channels connected again."""
+        cwid = self.widgets[-1]
+        self.assertIn(cwid, self.manager.paused_widgets)
+        self.manager.remove_widget(cwid)
+        self.assertNotIn(cwid, self.manager.widgets)
+        self.assertNotIn(cwid, self.manager.paused_widgets)
+        for chan in self._channels(cwid):
+            chan.connect.assert_called_once()
+
+    def test_destroyed_widget(self):
+        """Test destroyed widgets are forgotten."""
+        cwid = self.widgets.pop()
+        cwid.setParent(None)
+        cwid.deleteLater()
+        self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.assertEqual(len(self.manager.widgets), self.NR_WIDGETS - 1)
+        self.manager.update()